@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping
+
+from esper import World
+
+from ecs.components.ability import Ability
+from ecs.components.ability_effect import AbilityEffects
+from ecs.components.ability_target import AbilityTarget
+from ecs.components.health import Health
+from ecs.components.pending_ability_target import PendingAbilityTarget
+from ecs.components.tile_bank import TileBank
+from ecs.components.tile_counts import TileCounts
+from ecs.effects.registry import default_effect_registry
+from ecs.events.bus import BACKEND_DIRECT, EventBus
+from ecs.systems.abilities.base import AbilityContext, AbilityResolver, EffectDrivenAbilityResolver
+from ecs.systems.effects.bank_effect_helpers import drain_bank_counts
+from ecs.utils.tile_banks import find_bank
+from ecs.utils.effect_index import effect_index
+
+# Effects that only touch combatant health or tile banks, never the board.
+BOARD_NEUTRAL_EFFECT_SLUGS: frozenset[str] = frozenset({"damage", "heal", "deplete", "mana_drain"})
+
+# Declared-effect targeting for abilities resolved without a custom resolver.
+_DECLARED_EFFECTS = EffectDrivenAbilityResolver()
+
+
+@dataclass(slots=True)
+class AbilityProjection:
+    """Analytic outcome of a board-neutral ability.
+
+    ``bank_counts`` maps owner entity -> projected bank counts for every bank the
+    ability touches (the caster's bank always appears, after paying the cost).
+    ``health`` holds projected current health for every damaged or healed entity.
+    """
+
+    owner_entity: int
+    bank_counts: Dict[int, TileCounts] = field(default_factory=dict)
+    health: Dict[int, int] = field(default_factory=dict)
+    damage: Dict[int, int] = field(default_factory=dict)
+    healing: Dict[int, int] = field(default_factory=dict)
+    mana_removed: Dict[int, int] = field(default_factory=dict)
+
+    def owner_bank_counts(self) -> Mapping[str, int]:
+        return self.bank_counts.get(self.owner_entity, {})
+
+    def defeated(self) -> set[int]:
+        return {entity for entity, current in self.health.items() if current <= 0}
+
+
+def is_board_neutral_ability(
+    world: World,
+    ability_entity: int,
+    resolvers: Mapping[str, AbilityResolver] | None = None,
+) -> bool:
+    """Return True when the ability's outcome can be computed without the board.
+
+    An ability qualifies when every declared effect is a damage/heal/deplete/
+    mana_drain spec that does not target the board, it is not tile-targeted, and
+    any custom resolver registered for it opts in via ``board_neutral = True``.
+    """
+
+    try:
+        ability: Ability = world.component_for_entity(ability_entity, Ability)
+        effects: AbilityEffects = world.component_for_entity(ability_entity, AbilityEffects)
+    except KeyError:
+        return False
+    if not effects.effects:
+        return False
+    try:
+        target: AbilityTarget = world.component_for_entity(ability_entity, AbilityTarget)
+        if target.target_type == "tile":
+            return False
+    except KeyError:
+        pass
+    resolver = (resolvers or {}).get(ability.name)
+    if resolver is not None and not getattr(resolver, "board_neutral", False):
+        return False
+    for spec in effects.effects:
+        if spec.slug not in BOARD_NEUTRAL_EFFECT_SLUGS or spec.target == "board":
+            return False
+    return True
+
+
+def project_ability(
+    world: World,
+    ability_entity: int,
+    owner_entity: int,
+    pending: PendingAbilityTarget,
+    resolvers: Mapping[str, AbilityResolver] | None = None,
+    *,
+    event_bus: EventBus | None = None,
+) -> AbilityProjection | None:
+    """Compute the outcome of a board-neutral ability without mutating ``world``.
+
+    Mirrors the resolution order of ``AbilityResolutionSystem`` followed by the
+    damage, heal, deplete and mana-drain effect systems, including outgoing
+    ``damage_bonus`` and incoming ``frailty`` modifiers and thorns reflection. Random-eligible drains
+    are resolved against a copy of the bank, so the drained type is indicative
+    only when more than one type is eligible.
+
+    ``event_bus`` is the scratch bus handed to the resolver's context; callers
+    that project repeatedly pass one they keep, otherwise one is built per call.
+    """
+
+    if not is_board_neutral_ability(world, ability_entity, resolvers):
+        return None
+    try:
+        ability: Ability = world.component_for_entity(ability_entity, Ability)
+    except KeyError:
+        return None
+    projection = AbilityProjection(owner_entity=owner_entity)
+    owner_bank = _bank_copy(world, projection, owner_entity)
+    if owner_bank is not None and ability.cost and owner_bank.spend(ability.cost):
+        return None
+    if event_bus is None:
+        event_bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=0)
+    ctx = AbilityContext(
+        world=world,
+        event_bus=event_bus,
+        ability_entity=ability_entity,
+        ability=ability,
+        pending=pending,
+        owner_entity=owner_entity,
+        active_owner=owner_entity,
+        scratchpad={},
+    )
+    resolver = (resolvers or {}).get(ability.name)
+    prepare = getattr(resolver, "prepare_scratchpad", None)
+    if callable(prepare):
+        prepare(ctx)
+    effects = resolver if isinstance(resolver, EffectDrivenAbilityResolver) else _DECLARED_EFFECTS
+    for spec, target, metadata in effects.declared_effects(ctx):
+        metadata = _merged_metadata(spec.slug, metadata)
+        if spec.slug == "damage":
+            _project_damage(world, projection, target, metadata)
+        elif spec.slug == "heal":
+            _project_heal(world, projection, target, metadata)
+        else:
+            _project_drain(world, projection, target, metadata, grant_source=spec.slug == "mana_drain")
+    return projection
+
+
+def _merged_metadata(slug: str, override: Dict[str, Any]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {}
+    if default_effect_registry.has(slug):
+        merged.update(dict(default_effect_registry.get(slug).default_metadata))
+    merged.update(override)
+    return merged
+
+
+def _project_damage(world: World, projection: AbilityProjection, target: int, metadata: Dict[str, Any]) -> None:
+    amount = _coerce_int(metadata.get("amount"))
+    if amount <= 0:
+        return
+    amount += _effect_total(world, metadata.get("source_owner"), "damage_bonus", "bonus", 0)
+    amount += _effect_total(world, target, "frailty", "bonus", 1)
+    pre_damage = _current_health(world, projection, target)
+    _record_context(metadata, amount, pre_damage)
+    _project_thorns(world, projection, target, metadata)
+    if amount <= 0 or pre_damage is None:
+        return
+    _apply_projected_damage(projection, target, amount, pre_damage)
+
+
+def _project_thorns(world: World, projection: AbilityProjection, target: int, metadata: Dict[str, Any]) -> None:
+    # Ability damage carries its ability as source, so ThornsEffectSystem always
+    # reflects it: the thorned target deals its thorns total back to the caster,
+    # through the usual outgoing/incoming modifiers, and never reflects a reflection.
+    attacker = metadata.get("source_owner")
+    if not isinstance(attacker, int) or attacker == target or metadata.get("reason") == "thorns":
+        return
+    if not effect_index(world).has(target, "thorns"):
+        return
+    reflected = effect_index(world).total(target, "thorns", "amount", 1, positive=True)
+    if reflected <= 0:
+        return
+    reflected += _effect_total(world, target, "damage_bonus", "bonus", 0)
+    reflected += _effect_total(world, attacker, "frailty", "bonus", 1)
+    current = _current_health(world, projection, attacker)
+    if reflected <= 0 or current is None:
+        return
+    _apply_projected_damage(projection, attacker, reflected, current)
+
+
+def _apply_projected_damage(projection: AbilityProjection, target: int, amount: int, current: int) -> None:
+    projection.damage[target] = projection.damage.get(target, 0) + amount
+    projection.health[target] = max(0, current - amount)
+
+
+def _project_heal(world: World, projection: AbilityProjection, target: int, metadata: Dict[str, Any]) -> None:
+    amount = _coerce_int(metadata.get("amount"))
+    if amount <= 0:
+        return
+    current = _current_health(world, projection, target)
+    if current is None:
+        return
+    max_hp = world.component_for_entity(target, Health).max_hp
+    projection.healing[target] = projection.healing.get(target, 0) + amount
+    projection.health[target] = min(max_hp, current + amount)
+
+
+def _project_drain(
+    world: World,
+    projection: AbilityProjection,
+    target: int,
+    metadata: Dict[str, Any],
+    *,
+    grant_source: bool,
+) -> None:
+    amount = _coerce_int(metadata.get("amount"))
+    bank = _bank_copy(world, projection, target)
+    if amount <= 0 or bank is None or not bank.counts:
+        return
+    # A private generator keeps projections from consuming the live game's RNG.
+    drained = drain_bank_counts(bank, amount, metadata, rng=random.Random(target))
+    total = sum(drained.values())
+    if total <= 0:
+        return
+    projection.mana_removed[target] = projection.mana_removed.get(target, 0) + total
+    source_owner = metadata.get("source_owner")
+    if not grant_source or not isinstance(source_owner, int):
+        return
+    source_bank = _bank_copy(world, projection, source_owner)
+    if source_bank is None:
+        return
+    for type_name, gained in drained.items():
+        source_bank.add(type_name, gained)
+
+
+def _bank_copy(world: World, projection: AbilityProjection, owner_entity: int) -> TileBank | None:
+    counts = projection.bank_counts.get(owner_entity)
+    if counts is None:
+        entry = find_bank(world, owner_entity)
+        if entry is None:
+            return None
+        live = entry[1].counts
+        counts = TileCounts(live, codes=live.codes)
+        projection.bank_counts[owner_entity] = counts
+    # The proxy shares the projected counts so mutations land in the projection.
+    return TileBank(owner_entity=owner_entity, counts=counts)
+
+
+def _current_health(world: World, projection: AbilityProjection, entity: int) -> int | None:
+    if entity in projection.health:
+        return projection.health[entity]
+    try:
+        return world.component_for_entity(entity, Health).current
+    except KeyError:
+        return None
+
+
+def _record_context(metadata: Dict[str, Any], intended: int, pre_damage: int | None) -> None:
+    context_ref = metadata.get("_ability_context")
+    context_key = metadata.get("context_write")
+    if not isinstance(context_ref, dict) or not isinstance(context_key, str):
+        return
+    actual = intended
+    if pre_damage is not None:
+        actual = max(0, min(intended, max(pre_damage, 0)))
+    context_ref[context_key] = actual
+
+
+def _effect_total(world: World, owner_entity: Any, slug: str, key: str, default: int) -> int:
+    return effect_index(world).total(owner_entity, slug, key, default)
+
+
+def _coerce_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterator, Optional
+
+# Phases recorded by ``BaseAISystem``; unknown names are accepted too.
+DECISION_PHASES: tuple[str, ...] = ("find_swaps", "clone", "simulate", "score", "dispatch")
+
+
+class RollingHistogram:
+    """Keeps the most recent ``window`` samples and reports percentiles over them."""
+
+    __slots__ = ("_samples", "count", "max_seen")
+
+    def __init__(self, window: int = 512) -> None:
+        self._samples: Deque[float] = deque(maxlen=max(1, window))
+        self.count = 0
+        self.max_seen = 0.0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+        if value > self.max_seen:
+            self.max_seen = value
+
+    def percentile(self, pct: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max_seen,
+        }
+
+
+@dataclass(slots=True)
+class DecisionRecord:
+    """Timing breakdown of one AI decision (seconds)."""
+
+    owner_entity: int
+    candidates: Dict[str, int] = field(default_factory=dict)
+    phases: Dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "owner": self.owner_entity,
+            "candidates": dict(self.candidates),
+            "phases": dict(self.phases),
+            "total": self.total,
+        }
+
+
+class DecisionProfiler:
+    """Per-decision latency profiler for ``BaseAISystem``.
+
+    Attach an instance to ``ai_system.profiler``. Each decision accumulates time
+    per phase (swap discovery, cloning, simulation, scoring, dispatch) and the
+    candidate count by kind; finished decisions feed rolling histograms and,
+    when ``jsonl_path`` is set, are appended to that file one JSON line each.
+
+    A decision stays open until its action has been fully dispatched, which can
+    span several ticks (selection delays). ``pause``/``resume`` bracket the work
+    done in each tick so ``total`` counts active time, not the waits between.
+    """
+
+    def __init__(self, jsonl_path: str | Path | None = None, window: int = 512) -> None:
+        self.jsonl_path = Path(jsonl_path) if jsonl_path is not None else None
+        self.window = window
+        self.total = RollingHistogram(window)
+        self.phases: Dict[str, RollingHistogram] = {}
+        self.candidate_counts: Dict[str, RollingHistogram] = {}
+        self.decisions = 0
+        self.current: Optional[DecisionRecord] = None
+        self._started: Optional[float] = None
+
+    def begin(self, owner_entity: int) -> None:
+        # A decision abandoned mid-action (turn changed, error) is closed, not dropped.
+        self.end()
+        self.current = DecisionRecord(owner_entity=owner_entity)
+        self._started = time.perf_counter()
+
+    def pause(self) -> None:
+        if self.current is not None and self._started is not None:
+            self.current.total += time.perf_counter() - self._started
+        self._started = None
+
+    def resume(self) -> None:
+        if self.current is not None and self._started is None:
+            self._started = time.perf_counter()
+
+    def count_candidates(self, kind: str, count: int) -> None:
+        if self.current is not None:
+            self.current.candidates[kind] = self.current.candidates.get(kind, 0) + count
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.current is not None:
+                phases = self.current.phases
+                phases[name] = phases.get(name, 0.0) + (time.perf_counter() - start)
+
+    def end(self) -> Optional[DecisionRecord]:
+        record = self.current
+        if record is None:
+            return None
+        self.pause()
+        self.current = None
+        self.decisions += 1
+        self.total.add(record.total)
+        for name, seconds in record.phases.items():
+            self.phases.setdefault(name, RollingHistogram(self.window)).add(seconds)
+        for kind, count in record.candidates.items():
+            self.candidate_counts.setdefault(kind, RollingHistogram(self.window)).add(float(count))
+        if self.jsonl_path is not None:
+            with self.jsonl_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record.to_dict(), sort_keys=True) + "\n")
+        return record
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "decisions": self.decisions,
+            "total": self.total.summary(),
+            "phases": {name: hist.summary() for name, hist in self.phases.items()},
+            "candidates": {kind: hist.summary() for kind, hist in self.candidate_counts.items()},
+        }
+
+    def format_report(self) -> str:
+        lines = [f"AI decisions: {self.decisions}"]
+        rows = [("total", self.total)] + sorted(self.phases.items())
+        for name, hist in rows:
+            stats = hist.summary()
+            lines.append(
+                f"  {name:<10} p50={stats['p50'] * 1000:8.2f}ms "
+                f"p95={stats['p95'] * 1000:8.2f}ms max={stats['max'] * 1000:8.2f}ms"
+            )
+        for kind, hist in sorted(self.candidate_counts.items()):
+            stats = hist.summary()
+            lines.append(f"  {kind} candidates: p50={stats['p50']:.0f} p95={stats['p95']:.0f} max={stats['max']:.0f}")
+        return "\n".join(lines)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+
+from esper import World
+
+from ecs.components.health import Health
+from ecs.components.human_agent import HumanAgent
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.events.bus import BACKEND_DIRECT, EVENT_TURN_ADVANCED, EventBus
+from ecs.events.payloads import TickEvent
+from ecs.systems.rule_based_ai_system import RuleBasedAISystem, RuleBasedWeights
+from ecs.systems.wiring import wire_combat_systems
+from ecs.utils.census import reclaim_dead_entities
+from ecs.utils.combatants import find_primary_opponent
+
+HEADLESS_TICK = 0.25
+
+
+class SeatedRuleBasedAISystem(RuleBasedAISystem):
+    """Rule-based AI bound to a single owner so two profiles can share a world."""
+
+    def __init__(
+        self,
+        world: World,
+        event_bus: EventBus,
+        seat_owner: int,
+        rng: Optional[random.Random] = None,
+        weights: RuleBasedWeights | None = None,
+    ) -> None:
+        self.seat_owner = seat_owner
+        super().__init__(world, event_bus, rng=rng, weights=weights)
+
+    def _is_ai_owner(self, owner_entity: int) -> bool:
+        return owner_entity == self.seat_owner
+
+
+@dataclass(slots=True)
+class MatchConfig:
+    """Inputs for one headless AI-vs-AI match."""
+
+    seed: int
+    first: RuleBasedWeights = field(default_factory=RuleBasedWeights)
+    second: RuleBasedWeights = field(default_factory=RuleBasedWeights)
+    rows: int = 8
+    cols: int = 8
+    max_turns: int = 120
+    max_ticks: int = 20_000
+    # Deliver nested events FIFO (EventBus.enable_run_to_completion) instead of recursively.
+    run_to_completion: bool = False
+
+
+@dataclass(slots=True)
+class MatchResult:
+    """Outcome of a headless match from the perspective of the first seat."""
+
+    seed: int
+    winner: str | None
+    turns: int
+    ticks: int
+    first_health: int
+    second_health: int
+    # Most entities alive at the end of any tick, after deleted ones are reclaimed.
+    peak_entities: int = 0
+
+    @property
+    def first_score(self) -> float:
+        if self.winner == "first":
+            return 1.0
+        if self.winner == "second":
+            return 0.0
+        return 0.5
+
+
+def play_match(config: MatchConfig) -> MatchResult:
+    """Run a full combat between two rule-based profiles without Arcade.
+
+    The human seat is driven by ``config.first`` and the enemy seat by
+    ``config.second``. All randomness (board generation, refills, AI tie
+    breakers) comes from generators seeded by ``config.seed`` (the world's
+    ``random`` and one per seat), never the shared ``random`` module, and the
+    direct bus backend runs handlers in subscription order, so a seed always
+    replays the same match without disturbing the caller's global RNG.
+    """
+
+    from world import create_world
+
+    bus = EventBus(backend=BACKEND_DIRECT)
+    if config.run_to_completion:
+        bus.enable_run_to_completion()
+    world = create_world(
+        bus,
+        grant_default_player_abilities=True,
+        rng=random.Random(config.seed),
+    )
+    first_owner = next(ent for ent, _ in world.get_component(HumanAgent))
+    second_owner = find_primary_opponent(world, first_owner)
+    if second_owner is None:
+        raise RuntimeError("Self-play requires two combatants")
+    world.add_component(first_owner, RuleBasedAgent(decision_delay=0.0, selection_delay=0.0))
+    agent = world.component_for_entity(second_owner, RuleBasedAgent)
+    agent.decision_delay = 0.0
+    agent.selection_delay = 0.0
+    wire_combat_systems(world, bus, config.rows, config.cols)
+    SeatedRuleBasedAISystem(world, bus, first_owner, rng=random.Random(config.seed * 2 + 1), weights=config.first)
+    SeatedRuleBasedAISystem(world, bus, second_owner, rng=random.Random(config.seed * 2 + 2), weights=config.second)
+
+    turns = {"count": 0}
+
+    def _count_turn(sender, **payload) -> None:
+        turns["count"] += 1
+
+    bus.subscribe(EVENT_TURN_ADVANCED, _count_turn)
+    first_health = world.component_for_entity(first_owner, Health)
+    second_health = world.component_for_entity(second_owner, Health)
+    tick = TickEvent(HEADLESS_TICK)
+    ticks = 0
+    peak_entities = len(world._entities)
+    while ticks < config.max_ticks and turns["count"] < config.max_turns:
+        if first_health.current <= 0 or second_health.current <= 0:
+            break
+        bus.publish(tick)
+        reclaim_dead_entities(world)
+        peak_entities = max(peak_entities, len(world._entities))
+        ticks += 1
+    return MatchResult(
+        seed=config.seed,
+        winner=_winner(first_health, second_health),
+        turns=turns["count"],
+        ticks=ticks,
+        first_health=first_health.current,
+        second_health=second_health.current,
+        peak_entities=peak_entities,
+    )
+
+
+def _winner(first: Health, second: Health) -> str | None:
+    if first.current <= 0 < second.current:
+        return "second"
+    if second.current <= 0 < first.current:
+        return "first"
+    # Unfinished matches fall back to the larger share of remaining health.
+    first_share = first.current / max(1, first.max_hp)
+    second_share = second.current / max(1, second.max_hp)
+    if first_share > second_share:
+        return "first"
+    if second_share > first_share:
+        return "second"
+    return None
+
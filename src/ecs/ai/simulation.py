@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass
 from copy import deepcopy
 from typing import Dict, Iterable, Tuple
@@ -8,6 +9,7 @@ from esper import World
 
 from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.components.ability_effect import AbilityEffects
 from ecs.components.ability_list_owner import AbilityListOwner
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.pending_ability_target import PendingAbilityTarget
@@ -15,6 +17,9 @@ from ecs.components.active_switch import ActiveSwitch
 from ecs.components.active_turn import ActiveTurn
 from ecs.components.board import Board
 from ecs.components.board_position import BoardPosition
+from ecs.components.effect import Effect
+from ecs.components.effect_list import EffectList
+from ecs.components.health import Health
 from ecs.components.human_agent import HumanAgent
 from ecs.components.random_agent import RandomAgent
 from ecs.components.tile import TileType
@@ -22,18 +27,35 @@ from ecs.components.tile_bank import TileBank
 from ecs.components.tile_type_registry import TileTypeRegistry
 from ecs.components.tile_types import TileTypes
 from ecs.components.turn_state import TurnState
-from ecs.events.bus import EventBus
+from ecs.events.bus import BACKEND_DIRECT, EventBus
 from ecs.events.bus import EVENT_ABILITY_EXECUTE
 from ecs.systems.ability_resolution_system import AbilityResolutionSystem
 from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
 from ecs.systems.effects.board_clear_effect_system import BoardClearEffectSystem
 from ecs.systems.effects.board_transform_effect_system import BoardTransformEffectSystem
+from ecs.systems.effects.damage_effect_system import DamageEffectSystem
+from ecs.systems.effects.deplete_effect_system import DepleteEffectSystem
+from ecs.systems.effects.heal_effect_system import HealEffectSystem
+from ecs.systems.effects.mana_drain_effect_system import ManaDrainEffectSystem
+from ecs.systems.effects.thorns_effect_system import ThornsEffectSystem
+from ecs.systems.health_system import HealthSystem
+from ecs.systems.tile_bank_system import TileBankSystem
 from ecs.systems.board_ops import (
+    BoardKey,
+    CascadeCache,
+    apply_cascade_outcome,
+    board_key,
     clear_tiles_with_cascade,
+    default_cascade_cache,
     find_all_matches,
     predict_swap_creates_match,
     swap_tile_types,
 )
+from ecs.resources import resources_of
+from ecs.utils.effect_index import effect_index
+from ecs.utils.queries import QueryWorld
+from ecs.utils.tile_banks import bank_index
+from ecs.utils.tile_codes import tile_codes
 
 BoardPositionType = Tuple[int, int]
 TypeEntry = Tuple[int, int, str]
@@ -46,6 +68,7 @@ DEFAULT_COMPONENTS: Tuple[type, ...] = (
     TileTypes,
     AbilityListOwner,
     Ability,
+    AbilityEffects,
     AbilityTarget,
     AbilityCooldown,
     TileBank,
@@ -53,7 +76,14 @@ DEFAULT_COMPONENTS: Tuple[type, ...] = (
     TurnState,
     HumanAgent,
     RandomAgent,
+    Health,
+    Effect,
+    EffectList,
 )
+# Singletons among the cloned types; the clone's registry is seeded with them.
+_RESOURCE_COMPONENTS = frozenset({Board, TileTypes, ActiveTurn, TurnState})
+# Only read while resolving, so clones share them instead of copying.
+_SHARED_COMPONENTS = frozenset({AbilityEffects})
 
 
 @dataclass(slots=True)
@@ -65,16 +95,26 @@ class CloneState:
     entity_map: Dict[int, int]
     engine: "SimulationEngine"
 
+    def close(self) -> None:
+        """Release the clone's bus handlers once scoring is done with it."""
+        self.engine.close()
+
 
 def clone_world_state(world: World, components: Iterable[type] | None = None) -> CloneState:
     """Create a lightweight cloned world containing only selected components.
 
     A fresh ``EventBus`` is created for the clone so that any future event-driven
-    evaluation stays isolated from the live game's bus.
+    evaluation stays isolated from the live game's bus. Combatant health and the
+    live effects come along (effects only when their owner does), so abilities
+    resolved in the clone see the same modifiers and lethal outcomes that
+    ``project_ability`` computes.
     """
 
     comps = tuple(components) if components is not None else DEFAULT_COMPONENTS
-    clone = World()
+    clone = QueryWorld()
+    clone_resources = resources_of(clone)
+    clone_banks = bank_index(clone)
+    clone_effects = effect_index(clone)
     entity_map: Dict[int, int] = {}
     relevant_entities: set[int] = set()
     for comp_type in comps:
@@ -82,10 +122,18 @@ def clone_world_state(world: World, components: Iterable[type] | None = None) ->
             relevant_entities.add(ent)
     for ent in relevant_entities:
         entity_map[ent] = clone.create_entity()
+    # The clone keeps the source world's tile code table, so its banks and
+    # costs still line up slot by slot with the live ones.
+    codes = tile_codes(world)
     for comp_type in comps:
         for ent, comp in world.get_component(comp_type):
             new_ent = entity_map[ent]
-            new_comp = deepcopy(comp)
+            if comp_type is Effect and comp.owner_entity not in entity_map:
+                continue
+            if comp_type in _SHARED_COMPONENTS:
+                clone.add_component(new_ent, comp)
+                continue
+            new_comp = deepcopy(comp, {id(codes): codes})
             if isinstance(new_comp, AbilityListOwner):
                 new_comp.ability_entities = [
                     entity_map[a]
@@ -98,8 +146,26 @@ def clone_world_state(world: World, components: Iterable[type] | None = None) ->
             elif isinstance(new_comp, ActiveTurn):
                 if new_comp.owner_entity in entity_map:
                     new_comp.owner_entity = entity_map[new_comp.owner_entity]
+            elif isinstance(new_comp, Effect):
+                new_comp.owner_entity = entity_map[new_comp.owner_entity]
+                new_comp.source_entity = entity_map.get(new_comp.source_entity)
+            elif isinstance(new_comp, EffectList):
+                new_comp.effect_entities = [
+                    entity_map[e]
+                    for e in new_comp.effect_entities
+                    if e in entity_map and clone.has_component(entity_map[e], Effect)
+                ]
             clone.add_component(new_ent, new_comp)
-    event_bus = EventBus()
+            if comp_type in _RESOURCE_COMPONENTS:
+                clone_resources.track(new_ent, new_comp)
+            elif comp_type is TileBank:
+                clone_banks.reassign(new_ent, new_comp.owner_entity)
+            elif comp_type is Effect:
+                clone_effects.add(new_ent, new_comp)
+    # Drains pick from the clone's own generator, never the live game's.
+    clone.random = random.Random(0)  # type: ignore[attr-defined]
+    # Scratch bus: no flight recorder, the clone is thrown away after scoring.
+    event_bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=0)
     engine = SimulationEngine(clone, event_bus)
     return CloneState(world=clone, event_bus=event_bus, entity_map=entity_map, engine=engine)
 
@@ -115,15 +181,41 @@ def _find_entity_at(world: World, position: BoardPositionType) -> int | None:
 class SimulationEngine:
     """Utility to execute real game logic inside a cloned world."""
 
-    def __init__(self, world: World, event_bus: EventBus) -> None:
+    def __init__(
+        self,
+        world: World,
+        event_bus: EventBus,
+        cascade_cache: CascadeCache | None = default_cascade_cache,
+    ) -> None:
         self.world = world
         self.event_bus = event_bus
+        # Swap cascades are pure functions of the board; pass None to always recompute.
+        self.cascade_cache = cascade_cache
         # Ability resolution depends on lifecycle + board effect systems.
         self.effect_lifecycle = EffectLifecycleSystem(world, event_bus)
         self.board_clear_effect = BoardClearEffectSystem(world, event_bus, refill_cascades=False)
         self.board_transform_effect = BoardTransformEffectSystem(world, event_bus)
         self.ability_resolution = AbilityResolutionSystem(world, event_bus)
         self.last_action_generated_extra_turn: bool = False
+        self._combat_effects_wired = False
+
+    def close(self) -> None:
+        """Detach the effect lifecycle's handlers, including any expire-on-event ones."""
+        self.effect_lifecycle.close()
+
+    def _wire_combat_effects(self) -> None:
+        # Health and bank effects only matter to abilities; swap-only clones skip them.
+        if self._combat_effects_wired:
+            return
+        self._combat_effects_wired = True
+        world, event_bus = self.world, self.event_bus
+        HealthSystem(world, event_bus)
+        TileBankSystem(world, event_bus)
+        DamageEffectSystem(world, event_bus)
+        HealEffectSystem(world, event_bus)
+        DepleteEffectSystem(world, event_bus)
+        ManaDrainEffectSystem(world, event_bus)
+        ThornsEffectSystem(world, event_bus)
 
     def swap_and_resolve(
         self,
@@ -134,6 +226,11 @@ class SimulationEngine:
     ) -> None:
         """Perform a swap and resolve resulting cascades."""
 
+        if self.cascade_cache is not None:
+            keyed = board_key(self.world)
+            if keyed is not None:
+                self._replay_swap(self.cascade_cache, keyed[0], keyed[1], src, dst, acting_owner)
+                return
         if not predict_swap_creates_match(self.world, src, dst):
             return
         if not swap_tile_types(self.world, src, dst):
@@ -149,6 +246,7 @@ class SimulationEngine:
     ) -> None:
         """Run ability resolution end-to-end inside the clone."""
 
+        self._wire_combat_effects()
         if pending is not None:
             self.world.add_component(ability_entity, pending)
         self.event_bus.emit(
@@ -160,6 +258,31 @@ class SimulationEngine:
         self.last_action_generated_extra_turn = False
         self._resolve_cascades(owner_hint=owner_entity, allow_extra_turn=False)
 
+    def _replay_swap(
+        self,
+        cache: CascadeCache,
+        key: BoardKey,
+        entities: Dict[BoardPositionType, int],
+        src: BoardPositionType,
+        dst: BoardPositionType,
+        acting_owner: int | None,
+    ) -> None:
+        outcome = cache.resolve(key, src, dst)
+        if not outcome.swapped:
+            return
+        self.last_action_generated_extra_turn = any(
+            len(group) >= 4 for step in outcome.steps for group in step.groups
+        )
+        apply_cascade_outcome(self.world, key, entities, outcome)
+        owner_entity = self._active_owner()
+        if owner_entity is None:
+            owner_entity = acting_owner
+        if owner_entity is None:
+            return
+        for step in outcome.steps:
+            if step.typed:
+                self._apply_match_rewards(owner_entity, step.typed)
+
     def _resolve_cascades(self, owner_hint: int | None = None, *, allow_extra_turn: bool) -> None:
         while True:
             matches = find_all_matches(self.world)
@@ -178,10 +301,10 @@ class SimulationEngine:
                     self._apply_match_rewards(owner_entity, typed_before)
 
     def _active_owner(self) -> int | None:
-        active_entries = list(self.world.get_component(ActiveTurn))
-        if not active_entries:
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is None:
             return None
-        return active_entries[0][1].owner_entity
+        return active.owner_entity
 
     def _apply_match_rewards(self, owner_entity: int, typed_entries: list[TypeEntry]) -> None:
         try:
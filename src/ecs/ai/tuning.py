@@ -0,0 +1,235 @@
+"""Self-play tuning of ``RuleBasedWeights`` via successive halving.
+
+Run from ``src``::
+
+    python -m ecs.ai.tuning --candidates 16 --seeds 4 --workers 8 --results tuning.jsonl
+
+Every candidate profile plays seeded headless matches against the baseline
+profile from both seats. Each round keeps the best ``1 / eta`` of the field and
+multiplies the per-candidate seed budget by ``eta``. Every finished evaluation
+is appended to the results file as one JSON line so interrupted runs keep their
+data.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from ecs.ai.self_play import MatchConfig, play_match
+from ecs.systems.rule_based_ai_system import DEFAULT_WEIGHTS, RuleBasedWeights
+
+# The tie breaker only orders equal scores; perturbing it would just add noise.
+TUNABLE_WEIGHTS: tuple[str, ...] = tuple(
+    spec.name for spec in fields(RuleBasedWeights) if spec.name != "random_tie_breaker"
+)
+
+
+@dataclass(slots=True)
+class CandidateScore:
+    """Accumulated self-play record for one weight profile."""
+
+    index: int
+    weights: RuleBasedWeights
+    points: float = 0.0
+    matches: int = 0
+
+    @property
+    def mean(self) -> float:
+        return self.points / self.matches if self.matches else 0.0
+
+
+@dataclass(slots=True)
+class TuningReport:
+    """Summary of a tuning run."""
+
+    best: CandidateScore
+    rounds: List[List[CandidateScore]] = field(default_factory=list)
+    matches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def matches_per_second(self) -> float:
+        return self.matches / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def perturb_weights(
+    base: RuleBasedWeights,
+    rng: random.Random,
+    sigma: float = 0.5,
+    names: Sequence[str] = TUNABLE_WEIGHTS,
+) -> RuleBasedWeights:
+    """Return ``base`` with each named weight scaled by ``exp(N(0, sigma))``.
+
+    Weights span nine orders of magnitude, so multiplicative noise keeps the
+    relative ordering of the big bonuses meaningful while still exploring.
+    """
+
+    values = base.to_dict()
+    for name in names:
+        values[name] = values[name] * math.exp(rng.gauss(0.0, sigma))
+    return RuleBasedWeights.from_dict(values)
+
+
+def evaluate_seed(
+    candidate: Mapping[str, float],
+    baseline: Mapping[str, float],
+    seed: int,
+    max_turns: int = 120,
+) -> Dict[str, Any]:
+    """Play ``candidate`` against ``baseline`` from both seats on one seed.
+
+    Top-level so it can be pickled into worker processes. Returns the points
+    the candidate earned (1 per win, 0.5 per draw) and the match count.
+    """
+
+    cand = RuleBasedWeights.from_dict(candidate)
+    base = RuleBasedWeights.from_dict(baseline)
+    as_first = play_match(MatchConfig(seed=seed, first=cand, second=base, max_turns=max_turns))
+    as_second = play_match(MatchConfig(seed=seed, first=base, second=cand, max_turns=max_turns))
+    return {
+        "seed": seed,
+        "points": as_first.first_score + (1.0 - as_second.first_score),
+        "matches": 2,
+        "turns": as_first.turns + as_second.turns,
+    }
+
+
+def successive_halving(
+    candidates: Sequence[RuleBasedWeights],
+    *,
+    baseline: RuleBasedWeights = DEFAULT_WEIGHTS,
+    seeds_per_candidate: int = 2,
+    eta: int = 2,
+    max_turns: int = 120,
+    seed: int = 0,
+    executor: Optional[Executor] = None,
+    results_path: Optional[Path] = None,
+    evaluate: Callable[..., Dict[str, Any]] = evaluate_seed,
+    log: Callable[[str], None] | None = None,
+) -> TuningReport:
+    """Race ``candidates`` against ``baseline`` and return the survivor.
+
+    Candidates keep their accumulated record between rounds, so later rounds
+    refine rather than replace earlier estimates. Seeds are drawn from a
+    generator seeded with ``seed`` and shared by every candidate within a round
+    so profiles are compared on identical boards.
+    """
+
+    if not candidates:
+        raise ValueError("successive_halving needs at least one candidate")
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    seed_rng = random.Random(seed)
+    field_: List[CandidateScore] = [
+        CandidateScore(index=index, weights=weights) for index, weights in enumerate(candidates)
+    ]
+    report = TuningReport(best=field_[0])
+    baseline_values = baseline.to_dict()
+    budget = max(1, seeds_per_candidate)
+    round_index = 0
+    started = time.perf_counter()
+    while True:
+        seeds = [seed_rng.randrange(1 << 30) for _ in range(budget)]
+        jobs = [(entry, match_seed) for entry in field_ for match_seed in seeds]
+        results = _run_jobs(executor, evaluate, jobs, baseline_values, max_turns)
+        for (entry, match_seed), outcome in zip(jobs, results):
+            entry.points += outcome["points"]
+            entry.matches += outcome["matches"]
+            report.matches += outcome["matches"]
+            if results_path is not None:
+                _append_result(
+                    results_path,
+                    {
+                        "round": round_index,
+                        "candidate": entry.index,
+                        "seed": match_seed,
+                        "points": outcome["points"],
+                        "matches": outcome["matches"],
+                        "weights": entry.weights.to_dict(),
+                    },
+                )
+        ranked = sorted(field_, key=lambda entry: entry.mean, reverse=True)
+        report.rounds.append(list(ranked))
+        report.elapsed = time.perf_counter() - started
+        if log is not None:
+            log(
+                f"round {round_index}: {len(field_)} candidates, best #{ranked[0].index} "
+                f"mean={ranked[0].mean:.3f}, {report.matches_per_second:.2f} matches/s"
+            )
+        if len(ranked) == 1:
+            break
+        field_ = ranked[: max(1, len(ranked) // eta)]
+        budget *= eta
+        round_index += 1
+    report.best = field_[0]
+    return report
+
+
+def _run_jobs(
+    executor: Optional[Executor],
+    evaluate: Callable[..., Dict[str, Any]],
+    jobs: Iterable[tuple[CandidateScore, int]],
+    baseline: Dict[str, float],
+    max_turns: int,
+) -> List[Dict[str, Any]]:
+    jobs = list(jobs)
+    candidate_values = [entry.weights.to_dict() for entry, _ in jobs]
+    seeds = [match_seed for _, match_seed in jobs]
+    baselines = [baseline] * len(jobs)
+    turn_caps = [max_turns] * len(jobs)
+    if executor is None:
+        return list(map(evaluate, candidate_values, baselines, seeds, turn_caps))
+    return list(executor.map(evaluate, candidate_values, baselines, seeds, turn_caps))
+
+
+def _append_result(path: Path, record: Dict[str, Any]) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, sort_keys=True) + "\n")
+        handle.flush()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Tune rule-based AI weights via self-play.")
+    parser.add_argument("--candidates", type=int, default=16, help="initial number of profiles")
+    parser.add_argument("--seeds", type=int, default=2, help="seeds per candidate in the first round")
+    parser.add_argument("--eta", type=int, default=2, help="halving factor between rounds")
+    parser.add_argument("--sigma", type=float, default=0.5, help="log-normal perturbation scale")
+    parser.add_argument("--max-turns", type=int, default=120)
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--results", type=Path, default=Path("tuning_results.jsonl"))
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    # Keep the incumbent in the race so a noisy run can't only return worse profiles.
+    candidates = [DEFAULT_WEIGHTS] + [
+        perturb_weights(DEFAULT_WEIGHTS, rng, args.sigma) for _ in range(max(0, args.candidates - 1))
+    ]
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        report = successive_halving(
+            candidates,
+            seeds_per_candidate=args.seeds,
+            eta=args.eta,
+            max_turns=args.max_turns,
+            seed=args.seed,
+            executor=executor,
+            results_path=args.results,
+            log=print,
+        )
+    print(
+        f"{report.matches} matches in {report.elapsed:.1f}s "
+        f"({report.matches_per_second:.2f} matches/s); results in {args.results}"
+    )
+    print(json.dumps(report.best.weights.to_dict(), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
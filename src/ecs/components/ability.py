@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
+from ecs.components.tile_counts import TileCounts
+
 
 @dataclass(slots=True)
 class Ability:
@@ -9,7 +11,8 @@ class Ability:
     Fields:
       name: Display / reference name.
       kind: Semantic category (e.g., 'active', 'passive', 'special').
-      cost: Mapping of tile type names to counts consumed when activated.
+      cost: Tile counts consumed when activated, keyed by tile type name. Factories
+        build it on the world's code table (``tile_counts``); a plain dict is converted.
       description: Text description of the ability effect (for UI display).
       params: Arbitrary configuration values 
       cooldown: Number of player turns required before re-use.
@@ -18,9 +21,13 @@ class Ability:
 
     name: str
     kind: str
-    cost: Dict[str, int]
+    cost: TileCounts
     description: str = ""
     params: Dict[str, Any] = field(default_factory=dict)
     cooldown: int = 0
     ends_turn: bool = True
     affinity_bonus: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.cost, TileCounts):
+            self.cost = TileCounts(self.cost)
@@ -6,3 +6,4 @@ class FallAnimation:
     src: Tuple[int,int]
     dst: Tuple[int,int]
     linear: float = 0.0  # 0..1
+    eased: float = 0.0  # linear through the ease-in-out curve, filled by AnimationSystem
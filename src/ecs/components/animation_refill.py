@@ -5,3 +5,4 @@ from typing import Tuple
 class RefillAnimation:
     pos: Tuple[int,int]
     linear: float = 0.0
+    eased: float = 0.0
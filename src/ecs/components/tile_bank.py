@@ -1,29 +1,32 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Mapping
+
+from ecs.components.tile_counts import TileCounts
 
 @dataclass(slots=True)
 class TileBank:
-    """Stores accumulated tiles (by tile type name) for an owner entity.
+    """Stores accumulated tiles (by tile type) for an owner entity.
 
     owner_entity: the entity (e.g., player) whose clears contribute.
-    counts: mapping of tile type name -> number of tiles available for spending.
+    counts: code-indexed counts with a tile type name view; banks built by the
+      factories share the world's ``TileCodes`` table, so spending an ability
+      cost on the same table compares slot by slot. A plain dict is converted.
     """
     owner_entity: int
-    counts: Dict[str, int] = field(default_factory=dict)
+    counts: TileCounts = field(default_factory=TileCounts)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.counts, TileCounts):
+            self.counts = TileCounts(self.counts)
 
     def add(self, type_name: str, amount: int = 1):
         if amount <= 0:
             return
-        self.counts[type_name] = self.counts.get(type_name, 0) + amount
+        self.counts.add(type_name, amount)
 
-    def can_spend(self, cost: Dict[str, int]) -> bool:
-        return all(self.counts.get(t, 0) >= n for t, n in cost.items())
+    def can_spend(self, cost: Mapping[str, int]) -> bool:
+        return self.counts.covers(cost)
 
-    def spend(self, cost: Dict[str, int]) -> Dict[str, int]:
+    def spend(self, cost: Mapping[str, int]) -> Dict[str, int]:
         """Attempt to spend cost; returns missing dict if insufficient else empty dict."""
-        missing = {t: n - self.counts.get(t, 0) for t, n in cost.items() if self.counts.get(t, 0) < n}
-        if missing:
-            return missing
-        for t, n in cost.items():
-            self.counts[t] -= n
-        return {}
+        return self.counts.take(cost)
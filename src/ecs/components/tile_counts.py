@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Mapping, Tuple
+
+
+class TileCodes:
+    """Name <-> small integer code table for one world's tile types.
+
+    ``TileTypes`` owns the table and registers every type it defines. Codes
+    are handed out in first-seen order, so ``create_world`` assigns some while
+    building the combatants' costs, before the registry exists; the order is
+    the same for every world built the same way. Codes are never reused, so
+    count arrays built on the table stay valid as it grows. Deep copies are independent tables;
+    ``clone_world_state`` keeps its clones on the source world's table.
+    """
+
+    __slots__ = ("names", "_codes")
+
+    def __init__(self, names: Mapping[str, object] | List[str] | None = None) -> None:
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for name in names or ():
+            self.code_for(name)
+
+    def code_for(self, name: str) -> int:
+        """The code for ``name``, assigning the next one if it is new."""
+
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(name)
+            self._codes[name] = code
+        return code
+
+    def lookup(self, name: str) -> int | None:
+        return self._codes.get(name)
+
+    def name_for(self, code: int) -> str:
+        return self.names[code]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"TileCodes({self.names!r})"
+
+
+class TileCounts(MutableMapping):
+    """Tile counts stored in a list indexed by ``TileCodes`` code.
+
+    The string view behaves like ``collections.Counter``: reading any name
+    gives its count (0 when absent) and only non-zero counts are listed, so
+    ``len``, iteration, truthiness and equality with a plain dict all ignore
+    types at zero. Writing a name the table has not seen assigns it a code.
+
+    Counts on the same table compare and spend slot by slot. The required side
+    of a comparison (usually an ability cost) walks its non-zero
+    ``(code, amount)`` pairs, cached until the counts change, so a sparse cost
+    does not scan every slot. Counts on different tables fall back to names.
+    """
+
+    __slots__ = ("codes", "amounts", "_nonzero")
+
+    def __init__(
+        self,
+        counts: Mapping[str, int] | None = None,
+        *,
+        codes: TileCodes | None = None,
+    ) -> None:
+        self.codes = codes if codes is not None else TileCodes()
+        self._nonzero: Tuple[Tuple[int, int], ...] | None = None
+        if type(counts) is TileCounts and counts.codes is self.codes:
+            self.amounts: List[int] = list(counts.amounts)
+            return
+        self.amounts = [0] * len(self.codes)
+        if counts:
+            for name, amount in counts.items():
+                self[name] = amount
+
+    # String view -----------------------------------------------------------
+
+    def __getitem__(self, name: str) -> int:
+        code = self.codes.lookup(name)
+        if code is None or code >= len(self.amounts):
+            return 0
+        return self.amounts[code]
+
+    def __setitem__(self, name: str, amount: int) -> None:
+        self.amounts[self._slot(name)] = amount
+
+    def __delitem__(self, name: str) -> None:
+        code = self.codes.lookup(name)
+        if code is not None and code < len(self.amounts):
+            self.amounts[code] = 0
+            self._nonzero = None
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self[name] != 0
+
+    def __iter__(self) -> Iterator[str]:
+        names = self.codes.names
+        return (names[code] for code, amount in enumerate(self.amounts) if amount)
+
+    def __len__(self) -> int:
+        return len(self.amounts) - self.amounts.count(0)
+
+    def get(self, name: str, default=None):  # type: ignore[override]
+        amount = self[name]
+        return amount if amount else default
+
+    def clear(self) -> None:
+        amounts = self.amounts
+        amounts[:] = [0] * len(amounts)
+        self._nonzero = None
+
+    def copy(self) -> Dict[str, int]:
+        """A plain dict of the non-zero counts (event payloads and saves)."""
+
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"TileCounts({self.copy()!r})"
+
+    # Code-indexed operations -------------------------------------------------
+
+    def add(self, name: str, amount: int) -> None:
+        self.amounts[self._slot(name)] += amount
+
+    def nonzero(self) -> Tuple[Tuple[int, int], ...]:
+        """``(code, amount)`` for every non-zero slot, in code order."""
+
+        pairs = self._nonzero
+        if pairs is None:
+            pairs = tuple((code, amount) for code, amount in enumerate(self.amounts) if amount)
+            self._nonzero = pairs
+        return pairs
+
+    def aligned(self, codes: TileCodes) -> List[int]:
+        """Counts as a list indexed by ``codes`` and as long as it; read-only.
+
+        On the same table this is ``amounts`` itself unless it needs padding.
+        """
+
+        if codes is self.codes:
+            amounts = self.amounts
+            if len(amounts) == len(codes):
+                return amounts
+            return amounts + [0] * (len(codes) - len(amounts))
+        aligned = [0] * len(codes)
+        for name, amount in self.items():
+            code = codes.code_for(name)
+            if code >= len(aligned):
+                aligned.extend([0] * (code + 1 - len(aligned)))
+            aligned[code] = amount
+        return aligned
+
+    def covers(self, need: Mapping[str, int]) -> bool:
+        """True when every count in ``need`` is available here."""
+
+        if type(need) is TileCounts and need.codes is self.codes:
+            have = self.amounts
+            size = len(have)
+            for code, amount in need.nonzero():
+                if code >= size or have[code] < amount:
+                    return False
+            return True
+        return all(self[name] >= amount for name, amount in need.items())
+
+    def shortfall(self, need: Mapping[str, int]) -> Dict[str, int]:
+        """Names and amounts by which ``need`` exceeds these counts."""
+
+        return {name: amount - self[name] for name, amount in need.items() if self[name] < amount}
+
+    def take(self, need: Mapping[str, int]) -> Dict[str, int]:
+        """Subtract ``need`` if it is covered; otherwise return the shortfall."""
+
+        if not self.covers(need):
+            return self.shortfall(need)
+        if type(need) is TileCounts and need.codes is self.codes:
+            have = self.amounts
+            for code, amount in need.nonzero():
+                have[code] -= amount
+            self._nonzero = None
+        else:
+            for name, amount in need.items():
+                self.add(name, -amount)
+        return {}
+
+    def _slot(self, name: str) -> int:
+        """Code for ``name``, growing the list to the table; marks the counts changed."""
+
+        code = self.codes._codes.get(name)
+        if code is None:
+            code = self.codes.code_for(name)
+        amounts = self.amounts
+        if code >= len(amounts):
+            amounts.extend([0] * (len(self.codes) - len(amounts)))
+        self._nonzero = None
+        return code
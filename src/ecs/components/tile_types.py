@@ -1,16 +1,22 @@
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, Tuple, List
 
+from ecs.components.tile_counts import TileCodes
+
 @dataclass(slots=True)
 class TileTypes:
     """Canonical tile type definitions stored on a single entity.
 
     This component lives alongside TileTypeRegistry (tag) and provides mapping utilities.
+    It owns the world's ``TileCodes`` table and registers every defined type in it.
     """
     types: Dict[str, Tuple[int,int,int]]
     spawnable: List[str] = field(default_factory=list)
+    codes: TileCodes = field(default_factory=TileCodes)
 
     def __post_init__(self) -> None:
+        for name in self.types:
+            self.codes.code_for(name)
         if self.spawnable:
             # Preserve order while filtering unknown types.
             seen: set[str] = set()
@@ -57,6 +63,7 @@ class TileTypes:
 
     def register_type(self, type_name: str, color: Tuple[int, int, int], *, spawnable: bool = True) -> None:
         self.types[type_name] = color
+        self.codes.code_for(type_name)
         if spawnable:
             self.enable_type(type_name)
         elif type_name in self.spawnable:
@@ -0,0 +1,221 @@
+"""Micro-benchmarks for the effect lifecycle.
+
+Run from ``src``::
+
+    python -m ecs.effects.benchmark --effects 600 --turns 400 --applies 20000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from ecs.components.board_position import BoardPosition
+from ecs.components.effect import Effect
+from ecs.components.effect_duration import EffectDuration
+from ecs.components.human_agent import HumanAgent
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.events.bus import (
+    BACKEND_DIRECT,
+    EVENT_EFFECT_APPLY,
+    EVENT_EFFECT_EXPIRED,
+    EVENT_TURN_ADVANCED,
+    EventBus,
+)
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+
+# (turn, effect entity, owner, reason)
+ExpiryRecord = Tuple[int, int, int, str]
+
+
+class ScanExpiryLifecycle(EffectLifecycleSystem):
+    """Lifecycle with the original turn handler: scan every timed effect in the world."""
+
+    def on_turn_advanced(self, sender, **kwargs):
+        previous_owner = kwargs.get("previous_owner")
+        if previous_owner is None:
+            return
+        for effect_entity, (effect, duration) in list(self.world.get_components(Effect, EffectDuration)):
+            if effect.owner_entity != previous_owner:
+                continue
+            duration.remaining_turns -= 1
+            if duration.remaining_turns <= 0:
+                self._expire_effect(effect_entity, reason="duration")
+
+
+@dataclass(slots=True)
+class TurnAdvanceReport:
+    live_effects: int
+    turns: int
+    scan_ms: float
+    wheel_ms: float
+    scan_expiries: List[ExpiryRecord]
+    wheel_expiries: List[ExpiryRecord]
+
+    @property
+    def speedup(self) -> float:
+        return self.scan_ms / self.wheel_ms if self.wheel_ms else float("inf")
+
+    @property
+    def same_expiries(self) -> bool:
+        """Both handlers expired the same effects on the same turns."""
+
+        return sorted(self.scan_expiries) == sorted(self.wheel_expiries)
+
+
+def _run_turns(lifecycle_type: type, effects: int, turns: int, seed: int) -> Tuple[float, List[ExpiryRecord]]:
+    from ecs.systems.board import BoardSystem
+    from world import create_world
+
+    rng = random.Random(seed)
+    outer_state = random.getstate()
+    random.seed(seed)
+    try:
+        bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=0)
+        world = create_world(bus, rng=random.Random(seed))
+        BoardSystem(world, bus)
+        lifecycle_type(world, bus)
+    finally:
+        random.setstate(outer_state)
+    player = next(ent for ent, _ in world.get_component(HumanAgent))
+    enemy = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    tiles = [ent for ent, _ in world.get_component(BoardPosition)]
+
+    def apply_one() -> None:
+        roll = rng.random()
+        if roll < 0.2:
+            # Tile statuses: timed, but owned by tiles that never take a turn.
+            owner = rng.choice(tiles)
+        else:
+            owner = player if roll < 0.6 else enemy
+        bus.emit(
+            EVENT_EFFECT_APPLY,
+            owner_entity=owner,
+            slug=rng.choice(("poison", "bleeding", "damage_bonus", "frailty", "thorns")),
+            turns=rng.randint(0, 40),
+            metadata={"bench": True},
+            allow_multiple=True,
+        )
+
+    expiries: List[ExpiryRecord] = []
+    clock = [0]
+    bus.subscribe(
+        EVENT_EFFECT_EXPIRED,
+        lambda sender, **payload: expiries.append(
+            (clock[0], payload["effect_entity"], payload["owner_entity"], payload["reason"])
+        ),
+    )
+    for _ in range(effects):
+        apply_one()
+    elapsed = 0.0
+    owners = (player, enemy)
+    for turn in range(turns):
+        clock[0] = turn
+        start = time.perf_counter()
+        bus.emit(EVENT_TURN_ADVANCED, previous_owner=owners[turn % 2], new_owner=owners[(turn + 1) % 2])
+        elapsed += time.perf_counter() - start
+        # Keep the population steady: reclaim deleted entities, then replace what expired.
+        world._clear_dead_entities()
+        for _ in range(max(0, effects - len(world.get_component(Effect)))):
+            apply_one()
+    return elapsed * 1000 / max(turns, 1), expiries
+
+
+def measure_turn_advance(effects: int = 600, turns: int = 400, seed: int = 7) -> TurnAdvanceReport:
+    """Per-turn cost of duration expiry with the full scan vs. the per-owner wheel."""
+
+    scan_ms, scan_expiries = _run_turns(ScanExpiryLifecycle, effects, turns, seed)
+    wheel_ms, wheel_expiries = _run_turns(EffectLifecycleSystem, effects, turns, seed)
+    return TurnAdvanceReport(effects, turns, scan_ms, wheel_ms, scan_expiries, wheel_expiries)
+
+
+@dataclass(slots=True)
+class ApplyReport:
+    applies: int
+    elapsed_ms: float
+    expiries: int
+
+    @property
+    def us_per_apply(self) -> float:
+        return self.elapsed_ms * 1000 / max(self.applies, 1)
+
+
+def measure_apply_throughput(applies: int = 20000, seed: int = 7) -> ApplyReport:
+    """Cost of ``EVENT_EFFECT_APPLY`` in a poison/bleed-heavy fight.
+
+    Both sides trade poison and bleeding stacks plus immediate damage hits,
+    with a turn advance every ten applications so poison ticks consume stacks.
+    Only the apply emits are timed.
+    """
+
+    from ecs.systems.effects.bleeding_effect_system import BleedingEffectSystem
+    from ecs.systems.effects.damage_effect_system import DamageEffectSystem
+    from ecs.systems.effects.poison_effect_system import PoisonEffectSystem
+    from world import create_world
+
+    rng = random.Random(seed)
+    outer_state = random.getstate()
+    random.seed(seed)
+    try:
+        bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=0)
+        world = create_world(bus, rng=random.Random(seed))
+        EffectLifecycleSystem(world, bus)
+        DamageEffectSystem(world, bus)
+        PoisonEffectSystem(world, bus)
+        BleedingEffectSystem(world, bus)
+    finally:
+        random.setstate(outer_state)
+    player = next(ent for ent, _ in world.get_component(HumanAgent))
+    enemy = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    expiries = [0]
+    bus.subscribe(EVENT_EFFECT_EXPIRED, lambda sender, **payload: expiries.__setitem__(0, expiries[0] + 1))
+
+    elapsed = 0.0
+    for index in range(applies):
+        source, target = (player, enemy) if index % 2 else (enemy, player)
+        roll = rng.random()
+        if roll < 0.45:
+            kwargs = dict(slug="poison", count=rng.randint(1, 3), metadata={"source_owner": source})
+        elif roll < 0.8:
+            kwargs = dict(slug="bleeding", count=rng.randint(1, 2), metadata={"source_owner": source})
+        else:
+            kwargs = dict(slug="damage", turns=0, metadata={"amount": 1, "source_owner": source})
+        start = time.perf_counter()
+        bus.emit(EVENT_EFFECT_APPLY, owner_entity=target, source_entity=source, **kwargs)
+        elapsed += time.perf_counter() - start
+        if index % 10 == 9:
+            bus.emit(EVENT_TURN_ADVANCED, previous_owner=source, new_owner=target)
+            world._clear_dead_entities()
+    return ApplyReport(applies, elapsed * 1000, expiries[0])
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark effect lifecycle hot paths.")
+    parser.add_argument("--effects", type=int, default=600, help="live timed effects kept on the world")
+    parser.add_argument("--turns", type=int, default=400)
+    parser.add_argument("--applies", type=int, default=20000, help="effect applications in the fight benchmark")
+    args = parser.parse_args(argv)
+    report = measure_turn_advance(args.effects, args.turns)
+    if report.scan_expiries == report.wheel_expiries:
+        same = "identical expiries and order"
+    elif report.same_expiries:
+        same = "identical expiries per turn"
+    else:
+        same = "DIFFERENT expiries"
+    print(
+        f"turn advance with {report.live_effects} live effects: scan {report.scan_ms:.3f} ms, "
+        f"wheel {report.wheel_ms:.3f} ms ({report.speedup:.1f}x); "
+        f"{len(report.wheel_expiries)} expiries, {same}"
+    )
+    applied = measure_apply_throughput(args.applies)
+    print(
+        f"effect apply in a poison/bleed fight: {applied.applies} applies in {applied.elapsed_ms:.1f} ms "
+        f"({applied.us_per_apply:.2f} us each), {applied.expiries} expiries"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
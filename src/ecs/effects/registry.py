@@ -1,7 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, Mapping
+from typing import Any, Iterable, Mapping
+
+# Keys that configure how an effect is applied rather than what it does. They
+# may appear in ``default_metadata`` or in an apply override, but never reach
+# the live effect's metadata. ``turns`` is read the same way yet stays in the
+# metadata, where effect systems look for it.
+CONTROL_KEYS = frozenset(
+    {
+        "allow_multiple",
+        "cumulative",
+        "count",
+        "stack_key",
+        "expire_on_events",
+        "expire_match_owner",
+        "expire_payload_owner_key",
+    }
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,16 +35,99 @@ class EffectDefinition:
     default_metadata: Mapping[str, object] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class EffectTemplate:
+    """An effect definition compiled for application.
+
+    Control keys are split out of the default metadata and normalised once,
+    and tags become flags, so applying an effect only copies ``metadata`` and
+    merges the caller's override into it.
+    """
+
+    slug: str
+    metadata: Mapping[str, Any]
+    allow_multiple: bool = True
+    cumulative: bool = False
+    count: int = 0
+    stack_key: str | None = None
+    expire_on_events: tuple[str, ...] = ()
+    expire_match_owner: bool = False
+    expire_payload_owner_key: str = "owner_entity"
+    # Set by the "cumulative" tag: the effect stacks even if a caller says otherwise.
+    always_cumulative: bool = False
+    definition: EffectDefinition | None = None
+
+    def instantiate(self, override: Mapping[str, Any] | None) -> tuple[EffectTemplate, dict[str, Any]]:
+        """Metadata for one application, and the template it should follow.
+
+        The template differs from ``self`` only when ``override`` carries
+        control keys of its own.
+        """
+
+        if not override:
+            return self, dict(self.metadata)
+        if CONTROL_KEYS.isdisjoint(override):
+            metadata = dict(self.metadata)
+            metadata.update(override)
+            return self, metadata
+        defaults = self.definition.default_metadata if self.definition is not None else {}
+        template = compile_effect(self.slug, self.definition, {**defaults, **override})
+        return template, dict(template.metadata)
+
+
+def compile_effect(
+    slug: str,
+    definition: EffectDefinition | None,
+    metadata: Mapping[str, Any] | None = None,
+) -> EffectTemplate:
+    """Build the template for ``slug`` from ``metadata`` (the definition's defaults if omitted)."""
+
+    if metadata is None:
+        metadata = definition.default_metadata if definition is not None else {}
+    values = dict(metadata)
+    controls = {key: values.pop(key) for key in CONTROL_KEYS if key in values}
+    allow_multiple = controls.get("allow_multiple")
+    expire_on_events = controls.get("expire_on_events")
+    tagged_cumulative = definition is not None and "cumulative" in definition.tags
+    return EffectTemplate(
+        slug=slug,
+        metadata=values,
+        allow_multiple=True if allow_multiple is None else bool(allow_multiple),
+        cumulative=tagged_cumulative or bool(controls.get("cumulative", False)),
+        count=coerce_count(controls.get("count")),
+        stack_key=controls.get("stack_key"),  # type: ignore[arg-type]
+        expire_on_events=tuple(expire_on_events) if expire_on_events else (),  # type: ignore[arg-type]
+        expire_match_owner=bool(controls.get("expire_match_owner", False)),
+        expire_payload_owner_key=controls.get("expire_payload_owner_key", "owner_entity"),  # type: ignore[arg-type]
+        always_cumulative=tagged_cumulative,
+        definition=definition,
+    )
+
+
+def coerce_count(value: object) -> int:
+    """Stack count from a loosely typed value: missing, invalid or negative counts are 0."""
+
+    if value is None:
+        return 0
+    try:
+        count = int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return 0
+    return max(0, count)
+
+
 class EffectRegistry:
     """In-memory collection of effect definitions."""
 
     def __init__(self) -> None:
         self._definitions: dict[str, EffectDefinition] = {}
+        self._templates: dict[str, EffectTemplate] = {}
 
     def register(self, definition: EffectDefinition) -> None:
         if definition.slug in self._definitions:
             raise ValueError(f"Effect '{definition.slug}' already registered")
         self._definitions[definition.slug] = definition
+        self._templates[definition.slug] = compile_effect(definition.slug, definition)
 
     def get(self, slug: str) -> EffectDefinition:
         try:
@@ -36,6 +135,14 @@ class EffectRegistry:
         except KeyError as exc:
             raise KeyError(f"Effect '{slug}' is not registered") from exc
 
+    def template(self, slug: str) -> EffectTemplate:
+        """The compiled template for ``slug``; unregistered slugs get a bare one."""
+
+        template = self._templates.get(slug)
+        if template is None:
+            template = self._templates[slug] = compile_effect(slug, None)
+        return template
+
     def has(self, slug: str) -> bool:
         return slug in self._definitions
 
@@ -0,0 +1,108 @@
+"""Off-thread delivery for ``EventBus.subscribe_async`` handlers.
+
+One daemon thread per bus runs async handlers in emit order, so a handler
+that writes a file sees its writes land in the order the game raised them.
+The queue is bounded: when the worker falls ``capacity`` events behind, the
+emitting thread blocks until a slot frees up (``waits`` counts those stalls)
+instead of letting memory grow without limit. Handlers get the emit's kwargs
+as-is, so emitters should pass snapshots rather than live components.
+
+The thread is a daemon and nothing stops it at interpreter exit: whoever owns
+the bus calls ``close`` (``EventBus.close_async``) so queued writes land.
+"""
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+import traceback
+from typing import Any, Callable, Dict, List, Tuple
+
+DEFAULT_ASYNC_CAPACITY = 256
+
+_STOP = object()
+
+
+class AsyncWorker:
+    """Single worker thread draining a bounded FIFO of handler calls."""
+
+    def __init__(self, capacity: int = DEFAULT_ASYNC_CAPACITY, name: str = "event-bus-async") -> None:
+        if capacity <= 0:
+            raise ValueError("Async worker capacity must be positive")
+        self.capacity = capacity
+        self.name = name
+        self.submitted = 0
+        self.waits = 0
+        self.errors: List[Tuple[str, BaseException]] = []
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=capacity)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        # Submitted calls that have not finished running; flush waits for zero.
+        self._pending = 0
+        self._idle = threading.Condition()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, fn: Callable[..., Any], sender: Any, payload: Dict[str, Any]) -> None:
+        if self._thread is None:
+            self._start()
+        item = (fn, sender, payload)
+        self.submitted += 1
+        with self._idle:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.waits += 1
+            self._queue.put(item)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted call has run; False if ``timeout`` expired first."""
+
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush, then stop the thread; a later ``submit`` starts a new one."""
+
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return True
+            self._thread = None
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread = thread
+        thread.start()
+
+    def _run(self) -> None:
+        pending = self._queue
+        idle = self._idle
+        while True:
+            item = pending.get()
+            if item is _STOP:
+                return
+            fn, sender, payload = item
+            try:
+                fn(sender, **payload)
+            except Exception as exc:
+                from ecs.events.profiling import handler_label
+
+                label = handler_label(fn)
+                self.errors.append((label, exc))
+                print(f"Exception in async event handler {label}:", file=sys.stderr)
+                traceback.print_exception(exc)
+            finally:
+                with idle:
+                    self._pending -= 1
+                    if not self._pending:
+                        idle.notify_all()
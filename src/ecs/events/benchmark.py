@@ -0,0 +1,319 @@
+"""Micro-benchmarks for ``EventBus`` backends.
+
+Run from ``src``::
+
+    python -m ecs.events.benchmark --handlers 10 --emits 200000
+    python -m ecs.events.benchmark --cascades 50
+    python -m ecs.events.benchmark --flight-recorder
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+from ecs.events.bus import (
+    BACKEND_DIRECT,
+    EVENT_BOARD_CHANGED,
+    EVENT_BUS_BACKENDS,
+    EVENT_TICK,
+    EventBus,
+    _TypedReceiver,
+)
+from ecs.events.payloads import EventPayload, TickEvent
+
+
+class _Receiver:
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def on_tick(self, sender, **payload) -> None:
+        self.calls += 1
+
+
+def build_bus(backend: str, handlers: int) -> EventBus:
+    bus = EventBus(backend=backend)
+    for _ in range(handlers):
+        bus.subscribe(EVENT_TICK, _Receiver().on_tick)
+    return bus
+
+
+def measure_emit_rate(bus: EventBus, emits: int, name: str = EVENT_TICK) -> float:
+    """Return emits per second for ``emits`` calls of ``bus.emit(name, dt=...)``."""
+
+    emit = bus.emit
+    start = time.perf_counter()
+    for _ in range(emits):
+        emit(name, dt=0.016)
+    elapsed = time.perf_counter() - start
+    return emits / elapsed if elapsed > 0 else float("inf")
+
+
+def compare_backends(handlers: int = 10, emits: int = 100_000, repeats: int = 3) -> Dict[str, float]:
+    """Best-of-``repeats`` emits/second for every backend."""
+
+    rates: Dict[str, float] = {}
+    for backend in EVENT_BUS_BACKENDS:
+        bus = build_bus(backend, handlers)
+        rates[backend] = max(measure_emit_rate(bus, emits) for _ in range(repeats))
+    return rates
+
+
+class _PayloadCountingBus(EventBus):
+    """Direct bus that counts payload containers (kwargs dicts and event objects).
+
+    With ``typed=False`` every ``publish`` is downgraded to a kwargs ``emit``,
+    which is how the hot events were delivered before typed payloads.
+    """
+
+    def __init__(self, typed: bool) -> None:
+        # Counting hooks _emit_direct, which the flight-recorded emit bypasses.
+        super().__init__(backend=BACKEND_DIRECT, flight_recorder_size=0)
+        self.typed = typed
+        self.payloads = 0
+
+    def _emit_direct(self, name: str, **payload):
+        handlers = self._handlers.get(name, ())
+        # The caller's kwargs dict, a fresh one per ``**payload`` call, and the
+        # object ``from_payload`` builds for typed receivers.
+        self.payloads += 1 + len(handlers)
+        self.payloads += sum(1 for fn in handlers if type(fn) is _TypedReceiver)
+        super()._emit_direct(name, **payload)
+
+    def publish(self, event: EventPayload):
+        if not self.typed:
+            self._emit_direct(event.name, **event.as_payload())
+            return
+        handlers = self._handlers.get(event.name, ())
+        legacy = sum(1 for fn in handlers if type(fn) is not _TypedReceiver)
+        self.payloads += 1 + (legacy + 1 if legacy else 0)
+        super().publish(event)
+
+
+@dataclass(slots=True)
+class CascadePayloadReport:
+    cascades: int
+    kwargs_payloads: int
+    typed_payloads: int
+    kwargs_seconds: float
+    typed_seconds: float
+
+    @property
+    def reduction(self) -> float:
+        if not self.kwargs_payloads:
+            return 0.0
+        return 1.0 - self.typed_payloads / self.kwargs_payloads
+
+
+def _run_cascades(bus: EventBus, cascades: int, seed: int) -> int:
+    from ecs.systems.wiring import wire_combat_systems
+    from ecs.components.animation_fade import FadeAnimation
+    from ecs.components.animation_fall import FallAnimation
+    from ecs.components.animation_refill import RefillAnimation
+    from ecs.components.tile import TileType
+    from ecs.systems.board_ops import find_valid_swaps
+    from world import create_world
+
+    # Seed the refill RNG for repeatable cascades without disturbing the caller's sequence.
+    outer_state = random.getstate()
+    random.seed(seed)
+    try:
+        world = create_world(bus, grant_default_player_abilities=False, rng=random.Random(seed))
+        board = wire_combat_systems(world, bus, 8, 8)["board"]
+        tick = TickEvent(0.25)
+        ran = 0
+        for _ in range(cascades):
+            swaps = find_valid_swaps(world)
+            if not swaps:
+                break
+            (r1, c1), (r2, c2) = swaps[0]
+            first = world.component_for_entity(board._get_entity_at(r1, c1), TileType)
+            second = world.component_for_entity(board._get_entity_at(r2, c2), TileType)
+            first.type_name, second.type_name = second.type_name, first.type_name
+            bus.emit(EVENT_BOARD_CHANGED, reason="benchmark")
+            for _ in range(500):
+                bus.publish(tick)
+                if not any(
+                    world.get_component(kind) for kind in (FadeAnimation, FallAnimation, RefillAnimation)
+                ):
+                    break
+            ran += 1
+    finally:
+        random.setstate(outer_state)
+    return ran
+
+
+def measure_cascade_payloads(cascades: int = 20, seed: int = 7) -> CascadePayloadReport:
+    """Resolve the same seeded cascades with kwargs delivery and with typed payloads."""
+
+    results = {}
+    _run_cascades(_PayloadCountingBus(True), 1, seed)  # warm imports and caches
+    for typed in (False, True):
+        bus = _PayloadCountingBus(typed)
+        start = time.perf_counter()
+        ran = _run_cascades(bus, cascades, seed)
+        results[typed] = (ran, bus.payloads, time.perf_counter() - start)
+    (ran, kwargs_payloads, kwargs_seconds), (_, typed_payloads, typed_seconds) = results[False], results[True]
+    return CascadePayloadReport(ran, kwargs_payloads, typed_payloads, kwargs_seconds, typed_seconds)
+
+
+@dataclass(slots=True)
+class FlightRecorderOverhead:
+    emit_ns_bare: float
+    emit_ns_recorded: float
+    cascade_ms_bare: float
+    cascade_ms_recorded: float
+
+    @property
+    def emit_overhead(self) -> float:
+        return self.emit_ns_recorded / self.emit_ns_bare - 1.0
+
+    @property
+    def cascade_overhead(self) -> float:
+        return self.cascade_ms_recorded / self.cascade_ms_bare - 1.0
+
+
+def measure_flight_recorder_overhead(
+    handlers: int = 10,
+    emits: int = 50_000,
+    cascades: int = 10,
+    repeats: int = 5,
+    seed: int = 7,
+) -> FlightRecorderOverhead:
+    """Best-of-``repeats`` cost with and without the flight recorder, interleaved.
+
+    The micro figure uses trivial handlers; the cascade figure resolves real
+    seeded cascades through the headless systems.
+    """
+
+    sizes = (0, None)
+    buses = {}
+    for size in sizes:
+        bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=size)
+        for _ in range(handlers):
+            bus.subscribe(EVENT_TICK, _Receiver().on_tick)
+        buses[size] = bus
+    emit_ns = {size: float("inf") for size in sizes}
+    cascade_ms = {size: float("inf") for size in sizes}
+    _run_cascades(EventBus(backend=BACKEND_DIRECT), 1, seed)  # warm imports and caches
+    for _ in range(repeats):
+        for size in sizes:
+            emit_ns[size] = min(emit_ns[size], 1e9 / measure_emit_rate(buses[size], emits))
+            bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=size)
+            start = time.perf_counter()
+            ran = _run_cascades(bus, cascades, seed)
+            cascade_ms[size] = min(cascade_ms[size], (time.perf_counter() - start) * 1000 / max(ran, 1))
+    return FlightRecorderOverhead(emit_ns[0], emit_ns[None], cascade_ms[0], cascade_ms[None])
+
+
+@dataclass(slots=True)
+class SingleHandlerOverhead:
+    emit_ns_bare: float
+    emit_ns_recorded: float
+    handler_ns: float
+    cheapest_event: str
+    cheapest_handler_ns: float
+
+    @property
+    def recorder_ns(self) -> float:
+        return max(0.0, self.emit_ns_recorded - self.emit_ns_bare)
+
+    @property
+    def overhead(self) -> float:
+        return self.recorder_ns / (self.emit_ns_bare + self.handler_ns)
+
+    @property
+    def worst_overhead(self) -> float:
+        return self.recorder_ns / (self.emit_ns_bare + self.cheapest_handler_ns)
+
+
+def measure_single_handler_overhead(
+    emits: int = 200_000,
+    cascades: int = 10,
+    repeats: int = 7,
+    seed: int = 7,
+) -> SingleHandlerOverhead:
+    """Flight recorder cost on one-subscriber emits, relative to the game's own.
+
+    The recorder's fixed cost is the best-of-``repeats`` difference between
+    recorded and bare emits to one no-op handler, interleaved so drift hits
+    both. It is set against the one-subscriber events of seeded headless
+    cascades, timed by the profiler: their mean handler time per emit, and
+    the cheapest event's as the worst case.
+    """
+
+    sizes = (0, None)
+    buses = {}
+    for size in sizes:
+        bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=size)
+        bus.subscribe(EVENT_TICK, _Receiver().on_tick)
+        buses[size] = bus
+    emit_ns = {size: float("inf") for size in sizes}
+    for _ in range(repeats):
+        for size in sizes:
+            emit_ns[size] = min(emit_ns[size], 1e9 / measure_emit_rate(buses[size], emits))
+
+    _run_cascades(EventBus(backend=BACKEND_DIRECT), 1, seed)  # warm imports and caches
+    bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=0)
+    profiler = bus.enable_profiling()
+    _run_cascades(bus, cascades, seed)
+    single = [
+        (name, stats)
+        for name, stats in profiler.events.items()
+        if stats.emits and len(tuple(bus.receivers(name))) == 1
+    ]
+    total = sum(stats.total for _, stats in single)
+    count = sum(stats.emits for _, stats in single)
+    cheapest, stats = min(single, key=lambda item: item[1].total / item[1].emits, default=("", None))
+    return SingleHandlerOverhead(
+        emit_ns[0],
+        emit_ns[None],
+        total / count * 1e9 if count else 0.0,
+        cheapest,
+        stats.total / stats.emits * 1e9 if stats is not None else 0.0,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark EventBus emit throughput.")
+    parser.add_argument("--handlers", type=int, default=10, help="subscribers on the emitted event")
+    parser.add_argument("--emits", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--cascades", type=int, default=0, help="also compare payload allocations over N cascades")
+    parser.add_argument("--flight-recorder", action="store_true", help="also measure flight recorder overhead")
+    args = parser.parse_args(argv)
+    if args.flight_recorder:
+        overhead = measure_flight_recorder_overhead(args.handlers)
+        print(
+            f"flight recorder: emit {overhead.emit_ns_bare:.0f} -> {overhead.emit_ns_recorded:.0f} ns "
+            f"({overhead.emit_overhead:+.1%}); cascade {overhead.cascade_ms_bare:.2f} -> "
+            f"{overhead.cascade_ms_recorded:.2f} ms ({overhead.cascade_overhead:+.1%})"
+        )
+        single = measure_single_handler_overhead()
+        print(
+            f"flight recorder, one handler: +{single.recorder_ns:.0f} ns per emit, "
+            f"{single.overhead:.2%} of a cascade's mean one-handler emit "
+            f"({(single.emit_ns_bare + single.handler_ns) / 1000:.1f} us); "
+            f"{single.worst_overhead:.2%} of the cheapest ({single.cheapest_event})"
+        )
+    if args.cascades:
+        report = measure_cascade_payloads(args.cascades)
+        per = max(report.cascades, 1)
+        print(
+            f"payloads/cascade: kwargs {report.kwargs_payloads / per:.1f}, "
+            f"typed {report.typed_payloads / per:.1f} ({report.reduction:.0%} fewer); "
+            f"{report.kwargs_seconds * 1000 / per:.2f} ms vs {report.typed_seconds * 1000 / per:.2f} ms"
+        )
+    rates = compare_backends(args.handlers, args.emits, args.repeats)
+    baseline = rates[EVENT_BUS_BACKENDS[0]]
+    for backend, rate in rates.items():
+        print(f"{backend:>8}: {rate:12,.0f} emits/s  ({rate / baseline:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,21 +1,722 @@
+from collections import deque
 from blinker import Signal
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Callable, Collection, Deque, Dict, Hashable, Iterable, List, Protocol, Tuple
+
+from ecs.events.async_worker import AsyncWorker
+from ecs.events.flight_recorder import DEFAULT_FLIGHT_RECORDER_SIZE, FlightRecorder
+
+if TYPE_CHECKING:
+    from ecs.events.payloads import EventPayload
+    from ecs.events.profiling import EventProfiler
+
+Handler = Callable[..., object]
+# (queue position, event name, position of the event whose handler queued it)
+ScheduleEntry = Tuple[int, str, "int | None"]
+
+BACKEND_BLINKER = "blinker"
+BACKEND_DIRECT = "direct"
+EVENT_BUS_BACKENDS = (BACKEND_BLINKER, BACKEND_DIRECT)
+
+
+class InputRecorder(Protocol):
+    """Sink for the root inputs of a session (see ``EventBus.attach_input_recorder``)."""
+
+    names: Collection[str]
+
+    def capture(self, name: str, payload: Dict[str, Any]) -> bool:
+        """Record a root-level event; True if it was kept."""
+        ...
+
 
 class EventBus:
-    """Simple event bus leveraging blinker Signal objects."""
-    def __init__(self):
-        self._signals: Dict[str, Signal] = {}
+    """Simple event bus leveraging blinker Signal objects.
+
+    ``backend="direct"`` swaps blinker for plain per-event handler tuples. Handlers
+    run in subscription order, subscribing replaces the tuple (snapshot-on-write)
+    and ``emit`` does no per-call bookkeeping beyond the handler calls themselves.
+
+    Every bus keeps a ``flight_recorder`` ring of its last emits for crash dumps;
+    pass ``flight_recorder_size=0`` to run without it.
+
+    The ``subscribe*`` methods return a ``Subscription`` handle; systems that
+    register several handlers collect them in a ``group()`` and ``close()`` it
+    when they are torn down. ``census()`` counts what is still attached.
 
-    def subscribe(self, name: str, fn):
+    ``enable_run_to_completion()`` switches to FIFO scheduling: events raised
+    by a handler are queued and delivered after the current event has reached
+    every subscriber, so cascade length no longer costs stack depth.
+
+    ``subscribe_async`` handlers run on the bus's ``async_worker`` thread, for
+    I/O (saves, log sinks) that must not stall a frame.
+
+    ``attach_input_recorder`` offers root-level events (those not raised from
+    inside a handler of a captured event) to a session recorder.
+    """
+    def __init__(self, backend: str = BACKEND_BLINKER, flight_recorder_size: int | None = None):
+        if backend not in EVENT_BUS_BACKENDS:
+            raise ValueError(f"Unknown event bus backend: {backend!r}")
+        self.backend = backend
+        self._signals: Dict[str, Signal] = {}
+        self._handlers: Dict[str, Tuple[Handler, ...]] = {}
+        self._keyed: Dict[Tuple[str, str], Dict[Hashable, Tuple[Handler, ...]]] = {}
+        self.profiler: "EventProfiler | None" = None
+        # (receiver, coalesce value) -> latest payload, delivered by flush_deferred().
+        self._pending: Dict[Tuple["_DeferredReceiver", Hashable], Dict[str, Any]] = {}
+        if flight_recorder_size is None:
+            flight_recorder_size = DEFAULT_FLIGHT_RECORDER_SIZE
+        self.flight_recorder: FlightRecorder | None = (
+            FlightRecorder(flight_recorder_size) if flight_recorder_size > 0 else None
+        )
+        # Run-to-completion scheduling (None = synchronous nested delivery).
+        self._queue: Deque[Tuple[str, Any, bool, int | None]] | None = None
+        self._draining: int | None = None
+        self._scheduled = 0
+        self.schedule_trace: List[ScheduleEntry] | None = None
+        # Created by the first subscribe_async; assign one first to change its capacity.
+        self.async_worker: AsyncWorker | None = None
+        self.input_recorder: InputRecorder | None = None
+        self._input_depth = 0
+        if backend == BACKEND_DIRECT:
+            self.subscribe = self._subscribe_direct  # type: ignore[method-assign]
+        self._bind_emit()
+
+    def subscribe(self, name: str, fn) -> "Subscription":
         sig = self._signals.setdefault(name, Signal(name))
         # Use weak=False to retain strong reference to bound methods so systems not kept in a variable still receive events.
         sig.connect(fn, weak=False)
+        return Subscription(self, name, fn)
 
     def emit(self, name: str, **payload):
         sig = self._signals.get(name)
         if sig:
             sig.send(self, **payload)
 
+    def subscribe_keyed(self, name: str, key: str, value: Hashable, fn) -> "Subscription":
+        """Subscribe ``fn`` to ``name`` only for payloads where ``payload[key] == value``.
+
+        All keyed handlers for one ``(name, key)`` share a single router on the
+        underlying backend, so an emit costs one dict lookup plus the matching
+        handlers instead of a call into every subscriber.
+        """
+        table = self._keyed.get((name, key))
+        if table is None:
+            table = self._keyed[(name, key)] = {}
+            self.subscribe(name, _KeyedRouter(self, name, key, table))
+        handlers = table.get(value, ())
+        if fn not in handlers:
+            table[value] = handlers + (fn,)
+        return Subscription(self, name, fn, (key, value))
+
+    def subscribe_typed(self, event_type: "type[EventPayload]", fn) -> "Subscription":
+        """Subscribe ``fn(sender, event)`` to ``event_type.name``.
+
+        ``publish`` hands the event object straight to ``fn``; a plain ``emit``
+        of the same name is converted with ``event_type.from_payload``.
+        """
+        return self.subscribe(event_type.name, _TypedReceiver(fn, event_type))
+
+    def publish(self, event: "EventPayload"):
+        """Emit a typed payload; kwargs handlers get ``event.as_payload()``."""
+        flight = self.flight_recorder
+        if flight is None:
+            self._publish(event)
+            return
+        # A copy: callers may reuse the event object for their next publish.
+        payload = event.as_payload()
+        flight.note(event.name, payload)
+        depth = flight.depth
+        flight.depth = depth + 1
+        try:
+            self._publish(event, payload)
+        finally:
+            flight.depth = depth
+
+    def _publish(self, event: "EventPayload", payload: Dict[str, Any] | None = None):
+        profiler = self.profiler
+        if profiler is not None:
+            # publish already noted the event; don't route through _emit_profiled.
+            if payload is None:
+                payload = event.as_payload()
+            profiler.run_emit(event.name, tuple(self.receivers(event.name)), self, payload)
+            return
+        if self.backend == BACKEND_DIRECT:
+            receivers = self._handlers.get(event.name)
+            if not receivers:
+                return
+        else:
+            receivers = self.receivers(event.name)
+        for fn in receivers:
+            if type(fn) is _TypedReceiver:
+                fn.fn(self, event)
+            else:
+                if payload is None:
+                    payload = event.as_payload()
+                fn(self, **payload)
+
+    def subscribe_deferred(self, name: str, fn, coalesce_key: str | None = None) -> "Subscription":
+        """Queue ``name`` for ``fn`` and deliver it on the next ``flush_deferred``.
+
+        Only the latest payload is kept per ``payload[coalesce_key]`` value (or
+        per subscriber when ``coalesce_key`` is None), so a burst of events
+        between frames costs one handler call. Other subscribers of ``name``
+        still receive every emit synchronously.
+        """
+        return self.subscribe(name, _DeferredReceiver(self, fn, coalesce_key))
+
+    def subscribe_async(self, name: str, fn) -> "Subscription":
+        """Run ``fn`` for ``name`` on the bus's worker thread, in emit order.
+
+        ``emit`` only queues the call (blocking while the worker is a full
+        queue behind), so ``fn`` must not touch the world; hand it snapshots.
+        ``flush_async`` waits for queued calls, ``close_async`` stops the thread.
+        """
+        worker = self.async_worker
+        if worker is None:
+            worker = self.async_worker = AsyncWorker()
+        return self.subscribe(name, _AsyncReceiver(worker, fn))
+
+    def flush_async(self, timeout: float | None = None) -> bool:
+        """Block until every queued async handler call has run."""
+        worker = self.async_worker
+        return worker.flush(timeout) if worker is not None else True
+
+    def close_async(self, timeout: float | None = None) -> bool:
+        """Drain the async queue and stop the worker thread."""
+        worker = self.async_worker
+        return worker.close(timeout) if worker is not None else True
+
+    def unsubscribe(self, name: str, fn) -> bool:
+        """Detach ``fn`` from ``name``, however it was subscribed (keyed handlers excepted).
+
+        Typed and deferred subscriptions match on the function they wrap.
+        Returns False when ``fn`` was not attached. Handlers removed during an
+        emit still run for that emit.
+        """
+        for receiver in tuple(self.receivers(name)):
+            if receiver == fn or getattr(receiver, "fn", None) == fn:
+                return self._remove_receiver(name, receiver)
+        return False
+
+    def group(self) -> "SubscriptionGroup":
+        """Start a scoped set of subscriptions that ``close()`` drops together."""
+        return SubscriptionGroup(self)
+
+    def census(self) -> Dict[str, int]:
+        """Attached handlers per event name; keyed routers count their handlers."""
+        names = self._handlers if self.backend == BACKEND_DIRECT else self._signals
+        counts: Dict[str, int] = {}
+        for name in names:
+            total = 0
+            for receiver in self.receivers(name):
+                if type(receiver) is _KeyedRouter:
+                    total += sum(len(handlers) for handlers in receiver.table.values())
+                else:
+                    total += 1
+            if total:
+                counts[name] = total
+        return counts
+
+    def format_census(self) -> str:
+        from ecs.events.profiling import handler_label
+
+        lines = []
+        for name, total in sorted(self.census().items(), key=lambda item: (-item[1], item[0])):
+            labels = []
+            for receiver in self.receivers(name):
+                if type(receiver) is _KeyedRouter:
+                    for value, handlers in receiver.table.items():
+                        labels.extend(f"{receiver.key}={value!r}:{handler_label(fn)}" for fn in handlers)
+                else:
+                    labels.append(handler_label(receiver))
+            lines.append(f"{name:<28} {total:>4}  {', '.join(labels)}")
+        return "\n".join(lines) if lines else "(no handlers attached)"
+
+    def _remove_receiver(self, name: str, receiver) -> bool:
+        if self.backend == BACKEND_DIRECT:
+            handlers = self._handlers.get(name, ())
+            if receiver not in handlers:
+                return False
+            remaining = tuple(fn for fn in handlers if fn != receiver)
+            if remaining:
+                self._handlers[name] = remaining
+            else:
+                del self._handlers[name]
+        else:
+            sig = self._signals.get(name)
+            if sig is None or receiver not in sig.receivers.values():
+                return False
+            sig.disconnect(receiver)
+            if not sig.receivers:
+                del self._signals[name]
+        if type(receiver) is _DeferredReceiver and self._pending:
+            for entry in [entry for entry in self._pending if entry[0] is receiver]:
+                del self._pending[entry]
+        return True
+
+    def _remove_keyed(self, name: str, key: str, value: Hashable, fn) -> bool:
+        table = self._keyed.get((name, key))
+        handlers = table.get(value, ()) if table is not None else ()
+        if fn not in handlers:
+            return False
+        remaining = tuple(handler for handler in handlers if handler != fn)
+        if remaining:
+            table[value] = remaining
+            return True
+        del table[value]
+        if not table:
+            # Last handler for this (name, key): drop the router as well.
+            del self._keyed[(name, key)]
+            for receiver in tuple(self.receivers(name)):
+                if type(receiver) is _KeyedRouter and receiver.table is table:
+                    self._remove_receiver(name, receiver)
+        return True
+
+    def flush_deferred(self) -> int:
+        """Deliver queued deferred events in first-queued order; returns the count.
+
+        Events queued by the delivered handlers wait for the next flush.
+        """
+        pending = self._pending
+        if not pending:
+            return 0
+        self._pending = {}
+        for (receiver, _), payload in pending.items():
+            receiver.fn(self, **payload)
+        return len(pending)
+
+    def enable_profiling(self, profiler: "EventProfiler | None" = None) -> "EventProfiler":
+        """Start timing every emit and handler; returns the active profiler."""
+        if profiler is None:
+            from ecs.events.profiling import EventProfiler
+
+            profiler = self.profiler or EventProfiler()
+        self.profiler = profiler
+        self._bind_emit()
+        return profiler
+
+    def disable_profiling(self) -> "EventProfiler | None":
+        """Return to the uninstrumented emit path, keeping the collected data."""
+        profiler = self.profiler
+        self.profiler = None
+        self._bind_emit()
+        return profiler
+
+    def attach_input_recorder(self, recorder: InputRecorder) -> None:
+        """Offer every emit/publish named in ``recorder.names`` to ``recorder.capture``.
+
+        Only events raised outside a captured event's delivery are offered, so
+        the recorder sees the inputs that drove the session and not what the
+        systems derived from them. Under run-to-completion, events raised while
+        the queue drains are never offered. The hook is part of the emit binding
+        and survives switching profiling or run-to-completion on and off.
+        """
+        self.input_recorder = recorder
+        self._input_depth = 0
+        self._bind_emit()
+
+    def detach_input_recorder(self) -> "InputRecorder | None":
+        recorder = self.input_recorder
+        self.input_recorder = None
+        self._bind_emit()
+        return recorder
+
+    def enable_run_to_completion(self, trace: bool = False) -> None:
+        """Deliver events raised inside handlers FIFO instead of recursively.
+
+        The outermost ``emit``/``publish`` drains the queue before returning,
+        so callers outside handlers still see every consequence on return; a
+        handler that emits sees them only after it and its siblings finish.
+        With ``trace`` the delivery order is kept in ``schedule_trace``.
+        """
+        self._queue = deque()
+        self._scheduled = 0
+        self.schedule_trace = [] if trace else None
+        self._bind_emit()
+
+    def disable_run_to_completion(self) -> List[ScheduleEntry] | None:
+        """Return to nested delivery; returns the schedule trace, if one was kept."""
+        trace = self.schedule_trace
+        self._queue = None
+        self.schedule_trace = None
+        self._bind_emit()
+        return trace
+
+    def emit_now(self, name: str, **payload):
+        """Deliver ``name`` and everything it triggers before returning.
+
+        Same as ``emit`` unless run-to-completion is on, where it is the escape
+        hatch for drivers (AI, input) that act on the outcome of their own emit
+        from inside a handler: the nested cascade drains in its own FIFO and
+        the outer queue resumes afterwards.
+        """
+        queue = self._queue
+        parent = self._draining
+        if queue is None or parent is None:
+            self.emit(name, **payload)
+            return
+        self._queue = nested = deque(((name, payload, False, parent),))
+        try:
+            self._drain(nested)
+        finally:
+            self._queue = queue
+            self._draining = parent
+
+    def format_schedule_trace(self, limit: int = 200) -> str:
+        trace = self.schedule_trace
+        if not trace:
+            return "(no scheduled events)"
+        names = {position: name for position, name, _ in trace}
+        lines = []
+        for position, name, parent in trace[:limit]:
+            origin = f"  <- {parent} {names.get(parent, '?')}" if parent is not None else ""
+            lines.append(f"{position:>6}  {name}{origin}")
+        if len(trace) > limit:
+            lines.append(f"... {len(trace) - limit} more")
+        return "\n".join(lines)
+
+    def receivers(self, name: str) -> Iterable[Handler]:
+        """Backend receivers for ``name`` in call order (keyed routers included)."""
+        if self.backend == BACKEND_DIRECT:
+            return self._handlers.get(name, ())
+        sig = self._signals.get(name)
+        if sig is None:
+            return ()
+        return list(sig.receivers_for(self))
+
+    def _bind_emit(self):
+        # emit is rebound per mode so the default paths carry no feature checks.
+        recorded = self.flight_recorder is not None
+        if self.profiler is not None:
+            self.emit = self._emit_profiled  # type: ignore[method-assign]
+        elif self.backend == BACKEND_DIRECT:
+            self.emit = self._emit_direct_recorded if recorded else self._emit_direct  # type: ignore[method-assign]
+        elif recorded:
+            self.emit = self._emit_blinker_recorded  # type: ignore[method-assign]
+        else:
+            self.__dict__.pop("emit", None)
+        if self._queue is not None:
+            self._dispatch = self.emit
+            self.emit = self._emit_queued  # type: ignore[method-assign]
+            self.publish = self._publish_queued  # type: ignore[method-assign]
+        else:
+            self.__dict__.pop("publish", None)
+        if self.input_recorder is not None:
+            # Outermost layer: the recorder sees events as callers raise them.
+            self._unrecorded_emit = self.emit
+            self._unrecorded_publish = self.publish
+            self.emit = self._emit_input_recorded  # type: ignore[method-assign]
+            self.publish = self._publish_input_recorded  # type: ignore[method-assign]
+
+    def _emit_input_recorded(self, name: str, **payload):
+        recorder = self.input_recorder
+        if recorder is None or name not in recorder.names:
+            self._unrecorded_emit(name, **payload)
+            return
+        depth = self._input_depth
+        if depth == 0 and (self._draining is not None or not recorder.capture(name, payload)):
+            self._unrecorded_emit(name, **payload)
+            return
+        self._input_depth = depth + 1
+        try:
+            self._unrecorded_emit(name, **payload)
+        finally:
+            self._input_depth = depth
+
+    def _publish_input_recorded(self, event: "EventPayload"):
+        recorder = self.input_recorder
+        if recorder is None or event.name not in recorder.names:
+            self._unrecorded_publish(event)
+            return
+        depth = self._input_depth
+        if depth == 0 and (self._draining is not None or not recorder.capture(event.name, event.as_payload())):
+            self._unrecorded_publish(event)
+            return
+        self._input_depth = depth + 1
+        try:
+            self._unrecorded_publish(event)
+        finally:
+            self._input_depth = depth
+
+    def _emit_queued(self, name: str, **payload):
+        self._schedule(name, payload, False)
+
+    def _publish_queued(self, event: "EventPayload"):
+        self._schedule(event.name, event, True)
+
+    def _schedule(self, name: str, payload: Any, typed: bool):
+        queue = self._queue
+        if queue is None:
+            # Scheduling was switched off while a caller held the old bound method.
+            if typed:
+                self.publish(payload)
+            else:
+                self.emit(name, **payload)
+            return
+        queue.append((name, payload, typed, self._draining))
+        if self._draining is None:
+            self._drain(queue)
+
+    def _drain(self, queue: Deque[Tuple[str, Any, bool, int | None]]):
+        dispatch = self._dispatch
+        trace = self.schedule_trace
+        try:
+            while queue:
+                name, payload, typed, parent = queue.popleft()
+                position = self._scheduled
+                self._scheduled = position + 1
+                if trace is not None:
+                    trace.append((position, name, parent))
+                self._draining = position
+                if typed:
+                    EventBus.publish(self, payload)
+                else:
+                    dispatch(name, **payload)
+        finally:
+            self._draining = None
+            # A handler raised: drop its queued follow-ups rather than leak them into the next emit.
+            queue.clear()
+
+    def _emit_profiled(self, name: str, **payload):
+        profiler = self.profiler
+        if profiler is None:
+            # Profiling was switched off while a caller held the old bound emit.
+            self.emit(name, **payload)
+            return
+        flight = self.flight_recorder
+        if flight is None:
+            profiler.run_emit(name, tuple(self.receivers(name)), self, payload)
+            return
+        flight.note(name, payload)
+        depth = flight.depth
+        flight.depth = depth + 1
+        try:
+            profiler.run_emit(name, tuple(self.receivers(name)), self, payload)
+        finally:
+            flight.depth = depth
+
+    def _subscribe_direct(self, name: str, fn) -> "Subscription":
+        handlers = self._handlers.get(name, ())
+        # Like blinker, connecting the same receiver twice is a no-op.
+        if fn not in handlers:
+            self._handlers[name] = handlers + (fn,)
+        return Subscription(self, name, fn)
+
+    def _emit_direct(self, name: str, **payload):
+        handlers = self._handlers.get(name)
+        if handlers:
+            for fn in handlers:
+                fn(self, **payload)
+
+    # The recorded emits inline the slot stores of FlightRecorder.note (minus the
+    # clock read): a method call per emit would cost more than the stores. The
+    # kwargs dict is already a snapshot: every handler call unpacks it into its own.
+    def _emit_direct_recorded(self, name: str, **payload):
+        flight = self.flight_recorder
+        seq = flight.seq
+        flight.seq = seq + 1
+        index = seq & flight.mask
+        flight.names[index] = name
+        flight.payloads[index] = payload
+        flight.times[index] = flight.clock
+        flight.depths[index] = depth = flight.depth
+        handlers = self._handlers.get(name)
+        if handlers:
+            flight.depth = depth + 1
+            try:
+                for fn in handlers:
+                    fn(self, **payload)
+            finally:
+                flight.depth = depth
+
+    def _emit_blinker_recorded(self, name: str, **payload):
+        flight = self.flight_recorder
+        seq = flight.seq
+        flight.seq = seq + 1
+        index = seq & flight.mask
+        flight.names[index] = name
+        flight.payloads[index] = payload
+        flight.times[index] = flight.clock
+        flight.depths[index] = depth = flight.depth
+        sig = self._signals.get(name)
+        if sig:
+            flight.depth = depth + 1
+            try:
+                sig.send(self, **payload)
+            finally:
+                flight.depth = depth
+
+
+class Subscription:
+    """Handle for one ``subscribe*`` call; ``unsubscribe()`` is idempotent.
+
+    Subscribing the same receiver twice attaches it once, so both handles
+    refer to that single attachment.
+    """
+
+    __slots__ = ("bus", "name", "receiver", "keyed")
+
+    def __init__(self, bus: EventBus, name: str, receiver: Handler, keyed: Tuple[str, Hashable] | None = None):
+        self.bus: EventBus | None = bus
+        self.name = name
+        self.receiver = receiver
+        self.keyed = keyed
+
+    @property
+    def active(self) -> bool:
+        return self.bus is not None
+
+    def unsubscribe(self) -> bool:
+        bus = self.bus
+        if bus is None:
+            return False
+        self.bus = None
+        if self.keyed is None:
+            return bus._remove_receiver(self.name, self.receiver)
+        key, value = self.keyed
+        return bus._remove_keyed(self.name, key, value, self.receiver)
+
+
+class SubscriptionGroup:
+    """Subscriptions owned by one system, dropped together by ``close()``."""
+
+    __slots__ = ("bus", "handles")
+
+    def __init__(self, bus: EventBus):
+        self.bus = bus
+        self.handles: list[Subscription] = []
+
+    def add(self, handle: Subscription) -> Subscription:
+        self.handles.append(handle)
+        return handle
+
+    def subscribe(self, name: str, fn) -> Subscription:
+        return self.add(self.bus.subscribe(name, fn))
+
+    def subscribe_keyed(self, name: str, key: str, value: Hashable, fn) -> Subscription:
+        return self.add(self.bus.subscribe_keyed(name, key, value, fn))
+
+    def subscribe_typed(self, event_type: "type[EventPayload]", fn) -> Subscription:
+        return self.add(self.bus.subscribe_typed(event_type, fn))
+
+    def subscribe_deferred(self, name: str, fn, coalesce_key: str | None = None) -> Subscription:
+        return self.add(self.bus.subscribe_deferred(name, fn, coalesce_key))
+
+    def subscribe_async(self, name: str, fn) -> Subscription:
+        return self.add(self.bus.subscribe_async(name, fn))
+
+    def release(self, handle: Subscription) -> bool:
+        """Unsubscribe one handle early and stop tracking it."""
+        try:
+            self.handles.remove(handle)
+        except ValueError:
+            pass
+        return handle.unsubscribe()
+
+    def close(self) -> int:
+        """Unsubscribe everything in the group (newest first); returns how many were attached."""
+        removed = 0
+        for handle in reversed(self.handles):
+            removed += handle.unsubscribe()
+        self.handles.clear()
+        return removed
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def __enter__(self) -> "SubscriptionGroup":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _KeyedRouter:
+    """Backend receiver that forwards an event to handlers keyed on one payload field."""
+
+    __slots__ = ("bus", "name", "key", "table")
+
+    def __init__(self, bus: EventBus, name: str, key: str, table: Dict[Hashable, Tuple[Handler, ...]]):
+        self.bus = bus
+        self.name = name
+        self.key = key
+        self.table = table
+
+    @property
+    def profile_label(self) -> str:
+        return f"keyed[{self.key}]"
+
+    def __call__(self, sender: Any, **payload):
+        handlers = self.table.get(payload.get(self.key))
+        if not handlers:
+            return
+        profiler = self.bus.profiler
+        if profiler is None:
+            for fn in handlers:
+                fn(sender, **payload)
+            return
+        stats = profiler.events.get(self.name)
+        for fn in handlers:
+            profiler.run_handler(fn, sender, payload, stats)
+
+
+class _TypedReceiver:
+    """Backend receiver for ``subscribe_typed``; converts kwargs emits to the event type."""
+
+    __slots__ = ("fn", "event_type")
+
+    def __init__(self, fn: Handler, event_type: "type[EventPayload]"):
+        self.fn = fn
+        self.event_type = event_type
+
+    @property
+    def profile_label(self) -> str:
+        from ecs.events.profiling import handler_label
+
+        return handler_label(self.fn)
+
+    def __call__(self, sender: Any, **payload):
+        self.fn(sender, self.event_type.from_payload(payload))
+
+
+class _AsyncReceiver:
+    """Backend receiver for ``subscribe_async``; hands the call to the worker thread."""
+
+    __slots__ = ("worker", "fn")
+
+    def __init__(self, worker: AsyncWorker, fn: Handler):
+        self.worker = worker
+        self.fn = fn
+
+    @property
+    def profile_label(self) -> str:
+        from ecs.events.profiling import handler_label
+
+        return f"async[{handler_label(self.fn)}]"
+
+    def __call__(self, sender: Any, **payload):
+        self.worker.submit(self.fn, sender, payload)
+
+
+class _DeferredReceiver:
+    """Backend receiver that parks the latest payload for ``EventBus.flush_deferred``."""
+
+    __slots__ = ("bus", "fn", "coalesce_key")
+
+    def __init__(self, bus: EventBus, fn: Handler, coalesce_key: str | None):
+        self.bus = bus
+        self.fn = fn
+        self.coalesce_key = coalesce_key
+
+    @property
+    def profile_label(self) -> str:
+        return "deferred"
+
+    def __call__(self, sender: Any, **payload):
+        value = payload.get(self.coalesce_key) if self.coalesce_key is not None else None
+        # Re-assigning an existing key keeps its queue position, so delivery order
+        # follows the first emit of the frame while the payload is the latest.
+        self.bus._pending[(self, value)] = payload
+
 
 # ============================================================================
 # SYSTEM & TIMING
@@ -161,6 +862,7 @@ EVENT_COMBAT_START_REQUEST = "combat_start_request"    # payload: player_entity=
 EVENT_DIALOGUE_START = "dialogue_start"            # payload: left_entity=int, right_entity=int, lines=Iterable[dict]|None, resume_mode=GameMode
 EVENT_DIALOGUE_ADVANCE = "dialogue_advance"        # payload: None
 EVENT_DIALOGUE_COMPLETED = "dialogue_completed"    # payload: left_entity=int, right_entity=int
+EVENT_STORY_PROGRESS_SAVE = "story_progress_save"  # payload: path=Path, progress=dict (snapshot)
 
 
 # ============================================================================
@@ -0,0 +1,146 @@
+"""Fixed-size ring buffer of the most recent ``EventBus`` emits.
+
+The bus writes each emit straight into preallocated parallel lists (name,
+payload snapshot, timestamp, nesting depth), so recording costs a few slot
+stores. The snapshot is a dict no caller or handler holds: an ``emit`` stores
+its own kwargs dict, and ``publish`` stores ``as_payload()`` of the event, so a
+reused event object (the self-play tick) cannot rewrite history. Timestamps
+are frame-resolution: the clock is read by ``publish`` (every tick and typed
+hot event), not per ``emit``. Payloads are only summarised when the buffer is
+dumped, typically from ``install_crash_dump`` after an unhandled exception::
+
+    0.412ms  d1  animation_complete  kind='fade' items=[(3, 4), (3, 5), (3, 6)]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+DEFAULT_FLIGHT_RECORDER_SIZE = 256
+DEFAULT_DUMP_PATH = "flight_recorder.log"
+
+_SUMMARY_ITEMS = 3
+_SUMMARY_WIDTH = 60
+
+Entry = Tuple[int, float, int, str, str]
+
+
+class FlightRecorder:
+    """Last ``capacity`` events, oldest overwritten first (capacity is a power of two).
+
+    ``seq`` counts every event noted so far; the newest sits at ``(seq - 1) & mask``.
+    """
+
+    __slots__ = ("capacity", "mask", "seq", "names", "payloads", "times", "depths", "depth", "clock")
+
+    def __init__(self, capacity: int = DEFAULT_FLIGHT_RECORDER_SIZE) -> None:
+        if capacity <= 0:
+            raise ValueError("Flight recorder capacity must be positive")
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        self.mask = size - 1
+        self.seq = 0
+        self.names: List[str | None] = [None] * size
+        self.payloads: List[Any] = [None] * size
+        self.times: List[float] = [0.0] * size
+        self.depths: List[int] = [0] * size
+        self.depth = 0
+        self.clock = time.perf_counter()
+
+    def note(self, name: str, payload: Any) -> None:
+        """Record one event at the current depth and advance the clock.
+
+        ``payload`` is kept as-is until overwritten; pass a snapshot nobody mutates.
+        """
+
+        self.clock = time.perf_counter()
+        seq = self.seq
+        self.seq = seq + 1
+        index = seq & self.mask
+        self.names[index] = name
+        self.payloads[index] = payload
+        self.times[index] = self.clock
+        self.depths[index] = self.depth
+
+    def entries(self) -> List[Entry]:
+        """``(sequence, timestamp, depth, name, payload summary)`` oldest first."""
+
+        total = self.seq
+        start = max(0, total - self.capacity)
+        entries: List[Entry] = []
+        for sequence in range(start, total):
+            index = sequence & self.mask
+            name = self.names[index]
+            if name is None:
+                continue
+            entries.append(
+                (sequence, self.times[index], self.depths[index], name, summarize_payload(self.payloads[index]))
+            )
+        return entries
+
+    def format(self) -> str:
+        entries = self.entries()
+        if not entries:
+            return "(no events recorded)"
+        last = entries[-1][1]
+        lines = [f"# last {len(entries)} events, times relative to the newest"]
+        for sequence, stamp, depth, name, summary in entries:
+            lines.append(f"{(stamp - last) * 1000:9.3f}ms  d{depth}  {name}  {summary}".rstrip())
+        return "\n".join(lines)
+
+    def dump(self, path: str | Path = DEFAULT_DUMP_PATH, header: str | None = None) -> Path:
+        target = Path(path)
+        with target.open("w", encoding="utf-8") as handle:
+            if header:
+                handle.write(header.rstrip() + "\n")
+            handle.write(self.format() + "\n")
+        return target
+
+
+def summarize_payload(payload: Any) -> str:
+    if payload is None:
+        return ""
+    if isinstance(payload, dict):
+        items = payload.items()
+    else:
+        slots = getattr(payload, "__slots__", ())
+        items = ((key, getattr(payload, key, None)) for key in slots)
+    return " ".join(f"{key}={_summarize_value(value)}" for key, value in items)
+
+
+def _summarize_value(value: Any) -> str:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)[:_SUMMARY_ITEMS]
+        text = ", ".join(_summarize_value(item) for item in items)
+        if len(value) > _SUMMARY_ITEMS:
+            text += f", ... {len(value)} total"
+        open_, close = ("(", ")") if isinstance(value, tuple) else ("[", "]")
+        return f"{open_}{text}{close}"
+    if isinstance(value, dict):
+        return f"{{{len(value)} keys}}"
+    text = repr(value)
+    if len(text) > _SUMMARY_WIDTH:
+        text = text[: _SUMMARY_WIDTH - 3] + "..."
+    return text
+
+
+def install_crash_dump(
+    recorder: FlightRecorder,
+    path: str | Path = DEFAULT_DUMP_PATH,
+) -> Callable[..., None]:
+    """Chain ``sys.excepthook`` so an unhandled exception writes the recent events to ``path``."""
+
+    previous = sys.excepthook
+
+    def hook(exc_type, exc, tb) -> None:
+        try:
+            recorder.dump(path, header=f"# unhandled {exc_type.__name__}: {exc}")
+        finally:
+            previous(exc_type, exc, tb)
+
+    sys.excepthook = hook
+    return hook
@@ -0,0 +1,117 @@
+"""Typed payload objects for the hottest ``EventBus`` events.
+
+Emitters call ``bus.publish(TickEvent(dt))`` and handlers registered with
+``bus.subscribe_typed(TickEvent, fn)`` receive ``fn(sender, event)``: one
+slotted object per emit instead of a kwargs dict per handler call. Plain
+``emit``/``subscribe`` keep working in both directions; ``as_payload`` and
+``from_payload`` convert at the boundary.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Mapping, Sequence, Tuple
+
+from ecs.events.bus import (
+    EVENT_ANIMATION_COMPLETE,
+    EVENT_ANIMATION_START,
+    EVENT_EFFECT_APPLIED,
+    EVENT_GRAVITY_APPLIED,
+    EVENT_MATCH_CLEARED,
+    EVENT_MATCH_FOUND,
+    EVENT_REFILL_COMPLETED,
+    EVENT_TICK,
+    EVENT_TILES_MATCHED,
+)
+
+Position = Tuple[int, int]
+TypedPosition = Tuple[int, int, str]
+
+
+class EventPayload:
+    """Base for typed payloads; subclasses are ``@dataclass(slots=True)``."""
+
+    __slots__ = ()
+    name: ClassVar[str]
+
+    def as_payload(self) -> Dict[str, Any]:
+        """Kwargs view for legacy handlers; ``None`` fields are left out."""
+
+        payload = {}
+        for key in self.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                payload[key] = value
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]):
+        """Build the typed event from an ``emit`` kwargs dict, ignoring unknown keys."""
+
+        return cls(**{key: payload[key] for key in cls.__slots__ if key in payload})
+
+
+@dataclass(slots=True)
+class TickEvent(EventPayload):
+    name: ClassVar[str] = EVENT_TICK
+    dt: float = 1 / 60
+
+
+@dataclass(slots=True)
+class MatchFoundEvent(EventPayload):
+    name: ClassVar[str] = EVENT_MATCH_FOUND
+    positions: Sequence[Position] = ()
+    size: int = 0
+    reason: str | None = None
+
+
+@dataclass(slots=True)
+class MatchClearedEvent(EventPayload):
+    name: ClassVar[str] = EVENT_MATCH_CLEARED
+    positions: Sequence[Position] = ()
+    types: Sequence[TypedPosition] = ()
+    owner_entity: int | None = None
+    entities: Sequence[Tuple[int, int, int]] | None = None
+    reason: str | None = None
+
+
+@dataclass(slots=True)
+class TilesMatchedEvent(EventPayload):
+    name: ClassVar[str] = EVENT_TILES_MATCHED
+    positions: Sequence[Position] = ()
+    types: Sequence[TypedPosition] = ()
+    owner_entity: int | None = None
+    source: str | None = None
+
+
+@dataclass(slots=True)
+class GravityAppliedEvent(EventPayload):
+    name: ClassVar[str] = EVENT_GRAVITY_APPLIED
+    cascades: int = 0
+
+
+@dataclass(slots=True)
+class RefillCompletedEvent(EventPayload):
+    name: ClassVar[str] = EVENT_REFILL_COMPLETED
+    new_tiles: Sequence[Position] = ()
+
+
+@dataclass(slots=True)
+class AnimationStartEvent(EventPayload):
+    name: ClassVar[str] = EVENT_ANIMATION_START
+    kind: str | None = None
+    items: Sequence[Any] = ()
+
+
+@dataclass(slots=True)
+class AnimationCompleteEvent(EventPayload):
+    name: ClassVar[str] = EVENT_ANIMATION_COMPLETE
+    kind: str | None = None
+    items: Sequence[Any] = ()
+
+
+@dataclass(slots=True)
+class EffectAppliedEvent(EventPayload):
+    name: ClassVar[str] = EVENT_EFFECT_APPLIED
+    effect_entity: int | None = None
+    owner_entity: int | None = None
+    slug: str | None = None
@@ -0,0 +1,136 @@
+"""Opt-in per-event / per-handler timing for ``EventBus``.
+
+Enable with ``bus.enable_profiling()``; while disabled the bus runs its normal
+emit path and pays nothing. Handler time is attributed to the full chain of
+nested emits it ran under, and ``write_collapsed`` exports that chain in the
+collapsed-stack format read by flamegraph.pl and speedscope::
+
+    tick;AnimationSystem.on_tick;animation_complete;MatchResolutionSystem.on_animation_complete 412
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+
+def handler_label(fn: Callable[..., Any]) -> str:
+    """Readable name for a subscriber: ``Class.method`` for bound methods."""
+
+    owner = getattr(fn, "__self__", None)
+    func = getattr(fn, "__func__", None)
+    if owner is not None and func is not None:
+        return f"{type(owner).__name__}.{func.__name__}"
+    label = getattr(fn, "__qualname__", None)
+    if label is None:
+        label = getattr(fn, "profile_label", None) or type(fn).__name__
+    return label
+
+
+@dataclass(slots=True)
+class HandlerStats:
+    calls: int = 0
+    total: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+@dataclass(slots=True)
+class EventStats:
+    emits: int = 0
+    total: float = 0.0
+    max_depth: int = 0
+    handlers: Dict[str, HandlerStats] = field(default_factory=dict)
+
+
+class EventProfiler:
+    """Accumulates emit counts, per-handler timings and nested emit stacks."""
+
+    def __init__(self) -> None:
+        self.events: Dict[str, EventStats] = {}
+        # Collapsed stack -> self time in seconds.
+        self.collapsed: Dict[str, float] = {}
+        self.depth = 0
+        self._stack: List[str] = []
+        self._child_time: List[float] = []
+
+    def reset(self) -> None:
+        self.events.clear()
+        self.collapsed.clear()
+
+    def run_emit(self, name: str, handlers: Iterable[Callable[..., Any]], sender: Any, payload: Dict[str, Any]) -> None:
+        stats = self.events.get(name)
+        if stats is None:
+            stats = self.events[name] = EventStats()
+        stats.emits += 1
+        if self.depth > stats.max_depth:
+            stats.max_depth = self.depth
+        self.depth += 1
+        self._stack.append(name)
+        start = time.perf_counter()
+        try:
+            for fn in handlers:
+                self.run_handler(fn, sender, payload, stats)
+        finally:
+            stats.total += time.perf_counter() - start
+            self._stack.pop()
+            self.depth -= 1
+
+    def run_handler(
+        self,
+        fn: Callable[..., Any],
+        sender: Any,
+        payload: Dict[str, Any],
+        stats: EventStats | None = None,
+    ) -> None:
+        label = handler_label(fn)
+        self._stack.append(label)
+        self._child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            fn(sender, **payload)
+        finally:
+            elapsed = time.perf_counter() - start
+            child = self._child_time.pop()
+            stack_key = ";".join(self._stack)
+            self.collapsed[stack_key] = self.collapsed.get(stack_key, 0.0) + max(0.0, elapsed - child)
+            self._stack.pop()
+            if self._child_time:
+                self._child_time[-1] += elapsed
+            if stats is not None:
+                handler_stats = stats.handlers.get(label)
+                if handler_stats is None:
+                    handler_stats = stats.handlers[label] = HandlerStats()
+                handler_stats.calls += 1
+                handler_stats.total += elapsed
+                if elapsed > handler_stats.max_time:
+                    handler_stats.max_time = elapsed
+
+    def write_collapsed(self, path: str | Path) -> Path:
+        """Write ``stack microseconds`` lines for flame-graph tools."""
+
+        target = Path(path)
+        with target.open("w", encoding="utf-8") as handle:
+            for stack, seconds in sorted(self.collapsed.items()):
+                micros = int(round(seconds * 1_000_000))
+                if micros > 0:
+                    handle.write(f"{stack} {micros}\n")
+        return target
+
+    def format_report(self, limit: int = 20) -> str:
+        rows = []
+        for event_name, stats in self.events.items():
+            for label, handler in stats.handlers.items():
+                rows.append((handler.total, event_name, label, handler))
+        rows.sort(key=lambda row: row[0], reverse=True)
+        lines = [f"{'event':<28} {'handler':<48} {'calls':>7} {'total ms':>9} {'mean us':>9} {'max us':>9}"]
+        for total, event_name, label, handler in rows[:limit]:
+            lines.append(
+                f"{event_name:<28} {label:<48} {handler.calls:>7} {total * 1000:>9.2f} "
+                f"{handler.mean * 1e6:>9.1f} {handler.max_time * 1e6:>9.1f}"
+            )
+        return "\n".join(lines)
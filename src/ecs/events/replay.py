@@ -0,0 +1,533 @@
+"""Binary event-log recording and headless replay.
+
+A log holds the session seeds plus the root inputs that drove it: tile clicks,
+ability requests, choice picks and ticks with their ``dt`` get compact
+records; the rarer inputs (menu and dialogue actions, skips, bank and debug
+clicks, right-button presses) are stored as their event name and a JSON object
+of the scalar fields their schema lists. Events raised while a recorded input is being delivered (AI clicks,
+follow-up requests) are derived state and are not recorded; the replayer
+re-creates them by running the same seeded systems. Replay publishes ticks
+back-to-back, so a session plays at CPU speed::
+
+    python -m ecs.events.replay session.blog
+
+Two kinds of session exist. A combat session is a bare headless combat
+(``create_session``), as self-play and the benchmarks build. A game session
+is the whole window from the main menu on (``create_game_session``); the game
+records one when ``BATTLELINES_RECORD`` names the log to write, seeding the
+world from ``BATTLELINES_SEED`` when it is set. Recording windows run the
+direct bus backend, whose handler order is the subscription order. Game
+sessions also record the frame ends that reclaimed dead entities outside a
+tick, since a tick always ends its frame.
+
+Layout (little-endian): an 8-byte magic/version prefix, the header struct, then
+one opcode byte per record followed by its fields. Runs of equal ``dt`` ticks
+collapse into a single ``TICK_RUN`` record.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import random
+import struct
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+from esper import World
+
+from ecs.events.bus import (
+    BACKEND_DIRECT,
+    EVENT_ABILITY_ACTIVATE_REQUEST,
+    EVENT_BANK_MANA,
+    EVENT_CHOICE_SELECTED,
+    EVENT_CHOICE_SKIPPED,
+    EVENT_DIALOGUE_ADVANCE,
+    EVENT_HEALTH_DAMAGE,
+    EVENT_MENU_CONTINUE_SELECTED,
+    EVENT_MENU_NEW_GAME_SELECTED,
+    EVENT_MOUSE_PRESS,
+    EVENT_TICK,
+    EVENT_TILE_CLICK,
+    EventBus,
+)
+from ecs.events.payloads import TickEvent
+from ecs.utils.census import reclaim_dead_entities
+
+MAGIC = b"BLEV"
+VERSION = 2
+
+RECORD_ENV = "BATTLELINES_RECORD"
+SEED_ENV = "BATTLELINES_SEED"
+
+_PREFIX = struct.Struct("<4sH2x")
+_HEADER = struct.Struct("<QQBBBHH")
+_OP = struct.Struct("<B")
+_TICK = struct.Struct("<d")
+_TICK_RUN = struct.Struct("<dI")
+_CLICK = struct.Struct("<hh")
+_ABILITY = struct.Struct("<ii")
+_CHOICE = struct.Struct("<iii")
+_EVENT = struct.Struct("<H")
+_RECLAIM = struct.Struct("<")
+
+OP_TICK = 0
+OP_TICK_RUN = 1
+OP_TILE_CLICK = 2
+OP_ABILITY_ACTIVATE = 3
+OP_CHOICE_SELECTED = 4
+OP_EVENT = 5
+OP_RECLAIM = 6
+
+_FLAG_DEFAULT_ABILITIES = 1
+_FLAG_RANDOMIZE_ENEMY = 2
+_FLAG_GAME_SESSION = 4
+
+# Inputs stored as name + JSON, with the payload fields each may carry: the
+# required ones, then the optional ones. A field kind is the tuple of exact
+# types its value may have, so bools, enums and containers are rejected rather
+# than coming back from the log as something else. Left-button presses are left
+# out because every system that acts on them turns them into one of the
+# recorded events.
+_INT = (int,)
+_NUMBER = (int, float)
+_TEXT = (str,)
+_ENTITY = (int, type(None))
+_EVENT_SCHEMAS: Dict[str, Tuple[Dict[str, tuple], Dict[str, tuple]]] = {
+    EVENT_CHOICE_SKIPPED: ({"window_entity": _INT}, {"press_id": _INT}),
+    EVENT_MENU_NEW_GAME_SELECTED: ({}, {"press_id": _INT}),
+    EVENT_MENU_CONTINUE_SELECTED: ({}, {"press_id": _INT}),
+    EVENT_DIALOGUE_ADVANCE: ({}, {"press_id": _INT}),
+    EVENT_BANK_MANA: (
+        {"owner_entity": _INT, "type_name": _TEXT, "amount": _INT},
+        {"source": _TEXT},
+    ),
+    EVENT_HEALTH_DAMAGE: (
+        {"target_entity": _INT, "amount": _INT},
+        {"reason": _TEXT, "source_owner": _ENTITY},
+    ),
+    EVENT_MOUSE_PRESS: ({"x": _NUMBER, "y": _NUMBER, "button": _INT}, {"press_id": _INT}),
+}
+_EVENT_INPUTS = tuple(_EVENT_SCHEMAS)
+_RECORDED_INPUTS = frozenset(
+    (EVENT_TICK, EVENT_TILE_CLICK, EVENT_ABILITY_ACTIVATE_REQUEST, EVENT_CHOICE_SELECTED) + _EVENT_INPUTS
+)
+_LEFT_BUTTON = 1
+
+Record = Tuple[str, Dict[str, Any]]
+Session = Tuple[World, EventBus, Dict[str, object]]
+
+
+@dataclass(slots=True)
+class SessionHeader:
+    """Everything needed to rebuild the world a log was recorded against.
+
+    ``width``/``height`` are the window size the main menu was laid out for;
+    they only matter for game sessions.
+    """
+
+    seed: int
+    ai_seed: int = 0
+    rows: int = 8
+    cols: int = 8
+    grant_default_player_abilities: bool = True
+    randomize_enemy: bool = False
+    game_session: bool = False
+    width: int = 0
+    height: int = 0
+
+    @classmethod
+    def for_game(cls, seed: int, width: int, height: int) -> "SessionHeader":
+        """Header for a window session, with the AI seed derived from ``seed``."""
+
+        from ecs.constants import GRID_COLS, GRID_ROWS
+
+        return cls(
+            seed=seed,
+            ai_seed=seed * 2 + 1,
+            rows=GRID_ROWS,
+            cols=GRID_COLS,
+            grant_default_player_abilities=False,
+            randomize_enemy=True,
+            game_session=True,
+            width=width,
+            height=height,
+        )
+
+    def pack(self) -> bytes:
+        flags = (
+            (_FLAG_DEFAULT_ABILITIES if self.grant_default_player_abilities else 0)
+            | (_FLAG_RANDOMIZE_ENEMY if self.randomize_enemy else 0)
+            | (_FLAG_GAME_SESSION if self.game_session else 0)
+        )
+        return _PREFIX.pack(MAGIC, VERSION) + _HEADER.pack(
+            self.seed, self.ai_seed, self.rows, self.cols, flags, self.width, self.height
+        )
+
+    @classmethod
+    def unpack(cls, handle: BinaryIO) -> "SessionHeader":
+        magic, version = _PREFIX.unpack(handle.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError("Not a Battlelines event log")
+        if version != VERSION:
+            raise ValueError(f"Unsupported event log version {version}")
+        seed, ai_seed, rows, cols, flags, width, height = _HEADER.unpack(handle.read(_HEADER.size))
+        return cls(
+            seed=seed,
+            ai_seed=ai_seed,
+            rows=rows,
+            cols=cols,
+            grant_default_player_abilities=bool(flags & _FLAG_DEFAULT_ABILITIES),
+            randomize_enemy=bool(flags & _FLAG_RANDOMIZE_ENEMY),
+            game_session=bool(flags & _FLAG_GAME_SESSION),
+            width=width,
+            height=height,
+        )
+
+
+def create_session(header: SessionHeader) -> Session:
+    """Wire a headless combat world seeded from ``header``.
+
+    Recording harnesses and the replayer both build their world here, so a
+    log replays against exactly the systems and seeds it was recorded with.
+    Every random draw comes from the world's and the AI's own generators.
+    """
+
+    from ecs.systems.rule_based_ai_system import RuleBasedAISystem
+    from ecs.systems.wiring import wire_combat_systems
+    from world import create_world
+
+    bus = EventBus(backend=BACKEND_DIRECT)
+    world = create_world(
+        bus,
+        grant_default_player_abilities=header.grant_default_player_abilities,
+        randomize_enemy=header.randomize_enemy,
+        rng=random.Random(header.seed),
+    )
+    systems = wire_combat_systems(world, bus, header.rows, header.cols)
+    systems["ai"] = RuleBasedAISystem(world, bus, rng=random.Random(header.ai_seed))
+    return world, bus, systems
+
+
+def create_game_session(header: SessionHeader, *, save_dir: str | Path | None = None) -> Session:
+    """Wire the window's systems, minus rendering, for a recorded game session.
+
+    Like a recording window, the bus uses the direct backend so handlers run in
+    subscription order. Story progress starts empty and saves into
+    ``save_dir`` (a fresh temporary directory by default), as it did while
+    recording.
+    """
+
+    from ecs.components.game_state import GameMode
+    from ecs.systems.wiring import wire_game_systems
+    from world import create_world
+
+    if save_dir is None:
+        save_dir = tempfile.mkdtemp(prefix="battlelines-replay-")
+    bus = EventBus(backend=BACKEND_DIRECT)
+    world = create_world(
+        bus,
+        initial_mode=GameMode.MENU,
+        grant_default_player_abilities=header.grant_default_player_abilities,
+        randomize_enemy=header.randomize_enemy,
+        rng=random.Random(header.seed),
+    )
+    systems = wire_game_systems(
+        world,
+        bus,
+        menu_size=(header.width, header.height),
+        story_save_path=Path(save_dir) / "story_progress.json",
+        load_story=False,
+        ai_rng=random.Random(header.ai_seed),
+    )
+    return world, bus, systems
+
+
+def recording_from_env(
+    width: int, height: int, environ: Mapping[str, str] = os.environ
+) -> Tuple[Path, SessionHeader] | None:
+    """Log path and game-session header requested through the environment, if any."""
+
+    path = environ.get(RECORD_ENV)
+    if not path:
+        return None
+    seed_text = environ.get(SEED_ENV)
+    seed = int(seed_text) if seed_text else random.SystemRandom().getrandbits(48)
+    return Path(path), SessionHeader.for_game(seed, width, height)
+
+
+class EventRecorder:
+    """Writes a bus's root inputs and ticks to a binary log.
+
+    ``attach`` installs the recorder through ``EventBus.attach_input_recorder``,
+    so it keeps recording across profiling and run-to-completion toggles.
+    """
+
+    names = _RECORDED_INPUTS
+
+    def __init__(self, path: str | Path, header: SessionHeader) -> None:
+        self.path = Path(path)
+        self.header = header
+        self.records = 0
+        self._handle: BinaryIO = self.path.open("wb")
+        self._handle.write(header.pack())
+        self._run_dt: float | None = None
+        self._run_count = 0
+        self._bus: EventBus | None = None
+
+    def attach(self, bus: EventBus) -> "EventRecorder":
+        bus.attach_input_recorder(self)
+        self._bus = bus
+        return self
+
+    def detach(self) -> None:
+        bus = self._bus
+        if bus is None:
+            return
+        if bus.input_recorder is self:
+            bus.detach_input_recorder()
+        self._bus = None
+
+    def close(self) -> None:
+        self.detach()
+        if self._handle.closed:
+            return
+        self._flush_ticks()
+        self._handle.close()
+
+    def __enter__(self) -> "EventRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def capture(self, name: str, payload: Dict[str, Any]) -> bool:
+        if name == EVENT_MOUSE_PRESS and payload.get("button") == _LEFT_BUTTON:
+            return False
+        self._record(name, payload)
+        return True
+
+    def end_frame(self, ticked: bool, reclaimed: int) -> None:
+        """Note a frame end; only game sessions that reclaimed without a tick need a record."""
+
+        if ticked or not reclaimed or self._handle.closed:
+            return
+        self._flush_ticks()
+        self._handle.write(_OP.pack(OP_RECLAIM))
+        self.records += 1
+
+    def _record(self, name: str, data: Dict[str, Any]) -> None:
+        if name == EVENT_TICK:
+            dt = float(data.get("dt", 1 / 60))
+            if self._run_count and dt == self._run_dt:
+                self._run_count += 1
+                return
+            self._flush_ticks()
+            self._run_dt = dt
+            self._run_count = 1
+            return
+        self._flush_ticks()
+        write = self._handle.write
+        if name == EVENT_TILE_CLICK:
+            write(_OP.pack(OP_TILE_CLICK) + _CLICK.pack(int(data["row"]), int(data["col"])))
+        elif name == EVENT_ABILITY_ACTIVATE_REQUEST:
+            write(
+                _OP.pack(OP_ABILITY_ACTIVATE)
+                + _ABILITY.pack(_entity(data.get("ability_entity")), _entity(data.get("owner_entity")))
+            )
+        elif name == EVENT_CHOICE_SELECTED:
+            write(
+                _OP.pack(OP_CHOICE_SELECTED)
+                + _CHOICE.pack(
+                    _entity(data.get("window_entity")),
+                    _entity(data.get("choice_entity")),
+                    _entity(data.get("payload_entity")),
+                )
+            )
+        else:
+            encoded = _encode_event(name, data)
+            write(_OP.pack(OP_EVENT) + _EVENT.pack(len(encoded)) + encoded)
+        self.records += 1
+
+    def _flush_ticks(self) -> None:
+        if not self._run_count:
+            return
+        if self._run_count == 1:
+            self._handle.write(_OP.pack(OP_TICK) + _TICK.pack(self._run_dt))
+        else:
+            self._handle.write(_OP.pack(OP_TICK_RUN) + _TICK_RUN.pack(self._run_dt, self._run_count))
+        self.records += self._run_count
+        self._run_count = 0
+
+
+def _encode_event(name: str, data: Mapping[str, Any]) -> bytes:
+    """JSON for an ``OP_EVENT`` record; raises ``ValueError`` off its schema."""
+
+    schema = _EVENT_SCHEMAS.get(name)
+    if schema is None:
+        raise ValueError(f"Cannot record {name!r}: no payload schema for it")
+    required, optional = schema
+    for key in required:
+        if key not in data:
+            raise ValueError(f"Cannot record {name!r}: payload is missing {key!r}")
+    for key, value in data.items():
+        kinds = required.get(key) or optional.get(key)
+        if kinds is None:
+            raise ValueError(f"Cannot record {name!r}: field {key!r} is not in its schema")
+        if type(value) not in kinds:
+            expected = " or ".join("None" if kind is type(None) else kind.__name__ for kind in kinds)
+            raise ValueError(
+                f"Cannot record {name!r}: field {key!r} must be {expected}, not {type(value).__name__}"
+            )
+    return json.dumps([name, data], separators=(",", ":")).encode("utf-8")
+
+
+def _entity(value: Any) -> int:
+    return -1 if value is None else int(value)
+
+
+def _optional(value: int) -> int | None:
+    return None if value < 0 else value
+
+
+def read_log(path: str | Path) -> Tuple[SessionHeader, List[Tuple[int, tuple]]]:
+    """Decode a log into its header and ``(opcode, fields)`` records."""
+
+    data = Path(path).read_bytes()
+    header = SessionHeader.unpack(io.BytesIO(data))
+    offset = _PREFIX.size + _HEADER.size
+    layouts = {
+        OP_TICK: _TICK,
+        OP_TICK_RUN: _TICK_RUN,
+        OP_TILE_CLICK: _CLICK,
+        OP_ABILITY_ACTIVATE: _ABILITY,
+        OP_CHOICE_SELECTED: _CHOICE,
+        OP_RECLAIM: _RECLAIM,
+    }
+    records: List[Tuple[int, tuple]] = []
+    end = len(data)
+    while offset < end:
+        op = data[offset]
+        if op == OP_EVENT:
+            (size,) = _EVENT.unpack_from(data, offset + 1)
+            start = offset + 1 + _EVENT.size
+            name, payload = json.loads(data[start : start + size].decode("utf-8"))
+            if name not in _EVENT_SCHEMAS:
+                raise ValueError(f"Unknown event {name!r} at byte {offset}")
+            records.append((op, (name, payload)))
+            offset = start + size
+            continue
+        layout = layouts.get(op)
+        if layout is None:
+            raise ValueError(f"Unknown record opcode {op} at byte {offset}")
+        records.append((op, layout.unpack_from(data, offset + 1)))
+        offset += 1 + layout.size
+    return header, records
+
+
+def iter_events(records: Sequence[Tuple[int, tuple]]) -> Iterator[Record]:
+    """Expand decoded records into ``(event name, payload)`` pairs.
+
+    ``OP_RECLAIM`` frame ends carry no event and are skipped.
+    """
+
+    for op, fields in records:
+        if op == OP_TICK:
+            yield EVENT_TICK, {"dt": fields[0]}
+        elif op == OP_TICK_RUN:
+            dt, count = fields
+            for _ in range(count):
+                yield EVENT_TICK, {"dt": dt}
+        elif op == OP_TILE_CLICK:
+            yield EVENT_TILE_CLICK, {"row": fields[0], "col": fields[1]}
+        elif op == OP_ABILITY_ACTIVATE:
+            yield EVENT_ABILITY_ACTIVATE_REQUEST, {
+                "ability_entity": fields[0],
+                "owner_entity": _optional(fields[1]),
+            }
+        elif op == OP_CHOICE_SELECTED:
+            yield EVENT_CHOICE_SELECTED, {
+                "window_entity": fields[0],
+                "choice_entity": fields[1],
+                "payload_entity": _optional(fields[2]),
+            }
+        elif op == OP_EVENT:
+            yield fields[0], dict(fields[1])
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    world: World
+    bus: EventBus
+    systems: Dict[str, object]
+    ticks: int = 0
+    inputs: int = 0
+    seconds: float = 0.0
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.seconds if self.seconds > 0 else float("inf")
+
+
+def replay(
+    path: str | Path,
+    *,
+    session: Callable[[SessionHeader], Session] | None = None,
+) -> ReplayResult:
+    """Re-drive a fresh world from a log as fast as the systems allow.
+
+    ``session`` defaults to ``create_game_session`` or ``create_session``
+    depending on the header. Game sessions reclaim dead entities where the
+    window ended its frames: after every tick and at each ``OP_RECLAIM``.
+    """
+
+    header, records = read_log(path)
+    if session is None:
+        session = create_game_session if header.game_session else create_session
+    world, bus, systems = session(header)
+    result = ReplayResult(world, bus, systems)
+    frames = header.game_session
+    publish = bus.publish
+    emit = bus.emit
+    tick = None
+    start = time.perf_counter()
+    for op, fields in records:
+        if op == OP_RECLAIM:
+            reclaim_dead_entities(world)
+            continue
+        for name, payload in iter_events(((op, fields),)):
+            if name == EVENT_TICK:
+                dt = payload["dt"]
+                if tick is None or tick.dt != dt:
+                    tick = TickEvent(dt)
+                publish(tick)
+                if frames:
+                    reclaim_dead_entities(world)
+                result.ticks += 1
+            else:
+                emit(name, **payload)
+                result.inputs += 1
+                result.counters[name] = result.counters.get(name, 0) + 1
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a binary Battlelines event log headlessly.")
+    parser.add_argument("log", type=Path)
+    args = parser.parse_args(argv)
+    result = replay(args.log)
+    print(
+        f"{result.ticks} ticks, {result.inputs} inputs in {result.seconds:.3f}s "
+        f"({result.ticks_per_second:,.0f} ticks/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
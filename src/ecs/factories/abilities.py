@@ -16,6 +16,7 @@ from ecs.events.bus import EventBus
 from ecs.factories.choice_window import ChoiceDefinition, spawn_choice_window
 from ecs.systems.ability_pool_system import available_basic_player_ability_names
 from ecs.utils.game_state import set_game_mode
+from ecs.resources import resources_of
 
 ABILITY_FACTORY_PACKAGES: Tuple[str, ...] = (
     "ecs.factories.player_abilities",
@@ -155,10 +156,10 @@ def spawn_ability_choice_window(
                 input_guard_press_id=press_id,
             )
         else:
-            state_entries = list(world.get_component(GameState))
-            if state_entries:
-                state_entries[0][1].mode = mode
-                state_entries[0][1].input_guard_press_id = press_id
+            state = resources_of(world).get(GameState)
+            if state is not None:
+                state.mode = mode
+                state.input_guard_press_id = press_id
     return spawn_choice_window(
         world,
         definitions,
@@ -213,19 +214,17 @@ def _ability_preview(world: World, ability_name: str) -> tuple[str, Dict[str, in
     if cached is not None:
         description, cost_tuples = cached
         return description, dict(cost_tuples)
-    temp_entity = create_ability_by_name(world, ability_name)
+    # Build the sample in a scratch world: whether the cache was warm must not
+    # shift the entity ids the live world hands out (recorded sessions rely on them).
+    scratch = World()
+    temp_entity = create_ability_by_name(scratch, ability_name)
     try:
-        ability = world.component_for_entity(temp_entity, Ability)
+        ability = scratch.component_for_entity(temp_entity, Ability)
         description = ability.description or ""
         cost_items = tuple(sorted((ability.cost or {}).items()))
     except KeyError:
         description = ""
         cost_items = ()
-    finally:
-        try:
-            world.delete_entity(temp_entity, immediate=True)
-        except Exception:
-            world.delete_entity(temp_entity)
     _ABILITY_PREVIEW_CACHE[ability_name] = (description, cost_items)
     return description, dict(cost_items)
 
@@ -4,11 +4,31 @@ from ecs.components.animation_fade import FadeAnimation
 from ecs.components.animation_fall import FallAnimation
 from ecs.components.animation_refill import RefillAnimation
 from ecs.components.duration import Duration
-from typing import Tuple, List
+from typing import Any, Dict, Tuple, List
+
+# An animation slot: the entity plus the animation and Duration instances it reuses.
+AnimationSlot = Tuple[int, Any, Duration]
+
 
 class AnimationFactory:
+    """Creates animation entities; per-tile fade/fall/refill slots are pooled.
+
+    A cascade step animates every affected tile, so instead of creating and
+    deleting an entity per tile the factory recycles slots. A released slot
+    keeps only its ``Duration``, which hides it from ``get_component`` queries
+    for the animation type; acquiring it resets the pooled animation instance
+    and attaches it again. After warm-up a cascade step creates no entities.
+    """
+
     def __init__(self, world: World):
         self.world = world
+        self.slots_created = 0
+        self._free: Dict[type, List[AnimationSlot]] = {
+            FadeAnimation: [],
+            FallAnimation: [],
+            RefillAnimation: [],
+        }
+        self._slots: Dict[int, AnimationSlot] = {}
 
     def create_swap(self, src: Tuple[int,int], dst: Tuple[int,int], duration: float = 0.15) -> int:
         ent = self.world.create_entity()
@@ -19,26 +39,90 @@ class AnimationFactory:
     def create_fade_group(self, positions: List[Tuple[int,int]], duration: float = 0.2) -> List[int]:
         ents = []
         for pos in positions:
-            ent = self.world.create_entity()
-            self.world.add_component(ent, FadeAnimation(pos=pos))
-            self.world.add_component(ent, Duration(duration))
+            ent, fade = self._acquire(FadeAnimation, duration)
+            fade.pos = pos
+            fade.alpha = 1.0
+            self.world.add_component(ent, fade)
             ents.append(ent)
         return ents
 
     def create_fall_group(self, moves: List[dict], duration: float = 0.25) -> List[int]:
         ents = []
         for m in moves:
-            ent = self.world.create_entity()
-            self.world.add_component(ent, FallAnimation(src=m['from'], dst=m['to']))
-            self.world.add_component(ent, Duration(duration))
+            ent, fall = self._acquire(FallAnimation, duration)
+            fall.src = m['from']
+            fall.dst = m['to']
+            fall.linear = 0.0
+            fall.eased = 0.0
+            self.world.add_component(ent, fall)
             ents.append(ent)
         return ents
 
     def create_refill_group(self, positions: List[Tuple[int,int]], duration: float = 0.18) -> List[int]:
         ents = []
         for pos in positions:
-            ent = self.world.create_entity()
-            self.world.add_component(ent, RefillAnimation(pos=pos))
-            self.world.add_component(ent, Duration(duration))
+            ent, refill = self._acquire(RefillAnimation, duration)
+            refill.pos = pos
+            refill.linear = 0.0
+            refill.eased = 0.0
+            self.world.add_component(ent, refill)
             ents.append(ent)
         return ents
+
+    def release(self, ent: int, comp_type: type) -> bool:
+        """Detach a finished pooled animation and keep its slot for reuse.
+
+        Returns False when ``ent`` is not an active pooled slot of ``comp_type``.
+        """
+
+        slot = self._slots.get(ent)
+        if slot is None or type(slot[1]) is not comp_type:
+            return False
+        if not self._alive(slot):
+            del self._slots[ent]
+            return False
+        if comp_type not in self.world._entities[ent]:
+            return False  # already idle
+        self.world.remove_component(ent, comp_type)
+        self._free[comp_type].append(slot)
+        return True
+
+    def slot(self, ent: int) -> AnimationSlot | None:
+        return self._slots.get(ent)
+
+    def pooled(self, comp_type: type) -> int:
+        """Idle slots ready for ``comp_type`` animations."""
+
+        return len(self._free[comp_type])
+
+    def _acquire(self, comp_type: type, duration: float) -> Tuple[int, Any]:
+        free = self._free[comp_type]
+        while free:
+            slot = free.pop()
+            if self._alive(slot):
+                slot[2].value = duration
+                return slot[0], slot[1]
+            self._slots.pop(slot[0], None)
+        timer = Duration(duration)
+        ent = self.world.create_entity(timer)
+        animation = _blank(comp_type)
+        self._slots[ent] = (ent, animation, timer)
+        self.slots_created += 1
+        return ent, animation
+
+    def _alive(self, slot: AnimationSlot) -> bool:
+        # Someone else may have deleted the entity (e.g. a sweep of every Duration holder).
+        components = self.world._entities.get(slot[0])
+        return (
+            components is not None
+            and components.get(Duration) is slot[2]
+            and slot[0] not in self.world._dead_entities
+        )
+
+
+def _blank(comp_type: type) -> Any:
+    if comp_type is FadeAnimation:
+        return FadeAnimation(pos=(0, 0))
+    if comp_type is FallAnimation:
+        return FallAnimation(src=(0, 0), dst=(0, 0))
+    return RefillAnimation(pos=(0, 0))
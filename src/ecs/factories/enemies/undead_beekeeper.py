@@ -10,6 +10,7 @@ from ecs.components.health import Health
 from ecs.components.rule_based_agent import RuleBasedAgent
 from ecs.components.tile_bank import TileBank
 from ecs.components.affinity import Affinity
+from ecs.utils.tile_codes import tile_counts
 from .common import resolve_enemy_abilities
 
 DEFAULT_UNDEAD_BEEKEEPER_LOADOUT: Sequence[str] = (
@@ -29,7 +30,7 @@ def create_enemy_undead_beekeeper(
     enemy_entity = world.create_entity(
         RuleBasedAgent(),
         AbilityListOwner(ability_entities=ability_entities),
-        TileBank(owner_entity=0),
+        TileBank(owner_entity=0, counts=tile_counts(world)),
         Health(current=max_hp, max_hp=max_hp),
         Affinity(base={"nature": 1, "spirit": 1}),
         Character(
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_target import AbilityTarget
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_bee_sting(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_bee_sting(world: World) -> int:
         Ability(
             name="bee_sting",
             kind="active",
-            cost={"nature": 5, "spirit": 3, "shapeshift": 3},
+            cost=tile_counts(world, {"nature": 5, "spirit": 3, "shapeshift": 3}),
             description="Sting the foe, dealing damage equal to all nature tiles on the board.",
             cooldown=0,
         ),
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_target import AbilityTarget
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_cease_witchfire(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_cease_witchfire(world: World) -> int:
         Ability(
             name="cease_witchfire",
             kind="active",
-            cost={"shapeshift": 4},
+            cost=tile_counts(world, {"shapeshift": 4}),
             description="Convert up to three witchfire tiles into random mana, then heal 3.",
             cooldown=0,
         ),
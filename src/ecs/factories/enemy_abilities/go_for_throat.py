@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_target import AbilityTarget
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_go_for_throat(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_go_for_throat(world: World) -> int:
         Ability(
             name="go_for_throat",
             kind="active",
-            cost={"shapeshift": 7},
+            cost=tile_counts(world, {"shapeshift": 7}),
             description="Deal 3 damage plus 2 for every Locked Scent on the target.",
             cooldown=0,
         ),
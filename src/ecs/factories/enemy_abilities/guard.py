@@ -5,6 +5,7 @@ from esper import World
 from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
 from ecs.components.ability_target import AbilityTarget
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_guard(world: World) -> int:
@@ -13,7 +14,7 @@ def create_ability_guard(world: World) -> int:
         Ability(
             name="guard",
             kind="active",
-            cost={"shapeshift": 3},
+            cost=tile_counts(world, {"shapeshift": 3}),
             description="Place up to five guarded tiles that retaliate when cleared.",
             cooldown=0,
         ),
@@ -5,6 +5,7 @@ from esper import World
 from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
 from ecs.components.ability_target import AbilityTarget
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_mighty_bark(world: World) -> int:
@@ -13,7 +14,7 @@ def create_ability_mighty_bark(world: World) -> int:
         Ability(
             name="mighty_bark",
             kind="active",
-            cost={"spirit": 4, "nature": 2},
+            cost=tile_counts(world, {"spirit": 4, "nature": 2}),
             description="Heal 1 for every tile currently guarded by the mastiffs.",
             cooldown=0,
             params={"heal_per_tile": 1},
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_target import AbilityTarget
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_poisoned_flower(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_poisoned_flower(world: World) -> int:
         Ability(
             name="poisoned_flower",
             kind="active",
-            cost={"nature": 5, "hex": 3},
+            cost=tile_counts(world, {"nature": 5, "hex": 3}),
             description="Inflict 6 poison (1 damage per turn) on the opponent.",
             cooldown=0,
         ),
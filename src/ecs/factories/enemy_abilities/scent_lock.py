@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_cooldown import AbilityCooldown
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_target import AbilityTarget
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_scent_lock(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_scent_lock(world: World) -> int:
         Ability(
             name="scent_lock",
             kind="active",
-            cost={"blood": 2, "shapeshift": 2},
+            cost=tile_counts(world, {"blood": 2, "shapeshift": 2}),
             description="Inflict heavy bleeding on the foe to set up the kill.",
             cooldown=1,
             ends_turn=False,
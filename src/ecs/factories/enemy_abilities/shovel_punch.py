@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_shovel_punch(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_shovel_punch(world: World) -> int:
         Ability(
             name="shovel_punch",
             kind="active",
-            cost={"nature": 4, "shapeshift": 4},
+            cost=tile_counts(world, {"nature": 4, "shapeshift": 4}),
             description="Deal 5 damage to the opponent.",
             cooldown=0,
         ),
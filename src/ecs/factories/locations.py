@@ -12,6 +12,7 @@ from ecs.components.story_progress_tracker import StoryProgressTracker
 from ecs.events.bus import EventBus
 from ecs.factories.choice_window import ChoiceDefinition, spawn_choice_window
 from ecs.utils.game_state import set_game_mode
+from ecs.resources import resources_of
 
 
 @dataclass(frozen=True)
@@ -98,10 +99,10 @@ def spawn_location_choice_window(
     if event_bus is not None:
         set_game_mode(world, event_bus, GameMode.LOCATION_DRAFT, input_guard_press_id=press_id)
     else:
-        entries = list(world.get_component(GameState))
-        if entries:
-            entries[0][1].mode = GameMode.LOCATION_DRAFT
-            entries[0][1].input_guard_press_id = press_id
+        state = resources_of(world).get(GameState)
+        if state is not None:
+            state.mode = GameMode.LOCATION_DRAFT
+            state.input_guard_press_id = press_id
     return spawn_choice_window(
         world,
         definitions,
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_blood_bolt(world: World) -> int:
@@ -13,7 +14,7 @@ def create_ability_blood_bolt(world: World) -> int:
         Ability(
             name="blood_bolt",
             kind="active",
-            cost={"blood": 6},
+            cost=tile_counts(world, {"blood": 6}),
             description="Deal 2 damage to yourself and 5 damage to opponent.",
             params={"self_damage": 2, "opponent_damage": 5},
             cooldown=1,
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_blood_sacrifice(world: World) -> int:
@@ -15,7 +16,7 @@ def create_ability_blood_sacrifice(world: World) -> int:
         Ability(
             name="blood_sacrifice",
             kind="active",
-            cost={"blood": 7},
+            cost=tile_counts(world, {"blood": 7}),
             description=(
                 "Sacrifice a selected tile, gaining triple its effect while leaving the hole unfilled until a later cascade."
             ),
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_curse_of_frailty(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_curse_of_frailty(world: World) -> int:
         Ability(
             name="curse_of_frailty",
             kind="active",
-            cost={"hex": 3},
+            cost=tile_counts(world, {"hex": 3}),
             description="Afflict the enemy with frailty for 5 turns. Each application adds +1 damage taken.",
             cooldown=0,
             ends_turn=False,
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_life_drain(world: World) -> int:
@@ -15,7 +16,7 @@ def create_ability_life_drain(world: World) -> int:
         Ability(
             name="life_drain",
             kind="active",
-            cost={"blood": 7},
+            cost=tile_counts(world, {"blood": 7}),
             description="Deal 2 damage to the opponent and heal for the damage actually dealt.",
             params={"damage_amount": 2},
             cooldown=1,
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_savagery(world: World) -> int:
@@ -13,7 +14,7 @@ def create_ability_savagery(world: World) -> int:
         Ability(
             name="savagery",
             kind="active",
-            cost={"shapeshift": 5},
+            cost=tile_counts(world, {"shapeshift": 5}),
             description="Gain +1 damage to all attacks for five turns.",
             cooldown=2,
             ends_turn=False,
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_spirit_leech(world: World) -> int:
@@ -14,7 +15,7 @@ def create_ability_spirit_leech(world: World) -> int:
         Ability(
             name="spirit_leech",
             kind="active",
-            cost={"spirit": 5},
+            cost=tile_counts(world, {"spirit": 5}),
             description="Drain 2 mana from the opponent and deal 2 damage.",
             cooldown=1,
         ),
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_thorned_ward(world: World) -> int:
@@ -15,7 +16,7 @@ def create_ability_thorned_ward(world: World) -> int:
         Ability(
             name="thorned_ward",
             kind="active",
-            cost={"nature": 4},
+            cost=tile_counts(world, {"nature": 4}),
             description="Gain thorns for three turns, returning 2 damage to attackers hit via abilities or witchfire.",
             cooldown=1,
             ends_turn=False,
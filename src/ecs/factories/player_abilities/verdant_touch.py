@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_verdant_touch(world: World) -> int:
@@ -13,7 +14,7 @@ def create_ability_verdant_touch(world: World) -> int:
         Ability(
             name="verdant_touch",
             kind="active",
-            cost={"nature": 6},
+            cost=tile_counts(world, {"nature": 6}),
             description="Heal 4 HP.",
             params={"heal_amount": 4},
             cooldown=1,
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_crimson_pulse(world: World) -> int:
@@ -13,7 +14,7 @@ def create_ability_crimson_pulse(world: World) -> int:
         Ability(
             name="crimson_pulse",
             kind="active",
-            cost={"hex": 5},
+            cost=tile_counts(world, {"hex": 5}),
             description="Clear a 3x3 area centered on the target tile.",
             cooldown=2,
         ),
@@ -6,6 +6,7 @@ from ecs.components.ability import Ability
 from ecs.components.ability_target import AbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.components.ability_cooldown import AbilityCooldown
+from ecs.utils.tile_codes import tile_counts
 
 
 def create_ability_tactical_shift(world: World) -> int:
@@ -13,7 +14,7 @@ def create_ability_tactical_shift(world: World) -> int:
         Ability(
             name="tactical_shift",
             kind="active",
-            cost={"hex": 3, "nature": 2},
+            cost=tile_counts(world, {"hex": 3, "nature": 2}),
             description="Convert all tiles of the selected color to hex tiles.",
             params={"target_color": "hex"},
             cooldown=1,
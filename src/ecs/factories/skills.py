@@ -16,6 +16,7 @@ from ecs.components.starting_skill_choice import SkillChoice
 from ecs.events.bus import EventBus
 from ecs.factories.choice_window import ChoiceDefinition, spawn_choice_window
 from ecs.utils.game_state import set_game_mode
+from ecs.resources import resources_of
 
 SKILL_FACTORY_PACKAGES: Tuple[str, ...] = (
     "ecs.factories.player_skills",
@@ -129,10 +130,10 @@ def spawn_skill_choice_window(
         if event_bus is not None:
             set_game_mode(world, event_bus, mode, input_guard_press_id=press_id)
         else:
-            state_entries = list(world.get_component(GameState))
-            if state_entries:
-                state_entries[0][1].mode = mode
-                state_entries[0][1].input_guard_press_id = press_id
+            state = resources_of(world).get(GameState)
+            if state is not None:
+                state.mode = mode
+                state.input_guard_press_id = press_id
     return spawn_choice_window(
         world,
         definitions,
@@ -185,17 +186,14 @@ def _skill_description(world: World, skill_name: str) -> str:
     cached = _SKILL_DESCRIPTION_CACHE.get(skill_name)
     if cached is not None:
         return cached
-    temp_entity = create_skill_by_name(world, skill_name)
+    # Scratch world, as for ability previews: keep the live world's entity ids cache-independent.
+    scratch = World()
+    temp_entity = create_skill_by_name(scratch, skill_name)
     try:
-        skill = world.component_for_entity(temp_entity, Skill)
+        skill = scratch.component_for_entity(temp_entity, Skill)
         description = skill.description or ""
     except KeyError:
         description = ""
-    finally:
-        try:
-            world.delete_entity(temp_entity, immediate=True)
-        except Exception:
-            world.delete_entity(temp_entity)
     _SKILL_DESCRIPTION_CACHE[skill_name] = description
     return description
 
@@ -9,6 +9,7 @@ from ecs.events.bus import (
     EventBus,
 )
 from ecs.menu.components import MenuAction, MenuBackground, MenuButton, MenuTag
+from ecs.resources import resources_of
 
 
 class MenuInputSystem:
@@ -19,6 +20,9 @@ class MenuInputSystem:
         self._event_bus = event_bus
         if event_bus is not None:
             event_bus.subscribe(EVENT_MOUSE_PRESS, self.on_mouse_press)
+            # Clear on the selection event itself so replaying it tears the menu down too.
+            event_bus.subscribe(EVENT_MENU_NEW_GAME_SELECTED, self._on_menu_selected)
+            event_bus.subscribe(EVENT_MENU_CONTINUE_SELECTED, self._on_menu_selected)
 
     def on_mouse_press(self, sender, **payload) -> None:
         x = payload.get("x")
@@ -67,6 +71,9 @@ class MenuInputSystem:
         elif action == MenuAction.CONTINUE:
             self._handle_continue_selection(press_id=press_id)
 
+    def _on_menu_selected(self, sender, **payload) -> None:
+        self._clear_menu_entities()
+
     def _clear_menu_entities(self) -> None:
         """Remove all entities that are part of the menu UI."""
         to_delete: set[int] = set()
@@ -80,16 +87,14 @@ class MenuInputSystem:
             self.world.delete_entity(ent)
 
     def _get_game_state(self) -> GameState | None:
-        for _, state in self.world.get_component(GameState):
-            return state
-        return None
+        return resources_of(self.world).get(GameState)
 
     def _handle_new_game_selection(self, *, press_id: int | None = None) -> None:
         state = self._get_game_state()
         if state and state.mode == GameMode.MENU:
             self._emit(EVENT_MENU_NEW_GAME_SELECTED, press_id=press_id)
-            self._clear_menu_entities()
             if self._event_bus is None:
+                self._clear_menu_entities()
                 state.mode = GameMode.ABILITY_DRAFT
                 state.input_guard_press_id = press_id
                 from ecs.factories.abilities import spawn_player_ability_choice
@@ -106,8 +111,8 @@ class MenuInputSystem:
         state = self._get_game_state()
         if state and state.mode == GameMode.MENU:
             self._emit(EVENT_MENU_CONTINUE_SELECTED, press_id=press_id)
-            self._clear_menu_entities()
             if self._event_bus is None:
+                self._clear_menu_entities()
                 state.mode = GameMode.ABILITY_DRAFT
                 state.input_guard_press_id = press_id
                 from ecs.factories.abilities import spawn_player_ability_choice
@@ -3,6 +3,7 @@ import arcade
 from esper import World
 from ecs.components.game_state import GameState, GameMode
 from ecs.menu.components import MenuBackground, MenuButton
+from ecs.resources import resources_of
 
 
 class MenuRenderSystem:
@@ -62,6 +63,4 @@ class MenuRenderSystem:
             )
 
     def _get_game_state(self) -> GameState | None:
-        for _, state in self.world.get_component(GameState):
-            return state
-        return None
+        return resources_of(self.world).get(GameState)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from ecs.components.active_switch import ActiveSwitch
 from ecs.components.tile import TileType
 from ecs.components.tile_status_overlay import TileStatusOverlay
+from ecs.utils.queries import query_cache
 
 if TYPE_CHECKING:
     from ecs.components.tile_types import TileTypes
@@ -31,24 +32,20 @@ class BoardRenderer:
         rs._last_tile_layout = {}
         rs._last_draw_coords = {}
 
+        queries = query_cache(rs.world)
+        switches = queries.mapping(ActiveSwitch)
+        overlays = queries.mapping(TileStatusOverlay)
+        tile_types = queries.mapping(TileType)
         for (row, col), (ent, base_x, base_y) in positions.items():
-            try:
-                switch = rs.world.component_for_entity(ent, ActiveSwitch)
-            except KeyError:
+            switch = switches.get(ent)
+            if switch is None:
                 continue
             tile_active = switch.active
-            overlay: TileStatusOverlay | None
-            try:
-                overlay = rs.world.component_for_entity(ent, TileStatusOverlay)
-            except KeyError:
-                overlay = None
+            overlay: TileStatusOverlay | None = overlays.get(ent)
             tile_type_name = None
             if tile_active:
-                try:
-                    tile_component: TileType = rs.world.component_for_entity(ent, TileType)
-                    tile_type_name = tile_component.type_name
-                except KeyError:
-                    tile_type_name = None
+                tile_component: TileType | None = tile_types.get(ent)
+                tile_type_name = tile_component.type_name if tile_component is not None else None
             color = registry.background_for(tile_type_name) if tile_active and tile_type_name else None
             alpha_override = None
             draw_x = base_x
@@ -70,13 +67,8 @@ class BoardRenderer:
             if fall_anim is not None:
                 from_pos = positions[fall_anim.src][1:]
                 to_pos = positions[fall_anim.dst][1:]
-                p_lin = fall_anim.linear
-                p = p_lin
-                if rs.use_easing:
-                    if p < 0.5:
-                        p = 2 * p * p
-                    else:
-                        p = -2 * p * p + 4 * p - 1
+                # AnimationSystem eases the whole batch each tick.
+                p = fall_anim.eased if rs.use_easing else fall_anim.linear
                 draw_x = from_pos[0] + (to_pos[0] - from_pos[0]) * p
                 draw_y = from_pos[1] + (to_pos[1] - from_pos[1]) * p
 
@@ -84,13 +76,7 @@ class BoardRenderer:
             if refill_anim is not None:
                 to_pos = positions[(row, col)][1:]
                 start_y2 = to_pos[1] + ctx.tile_size * 1.2
-                p_lin = refill_anim.linear
-                p = p_lin
-                if rs.use_easing:
-                    if p < 0.5:
-                        p = 2 * p * p
-                    else:
-                        p = -2 * p * p + 4 * p - 1
+                p = refill_anim.eased if rs.use_easing else refill_anim.linear
                 draw_y = start_y2 + (to_pos[1] - start_y2) * p
 
             if color is None:
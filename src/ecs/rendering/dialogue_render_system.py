@@ -13,6 +13,7 @@ from ecs.rendering.highlight_profiles import (
     INACTIVE_PORTRAIT_ALPHA,
     INACTIVE_PORTRAIT_TINT,
 )
+from ecs.resources import resources_of
 
 
 class DialogueRenderSystem:
@@ -129,10 +130,7 @@ class DialogueRenderSystem:
         return sessions[0]
 
     def _get_game_state(self) -> GameState | None:
-        entries = list(self.world.get_component(GameState))
-        if not entries:
-            return None
-        return entries[0][1]
+        return resources_of(self.world).get(GameState)
 
     def _character_info(self, entity: int):
         try:
@@ -2,6 +2,7 @@ from esper import World
 
 from ecs.components.forbidden_knowledge import ForbiddenKnowledge
 from ecs.rendering.context import RenderContext
+from ecs.resources import resources_of
 
 
 class ForbiddenKnowledgeRenderer:
@@ -12,12 +13,11 @@ class ForbiddenKnowledgeRenderer:
         self.layout_cache: dict[int, tuple[float, float, float, float]] = {}
 
     def render(self, arcade, ctx: RenderContext) -> None:
-        entries = list(self.world.get_component(ForbiddenKnowledge))
-        if not entries:
-            return
-        entity, meter = entries[0]
-        if meter.max_value <= 0:
+        resources = resources_of(self.world)
+        meter = resources.get(ForbiddenKnowledge)
+        if meter is None or meter.max_value <= 0:
             return
+        entity = resources.entity(ForbiddenKnowledge)
 
         bar_width = 260
         bar_height = 18
@@ -0,0 +1,135 @@
+"""Singleton components ("resources") with O(1) access: ``world.resources[TurnState]``.
+
+Resources stay ordinary components on some entity, so cloning, deferred
+deletion and code that still uses ``world.get_component`` all see the same
+objects. The registry only remembers which entity holds each type and checks
+that the entity still carries that exact instance. A lookup is two dict
+probes, and a store scan happens only when the resource was created, replaced
+or removed behind its back.
+
+``create_world`` installs the registry. ``resources_of(world)`` attaches one
+lazily to a bare ``esper.World``.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+from esper import World
+
+T = TypeVar("T")
+Hook = Callable[[World, int, Any], None]
+
+
+class Resources:
+    """Typed singleton lookup for one world, plus insert/remove hooks."""
+
+    __slots__ = ("world", "hits", "scans", "_cache", "_on_insert", "_on_remove")
+
+    def __init__(self, world: World) -> None:
+        self.world = world
+        # Lookups answered from the cache vs. ones that had to scan the component store.
+        self.hits = 0
+        self.scans = 0
+        self._cache: Dict[type, Tuple[int, Any]] = {}
+        self._on_insert: Dict[type, List[Hook]] = {}
+        self._on_remove: Dict[type, List[Hook]] = {}
+
+    def __getitem__(self, resource_type: Type[T]) -> T:
+        instance = self.get(resource_type)
+        if instance is None:
+            raise KeyError(resource_type.__name__)
+        return instance
+
+    def __contains__(self, resource_type: type) -> bool:
+        return self.get(resource_type) is not None
+
+    def get(self, resource_type: Type[T], default: T | None = None) -> T | None:
+        entry = self._cache.get(resource_type)
+        if entry is not None:
+            components = self.world._entities.get(entry[0])
+            if components is not None and components.get(resource_type) is entry[1]:
+                self.hits += 1
+                return entry[1]
+        self.scans += 1
+        for entity, instance in self.world.get_component(resource_type):
+            self._cache[resource_type] = (entity, instance)
+            return instance
+        self._cache.pop(resource_type, None)
+        return default
+
+    def entity(self, resource_type: type) -> int | None:
+        """Entity currently holding ``resource_type``, if any."""
+
+        if self.get(resource_type) is None:
+            return None
+        return self._cache[resource_type][0]
+
+    def insert(self, instance: Any, entity: int | None = None) -> int:
+        """Install ``instance`` as its type's resource, replacing any existing one.
+
+        The replacement lands on the current holder unless ``entity`` is given;
+        with no holder a new entity is created.
+        """
+
+        resource_type = type(instance)
+        holder = self.entity(resource_type)
+        if holder is not None and entity is not None and holder != entity:
+            self.remove(resource_type)
+            holder = None
+        if holder is not None:
+            self._fire(self._on_remove, resource_type, holder, self._cache[resource_type][1])
+        target = entity if entity is not None else holder
+        if target is None:
+            target = self.world.create_entity()
+        self.world.add_component(target, instance)
+        self._cache[resource_type] = (target, instance)
+        self._fire(self._on_insert, resource_type, target, instance)
+        return target
+
+    def track(self, entity: int, instance: Any) -> None:
+        """Record a component already on ``entity`` as its type's resource, skipping scan and hooks."""
+
+        self._cache[type(instance)] = (entity, instance)
+
+    def get_or_insert(self, resource_type: Type[T], factory: Callable[[], T] | None = None) -> T:
+        instance = self.get(resource_type)
+        if instance is None:
+            instance = (factory or resource_type)()
+            self.insert(instance)
+        return instance
+
+    def remove(self, resource_type: type) -> Any | None:
+        """Detach the resource's component from its holder and return it."""
+
+        instance = self.get(resource_type)
+        if instance is None:
+            return None
+        holder = self._cache.pop(resource_type)[0]
+        self.world.remove_component(holder, resource_type)
+        self._fire(self._on_remove, resource_type, holder, instance)
+        return instance
+
+    def on_insert(self, resource_type: type, hook: Hook) -> None:
+        """Call ``hook(world, entity, instance)`` whenever ``insert`` installs the type."""
+
+        self._on_insert.setdefault(resource_type, []).append(hook)
+
+    def on_remove(self, resource_type: type, hook: Hook) -> None:
+        """Call ``hook(world, entity, instance)`` when ``remove``/``insert`` drops the type."""
+
+        self._on_remove.setdefault(resource_type, []).append(hook)
+
+    def _fire(self, hooks: Dict[type, List[Hook]], resource_type: type, entity: int, instance: Any) -> None:
+        for hook in hooks.get(resource_type, ()):
+            hook(self.world, entity, instance)
+
+
+def resources_of(world: World) -> Resources:
+    """The world's resource registry, attaching one on first use."""
+
+    registry = world.__dict__.get("resources")
+    if registry is None:
+        registry = Resources(world)
+        world.resources = registry  # type: ignore[attr-defined]
+    return registry
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
 from esper import World
 
@@ -10,6 +10,7 @@ from ecs.components.pending_ability_target import PendingAbilityTarget
 from ecs.components.ability_effect import AbilityEffectSpec, AbilityEffects
 from ecs.events.bus import EventBus, EVENT_EFFECT_APPLY
 from ecs.utils.combatants import find_primary_opponent
+from ecs.resources import resources_of
 
 
 @dataclass(slots=True)
@@ -38,16 +39,21 @@ class AbilityResolver(Protocol):
 class EffectDrivenAbilityResolver:
     """Mixin providing helpers for abilities defined via AbilityEffects."""
 
-    def _apply_declared_effects(self, ctx: AbilityContext) -> list[int]:
-        specs = self._collect_effect_specs(ctx)
-        if not specs:
-            return []
-        affected: list[int] = []
-        for spec in specs:
+    def declared_effects(self, ctx: AbilityContext) -> Iterator[tuple[AbilityEffectSpec, int, dict[str, Any]]]:
+        """Yield ``(spec, target, metadata)`` for each declared effect that has a target.
+
+        Metadata is built as each effect is reached, so ``context_read`` sees
+        what the effects before it wrote to ``ctx.scratchpad``.
+        """
+        for spec in self._collect_effect_specs(ctx):
             target = self._select_effect_target(ctx, spec)
             if target is None:
                 continue
-            metadata = self._build_effect_metadata(ctx, spec)
+            yield spec, target, self._build_effect_metadata(ctx, spec)
+
+    def _apply_declared_effects(self, ctx: AbilityContext) -> list[int]:
+        affected: list[int] = []
+        for spec, target, metadata in self.declared_effects(ctx):
             payload: dict[str, Any] = {
                 "owner_entity": target,
                 "source_entity": ctx.ability_entity,
@@ -121,7 +127,4 @@ class EffectDrivenAbilityResolver:
     def _find_board_entity(self, ctx: AbilityContext) -> int | None:
         from ecs.components.board import Board
 
-        boards = list(ctx.world.get_component(Board))
-        if not boards:
-            return None
-        return boards[0][0]
+        return resources_of(ctx.world).entity(Board)
@@ -12,12 +12,14 @@ class BeeStingResolver(AbilityResolver):
     """Ability resolver that scales damage with nature tiles on the board."""
 
     name = "bee_sting"
+    # Reads the board but never changes it, so AI scoring may project it analytically.
+    board_neutral = True
 
     def __init__(self) -> None:
         self._effect_helper = EffectDrivenAbilityResolver()
 
     def resolve(self, ctx: AbilityContext) -> None:  # pragma: no cover - exercised in tests
-        ctx.scratchpad["bee_sting_amount"] = self._nature_tile_count(ctx.world)
+        self.prepare_scratchpad(ctx)
         affected = self._effect_helper._apply_declared_effects(ctx)
         ctx.event_bus.emit(
             EVENT_ABILITY_EFFECT_APPLIED,
@@ -28,6 +30,9 @@ class BeeStingResolver(AbilityResolver):
         if not state.cascade_observed:
             ctx.event_bus.emit(EVENT_CASCADE_COMPLETE, depth=0)
 
+    def prepare_scratchpad(self, ctx: AbilityContext) -> None:
+        ctx.scratchpad["bee_sting_amount"] = self._nature_tile_count(ctx.world)
+
     @staticmethod
     def _nature_tile_count(world: World) -> int:
         try:
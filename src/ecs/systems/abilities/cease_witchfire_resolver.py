@@ -8,7 +8,6 @@ from esper import World
 from ecs.components.active_switch import ActiveSwitch
 from ecs.components.board_position import BoardPosition
 from ecs.components.tile import TileType
-from ecs.components.tile_type_registry import TileTypeRegistry
 from ecs.components.tile_types import TileTypes
 from ecs.events.bus import EVENT_ABILITY_EFFECT_APPLIED, EVENT_CASCADE_COMPLETE
 from ecs.systems.abilities.base import (
@@ -17,6 +16,7 @@ from ecs.systems.abilities.base import (
     EffectDrivenAbilityResolver,
 )
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.resources import resources_of
 
 Position = Tuple[int, int]
 
@@ -100,6 +100,4 @@ class CeaseWitchfireResolver(AbilityResolver):
 
     @staticmethod
     def _registry_entity(world: World) -> int | None:
-        for entity, _ in world.get_component(TileTypeRegistry):
-            return entity
-        return None
+        return resources_of(world).entity(TileTypes)
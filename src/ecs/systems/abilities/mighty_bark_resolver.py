@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from ecs.components.effect import Effect
 from ecs.events.bus import EVENT_ABILITY_EFFECT_APPLIED, EVENT_CASCADE_COMPLETE, EVENT_EFFECT_APPLY
 from ecs.systems.abilities.base import AbilityContext, AbilityResolver
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.utils.effect_index import effect_index
 
 
 class MightyBarkResolver(AbilityResolver):
@@ -46,14 +46,7 @@ class MightyBarkResolver(AbilityResolver):
         self._finalize(ctx, healed=amount > 0)
 
     def _guarded_tile_count(self, ctx: AbilityContext, owner_entity: int) -> int:
-        count = 0
-        for _, effect in ctx.world.get_component(Effect):
-            if effect.slug != "tile_guarded":
-                continue
-            if effect.metadata.get("source_owner") != owner_entity:
-                continue
-            count += 1
-        return count
+        return effect_index(ctx.world).count_where("tile_guarded", "source_owner", owner_entity)
 
     def _finalize(self, ctx: AbilityContext, *, healed: bool) -> None:
         state = get_or_create_turn_state(ctx.world)
@@ -19,6 +19,7 @@ from ecs.systems.abilities.base import (
 )
 from ecs.systems.abilities.registry import create_resolver_registry
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.resources import resources_of
 
 
 class AbilityResolutionSystem:
@@ -85,10 +86,10 @@ class AbilityResolutionSystem:
     def _get_active_owner(self) -> int | None:
         from ecs.components.active_turn import ActiveTurn
 
-        active = list(self.world.get_component(ActiveTurn))
-        if not active:
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is None:
             return None
-        return active[0][1].owner_entity
+        return active.owner_entity
 
     def _clear_pending_target(self, ability_entity: int) -> None:
         try:
@@ -19,6 +19,7 @@ from ecs.events.bus import (
     EVENT_TILE_CLICK,
 )
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.resources import resources_of
 
 
 class AbilityTargetingSystem:
@@ -164,10 +165,10 @@ class AbilityTargetingSystem:
     def _is_owner_active(self, owner_entity: int) -> bool:
         from ecs.components.active_turn import ActiveTurn
 
-        active_turns = list(self.world.get_component(ActiveTurn))
-        if not active_turns:
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is None:
             return True
-        return active_turns[0][1].owner_entity == owner_entity
+        return active.owner_entity == owner_entity
 
     def _clear_targeting(self, owner_entity: int) -> None:
         try:
@@ -1,6 +1,7 @@
-from ecs.events.bus import (EVENT_TICK, EventBus, EVENT_ANIMATION_START, EVENT_ANIMATION_COMPLETE,
+from ecs.events.bus import (EventBus,
                              EVENT_TILE_SWAP_REQUEST, EVENT_TILE_SWAP_VALID, EVENT_TILE_SWAP_INVALID,
                              EVENT_TILE_SWAP_DO, EVENT_TILE_SWAP_FINALIZE)
+from ecs.events.payloads import AnimationCompleteEvent, AnimationStartEvent, TickEvent
 from ecs.components.animation_swap import SwapAnimation
 from ecs.components.animation_fade import FadeAnimation
 from ecs.components.animation_fall import FallAnimation
@@ -8,24 +9,35 @@ from ecs.components.animation_refill import RefillAnimation
 # TileType now used; color access remains via compatibility .color property when needed.
 from ecs.components.duration import Duration
 from ecs.factories.animation_factory import AnimationFactory
+from ecs.systems.animation_batch import AnimationBatch
 from esper import World
 from typing import Tuple
 from ecs.components.duration import Duration
 from ecs.components.board_position import BoardPosition
 
 class AnimationSystem:
-    """Drives timing of animations; each animation is its own component instance."""
+    """Drives timing of animations.
+
+    The swap is its own component instance. Fade, fall and refill animations
+    are pooled components whose timing lives in one ``AnimationBatch`` per kind.
+    """
     def __init__(self, world: World, event_bus: EventBus):
         self.world = world
         self.event_bus = event_bus
         self.swap_entity: int | None = None
         self.factory = AnimationFactory(world)
+        # One struct-of-arrays batch per tile animation kind; ticked in this order.
+        self.batches: dict[type, AnimationBatch] = {
+            FadeAnimation: AnimationBatch('fade', descending=True),
+            FallAnimation: AnimationBatch('fall'),
+            RefillAnimation: AnimationBatch('refill'),
+        }
         # Store validity outcomes received before swap entity exists.
         self._pending_swap_outcomes: dict[tuple[int,int], bool] = {}
         # Track finalize wait elapsed time to auto-complete in test environments lacking finalize event.
         self._finalize_wait_elapsed: float = 0.0
-        event_bus.subscribe(EVENT_TICK, self.on_tick)
-        event_bus.subscribe(EVENT_ANIMATION_START, self.on_animation_start)
+        event_bus.subscribe_typed(TickEvent, self.on_tick)
+        event_bus.subscribe_typed(AnimationStartEvent, self.on_animation_start)
         event_bus.subscribe(EVENT_TILE_SWAP_REQUEST, self.on_swap_request)
         event_bus.subscribe(EVENT_TILE_SWAP_VALID, self.on_swap_valid)
         event_bus.subscribe(EVENT_TILE_SWAP_INVALID, self.on_swap_invalid)
@@ -39,10 +51,21 @@ class AnimationSystem:
         except Exception:
             return None
 
+    def _retire_finalized_swap(self):
+        # A swap waiting out its finalize grace period has already been applied to the
+        # board. When a new swap starts in the same tick (e.g. an extra turn granted by a
+        # cascade that resolved within one large dt) retire it instead of dropping the request.
+        swap = self._active_swap()
+        if swap is not None and swap.phase == 'finalize_wait':
+            pending = dict(self._pending_swap_outcomes)
+            self._end_swap()
+            self._pending_swap_outcomes.update(pending)
+
     def on_swap_request(self, sender, **kwargs):
         src = kwargs.get('src'); dst = kwargs.get('dst')
         if not src or not dst:
             return
+        self._retire_finalized_swap()
         if self._active_swap() is None:
             self.swap_entity = self.factory.create_swap(src, dst)
             # Apply any pending outcome captured earlier.
@@ -54,6 +77,7 @@ class AnimationSystem:
 
     def on_swap_valid(self, sender, **kwargs):
         src = kwargs.get('src'); dst = kwargs.get('dst')
+        self._retire_finalized_swap()
         swap = self._active_swap()
         if swap and swap.src == src and swap.dst == dst:
             swap.valid = True
@@ -64,6 +88,7 @@ class AnimationSystem:
 
     def on_swap_invalid(self, sender, **kwargs):
         src = kwargs.get('src'); dst = kwargs.get('dst')
+        self._retire_finalized_swap()
         swap = self._active_swap()
         if swap and swap.src == src and swap.dst == dst:
             swap.valid = False
@@ -79,18 +104,25 @@ class AnimationSystem:
         if swap and swap.src == src and swap.dst == dst and swap.phase == 'finalize_wait':
             self._end_swap()
 
-    def on_animation_start(self, sender, **kwargs):
-        kind = kwargs.get('kind'); items = kwargs.get('items', [])
+    def on_animation_start(self, sender, event: AnimationStartEvent):
+        kind = event.kind; items = event.items
         if kind == 'fade':
-            self.factory.create_fade_group(items)
+            self._track(FadeAnimation, self.factory.create_fade_group(items))
         elif kind == 'fall':
             # items contain dicts with 'from'/'to' only; color derived at render via TileTypes
-            self.factory.create_fall_group(items)
+            self._track(FallAnimation, self.factory.create_fall_group(items))
         elif kind == 'refill':
-            self.factory.create_refill_group(items)
+            self._track(RefillAnimation, self.factory.create_refill_group(items))
 
-    def on_tick(self, sender, **kwargs):
-        dt = kwargs.get('dt', 1/60)
+    def _track(self, comp_type, ents):
+        # A group shares one duration, so it becomes a single segment of the kind's batch.
+        if not ents:
+            return
+        slots = [self.factory.slot(ent) for ent in ents]
+        self.batches[comp_type].add_segment(list(ents), [slot[1] for slot in slots], slots[0][2].value)
+
+    def on_tick(self, sender, event: TickEvent):
+        dt = event.dt
         # Swap progression
         swap = self._active_swap()
         if swap:
@@ -122,48 +154,20 @@ class AnimationSystem:
                 self._finalize_wait_elapsed += dt
                 if self._finalize_wait_elapsed >= 0.05:  # ~3 frames at 60fps
                     self._end_swap()
-        # Fade progression
-        fades = list(self.world.get_component(FadeAnimation))
-        if fades:
-            for ent, fade in fades:
-                if fade.alpha > 0.0:
-                    d = self.world.component_for_entity(ent, Duration)
-                    fade.alpha -= dt / d.value
-                    if fade.alpha < 0.0:
-                        fade.alpha = 0.0
-            if all(fade.alpha <= 0.0 for _, fade in fades):
-                positions = [fade.pos for _, fade in fades]
-                for ent, _ in fades:
-                    self._delete_animation_entity(ent, FadeAnimation)
-                self.event_bus.emit(EVENT_ANIMATION_COMPLETE, kind='fade', items=positions)
-        # Fall progression
-        falls = list(self.world.get_component(FallAnimation))
-        if falls:
-            for ent, fall in falls:
-                if fall.linear < 1.0:
-                    d = self.world.component_for_entity(ent, Duration)
-                    fall.linear += dt / d.value
-                    if fall.linear > 1.0:
-                        fall.linear = 1.0
-            if all(fall.linear >= 1.0 for _, fall in falls):
-                items = [{'from':fall.src,'to':fall.dst} for _, fall in falls]
-                for ent, _ in falls:
-                    self._delete_animation_entity(ent, FallAnimation)
-                self.event_bus.emit(EVENT_ANIMATION_COMPLETE, kind='fall', items=items)
-        # Refill progression
-        refills = list(self.world.get_component(RefillAnimation))
-        if refills:
-            for ent, refill in refills:
-                if refill.linear < 1.0:
-                    d = self.world.component_for_entity(ent, Duration)
-                    refill.linear += dt / d.value
-                    if refill.linear > 1.0:
-                        refill.linear = 1.0
-            if all(refill.linear >= 1.0 for _, refill in refills):
-                positions = [refill.pos for _, refill in refills]
-                for ent, _ in refills:
-                    self._delete_animation_entity(ent, RefillAnimation)
-                self.event_bus.emit(EVENT_ANIMATION_COMPLETE, kind='refill', items=positions)
+        # Fade, fall and refill progression: a group completes when every animation in it has.
+        for comp_type, batch in self.batches.items():
+            if batch and batch.advance(dt):
+                items = self._completed_items(comp_type, batch.views)
+                for ent in batch.entities:
+                    self._finish_animation(ent, comp_type)
+                batch.clear()
+                self.event_bus.publish(AnimationCompleteEvent(batch.kind, items))
+
+    @staticmethod
+    def _completed_items(comp_type, views):
+        if comp_type is FallAnimation:
+            return [{'from': fall.src, 'to': fall.dst} for fall in views]
+        return [view.pos for view in views]
 
     # Removed internal swap validity prediction to enforce pure event-driven validation.
 
@@ -187,6 +191,11 @@ class AnimationSystem:
         self._pending_swap_outcomes.clear()
         self._finalize_wait_elapsed = 0.0
 
+    def _finish_animation(self, ent: int, comp_type):
+        # Pooled slots go back to the factory; anything else is torn down.
+        if not self.factory.release(ent, comp_type):
+            self._delete_animation_entity(ent, comp_type)
+
     def _delete_animation_entity(self, ent: int, comp_type):
         """Robust deletion: remove animation, duration, board position then entity."""
 
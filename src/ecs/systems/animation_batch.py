@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, List
+
+
+class AnimationBatch:
+    """Struct-of-arrays timing for every running tile animation of one kind.
+
+    Tiles started by the same ``AnimationStartEvent`` share a start time and
+    duration, so the batch keeps one progress value per started segment:
+    ``values`` and ``durations`` are parallel arrays and ``ends`` marks where
+    each segment's tiles stop in ``entities``/``views``. Fades count down from
+    1.0 to 0.0 (their alpha); falls and refills count up from 0.0 to 1.0.
+
+    A tick is one add-and-clip pass that updates the segment arrays in place,
+    and the ease-in-out curve is computed per segment; ticking allocates no
+    new arrays and ``clear`` empties the same ones. The per-tile components
+    (``FadeAnimation`` etc.) stay the renderer's view; only segments still
+    moving write their new value out.
+    """
+
+    __slots__ = ("kind", "descending", "entities", "views", "values", "durations", "eased", "ends")
+
+    def __init__(self, kind: str, descending: bool = False) -> None:
+        self.kind = kind
+        self.descending = descending
+        self.entities: List[int] = []
+        self.views: List[Any] = []
+        self.values = array("d")
+        self.durations = array("d")
+        self.eased = array("d")
+        self.ends: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def add_segment(self, entities: List[int], views: List[Any], duration: float) -> None:
+        if not entities:
+            return
+        self.entities.extend(entities)
+        self.views.extend(views)
+        self.values.append(1.0 if self.descending else 0.0)
+        self.durations.append(duration)
+        self.eased.append(0.0)
+        self.ends.append(len(self.views))
+
+    def advance(self, dt: float) -> bool:
+        """Step every animation by ``dt``; True once the whole batch has finished.
+
+        Updates ``values`` and ``eased`` in place, one pass over the segments.
+        """
+
+        values = self.values
+        durations = self.durations
+        views = self.views
+        ends = self.ends
+        descending = self.descending
+        finished = True
+        start = 0
+        for segment in range(len(ends)):
+            end = ends[segment]
+            value = values[segment]
+            if descending:
+                # Same arithmetic as the per-tile ``alpha -= dt / duration`` clamped at 0.
+                if value > 0.0:
+                    value = value - dt / durations[segment]
+                    if value <= 0.0:
+                        value = 0.0
+                    else:
+                        finished = False
+                    values[segment] = value
+                    for index in range(start, end):
+                        views[index].alpha = value
+            elif value < 1.0:
+                value = value + dt / durations[segment]
+                if value >= 1.0:
+                    value = 1.0
+                else:
+                    finished = False
+                values[segment] = value
+                curve = 2 * value * value if value < 0.5 else -2 * value * value + 4 * value - 1
+                self.eased[segment] = curve
+                for index in range(start, end):
+                    view = views[index]
+                    view.linear = value
+                    view.eased = curve
+            start = end
+        return finished
+
+    def clear(self) -> None:
+        """Drop every segment, keeping the buffers for the next batch."""
+
+        self.entities.clear()
+        self.views.clear()
+        del self.values[:]
+        del self.durations[:]
+        del self.eased[:]
+        self.ends.clear()
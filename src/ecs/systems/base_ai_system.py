@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import random
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Type, Union, cast
 
@@ -14,7 +15,9 @@ from ecs.components.ability_target import AbilityTarget
 from ecs.components.pending_ability_target import PendingAbilityTarget
 from ecs.components.targeting_state import TargetingState
 from ecs.components.tile_bank import TileBank
+from ecs.components.tile_counts import TileCounts
 from ecs.events.bus import (
+    BACKEND_DIRECT,
     EventBus,
     EVENT_ABILITY_ACTIVATE_REQUEST,
     EVENT_TILE_CLICK,
@@ -23,9 +26,21 @@ from ecs.events.bus import (
     EVENT_TURN_ADVANCED,
     EVENT_EXTRA_TURN_GRANTED,
 )
-from ecs.systems.board_ops import active_tile_type_map, find_valid_swaps
+from ecs.systems.abilities.registry import create_resolver_registry
+from ecs.systems.board_ops import (
+    active_tile_type_map,
+    board_key,
+    canonical_cascade_cache,
+    canonical_swap,
+    find_valid_swaps,
+)
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.ai.ability_projection import AbilityProjection, project_ability
+from ecs.ai.decision_profiler import DecisionProfiler
 from ecs.ai.simulation import CloneState, clone_world_state
+from ecs.resources import resources_of
+from ecs.utils.tile_banks import find_bank
+from ecs.utils.tile_codes import tile_codes
 
 Position = Tuple[int, int]
 
@@ -43,7 +58,7 @@ ActionPayload = Union[Tuple[Position, Position], AbilityAction]
 @dataclass(slots=True)
 class AbilitySnapshot:
     entity: int
-    cost: Dict[str, int]
+    cost: TileCounts
     affordable: bool
     cooldown: int
     name: str
@@ -52,13 +67,22 @@ class AbilitySnapshot:
 
 @dataclass(slots=True)
 class OwnerSnapshot:
-    bank_counts: Dict[str, int]
+    bank_counts: TileCounts
     ability_map: Dict[int, AbilitySnapshot]
 
 
 class BaseAISystem(ABC):
     """Shared turn automation for AI owners with pluggable evaluation."""
 
+    # Subclasses that implement ``_score_projection`` flip this on so board-neutral
+    # abilities are scored analytically instead of through a cloned world; a
+    # projection the subclass declines to score still goes through a clone.
+    analytic_ability_scoring: bool = False
+    # Opt-in: swaps equivalent under left/right mirroring (and renaming of the
+    # colours ``_score_neutral_types`` reports) are scored once per decision, and
+    # clones share the canonicalising cascade cache.
+    symmetric_swap_dedup: bool = False
+
     def __init__(
         self,
         world: World,
@@ -76,6 +100,11 @@ class BaseAISystem(ABC):
         self.current_action: Optional[Tuple[str, ActionPayload]] = None
         self.action_phase: Optional[str] = None
         self._acting_owner: Optional[int] = None
+        self._ability_resolvers = create_resolver_registry()
+        # Context bus for ability projections; nothing listens on it, so one serves every call.
+        self._projection_bus = EventBus(backend=BACKEND_DIRECT, flight_recorder_size=0)
+        # Optional latency instrumentation; attach a DecisionProfiler to enable.
+        self.profiler: DecisionProfiler | None = None
         event_bus.subscribe(EVENT_TURN_ADVANCED, self.on_turn_advanced)
         event_bus.subscribe(EVENT_TURN_ACTION_STARTED, self.on_turn_action_started)
         event_bus.subscribe(EVENT_EXTRA_TURN_GRANTED, self.on_extra_turn_granted)
@@ -140,26 +169,55 @@ class BaseAISystem(ABC):
             self.delay_remaining = max(0.0, self.delay_remaining - dt)
             if self.delay_remaining > 0.0:
                 return
-        if self.current_action is None:
-            action = self._choose_action(self.pending_owner)
-            if action is None:
-                self.has_dispatched_action = True
-                return
-            self.current_action = action
-            self.action_phase = "start"
-        self._progress_action()
+        profiler = self.profiler
+        deciding = self.current_action is None
+        if profiler is not None:
+            if deciding:
+                profiler.begin(self.pending_owner)
+            else:
+                profiler.resume()
+        try:
+            if deciding:
+                action = self._choose_action(self.pending_owner)
+                if action is None:
+                    self.has_dispatched_action = True
+                    return
+                self.current_action = action
+                self.action_phase = "start"
+            with self._phase("dispatch"):
+                self._progress_action()
+        finally:
+            if profiler is not None:
+                # The record covers the whole action, including later dispatch ticks.
+                if self.current_action is None:
+                    profiler.end()
+                else:
+                    profiler.pause()
 
     # --- Core flow ------------------------------------------------------
     def _choose_action(self, owner_entity: int) -> Optional[Tuple[str, ActionPayload]]:
-        swaps = find_valid_swaps(self.world)
+        with self._phase("find_swaps"):
+            swaps = find_valid_swaps(self.world)
         candidates: List[Tuple[str, ActionPayload]] = [("swap", swap) for swap in swaps]
-        candidates.extend(("ability", ability) for ability in self._enumerate_ability_actions(owner_entity))
+        abilities = self._enumerate_ability_actions(owner_entity)
+        candidates.extend(("ability", ability) for ability in abilities)
+        if self.profiler is not None:
+            self.profiler.count_candidates("swap", len(swaps))
+            self.profiler.count_candidates("ability", len(abilities))
         if not candidates:
             return None
         best_action: Optional[Tuple[str, ActionPayload]] = None
         best_score = float("-inf")
+        classes = self._swap_equivalence_classes(owner_entity, swaps) if self.symmetric_swap_dedup else {}
+        class_scores: Dict[object, float] = {}
         for candidate in candidates:
-            score = self._score_action(owner_entity, candidate)
+            class_key = classes.get(candidate[1]) if candidate[0] == "swap" else None
+            if class_key is not None and class_key in class_scores:
+                score = class_scores[class_key]
+            else:
+                score = self._score_action(owner_entity, candidate)
+                if class_key is not None:
+                    class_scores[class_key] = score
             if score > best_score:
                 best_score = score
                 best_action = candidate
@@ -167,18 +225,63 @@ class BaseAISystem(ABC):
 
     def _score_action(self, owner_entity: int, candidate: Tuple[str, ActionPayload]) -> float:
         snapshot = self._capture_owner_snapshot(owner_entity)
-        clone_state = clone_world_state(self.world)
-        entity_map = clone_state.entity_map
-        engine = clone_state.engine
-        clone_owner = entity_map.get(owner_entity, owner_entity)
         kind, payload_obj = candidate
-        if kind == "swap":
-            source, target = cast(Tuple[Position, Position], payload_obj)
-            engine.swap_and_resolve(source, target, acting_owner=clone_owner)
-        elif kind == "ability":
-            ability_action = cast(AbilityAction, payload_obj)
-            self._apply_ability_in_clone(clone_state, clone_owner, ability_action)
-        return self._score_clone_world(clone_state, clone_owner, snapshot, candidate)
+        if kind == "ability" and self.analytic_ability_scoring:
+            with self._phase("simulate"):
+                projection = self._project_ability(owner_entity, cast(AbilityAction, payload_obj))
+            if projection is not None:
+                with self._phase("score"):
+                    projected = self._score_projection(projection, snapshot, candidate)
+                if projected is not None:
+                    return projected
+        with self._phase("clone"):
+            clone_state = clone_world_state(self.world)
+        try:
+            if self.symmetric_swap_dedup:
+                clone_state.engine.cascade_cache = canonical_cascade_cache
+            entity_map = clone_state.entity_map
+            engine = clone_state.engine
+            clone_owner = entity_map.get(owner_entity, owner_entity)
+            with self._phase("simulate"):
+                if kind == "swap":
+                    source, target = cast(Tuple[Position, Position], payload_obj)
+                    engine.swap_and_resolve(source, target, acting_owner=clone_owner)
+                elif kind == "ability":
+                    ability_action = cast(AbilityAction, payload_obj)
+                    self._apply_ability_in_clone(clone_state, clone_owner, ability_action)
+            with self._phase("score"):
+                return self._score_clone_world(clone_state, clone_owner, snapshot, candidate)
+        finally:
+            clone_state.close()
+
+    def _swap_equivalence_classes(
+        self,
+        owner_entity: int,
+        swaps: List[Tuple[Position, Position]],
+    ) -> Dict[Tuple[Position, Position], object]:
+        keyed = board_key(self.world)
+        if keyed is None:
+            return {}
+        key = keyed[0]
+        relabel = self._score_neutral_types(owner_entity)
+        classes: Dict[Tuple[Position, Position], object] = {}
+        for src, dst in swaps:
+            canonical = canonical_swap(key, src, dst, relabel)
+            classes[(src, dst)] = (canonical.key, canonical.src, canonical.dst)
+        return classes
+
+    def _score_neutral_types(self, owner_entity: int) -> frozenset[str]:
+        """Tile types the scorer treats interchangeably for ``owner_entity``.
+
+        Only these colours may be renamed when deduplicating swaps; the default is
+        none, which limits deduplication to mirror images.
+        """
+        return frozenset()
+
+    def _phase(self, name: str) -> AbstractContextManager[None]:
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
 
     def _capture_owner_snapshot(self, owner_entity: int) -> OwnerSnapshot:
         bank: TileBank | None = None
@@ -186,7 +289,9 @@ class BaseAISystem(ABC):
             bank = self.world.component_for_entity(owner_entity, TileBank)
         except KeyError:
             bank = None
-        bank_counts: Dict[str, int] = dict(bank.counts) if bank is not None else {}
+        # Snapshot maps sit on the world's code table so scoring works slot by slot.
+        codes = tile_codes(self.world)
+        bank_counts = TileCounts(bank.counts if bank is not None else None, codes=codes)
         ability_map: Dict[int, AbilitySnapshot] = {}
         owner_comp: AbilityListOwner | None
         try:
@@ -195,19 +300,21 @@ class BaseAISystem(ABC):
             owner_comp = None
         if owner_comp is not None:
             for ability_entity in owner_comp.ability_entities:
-                cost: Dict[str, int] = {}
+                cost = TileCounts(codes=codes)
                 name = ""
                 try:
                     ability = self.world.component_for_entity(ability_entity, Ability)
                 except KeyError:
                     ability = None
                 if ability is not None:
-                    cost = dict(ability.cost)
+                    cost = ability.cost
+                    if cost.codes is not codes:
+                        cost = TileCounts(cost, codes=codes)
                     name = ability.name
                     ends_turn = ability.ends_turn
                 else:
                     ends_turn = True
-                affordable = all(bank_counts.get(t, 0) >= n for t, n in cost.items())
+                affordable = bank_counts.covers(cost)
                 cooldown = 0
                 try:
                     cooldown_comp: AbilityCooldown = self.world.component_for_entity(ability_entity, AbilityCooldown)
@@ -224,6 +331,23 @@ class BaseAISystem(ABC):
                 )
         return OwnerSnapshot(bank_counts=bank_counts, ability_map=ability_map)
 
+    def _project_ability(
+        self,
+        owner_entity: int,
+        ability_action: AbilityAction,
+    ) -> AbilityProjection | None:
+        pending = self._build_pending_target(ability_action.ability_entity, owner_entity, ability_action)
+        if pending is None:
+            return None
+        return project_ability(
+            self.world,
+            ability_action.ability_entity,
+            owner_entity,
+            pending,
+            self._ability_resolvers,
+            event_bus=self._projection_bus,
+        )
+
     def _apply_ability_in_clone(
         self,
         clone_state: CloneState,
@@ -245,10 +369,9 @@ class BaseAISystem(ABC):
         except KeyError:
             ability = None
         if ability and ability.cost:
-            for _, bank in clone_world.get_component(TileBank):
-                if bank.owner_entity == clone_owner:
-                    bank.spend(dict(ability.cost))
-                    break
+            entry = find_bank(clone_world, clone_owner)
+            if entry is not None:
+                entry[1].spend(ability.cost)
         engine.execute_ability(clone_ability, clone_owner, pending)
 
     def _build_pending_target(
@@ -286,6 +409,18 @@ class BaseAISystem(ABC):
     ) -> float:
         """Return a score for the clone after applying the candidate."""
 
+    def _score_projection(
+        self,
+        projection: AbilityProjection,
+        snapshot: OwnerSnapshot,
+        candidate: Tuple[str, ActionPayload],
+    ) -> Optional[float]:
+        """Return a score for an analytically projected board-neutral ability.
+
+        ``None`` (the default) falls back to scoring the ability in a cloned world.
+        """
+        return None
+
     # --- Action execution ------------------------------------------------
     def _progress_action(self) -> None:
         if self.current_action is None or self.pending_owner is None:
@@ -295,21 +430,21 @@ class BaseAISystem(ABC):
             src, dst = cast(Tuple[Position, Position], payload_obj)
             if self.action_phase == "start":
                 self._acting_owner = self.pending_owner
-                self.event_bus.emit(EVENT_TILE_CLICK, row=src[0], col=src[1])
+                self.event_bus.emit_now(EVENT_TILE_CLICK, row=src[0], col=src[1])
                 self.action_phase = "swap_target"
                 self.delay_remaining = self._selection_delay_for(self.pending_owner)
                 if self.delay_remaining <= 0.0:
                     self._progress_action()
                 return
             if self.action_phase == "swap_target":
-                self.event_bus.emit(EVENT_TILE_CLICK, row=dst[0], col=dst[1])
+                self.event_bus.emit_now(EVENT_TILE_CLICK, row=dst[0], col=dst[1])
                 self._complete_action(ends_turn=True, owner_entity=self._acting_owner)
                 return
         elif kind == "ability":
             ability_action = cast(AbilityAction, payload_obj)
             if self.action_phase == "start":
                 self._acting_owner = self.pending_owner
-                self.event_bus.emit(
+                self.event_bus.emit_now(
                     EVENT_ABILITY_ACTIVATE_REQUEST,
                     ability_entity=ability_action.ability_entity,
                     owner_entity=self.pending_owner,
@@ -331,7 +466,7 @@ class BaseAISystem(ABC):
                 and ability_action.target is not None
             ):
                 row, col = ability_action.target
-                self.event_bus.emit(EVENT_TILE_CLICK, row=row, col=col)
+                self.event_bus.emit_now(EVENT_TILE_CLICK, row=row, col=col)
                 self._complete_action(
                     ends_turn=self._ability_ends_turn(ability_action.ability_entity),
                     owner_entity=self._acting_owner,
@@ -442,10 +577,9 @@ class BaseAISystem(ABC):
     def _prime_initial_owner(self) -> None:
         from ecs.components.active_turn import ActiveTurn
 
-        active_entries = list(self.world.get_component(ActiveTurn))
-        if not active_entries:
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is None:
             return
-        _, active = active_entries[0]
         if self._is_ai_owner(active.owner_entity):
             self.pending_owner = active.owner_entity
             self.has_dispatched_action = False
@@ -16,7 +16,6 @@ from ecs.events.bus import (
     EVENT_TURN_ADVANCED,
 )
 from ecs.components.active_switch import ActiveSwitch
-from ecs.components.tile_type_registry import TileTypeRegistry
 from ecs.components.tile_types import TileTypes
 from ecs.components.tile import TileType
 from ecs.components.board_position import BoardPosition
@@ -28,6 +27,7 @@ from ecs.systems.board_ops import swap_tile_types
 PALETTE: List[Tuple[int,int,int]] = []  # retained only if future random color generation needed for new types.
 
 from ecs.components.board import Board
+from ecs.resources import resources_of
 
 class BoardSystem:
     def __init__(self, world: World, event_bus: EventBus, rows: int = 8, cols: int = 8):
@@ -49,6 +49,7 @@ class BoardSystem:
 
     def _init_board(self):
         board: Board = self.world.component_for_entity(self.board_entity, Board)
+        rng = getattr(self.world, "random", None) or random
         for r in range(board.rows):
             for c in range(board.cols):
                 ent = self.world.create_entity()
@@ -69,7 +70,7 @@ class BoardSystem:
                     down2 = self._get_type_name(r-2, c)
                     if down1 and down1 == down2 and down1 in available_types:
                         available_types = [t for t in available_types if t != down1]
-                type_name = random.choice(available_types) if available_types else random.choice(all_types)
+                type_name = rng.choice(available_types) if available_types else rng.choice(all_types)
                 self.world.add_component(ent, TileType(type_name=type_name))
                 self.world.add_component(ent, ActiveSwitch(active=True))
 
@@ -179,6 +180,7 @@ class BoardSystem:
             return None
 
     def _registry(self) -> TileTypes:
-        for ent, _ in self.world.get_component(TileTypeRegistry):
-            return self.world.component_for_entity(ent, TileTypes)
-        raise RuntimeError("TileTypes definitions not found")
+        registry = resources_of(self.world).get(TileTypes)
+        if registry is None:
+            raise RuntimeError("TileTypes definitions not found")
+        return registry
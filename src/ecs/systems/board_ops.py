@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Set, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from esper import World
 
@@ -12,9 +13,11 @@ from ecs.components.tile import TileType
 from ecs.components.effect import Effect
 from ecs.components.effect_list import EffectList
 from ecs.components.tile_status_overlay import TileStatusOverlay
-from ecs.components.tile_type_registry import TileTypeRegistry
 from ecs.components.tile_types import TileTypes
 from ecs.components.board import Board
+from ecs.resources import resources_of
+from ecs.utils.effect_index import effect_index
+from ecs.utils.queries import query_cache
 
 Position = Tuple[int, int]
 ColorEntry = Tuple[int, int, Tuple[int, int, int]]
@@ -33,7 +36,7 @@ def _set_effect_owner(world: World, effect_entity: int, owner_entity: int) -> No
         effect: Effect = world.component_for_entity(effect_entity, Effect)
     except KeyError:
         return
-    effect.owner_entity = owner_entity
+    effect_index(world).move(effect_entity, effect, owner_entity)
 
 
 def _remove_effect_list_component(world: World, entity: int) -> None:
@@ -123,9 +126,10 @@ def _transfer_tile_effect_payload(world: World, src_entity: int, dst_entity: int
 
 
 def get_tile_registry(world: World) -> TileTypes:
-    for entity, _ in world.get_component(TileTypeRegistry):
-        return world.component_for_entity(entity, TileTypes)
-    raise RuntimeError("TileTypes definitions not found")
+    registry = resources_of(world).get(TileTypes)
+    if registry is None:
+        raise RuntimeError("TileTypes definitions not found")
+    return registry
 
 
 def set_spawnable_tile_types(world: World, type_names: Iterable[str], *, allow_empty: bool = False) -> List[str]:
@@ -227,10 +231,7 @@ def clear_tiles_with_cascade(
 
 
 def compute_gravity_moves(world: World) -> Tuple[List[GravityMove], int]:
-    board_comp = None
-    for _, board in world.get_component(Board):
-        board_comp = board
-        break
+    board_comp = resources_of(world).get(Board)
     if board_comp is None:
         return [], 0
     moves: List[GravityMove] = []
@@ -280,16 +281,17 @@ def apply_gravity_moves(world: World, moves: List[GravityMove]) -> None:
         src_switch.active = False
 
 
-def refill_inactive_tiles(world: World) -> List[Position]:
+def refill_inactive_tiles(world: World, *, rng: random.Random | None = None) -> List[Position]:
     spawned: List[Position] = []
     registry = get_tile_registry(world)
     choices = registry.all_types()
+    chooser = rng or getattr(world, "random", None) or random
     for entity, position in world.get_component(BoardPosition):
         tile_switch: ActiveSwitch = world.component_for_entity(entity, ActiveSwitch)
         if tile_switch.active:
             continue
         tile_type: TileType = world.component_for_entity(entity, TileType)
-        tile_type.type_name = random.choice(choices)
+        tile_type.type_name = chooser.choice(choices)
         tile_switch.active = True
         spawned.append((position.row, position.col))
     return spawned
@@ -364,15 +366,9 @@ def respawn_full_board(
 def active_tile_type_map(world: World) -> Dict[Position, str]:
     """Return mapping of active tile positions to their type names."""
     mapping: Dict[Position, str] = {}
-    for entity, position in world.get_component(BoardPosition):
-        try:
-            switch: ActiveSwitch = world.component_for_entity(entity, ActiveSwitch)
-            if not switch.active:
-                continue
-            tile: TileType = world.component_for_entity(entity, TileType)
-        except KeyError:
-            continue
-        mapping[(position.row, position.col)] = tile.type_name
+    for _, (position, switch, tile) in query_cache(world).join(BoardPosition, ActiveSwitch, TileType):
+        if switch.active:
+            mapping[(position.row, position.col)] = tile.type_name
     return mapping
 
 
@@ -413,6 +409,10 @@ def predict_swap_creates_match(
     """Return True if swapping src/dst would create a new match."""
 
     tile_map = types if types is not None else active_tile_type_map(world)
+    return _swap_creates_match(tile_map, src, dst)
+
+
+def _swap_creates_match(tile_map: Dict[Position, str], src: Position, dst: Position) -> bool:
     if src not in tile_map or dst not in tile_map:
         return False
     swapped = tile_map.copy()
@@ -448,9 +448,10 @@ def find_valid_swaps(world: World) -> List[Tuple[Position, Position]]:
 
 
 def board_dimensions(world: World) -> Tuple[int, int] | None:
-    for _, board in world.get_component(Board):
-        return board.rows, board.cols
-    return None
+    board = resources_of(world).get(Board)
+    if board is None:
+        return None
+    return board.rows, board.cols
 
 
 def find_all_matches(world: World) -> List[List[Position]]:
@@ -460,6 +461,13 @@ def find_all_matches(world: World) -> List[List[Position]]:
     if not dims or not types:
         return []
     rows, cols = dims
+    return find_matches_in_type_map(types, rows, cols)
+
+
+def find_matches_in_type_map(types: Dict[Position, str], rows: int, cols: int) -> List[List[Position]]:
+    """Match detection over a plain ``position -> type`` map of active tiles."""
+    if not types:
+        return []
     matches: List[List[Position]] = []
     # Horizontal runs
     for r in range(rows):
@@ -507,3 +515,312 @@ def find_all_matches(world: World) -> List[List[Position]]:
                     changed = True
         merged.append(first)
     return [sorted(list(group)) for group in merged]
+
+
+# ---------------------------------------------------------------------------
+# Cascade outcome cache
+# ---------------------------------------------------------------------------
+# A board key is (rows, cols, row-major tuple of (type_name, active) per cell).
+BoardKey = Tuple[int, int, Tuple[Tuple[str, bool] | None, ...]]
+
+
+@dataclass(slots=True)
+class CascadeStep:
+    """One refill-free clear followed by gravity."""
+
+    groups: List[List[Position]]
+    typed: List[TypeEntry]
+    moves: List[GravityMove]
+
+
+@dataclass(slots=True)
+class CascadeOutcome:
+    """Result of a swap resolved without refills.
+
+    ``final_cells`` holds (type_name, active) for every board cell in row-major
+    order, inactive cells keeping the stale type the world would keep.
+    """
+
+    swapped: bool
+    steps: List[CascadeStep] = field(default_factory=list)
+    final_cells: Tuple[Tuple[str, bool] | None, ...] = ()
+
+
+@dataclass(slots=True)
+class CascadeCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CascadeCache:
+    """Bounded LRU memo of ``(board key, swap) -> CascadeOutcome``.
+
+    With ``canonicalize=True`` entries are stored under ``canonical_swap`` keys so
+    mirrored and recoloured positions share one entry; outcomes are mapped back
+    to the caller's orientation and colours on the way out.
+    """
+
+    def __init__(self, maxsize: int = 4096, *, canonicalize: bool = False) -> None:
+        self.maxsize = maxsize
+        self.canonicalize = canonicalize
+        self.stats = CascadeCacheStats()
+        self._entries: "OrderedDict[Tuple[BoardKey, Position, Position], CascadeOutcome]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.stats = CascadeCacheStats()
+
+    def resolve(self, key: BoardKey, src: Position, dst: Position) -> CascadeOutcome:
+        canonical: CanonicalSwap | None = None
+        if self.canonicalize:
+            canonical = canonical_swap(key, src, dst)
+            key, src, dst = canonical.key, canonical.src, canonical.dst
+        entry_key = (key, src, dst)
+        outcome = self._entries.get(entry_key)
+        if outcome is not None:
+            self._entries.move_to_end(entry_key)
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+            outcome = resolve_swap_cascade(key, src, dst)
+            if self.maxsize > 0:
+                self._entries[entry_key] = outcome
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.stats.evictions += 1
+        if canonical is not None:
+            return canonical.restore(outcome)
+        return outcome
+
+
+default_cascade_cache = CascadeCache()
+canonical_cascade_cache = CascadeCache(canonicalize=True)
+
+
+@dataclass(slots=True)
+class CanonicalSwap:
+    """A board key plus swap rewritten into canonical orientation and colours.
+
+    ``labels`` maps canonical labels back to the original type names; types that
+    were not relabelled are absent and map to themselves.
+    """
+
+    key: BoardKey
+    src: Position
+    dst: Position
+    mirrored: bool
+    labels: Dict[str, str]
+
+    def restore_position(self, pos: Position) -> Position:
+        if not self.mirrored:
+            return pos
+        return (pos[0], self.key[1] - 1 - pos[1])
+
+    def restore_type(self, type_name: str) -> str:
+        return self.labels.get(type_name, type_name)
+
+    def restore(self, outcome: CascadeOutcome) -> CascadeOutcome:
+        if not self.mirrored and not self.labels:
+            return outcome
+        pos = self.restore_position
+        steps = [
+            CascadeStep(
+                groups=[sorted(pos(p) for p in group) for group in step.groups],
+                typed=sorted((*pos((row, col)), self.restore_type(t)) for row, col, t in step.typed),
+                moves=[
+                    GravityMove(source=pos(m.source), target=pos(m.target), type_name=self.restore_type(m.type_name))
+                    for m in step.moves
+                ],
+            )
+            for step in outcome.steps
+        ]
+        cells = [
+            None if cell is None else (self.restore_type(cell[0]), cell[1])
+            for cell in outcome.final_cells
+        ]
+        if self.mirrored:
+            cells = _mirror_cells(cells, self.key[1])
+        return CascadeOutcome(swapped=outcome.swapped, steps=steps, final_cells=tuple(cells))
+
+
+def _mirror_cells(cells, cols: int) -> List[Tuple[str, bool] | None]:
+    mirrored: List[Tuple[str, bool] | None] = []
+    for start in range(0, len(cells), cols):
+        mirrored.extend(reversed(cells[start:start + cols]))
+    return mirrored
+
+
+def _relabel_cells(
+    cells,
+    relabel: Optional[Set[str] | frozenset[str]],
+) -> Tuple[Tuple[Tuple[str, bool] | None, ...], Dict[str, str]]:
+    forward: Dict[str, str] = {}
+    out: List[Tuple[str, bool] | None] = []
+    for cell in cells:
+        if cell is None:
+            out.append(None)
+            continue
+        type_name, active = cell
+        if relabel is None or type_name in relabel:
+            label = forward.get(type_name)
+            if label is None:
+                label = forward[type_name] = f"#{len(forward)}"
+            type_name = label
+        out.append((type_name, active))
+    return tuple(out), {label: original for original, label in forward.items()}
+
+
+def canonical_swap(
+    key: BoardKey,
+    src: Position,
+    dst: Position,
+    relabel: Optional[Set[str] | frozenset[str]] = None,
+) -> CanonicalSwap:
+    """Canonicalise a board-plus-swap under left/right mirroring and colour renaming.
+
+    Gravity is vertical and matching only compares type names, so the cascade of
+    a swap is equivariant under horizontal reflection and any consistent renaming
+    of tile types. ``relabel`` limits renaming to the given types (``None`` renames
+    all of them); the lexicographically smaller of the plain and mirrored forms wins.
+    """
+
+    plain = _oriented_swap(key, src, dst, relabel, mirrored=False)
+    mirrored = _oriented_swap(key, src, dst, relabel, mirrored=True)
+    return mirrored if _canonical_order(mirrored) < _canonical_order(plain) else plain
+
+
+def _oriented_swap(
+    key: BoardKey,
+    src: Position,
+    dst: Position,
+    relabel: Optional[Set[str] | frozenset[str]],
+    *,
+    mirrored: bool,
+) -> CanonicalSwap:
+    rows, cols, cells = key
+    if mirrored:
+        cells = tuple(_mirror_cells(cells, cols))
+        src, dst = (src[0], cols - 1 - src[1]), (dst[0], cols - 1 - dst[1])
+    relabelled, labels = _relabel_cells(cells, relabel)
+    return CanonicalSwap(
+        key=(rows, cols, relabelled),
+        src=min(src, dst),
+        dst=max(src, dst),
+        mirrored=mirrored,
+        labels=labels,
+    )
+
+
+def _canonical_order(candidate: CanonicalSwap):
+    cells = tuple(("", False) if cell is None else cell for cell in candidate.key[2])
+    return cells, candidate.src, candidate.dst
+
+
+def board_key(world: World) -> Tuple[BoardKey, Dict[Position, int]] | None:
+    """Return the cache key for the current board plus a position -> entity map.
+
+    Returns ``None`` when a tile carries effects or a status overlay, since a
+    replayed outcome would not move those payloads with gravity.
+    """
+
+    dims = board_dimensions(world)
+    if not dims:
+        return None
+    rows, cols = dims
+    cells: List[Tuple[str, bool] | None] = [None] * (rows * cols)
+    entities: Dict[Position, int] = {}
+    for entity, (position, switch, tile) in query_cache(world).join(BoardPosition, ActiveSwitch, TileType):
+        row, col = position.row, position.col
+        if not (0 <= row < rows and 0 <= col < cols):
+            continue
+        if world.has_component(entity, EffectList) or world.has_component(entity, TileStatusOverlay):
+            return None
+        cells[row * cols + col] = (tile.type_name, switch.active)
+        entities[(row, col)] = entity
+    return (rows, cols, tuple(cells)), entities
+
+
+def resolve_swap_cascade(key: BoardKey, src: Position, dst: Position) -> CascadeOutcome:
+    """Resolve ``src``/``dst`` on a board key exactly as clear + gravity would in a world."""
+
+    rows, cols, cells_tuple = key
+    cells: List[Tuple[str, bool] | None] = list(cells_tuple)
+
+    def active_types() -> Dict[Position, str]:
+        return {
+            (index // cols, index % cols): cell[0]
+            for index, cell in enumerate(cells)
+            if cell is not None and cell[1]
+        }
+
+    types = active_types()
+    if not _swap_creates_match(types, src, dst):
+        return CascadeOutcome(swapped=False, final_cells=cells_tuple)
+    src_index = src[0] * cols + src[1]
+    dst_index = dst[0] * cols + dst[1]
+    cells[src_index], cells[dst_index] = cells[dst_index], cells[src_index]
+    steps: List[CascadeStep] = []
+    while True:
+        groups = find_matches_in_type_map(active_types(), rows, cols)
+        if not groups:
+            break
+        typed: List[TypeEntry] = []
+        for row, col in sorted({pos for group in groups for pos in group}):
+            cell = cells[row * cols + col]
+            if cell is None or not cell[1]:
+                continue
+            typed.append((row, col, cell[0]))
+            cells[row * cols + col] = (cell[0], False)
+        moves: List[GravityMove] = []
+        for col in range(cols):
+            filled = [
+                row
+                for row in range(rows)
+                if cells[row * cols + col] is not None and cells[row * cols + col][1]
+            ]
+            for target_row, source_row in enumerate(filled):
+                if source_row != target_row:
+                    moves.append(
+                        GravityMove(
+                            source=(source_row, col),
+                            target=(target_row, col),
+                            type_name=cells[source_row * cols + col][0],
+                        )
+                    )
+        for move in moves:
+            source_index = move.source[0] * cols + move.source[1]
+            target_index = move.target[0] * cols + move.target[1]
+            source_cell = cells[source_index]
+            if cells[target_index] is None or source_cell is None or not source_cell[1]:
+                continue
+            cells[target_index] = (source_cell[0], True)
+            cells[source_index] = (source_cell[0], False)
+        steps.append(CascadeStep(groups=groups, typed=typed, moves=moves))
+    return CascadeOutcome(swapped=True, steps=steps, final_cells=tuple(cells))
+
+
+def apply_cascade_outcome(
+    world: World,
+    key: BoardKey,
+    entities: Dict[Position, int],
+    outcome: CascadeOutcome,
+) -> None:
+    """Write a cached outcome's final tile types and active flags back into ``world``."""
+
+    _, cols, before = key
+    for (row, col), entity in entities.items():
+        index = row * cols + col
+        cell = outcome.final_cells[index]
+        if cell is None or cell == before[index]:
+            continue
+        world.component_for_entity(entity, TileType).type_name = cell[0]
+        world.component_for_entity(entity, ActiveSwitch).active = cell[1]
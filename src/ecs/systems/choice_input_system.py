@@ -12,6 +12,7 @@ from ecs.events.bus import (
 )
 from ecs.components.choice_window import ChoiceWindow, ChoiceOption
 from ecs.components.game_state import GameMode, GameState
+from ecs.resources import resources_of
 
 
 class ChoiceInputSystem:
@@ -118,11 +119,10 @@ class ChoiceInputSystem:
         return windows[0]
 
     def _interaction_enabled(self) -> bool:
-        states = list(self.world.get_component(GameState))
-        if not states:
+        state = resources_of(self.world).get(GameState)
+        if state is None:
             return True
-        mode = states[0][1].mode
-        return mode in (
+        return state.mode in (
             GameMode.COMBAT,
             GameMode.ABILITY_DRAFT,
             GameMode.SKILL_DRAFT,
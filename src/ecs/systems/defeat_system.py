@@ -40,6 +40,8 @@ from ecs.menu.factory import spawn_main_menu
 from ecs.systems.board_ops import get_tile_registry
 from ecs.systems.turn_state_utils import get_or_create_turn_state
 from ecs.utils.game_state import set_game_mode
+from ecs.resources import resources_of
+from ecs.utils.tile_banks import bank_index
 
 
 class DefeatSystem:
@@ -172,9 +174,9 @@ class DefeatSystem:
         self._clear_tooltips()
 
     def _owner_entities(self) -> list[int]:
-        orders = list(self.world.get_component(TurnOrder))
-        if orders:
-            owners = list(orders[0][1].owners)
+        order = resources_of(self.world).get(TurnOrder)
+        if order is not None:
+            owners = list(order.owners)
             if owners:
                 return owners
         humans = [ent for ent, _ in self.world.get_component(HumanAgent)]
@@ -244,24 +246,24 @@ class DefeatSystem:
 
     def _reset_turn_structures(self, owners: Sequence[int]) -> None:
         owners = list(owners)
-        turn_orders = list(self.world.get_component(TurnOrder))
-        if turn_orders:
-            _, order = turn_orders[0]
+        resources = resources_of(self.world)
+        order = resources.get(TurnOrder)
+        if order is not None:
             order.owners = owners
             order.index = 0
         elif owners:
-            self.world.create_entity(TurnOrder(owners=list(owners), index=0))
-        active_turns = list(self.world.get_component(ActiveTurn))
+            resources.insert(TurnOrder(owners=list(owners), index=0))
+        active = resources.get(ActiveTurn)
         if owners:
             first_owner = owners[0]
-            if active_turns:
-                _, active = active_turns[0]
+            if active is not None:
                 active.owner_entity = first_owner
             else:
-                self.world.create_entity(ActiveTurn(owner_entity=first_owner))
+                resources.insert(ActiveTurn(owner_entity=first_owner))
         else:
-            for ent, _ in active_turns:
-                self._delete_entity(ent)
+            holder = resources.entity(ActiveTurn)
+            if holder is not None:
+                self._delete_entity(holder)
         turn_state: TurnState = get_or_create_turn_state(self.world)
         turn_state.action_source = None
         turn_state.cascade_active = False
@@ -271,10 +273,9 @@ class DefeatSystem:
         turn_state.ability_ends_turn = True
 
     def _reset_board(self) -> None:
-        board_entries = list(self.world.get_component(Board))
-        if not board_entries:
+        board = resources_of(self.world).get(Board)
+        if board is None:
             return
-        _, board = board_entries[0]
         try:
             registry = get_tile_registry(self.world)
         except RuntimeError:
@@ -282,6 +283,7 @@ class DefeatSystem:
         types = registry.all_types()
         if not types:
             return
+        rng = getattr(self.world, "random", None) or random
         entity_grid: list[list[int | None]] = [
             [None for _ in range(board.cols)] for _ in range(board.rows)
         ]
@@ -304,7 +306,7 @@ class DefeatSystem:
                     up2 = assigned[row - 2][col]
                     if up1 is not None and up1 == up2 and up1 in available:
                         available = [t for t in available if t != up1]
-                choice = random.choice(available or types)
+                choice = rng.choice(available or types)
                 assigned[row][col] = choice
                 entity = entity_grid[row][col]
                 if entity is None:
@@ -358,8 +360,8 @@ class DefeatSystem:
             from ecs.components.tooltip_state import TooltipState
         except ImportError:
             return
-        entries = list(self.world.get_component(TooltipState))
-        for _, tooltip in entries:
+        tooltip = resources_of(self.world).get(TooltipState)
+        if tooltip is not None:
             tooltip.visible = False
             tooltip.lines = ()
             tooltip.width = 0.0
@@ -429,6 +431,8 @@ class DefeatSystem:
                 pass
 
     def _replace_enemy(self, defeated_entity: int) -> int | None:
+        banks = bank_index(self.world)
+        banks.forget(defeated_entity)
         self._delete_entity(defeated_entity)
         enemy_pool = getattr(self.world, "enemy_pool", None)
         new_enemy: int | None = None
@@ -442,6 +446,8 @@ class DefeatSystem:
 
             new_enemy = create_enemy_undead_gardener(self.world, max_hp=30)
         self._ensure_enemy_owner_order(new_enemy)
+        if self._has_component(new_enemy, TileBank):
+            banks.reassign(new_enemy, new_enemy)
         self._replace_turn_order_owner(defeated_entity, new_enemy)
         self._replace_active_turn_owner(defeated_entity, new_enemy)
         return new_enemy
@@ -455,13 +461,14 @@ class DefeatSystem:
         self.world.add_component(enemy_entity, abilities)
 
     def _replace_turn_order_owner(self, old_entity: int, new_entity: int) -> None:
-        for _, order in self.world.get_component(TurnOrder):
+        order = resources_of(self.world).get(TurnOrder)
+        if order is not None:
             order.owners = [new_entity if ent == old_entity else ent for ent in order.owners]
 
     def _replace_active_turn_owner(self, old_entity: int, new_entity: int) -> None:
-        for _, active in self.world.get_component(ActiveTurn):
-            if active.owner_entity == old_entity:
-                active.owner_entity = new_entity
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is not None and active.owner_entity == old_entity:
+            active.owner_entity = new_entity
 
     def _has_component(self, entity: int, component_type) -> bool:
         try:
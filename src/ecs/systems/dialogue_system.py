@@ -17,6 +17,7 @@ from ecs.events.bus import (
     EventBus,
 )
 from ecs.utils.game_state import set_game_mode
+from ecs.resources import resources_of
 
 
 @dataclass(slots=True)
@@ -75,12 +76,21 @@ class DialogueSystem:
                 self._press_guard = None
                 return
             self._press_guard = None
-        self._advance_dialogue(press_id_int)
+        # Advance through the bus so session recorders see the input, not the click.
+        if press_id_int is not None:
+            self.event_bus.emit(EVENT_DIALOGUE_ADVANCE, press_id=press_id_int)
+        else:
+            self.event_bus.emit(EVENT_DIALOGUE_ADVANCE)
 
     def _on_advance_requested(self, sender, **payload) -> None:
         if not self._is_dialogue_active():
             return
-        self._advance_dialogue(None)
+        press_id = payload.get("press_id")
+        try:
+            press_id_int = int(press_id) if press_id is not None else None
+        except (TypeError, ValueError):
+            press_id_int = None
+        self._advance_dialogue(press_id_int)
 
     # ------------------------------------------------------------------
     # Public input helpers (for key presses)
@@ -90,7 +100,7 @@ class DialogueSystem:
             return
         # Enter (13) and Space (32) advance the conversation.
         if symbol in (13, 32, 65293):
-            self._advance_dialogue(None)
+            self.event_bus.emit(EVENT_DIALOGUE_ADVANCE)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -100,10 +110,7 @@ class DialogueSystem:
         return state is not None and state.mode == GameMode.DIALOGUE and self._current_session_entity() is not None
 
     def _get_game_state(self) -> GameState | None:
-        entries = list(self.world.get_component(GameState))
-        if not entries:
-            return None
-        return entries[0][1]
+        return resources_of(self.world).get(GameState)
 
     def _current_session_entity(self) -> int | None:
         sessions = list(self.world.get_component(DialogueSession))
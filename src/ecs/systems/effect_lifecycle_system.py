@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any, Dict, Iterable, List, Tuple, cast
+from typing import Any, Dict, Iterable, List, Tuple
 
 from esper import World
 
@@ -9,29 +9,53 @@ from ecs.components.effect import Effect
 from ecs.components.effect_duration import EffectDuration
 from ecs.components.effect_expiry import EffectExpireOnEvents
 from ecs.components.effect_list import EffectList
-from ecs.effects.registry import default_effect_registry, EffectDefinition
+from ecs.effects.registry import coerce_count, default_effect_registry
+from ecs.events.payloads import EffectAppliedEvent
 from ecs.events.bus import (
     EVENT_EFFECT_APPLY,
-    EVENT_EFFECT_APPLIED,
     EVENT_EFFECT_EXPIRED,
     EVENT_EFFECT_REFRESHED,
     EVENT_EFFECT_REMOVE,
     EVENT_TURN_ADVANCED,
     EventBus,
+    Subscription,
 )
+from ecs.utils.effect_index import effect_index
 
 
 class EffectLifecycleSystem:
-    """Handles creation, refreshing, and expiration of effect entities."""
+    """Handles creation, refreshing, and expiration of effect entities.
+
+    Turn-based durations sit on a per-owner expiry wheel keyed by the owner's
+    turn count at which the effect runs out. A turn advance decrements only the
+    previous owner's timed effects and expires the single bucket that fell due,
+    so tile overlays and other owners' effects are never visited.
+    """
 
     def __init__(self, world: World, event_bus: EventBus):
         self.world = world
         self.event_bus = event_bus
-        self.event_bus.subscribe(EVENT_EFFECT_APPLY, self.on_effect_apply)
-        self.event_bus.subscribe(EVENT_EFFECT_REMOVE, self.on_effect_remove)
-        self.event_bus.subscribe(EVENT_TURN_ADVANCED, self.on_turn_advanced)
-        self._event_handlers: Dict[str, Callable] = {}
+        self.effects = effect_index(world)
+        self.subscriptions = event_bus.group()
+        self.subscriptions.subscribe(EVENT_EFFECT_APPLY, self.on_effect_apply)
+        self.subscriptions.subscribe(EVENT_EFFECT_REMOVE, self.on_effect_remove)
+        self.subscriptions.subscribe(EVENT_TURN_ADVANCED, self.on_turn_advanced)
+        # One bus handler per event name while any effect expires on it.
+        self._event_handlers: Dict[str, Subscription] = {}
         self._event_triggers: Dict[str, List[Tuple[int, bool, str]]] = {}
+        # owner -> turns that owner has ended; owner -> {due turn: effect entities};
+        # effect entity -> (owner, due turn, Effect, EffectDuration).
+        self._owner_turns: Dict[int, int] = {}
+        self._expiry_wheel: Dict[int, Dict[int, List[int]]] = {}
+        self._scheduled: Dict[int, Tuple[int, int, Effect, EffectDuration]] = {}
+
+    def close(self) -> None:
+        """Detach every handler this system registered on the bus."""
+        self.subscriptions.close()
+        self._event_handlers.clear()
+        self._event_triggers.clear()
+        self._expiry_wheel.clear()
+        self._scheduled.clear()
 
     def on_effect_apply(self, sender, **kwargs):
         slug = kwargs.get("slug")
@@ -39,47 +63,26 @@ class EffectLifecycleSystem:
         if slug is None or owner_entity is None:
             return
         source_entity = kwargs.get("source_entity")
-        metadata_override: Dict[str, Any] = dict(kwargs.get("metadata") or {})
-        definition = self._get_definition(slug)
-        metadata = self._merge_metadata(definition, metadata_override)
+        template, metadata = default_effect_registry.template(slug).instantiate(kwargs.get("metadata"))
         turns = kwargs.get("turns")
         if turns is None:
             turns = metadata.get("turns")
         allow_multiple = kwargs.get("allow_multiple")
-        metadata_allow_multiple = metadata.pop("allow_multiple", None)
-        if allow_multiple is None:
-            if metadata_allow_multiple is not None:
-                allow_multiple = metadata_allow_multiple
-            else:
-                allow_multiple = True
-        allow_multiple = bool(allow_multiple)
-        cumulative = bool(kwargs.get("cumulative", metadata.pop("cumulative", False)))
-        if definition is not None and "cumulative" in definition.tags:
-            cumulative = True
+        allow_multiple = template.allow_multiple if allow_multiple is None else bool(allow_multiple)
+        cumulative = template.always_cumulative or bool(kwargs.get("cumulative", template.cumulative))
         count_delta = kwargs.get("count")
-        if count_delta is None:
-            count_delta = metadata.pop("count", None)
-        if count_delta is None:
-            count_delta = 0
-        try:
-            count_delta = int(count_delta)
-        except (TypeError, ValueError):
-            count_delta = 0
-        if count_delta < 0:
-            count_delta = 0
-        stack_key = kwargs.get("stack_key", metadata.pop("stack_key", None))
+        count_delta = template.count if count_delta is None else coerce_count(count_delta)
+        stack_key = kwargs.get("stack_key", template.stack_key)
         refresh_existing = bool(kwargs.get("refresh", False))
         expire_on_events = kwargs.get("expire_on_events")
         if expire_on_events is None:
-            expire_on_events = metadata.pop("expire_on_events", ())
-        expire_on_events = tuple(expire_on_events) if expire_on_events else ()
-        expire_match_owner = bool(kwargs.get("expire_match_owner", metadata.pop("expire_match_owner", False)))
-        payload_owner_key = kwargs.get(
-            "expire_payload_owner_key",
-            metadata.pop("expire_payload_owner_key", "owner_entity"),
-        )
+            expire_on_events = template.expire_on_events
+        else:
+            expire_on_events = tuple(expire_on_events) if expire_on_events else ()
+        expire_match_owner = bool(kwargs.get("expire_match_owner", template.expire_match_owner))
+        payload_owner_key = kwargs.get("expire_payload_owner_key", template.expire_payload_owner_key)
         effect_list = self._ensure_effect_list(owner_entity)
-        duplicates = self._find_effects(effect_list, slug, stack_key)
+        duplicates = self._find_effects(owner_entity, slug, stack_key)
         if duplicates and cumulative:
             target_entity = duplicates[0]
             self._accumulate_effect(
@@ -108,24 +111,25 @@ class EffectLifecycleSystem:
         if duplicates and not allow_multiple:
             for effect_entity in list(duplicates):
                 self._expire_effect(effect_entity, reason="replaced")
-        components: list[Any] = [
-            Effect(
-                slug=slug,
-                owner_entity=owner_entity,
-                source_entity=source_entity,
-                allow_multiple=allow_multiple,
-                stack_key=stack_key,
-                cumulative=cumulative,
-                count=max(0, count_delta),
-                metadata=metadata,
-            )
-        ]
+        effect = Effect(
+            slug=slug,
+            owner_entity=owner_entity,
+            source_entity=source_entity,
+            allow_multiple=allow_multiple,
+            stack_key=stack_key,
+            cumulative=cumulative,
+            count=max(0, count_delta),
+            metadata=metadata,
+        )
+        components: list[Any] = [effect]
+        duration: EffectDuration | None = None
         if turns is not None:
             try:
                 remaining_turns = int(turns)
             except (TypeError, ValueError):
                 remaining_turns = 0
-            components.append(EffectDuration(remaining_turns=max(0, remaining_turns)))
+            duration = EffectDuration(remaining_turns=max(0, remaining_turns))
+            components.append(duration)
         if expire_on_events:
             components.append(
                 EffectExpireOnEvents(
@@ -136,6 +140,9 @@ class EffectLifecycleSystem:
             )
         effect_entity = self.world.create_entity(*components)
         effect_list.effect_entities.append(effect_entity)
+        self.effects.add(effect_entity, effect)
+        if duration is not None:
+            self._schedule_expiry(effect_entity, effect, duration)
         if expire_on_events:
             self._register_event_triggers(
                 effect_entity,
@@ -143,16 +150,7 @@ class EffectLifecycleSystem:
                 expire_match_owner,
                 payload_owner_key,
             )
-        try:
-            self.world.component_for_entity(effect_entity, Effect)
-        except KeyError:
-            pass
-        self.event_bus.emit(
-            EVENT_EFFECT_APPLIED,
-            effect_entity=effect_entity,
-            owner_entity=owner_entity,
-            slug=slug,
-        )
+        self.event_bus.publish(EffectAppliedEvent(effect_entity, owner_entity, slug))
 
     def on_effect_remove(self, sender, **kwargs):
         effect_entity = kwargs.get("effect_entity")
@@ -187,16 +185,52 @@ class EffectLifecycleSystem:
         previous_owner = kwargs.get("previous_owner")
         if previous_owner is None:
             return
-        for effect_entity, components in list(self.world.get_components(Effect, EffectDuration)):
-            effect_comp = cast(Effect, components[0])
-            duration_comp = cast(EffectDuration, components[1])
-            # Previously filtered by regiment owner; now just decrement all effects owned by previous owner entity.
+        turn = self._owner_turns.get(previous_owner, 0) + 1
+        self._owner_turns[previous_owner] = turn
+        wheel = self._expiry_wheel.get(previous_owner)
+        if not wheel:
+            return
+        due = wheel.get(turn, ())
+        scheduled = self._scheduled
+        # Effects tick in apply (entity id) order, then the due bucket expires in that order.
+        timed = sorted(effect_entity for bucket in wheel.values() for effect_entity in bucket)
+        expiring: List[int] = []
+        for effect_entity in timed:
+            _, _, effect_comp, duration_comp = scheduled[effect_entity]
             if effect_comp.owner_entity != previous_owner:
+                # Moved to another owner (tile effects follow their tile); tick there instead.
+                self._schedule_expiry(effect_entity, effect_comp, duration_comp)
                 continue
             duration_comp.remaining_turns -= 1
-            if duration_comp.remaining_turns <= 0:
+        if due:
+            expiring = sorted(
+                effect_entity for effect_entity in due if scheduled[effect_entity][0] == previous_owner
+            )
+        for effect_entity in expiring:
+            if effect_entity in scheduled:  # not already expired by an earlier expiry's handlers
                 self._expire_effect(effect_entity, reason="duration")
 
+    def _schedule_expiry(self, effect_entity: int, effect: Effect, duration: EffectDuration) -> None:
+        self._unschedule_expiry(effect_entity)
+        owner_entity = effect.owner_entity
+        # A duration of zero still lasts until the owner's next turn ends.
+        due = self._owner_turns.get(owner_entity, 0) + max(1, duration.remaining_turns)
+        self._expiry_wheel.setdefault(owner_entity, {}).setdefault(due, []).append(effect_entity)
+        self._scheduled[effect_entity] = (owner_entity, due, effect, duration)
+
+    def _unschedule_expiry(self, effect_entity: int) -> None:
+        entry = self._scheduled.pop(effect_entity, None)
+        if entry is None:
+            return
+        owner_entity, due = entry[0], entry[1]
+        wheel = self._expiry_wheel[owner_entity]
+        bucket = wheel[due]
+        bucket.remove(effect_entity)
+        if not bucket:
+            del wheel[due]
+            if not wheel:
+                del self._expiry_wheel[owner_entity]
+
     def _ensure_effect_list(self, owner_entity: int) -> EffectList:
         try:
             return self.world.component_for_entity(owner_entity, EffectList)
@@ -211,15 +245,13 @@ class EffectLifecycleSystem:
         except KeyError:
             return None
 
-    def _find_effects(self, effect_list: EffectList, slug: str, stack_key: str | None) -> List[int]:
+    def _find_effects(self, owner_entity: int, slug: str, stack_key: str | None) -> List[int]:
         matches: List[int] = []
-        for effect_entity in effect_list.effect_entities:
+        for effect_entity in self.effects.effects(owner_entity, slug):
             try:
                 effect = self.world.component_for_entity(effect_entity, Effect)
             except KeyError:
                 continue
-            if effect.slug != slug:
-                continue
             if stack_key is not None and effect.stack_key != stack_key:
                 continue
             matches.append(effect_entity)
@@ -260,11 +292,14 @@ class EffectLifecycleSystem:
             try:
                 duration_comp = self.world.component_for_entity(effect_entity, EffectDuration)
             except KeyError:
-                self.world.add_component(effect_entity, EffectDuration(remaining_turns=max(0, turns_value)))
+                duration_comp = EffectDuration(remaining_turns=max(0, turns_value))
+                self.world.add_component(effect_entity, duration_comp)
             else:
                 duration_comp.remaining_turns = max(0, turns_value)
+            self._schedule_expiry(effect_entity, effect, duration_comp)
         else:
             self._remove_component(effect_entity, EffectDuration)
+            self._unschedule_expiry(effect_entity)
         self._unregister_event_triggers(effect_entity)
         expire_events_tuple = tuple(expire_on_events) if expire_on_events else ()
         if expire_events_tuple:
@@ -291,6 +326,7 @@ class EffectLifecycleSystem:
             )
         else:
             self._remove_component(effect_entity, EffectExpireOnEvents)
+        self.effects.changed(effect)
         self.event_bus.emit(
             EVENT_EFFECT_REFRESHED,
             effect_entity=effect_entity,
@@ -316,6 +352,7 @@ class EffectLifecycleSystem:
             effect.metadata.update(metadata)
         if source_entity is not None:
             effect.source_entity = source_entity
+        self.effects.changed(effect)
         self.event_bus.emit(
             EVENT_EFFECT_REFRESHED,
             effect_entity=effect_entity,
@@ -330,6 +367,7 @@ class EffectLifecycleSystem:
             pass
 
     def _expire_effect(self, effect_entity: int, reason: str) -> None:
+        self._unschedule_expiry(effect_entity)
         try:
             effect = self.world.component_for_entity(effect_entity, Effect)
         except KeyError:
@@ -343,6 +381,7 @@ class EffectLifecycleSystem:
         effect_list = self._get_effect_list(owner_entity)
         if effect_list and effect_entity in effect_list.effect_entities:
             effect_list.effect_entities.remove(effect_entity)
+        self.effects.discard(effect_entity, effect)
         self._unregister_event_triggers(effect_entity)
         try:
             self.world.delete_entity(effect_entity)
@@ -370,8 +409,7 @@ class EffectLifecycleSystem:
             entries.append((effect_entity, match_owner, payload_owner_key))
             if event_name not in self._event_handlers:
                 handler = self._make_event_handler(event_name)
-                self._event_handlers[event_name] = handler
-                self.event_bus.subscribe(event_name, handler)
+                self._event_handlers[event_name] = self.subscriptions.subscribe(event_name, handler)
 
     def _unregister_event_triggers(self, effect_entity: int) -> None:
         for event_name, entries in list(self._event_triggers.items()):
@@ -380,6 +418,9 @@ class EffectLifecycleSystem:
                 self._event_triggers[event_name] = filtered
             else:
                 self._event_triggers.pop(event_name, None)
+                subscription = self._event_handlers.pop(event_name, None)
+                if subscription is not None:
+                    self.subscriptions.release(subscription)
 
     def _make_event_handler(self, event_name: str) -> Callable:
         def handler(sender, **payload):
@@ -402,20 +443,6 @@ class EffectLifecycleSystem:
                     continue
             self._expire_effect(effect_entity, reason=f"event:{event_name}")
 
-    @staticmethod
-    def _merge_metadata(definition: EffectDefinition | None, override: Dict[str, Any]) -> Dict[str, Any]:
-        base: Dict[str, Any] = {}
-        if definition is not None and definition.default_metadata:
-            base.update(dict(definition.default_metadata))
-        base.update(override)
-        return base
-
-    @staticmethod
-    def _get_definition(slug: str) -> EffectDefinition | None:
-        if default_effect_registry.has(slug):
-            return default_effect_registry.get(slug)
-        return None
-
     def process(self):
         # Lifecycle is event-driven; nothing to do per-frame beyond tick handling.
         return
@@ -23,6 +23,7 @@ from ecs.systems.board_ops import (
     apply_gravity_moves,
 )
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.resources import resources_of
 
 Position = Tuple[int, int]
 
@@ -34,12 +35,10 @@ class BoardClearEffectSystem:
         self.world = world
         self.event_bus = event_bus
         self._refill_cascades = refill_cascades
-        self.event_bus.subscribe(EVENT_EFFECT_APPLIED, self._on_effect_event)
-        self.event_bus.subscribe(EVENT_EFFECT_REFRESHED, self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_APPLIED, "slug", "board_clear_area", self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_REFRESHED, "slug", "board_clear_area", self._on_effect_event)
 
     def _on_effect_event(self, sender, **payload) -> None:
-        if payload.get("slug") != "board_clear_area":
-            return
         effect_entity = payload.get("effect_entity")
         if effect_entity is None:
             return
@@ -182,10 +181,9 @@ class BoardClearEffectSystem:
     def _board_dimensions(self) -> Tuple[int, int] | None:
         from ecs.components.board import Board
 
-        boards = list(self.world.get_component(Board))
-        if not boards:
+        board = resources_of(self.world).get(Board)
+        if board is None:
             return None
-        board = boards[0][1]
         return board.rows, board.cols
 
     @staticmethod
@@ -3,7 +3,6 @@ from __future__ import annotations
 from esper import World
 
 from ecs.components.effect import Effect
-from ecs.components.effect_list import EffectList
 from ecs.components.health import Health
 from ecs.events.bus import (
     EVENT_EFFECT_APPLIED,
@@ -12,6 +11,7 @@ from ecs.events.bus import (
     EVENT_HEALTH_DAMAGE,
     EventBus,
 )
+from ecs.utils.effect_index import effect_index
 
 
 class DamageEffectSystem:
@@ -20,12 +20,10 @@ class DamageEffectSystem:
     def __init__(self, world: World, event_bus: EventBus) -> None:
         self.world = world
         self.event_bus = event_bus
-        self.event_bus.subscribe(EVENT_EFFECT_APPLIED, self._on_effect_event)
-        self.event_bus.subscribe(EVENT_EFFECT_REFRESHED, self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_APPLIED, "slug", "damage", self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_REFRESHED, "slug", "damage", self._on_effect_event)
 
     def _on_effect_event(self, sender, **payload) -> None:
-        if payload.get("slug") != "damage":
-            return
         effect_entity = payload.get("effect_entity")
         if effect_entity is None:
             return
@@ -81,40 +79,10 @@ class DamageEffectSystem:
             return 0
 
     def _damage_bonus(self, owner_entity) -> int:
-        if owner_entity is None:
-            return 0
-        try:
-            effect_list: EffectList = self.world.component_for_entity(owner_entity, EffectList)
-        except KeyError:
-            return 0
-        bonus = 0
-        for effect_id in list(effect_list.effect_entities):
-            try:
-                active_effect: Effect = self.world.component_for_entity(effect_id, Effect)
-            except KeyError:
-                continue
-            if active_effect.slug != "damage_bonus":
-                continue
-            bonus += self._coerce_int(active_effect.metadata.get("bonus"))
-        return bonus
+        return effect_index(self.world).total(owner_entity, "damage_bonus", "bonus")
 
     def _incoming_bonus(self, target_entity) -> int:
-        if target_entity is None:
-            return 0
-        try:
-            effect_list: EffectList = self.world.component_for_entity(target_entity, EffectList)
-        except KeyError:
-            return 0
-        extra = 0
-        for effect_id in list(effect_list.effect_entities):
-            try:
-                active_effect: Effect = self.world.component_for_entity(effect_id, Effect)
-            except KeyError:
-                continue
-            if active_effect.slug != "frailty":
-                continue
-            extra += self._coerce_int(active_effect.metadata.get("bonus", 1))
-        return extra
+        return effect_index(self.world).total(target_entity, "frailty", "bonus", 1)
 
     def _record_actual_damage(
         self,
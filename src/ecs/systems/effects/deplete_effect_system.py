@@ -15,6 +15,7 @@ from ecs.events.bus import (
     EVENT_TILE_BANK_DEPLETED,
     EventBus,
 )
+from ecs.utils.tile_banks import find_bank
 
 
 class DepleteEffectSystem:
@@ -23,12 +24,10 @@ class DepleteEffectSystem:
     def __init__(self, world: World, event_bus: EventBus) -> None:
         self.world = world
         self.event_bus = event_bus
-        self.event_bus.subscribe(EVENT_EFFECT_APPLIED, self._on_effect_event)
-        self.event_bus.subscribe(EVENT_EFFECT_REFRESHED, self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_APPLIED, "slug", "deplete", self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_REFRESHED, "slug", "deplete", self._on_effect_event)
 
     def _on_effect_event(self, sender, **payload) -> None:
-        if payload.get("slug") != "deplete":
-            return
         effect_entity = payload.get("effect_entity")
         if effect_entity is None:
             return
@@ -50,7 +49,7 @@ class DepleteEffectSystem:
             return
         bank_entity, bank = bank_info
         mode = str(effect.metadata.get("mode", "type")).lower()
-        deltas = drain_bank_counts(bank, amount, effect.metadata)
+        deltas = drain_bank_counts(bank, amount, effect.metadata, rng=getattr(self.world, "random", None))
         context_ref = effect.metadata.get("_ability_context")
         if isinstance(context_ref, dict):
             total_key = effect.metadata.get("context_write")
@@ -89,10 +88,7 @@ class DepleteEffectSystem:
             self._remove_effect(effect_entity, reason="noop")
 
     def _find_bank(self, owner_entity: int) -> Tuple[int, TileBank] | None:
-        for entity, bank in self.world.get_component(TileBank):
-            if bank.owner_entity == owner_entity:
-                return entity, bank
-        return None
+        return find_bank(self.world, owner_entity)
 
     def _remove_effect(self, effect_entity: int, *, reason: str) -> None:
         self.event_bus.emit(
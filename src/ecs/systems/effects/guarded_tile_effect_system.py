@@ -5,7 +5,6 @@ from typing import Dict, Iterable, List, Sequence, Tuple
 from esper import World
 
 from ecs.components.effect import Effect
-from ecs.components.effect_list import EffectList
 from ecs.events.bus import (
     EVENT_EFFECT_APPLY,
     EVENT_EFFECT_REMOVE,
@@ -13,6 +12,7 @@ from ecs.events.bus import (
     EventBus,
 )
 from ecs.systems.board_ops import get_entity_at
+from ecs.utils.effect_index import effect_index
 
 
 class GuardedTileEffectSystem:
@@ -111,18 +111,13 @@ class GuardedTileEffectSystem:
             yield (norm_row, norm_col, None)
 
     def _collect_guard_effects(self, tile_entity: int) -> List[tuple[int, Effect]]:
-        try:
-            effect_list: EffectList = self.world.component_for_entity(tile_entity, EffectList)
-        except KeyError:
-            return []
         results: List[tuple[int, Effect]] = []
-        for effect_entity in list(effect_list.effect_entities):
+        for effect_entity in effect_index(self.world).effects(tile_entity, "tile_guarded"):
             try:
                 effect = self.world.component_for_entity(effect_entity, Effect)
             except KeyError:
                 continue
-            if effect.slug == "tile_guarded":
-                results.append((effect_entity, effect))
+            results.append((effect_entity, effect))
         return results
 
     @staticmethod
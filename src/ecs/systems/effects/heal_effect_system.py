@@ -18,12 +18,10 @@ class HealEffectSystem:
     def __init__(self, world: World, event_bus: EventBus) -> None:
         self.world = world
         self.event_bus = event_bus
-        self.event_bus.subscribe(EVENT_EFFECT_APPLIED, self._on_effect_event)
-        self.event_bus.subscribe(EVENT_EFFECT_REFRESHED, self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_APPLIED, "slug", "heal", self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_REFRESHED, "slug", "heal", self._on_effect_event)
 
     def _on_effect_event(self, sender, **payload) -> None:
-        if payload.get("slug") != "heal":
-            return
         effect_entity = payload.get("effect_entity")
         if effect_entity is None:
             return
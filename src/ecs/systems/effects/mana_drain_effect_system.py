@@ -3,7 +3,6 @@ from __future__ import annotations
 from esper import World
 
 from ecs.components.effect import Effect
-from ecs.components.tile_bank import TileBank
 from ecs.events.bus import (
     EventBus,
     EVENT_EFFECT_APPLIED,
@@ -13,6 +12,7 @@ from ecs.events.bus import (
     EVENT_BANK_MANA,
 )
 from ecs.systems.effects.bank_effect_helpers import drain_bank_counts
+from ecs.utils.tile_banks import find_bank
 
 
 class ManaDrainEffectSystem:
@@ -21,12 +21,10 @@ class ManaDrainEffectSystem:
     def __init__(self, world: World, event_bus: EventBus) -> None:
         self.world = world
         self.event_bus = event_bus
-        self.event_bus.subscribe(EVENT_EFFECT_APPLIED, self._on_effect_event)
-        self.event_bus.subscribe(EVENT_EFFECT_REFRESHED, self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_APPLIED, "slug", "mana_drain", self._on_effect_event)
+        self.event_bus.subscribe_keyed(EVENT_EFFECT_REFRESHED, "slug", "mana_drain", self._on_effect_event)
 
     def _on_effect_event(self, sender, **payload) -> None:
-        if payload.get("slug") != "mana_drain":
-            return
         effect_entity = payload.get("effect_entity")
         if effect_entity is None:
             return
@@ -51,7 +49,7 @@ class ManaDrainEffectSystem:
             self._remove_effect(effect_entity, reason="empty_bank")
             return
         mode = str(effect.metadata.get("mode", "type")).lower()
-        drained = drain_bank_counts(bank, amount, effect.metadata)
+        drained = drain_bank_counts(bank, amount, effect.metadata, rng=getattr(self.world, "random", None))
         total_drained = sum(drained.values())
         if total_drained > 0:
             bank_delta = {
@@ -98,10 +96,7 @@ class ManaDrainEffectSystem:
         return gains
 
     def _find_bank(self, owner_entity: int):
-        for entity, bank in self.world.get_component(TileBank):
-            if bank.owner_entity == owner_entity:
-                return entity, bank
-        return None
+        return find_bank(self.world, owner_entity)
 
     def _remove_effect(self, effect_entity: int, *, reason: str) -> None:
         from ecs.events.bus import EVENT_EFFECT_REMOVE
@@ -3,8 +3,8 @@ from __future__ import annotations
 from esper import World
 
 from ecs.components.effect import Effect
-from ecs.components.effect_list import EffectList
 from ecs.events.bus import EVENT_EFFECT_APPLY, EVENT_HEALTH_DAMAGE, EventBus
+from ecs.utils.effect_index import effect_index
 
 
 class ThornsEffectSystem:
@@ -45,28 +45,10 @@ class ThornsEffectSystem:
         )
 
     def _has_thorns(self, owner: int) -> bool:
-        effect_list = self._effect_list(owner)
-        if effect_list is None:
-            return False
-        for effect_id in list(effect_list.effect_entities):
-            effect = self._effect(effect_id)
-            if effect is None:
-                continue
-            if effect.slug == "thorns":
-                return True
-        return False
+        return effect_index(self.world).has(owner, "thorns")
 
     def _thorns_damage(self, owner: int) -> int:
-        effect_list = self._effect_list(owner)
-        if effect_list is None:
-            return 0
-        total = 0
-        for effect_id in list(effect_list.effect_entities):
-            effect = self._effect(effect_id)
-            if effect is None or effect.slug != "thorns":
-                continue
-            total += self._coerce_positive(effect.metadata.get("amount"), default=1)
-        return total
+        return effect_index(self.world).total(owner, "thorns", "amount", 1, positive=True)
 
     def _is_reflectable(self, payload: dict) -> bool:
         effect_entity = payload.get("effect_entity")
@@ -82,22 +64,8 @@ class ThornsEffectSystem:
             return True
         return reason == "witchfire"
 
-    def _effect_list(self, owner: int) -> EffectList | None:
-        try:
-            return self.world.component_for_entity(owner, EffectList)
-        except KeyError:
-            return None
-
     def _effect(self, entity: int) -> Effect | None:
         try:
             return self.world.component_for_entity(entity, Effect)
         except KeyError:
             return None
-
-    @staticmethod
-    def _coerce_positive(value, *, default: int = 0) -> int:
-        try:
-            amount = int(value)
-        except (TypeError, ValueError):
-            return default
-        return amount if amount > 0 else default
\ No newline at end of file
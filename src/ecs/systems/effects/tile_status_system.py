@@ -4,11 +4,11 @@ from typing import Dict, Optional, Tuple
 
 from esper import World
 
+from ecs.events.payloads import EffectAppliedEvent
 from ecs.components.board_position import BoardPosition
 from ecs.components.effect import Effect
 from ecs.components.tile_status_overlay import TileStatusOverlay
 from ecs.events.bus import (
-    EVENT_EFFECT_APPLIED,
     EVENT_EFFECT_EXPIRED,
     EVENT_EFFECT_REFRESHED,
     EVENT_EFFECT_REMOVE,
@@ -30,14 +30,14 @@ class TileStatusSystem:
     def __init__(self, world: World, event_bus: EventBus) -> None:
         self.world = world
         self.event_bus = event_bus
-        event_bus.subscribe(EVENT_EFFECT_APPLIED, self.on_effect_applied)
+        event_bus.subscribe_typed(EffectAppliedEvent, self.on_effect_applied)
         event_bus.subscribe(EVENT_EFFECT_REFRESHED, self.on_effect_refreshed)
         event_bus.subscribe(EVENT_EFFECT_EXPIRED, self.on_effect_expired)
 
-    def on_effect_applied(self, sender, **payload) -> None:
-        effect_entity = payload.get("effect_entity")
-        owner_entity = payload.get("owner_entity")
-        slug = payload.get("slug")
+    def on_effect_applied(self, sender, event: EffectAppliedEvent) -> None:
+        effect_entity = event.effect_entity
+        owner_entity = event.owner_entity
+        slug = event.slug
         if effect_entity is None or owner_entity is None or slug is None:
             return
         self._apply_overlay(effect_entity, owner_entity, slug)
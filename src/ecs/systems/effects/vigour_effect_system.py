@@ -3,9 +3,9 @@ from __future__ import annotations
 from esper import World
 
 from ecs.components.effect import Effect
-from ecs.components.effect_list import EffectList
 from ecs.events.bus import EVENT_EFFECT_APPLY, EVENT_HEALTH_CHANGED, EventBus
 from ecs.utils.combatants import find_primary_opponent
+from ecs.utils.effect_index import effect_index
 
 
 class VigourEffectSystem:
@@ -47,15 +47,12 @@ class VigourEffectSystem:
         )
 
     def _collect_totals(self, owner: int) -> tuple[int, str] | None:
-        effect_list = self._effect_list(owner)
-        if effect_list is None:
-            return None
         multiplier = 0
         reason = "vigour"
         found = False
-        for effect_id in list(effect_list.effect_entities):
+        for effect_id in effect_index(self.world).effects(owner, "vigour"):
             effect = self._effect(effect_id)
-            if effect is None or effect.slug != "vigour":
+            if effect is None:
                 continue
             found = True
             metadata = effect.metadata or {}
@@ -65,12 +62,6 @@ class VigourEffectSystem:
             return None
         return multiplier, reason
 
-    def _effect_list(self, owner: int) -> EffectList | None:
-        try:
-            return self.world.component_for_entity(owner, EffectList)
-        except KeyError:
-            return None
-
     def _effect(self, entity: int) -> Effect | None:
         try:
             return self.world.component_for_entity(entity, Effect)
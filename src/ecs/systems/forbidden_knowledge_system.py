@@ -10,6 +10,7 @@ from ecs.events.bus import (
 from ecs.components.tile import TileType
 from ecs.components.tile_bank import TileBank
 from ecs.systems.board_ops import get_tile_registry
+from ecs.resources import resources_of
 
 
 class ForbiddenKnowledgeSystem:
@@ -48,20 +49,24 @@ class ForbiddenKnowledgeSystem:
     def _increment_meter(self, amount: int) -> None:
         if amount <= 0:
             return
-        for entity, meter in self.world.get_component(ForbiddenKnowledge):
-            previous = meter.value
-            meter.value = min(meter.max_value, previous + amount)
-            delta = meter.value - previous
-            if delta:
-                self.event_bus.emit(
-                    EVENT_FORBIDDEN_KNOWLEDGE_CHANGED,
-                    entity=entity,
-                    value=meter.value,
-                    max_value=meter.max_value,
-                    delta=delta,
-                )
-            if meter.value >= meter.max_value and not meter.chaos_released:
-                self._release_chaos(meter)
+        resources = resources_of(self.world)
+        meter = resources.get(ForbiddenKnowledge)
+        if meter is None:
+            return
+        entity = resources.entity(ForbiddenKnowledge)
+        previous = meter.value
+        meter.value = min(meter.max_value, previous + amount)
+        delta = meter.value - previous
+        if delta:
+            self.event_bus.emit(
+                EVENT_FORBIDDEN_KNOWLEDGE_CHANGED,
+                entity=entity,
+                value=meter.value,
+                max_value=meter.max_value,
+                delta=delta,
+            )
+        if meter.value >= meter.max_value and not meter.chaos_released:
+            self._release_chaos(meter)
 
     def _release_chaos(self, meter: ForbiddenKnowledge) -> None:
         registry = None
@@ -14,6 +14,7 @@ from ecs.components.choice_window import ChoiceWindow
 from ecs.components.game_state import GameMode, GameState
 from ecs.components.tile_bank import TileBank
 from ecs.components.health import Health
+from ecs.resources import resources_of
 
 class InputSystem:
     def __init__(self, event_bus: EventBus, window, world=None):
@@ -149,18 +150,18 @@ class InputSystem:
     def _combat_mode_active(self) -> bool:
         if self.world is None:
             return True
-        states = list(self.world.get_component(GameState))
-        if not states:
+        state = resources_of(self.world).get(GameState)
+        if state is None:
             return True
-        return states[0][1].mode == GameMode.COMBAT
+        return state.mode == GameMode.COMBAT
 
     def _active_owner(self):
         if self.world is None:
             return None
-        active = list(self.world.get_component(ActiveTurn))
-        if not active:
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is None:
             return None
-        return active[0][1].owner_entity
+        return active.owner_entity
 
     def _is_human_entity(self, entity):
         if self.world is None or entity is None:
@@ -1,9 +1,18 @@
 from typing import List, Tuple
 from esper import World
-from ecs.events.bus import (EventBus, EVENT_TILE_SWAP_FINALIZE, EVENT_MATCH_FOUND,
-                            EVENT_MATCH_CLEARED, EVENT_TILES_MATCHED, EVENT_GRAVITY_APPLIED, EVENT_REFILL_COMPLETED,
-                            EVENT_CASCADE_STEP, EVENT_CASCADE_COMPLETE, EVENT_ANIMATION_START, EVENT_ANIMATION_COMPLETE,
-                            EVENT_BOARD_CHANGED, EVENT_TURN_ACTION_STARTED, EVENT_TICK)
+from ecs.events.bus import (EventBus, EVENT_TILE_SWAP_FINALIZE,
+                            EVENT_CASCADE_STEP, EVENT_CASCADE_COMPLETE,
+                            EVENT_BOARD_CHANGED, EVENT_TURN_ACTION_STARTED)
+from ecs.events.payloads import (
+    AnimationCompleteEvent,
+    AnimationStartEvent,
+    GravityAppliedEvent,
+    MatchClearedEvent,
+    MatchFoundEvent,
+    RefillCompletedEvent,
+    TickEvent,
+    TilesMatchedEvent,
+)
 from ecs.components.active_switch import ActiveSwitch
 from ecs.components.tile import TileType
 from ecs.components.board_position import BoardPosition
@@ -20,6 +29,7 @@ from ecs.systems.board_ops import (
     apply_gravity_moves,
 )
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.resources import resources_of
 
 class MatchResolutionSystem:
     def __init__(self, world: World, event_bus: EventBus):
@@ -27,8 +37,8 @@ class MatchResolutionSystem:
         self.event_bus = event_bus
         self.event_bus.subscribe(EVENT_TILE_SWAP_FINALIZE, self.on_swap_finalize)
         self.event_bus.subscribe(EVENT_BOARD_CHANGED, self.on_board_changed)
-        self.event_bus.subscribe(EVENT_ANIMATION_COMPLETE, self.on_animation_complete)
-        self.event_bus.subscribe(EVENT_TICK, self.on_tick)
+        self.event_bus.subscribe_typed(AnimationCompleteEvent, self.on_animation_complete)
+        self.event_bus.subscribe_typed(TickEvent, self.on_tick)
         self.pending_match_positions: List[Tuple[int, int]] = []
         self._pending_refill_checks = 0
         self._suppress_refill = False
@@ -61,20 +71,21 @@ class MatchResolutionSystem:
         matches = find_all_matches(self.world)
         if not matches:
             if state.cascade_active:
-                self.event_bus.emit(EVENT_CASCADE_COMPLETE, depth=state.cascade_depth)
+                # The stalemate check below needs the cascade closed first.
+                self.event_bus.emit_now(EVENT_CASCADE_COMPLETE, depth=state.cascade_depth)
             self._maybe_trigger_stalemate_reset()
             return
         self._flag_extra_turn(matches)
         flat_positions = sorted({pos for group in matches for pos in group})
         self.pending_match_positions = flat_positions
-        self.event_bus.emit(EVENT_MATCH_FOUND, positions=flat_positions, size=len(flat_positions), reason=reason)
-        self.event_bus.emit(EVENT_ANIMATION_START, kind='fade', items=flat_positions)
+        self.event_bus.publish(MatchFoundEvent(flat_positions, len(flat_positions), reason))
+        self.event_bus.publish(AnimationStartEvent('fade', flat_positions))
         depth = (state.cascade_depth + 1) if state.cascade_active else 1
         self.event_bus.emit(EVENT_CASCADE_STEP, depth=depth, positions=flat_positions, reason=reason)
 
-    def on_animation_complete(self, sender, **kwargs):
-        kind = kwargs.get('kind')
-        items = kwargs.get('items', [])
+    def on_animation_complete(self, sender, event: AnimationCompleteEvent):
+        kind = event.kind
+        items = event.items
         if kind == 'fade':
             positions = items or self.pending_match_positions
             self._after_fade(positions)
@@ -83,7 +94,7 @@ class MatchResolutionSystem:
         elif kind == 'refill':
             self._pending_refill_checks += 1
 
-    def on_tick(self, sender, **kwargs):
+    def on_tick(self, sender, event: TickEvent):
         if not self._pending_refill_checks:
             return
         pending = self._pending_refill_checks
@@ -118,19 +129,21 @@ class MatchResolutionSystem:
         types_before = sorted(typed_before)
         owner_entity = self._active_owner()
         # Emit match cleared with type info only; colors are derived in RenderSystem.
-        self.event_bus.emit(
-            EVENT_MATCH_CLEARED,
-            positions=positions,
-            types=types_before,
-            owner_entity=owner_entity,
-            entities=entity_snapshot,
+        self.event_bus.publish(
+            MatchClearedEvent(
+                positions=positions,
+                types=types_before,
+                owner_entity=owner_entity,
+                entities=entity_snapshot,
+            )
         )
-        self.event_bus.emit(
-            EVENT_TILES_MATCHED,
-            positions=positions,
-            types=types_before,
-            owner_entity=owner_entity,
-            source="match_resolution",
+        self.event_bus.publish(
+            TilesMatchedEvent(
+                positions=positions,
+                types=types_before,
+                owner_entity=owner_entity,
+                source="match_resolution",
+            )
         )
         # Gravity
         if moves:
@@ -139,13 +152,13 @@ class MatchResolutionSystem:
                 {'from': move.source, 'to': move.target, 'type_name': move.type_name}
                 for move in moves
             ]
-            self.event_bus.emit(EVENT_GRAVITY_APPLIED, cascades=cascades)
-            self.event_bus.emit(EVENT_ANIMATION_START, kind='fall', items=fall_payload)
+            self.event_bus.publish(GravityAppliedEvent(cascades))
+            self.event_bus.publish(AnimationStartEvent('fall', fall_payload))
         else:
-            self.event_bus.emit(EVENT_GRAVITY_APPLIED, cascades=0)
+            self.event_bus.publish(GravityAppliedEvent(0))
             if new_tiles:
-                self.event_bus.emit(EVENT_REFILL_COMPLETED, new_tiles=new_tiles)
-                self.event_bus.emit(EVENT_ANIMATION_START, kind='refill', items=new_tiles)
+                self.event_bus.publish(RefillCompletedEvent(new_tiles))
+                self.event_bus.publish(AnimationStartEvent('refill', new_tiles))
 
     def _after_fall(self, items):
         if self._suppress_refill:
@@ -154,8 +167,8 @@ class MatchResolutionSystem:
             return
         new_tiles = refill_inactive_tiles(self.world)
         if new_tiles:
-            self.event_bus.emit(EVENT_REFILL_COMPLETED, new_tiles=new_tiles)
-            self.event_bus.emit(EVENT_ANIMATION_START, kind='refill', items=new_tiles)
+            self.event_bus.publish(RefillCompletedEvent(new_tiles))
+            self.event_bus.publish(AnimationStartEvent('refill', new_tiles))
 
     def _after_refill(self):
         # After refill animation completes, check for next cascade step
@@ -164,7 +177,7 @@ class MatchResolutionSystem:
         if not matches:
             # Cascade ends
             if state.cascade_active:
-                self.event_bus.emit(EVENT_CASCADE_COMPLETE, depth=state.cascade_depth)
+                self.event_bus.emit_now(EVENT_CASCADE_COMPLETE, depth=state.cascade_depth)
             if self._stalemate_reset_active:
                 self._stalemate_reset_active = False
             self._maybe_trigger_stalemate_reset()
@@ -182,8 +195,8 @@ class MatchResolutionSystem:
         flat_positions = sorted({pos for group in matches for pos in group})
         self.pending_match_positions = flat_positions
         self.event_bus.emit(EVENT_CASCADE_STEP, depth=depth, positions=flat_positions)
-        self.event_bus.emit(EVENT_MATCH_FOUND, positions=flat_positions, size=len(flat_positions))
-        self.event_bus.emit(EVENT_ANIMATION_START, kind='fade', items=flat_positions)
+        self.event_bus.publish(MatchFoundEvent(flat_positions, len(flat_positions)))
+        self.event_bus.publish(AnimationStartEvent('fade', flat_positions))
 
     def _maybe_trigger_stalemate_reset(self) -> None:
         if self._stalemate_reset_active:
@@ -207,17 +220,8 @@ class MatchResolutionSystem:
             owner_entity=owner,
         )
         self.pending_match_positions = positions
-        self.event_bus.emit(
-            EVENT_MATCH_FOUND,
-            positions=positions,
-            size=len(positions),
-            reason="stalemate_reset",
-        )
-        self.event_bus.emit(
-            EVENT_ANIMATION_START,
-            kind='fade',
-            items=positions,
-        )
+        self.event_bus.publish(MatchFoundEvent(positions, len(positions), "stalemate_reset"))
+        self.event_bus.publish(AnimationStartEvent('fade', positions))
         self.event_bus.emit(
             EVENT_CASCADE_STEP,
             depth=1,
@@ -227,10 +231,10 @@ class MatchResolutionSystem:
 
     def _active_owner(self):
         from ecs.components.active_turn import ActiveTurn
-        active = list(self.world.get_component(ActiveTurn))
-        if not active:
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is None:
             return None
-        return active[0][1].owner_entity
+        return active.owner_entity
 
     def _flag_extra_turn(self, matches: list[list[tuple[int, int]]]) -> None:
         if not matches:
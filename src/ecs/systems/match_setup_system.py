@@ -18,6 +18,7 @@ from ecs.events.bus import (
     EventBus,
 )
 from ecs.utils.combatants import ensure_combatants
+from ecs.resources import resources_of
 
 
 FlowCallback = Callable[[], None]
@@ -116,21 +117,20 @@ class MatchSetupSystem:
         owners: list[int] = [owner_entity]
         if enemy_entity != owner_entity:
             owners.append(enemy_entity)
-        turn_orders = list(self.world.get_component(TurnOrder))
-        if turn_orders:
-            _, order = turn_orders[0]
+        resources = resources_of(self.world)
+        order = resources.get(TurnOrder)
+        if order is not None:
             order.owners = owners
             order.index = 0
         elif owners:
-            self.world.create_entity(TurnOrder(owners=list(owners), index=0))
-        active_turns = list(self.world.get_component(ActiveTurn))
+            resources.insert(TurnOrder(owners=list(owners), index=0))
+        active = resources.get(ActiveTurn)
         if owners:
             first_owner = owners[0]
-            if active_turns:
-                _, active = active_turns[0]
+            if active is not None:
                 active.owner_entity = first_owner
             else:
-                self.world.create_entity(ActiveTurn(owner_entity=first_owner))
+                resources.insert(ActiveTurn(owner_entity=first_owner))
 
     def _pick_existing_enemy(self, owner_entity: int) -> int | None:
         candidates = [entity for entity, _ in self.world.get_component(RuleBasedAgent)]
@@ -4,7 +4,6 @@ from typing import Any
 from ecs.events.bus import (EVENT_TICK, EventBus, EVENT_TILE_SELECTED, EVENT_TILE_DESELECTED,
                             EVENT_MATCH_FOUND, EVENT_MATCH_CLEARED,
                             EVENT_TILE_SWAP_REQUEST, EVENT_TILE_SWAP_FINALIZE)
-from ecs.components.tile_type_registry import TileTypeRegistry
 from ecs.components.tile_types import TileTypes
 from ecs.components.active_turn import ActiveTurn
 from ecs.rendering.context import RenderContext, build_render_context, collect_animation_maps
@@ -23,6 +22,7 @@ from ecs.constants import (
     GRID_ROWS, GRID_COLS, TILE_SIZE, BOTTOM_MARGIN,
     BOARD_MAX_WIDTH_PCT, BOARD_MAX_HEIGHT_PCT,
 )
+from ecs.resources import resources_of
 from esper import World
 
 PADDING = 4
@@ -141,11 +141,8 @@ class RenderSystem:
         if combat_active:
             registry = self._registry()
             try:
-                active_turn_entries = list(self.world.get_component(ActiveTurn))
-                if active_turn_entries:
-                    self._current_active_owner = active_turn_entries[0][1].owner_entity
-                else:
-                    self._current_active_owner = None
+                active_turn = resources_of(self.world).get(ActiveTurn)
+                self._current_active_owner = active_turn.owner_entity if active_turn is not None else None
             except Exception:
                 self._current_active_owner = None
             self._board_renderer.render(arcade, ctx, registry, headless=headless)
@@ -275,21 +272,19 @@ class RenderSystem:
         self.selected = None
 
     def _registry(self) -> TileTypes:
-        for ent, _ in self.world.get_component(TileTypeRegistry):
-            return self.world.component_for_entity(ent, TileTypes)
-        raise RuntimeError('TileTypes definitions not found')
+        registry = resources_of(self.world).get(TileTypes)
+        if registry is None:
+            raise RuntimeError('TileTypes definitions not found')
+        return registry
 
     def _current_tooltip(self) -> TooltipState | None:
-        entries = list(self.world.get_component(TooltipState))
-        if not entries:
-            return None
-        return entries[0][1]
+        return resources_of(self.world).get(TooltipState)
 
     def _current_mode(self) -> GameMode:
-        states = list(self.world.get_component(GameState))
-        if not states:
+        state = resources_of(self.world).get(GameState)
+        if state is None:
             return GameMode.COMBAT
-        return states[0][1].mode
+        return state.mode
 
     def _render_tooltip(self, arcade) -> None:
         tooltip = self._current_tooltip()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import random
-from typing import Dict, Optional, Tuple, cast
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Mapping, Optional, Tuple, cast
 
 from esper import World
 
+from ecs.ai.ability_projection import AbilityProjection
 from ecs.ai.simulation import CloneState
 from ecs.components.active_switch import ActiveSwitch
 from ecs.components.ability_cooldown import AbilityCooldown
@@ -13,6 +15,7 @@ from ecs.components.health import Health
 from ecs.components.rule_based_agent import RuleBasedAgent
 from ecs.components.tile import TileType
 from ecs.components.tile_bank import TileBank
+from ecs.components.tile_counts import TileCodes, TileCounts
 from ecs.components.forbidden_knowledge import ForbiddenKnowledge
 
 
@@ -32,7 +35,10 @@ MANA_GAIN_WEIGHT = 10
 SECRETS_GAIN_WEIGHT = 1
 KNOWLEDGE_COMPLETION_BONUS = 3_000_000
 RANDOM_TIE_BREAKER = 0.001
+# Tile types the heuristics score individually rather than as generic mana.
+SCORE_SPECIAL_TYPES = frozenset({"secrets", "chaos", "witchfire"})
 from ecs.events.bus import EventBus
+from ecs.systems.board_ops import active_tile_type_map
 from ecs.systems.base_ai_system import (
     ActionPayload,
     AbilityAction,
@@ -40,17 +46,53 @@ from ecs.systems.base_ai_system import (
     BaseAISystem,
     OwnerSnapshot,
 )
+from ecs.resources import resources_of
+from ecs.utils.queries import query_cache
+
+
+@dataclass(frozen=True, slots=True)
+class RuleBasedWeights:
+    """Weight profile consumed by ``RuleBasedAISystem``; defaults are the tuned constants above."""
+
+    kill_bonus: float = KILL_BONUS
+    witchfire_bonus: float = WITCHFIRE_BONUS
+    chaos_tile_bonus: float = CHAOS_TILE_BONUS
+    extra_turn_bonus: float = EXTRA_TURN_BONUS
+    ability_usage_bonus: float = ABILITY_USAGE_BONUS
+    free_action_bonus: float = FREE_ACTION_BONUS
+    ability_cost_weight: float = ABILITY_COST_WEIGHT
+    new_affordable_weight: float = NEW_AFFORDABLE_WEIGHT
+    needed_mana_weight: float = NEEDED_MANA_WEIGHT
+    mana_gain_weight: float = MANA_GAIN_WEIGHT
+    secrets_gain_weight: float = SECRETS_GAIN_WEIGHT
+    knowledge_completion_bonus: float = KNOWLEDGE_COMPLETION_BONUS
+    random_tie_breaker: float = RANDOM_TIE_BREAKER
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, float]) -> "RuleBasedWeights":
+        known = {field.name for field in fields(cls)}
+        return cls(**{key: float(value) for key, value in values.items() if key in known})
+
+
+DEFAULT_WEIGHTS = RuleBasedWeights()
 
 
 class RuleBasedAISystem(BaseAISystem):
     """Scores actions according to prioritised tactical heuristics."""
 
+    analytic_ability_scoring = True
+
     def __init__(
         self,
         world: World,
         event_bus: EventBus,
         rng: Optional[random.Random] = None,
+        weights: RuleBasedWeights | None = None,
     ) -> None:
+        self.weights = weights or DEFAULT_WEIGHTS
         super().__init__(world, event_bus, RuleBasedAgent, rng)
 
     def _score_clone_world(
@@ -65,55 +107,122 @@ class RuleBasedAISystem(BaseAISystem):
         post_witchfire = self._count_active_witchfire(clone_world)
         base_chaos = self._count_active_type(self.world, "chaos")
         post_chaos = self._count_active_type(clone_world, "chaos")
-        witchfire_cleared = max(0, base_witchfire - post_witchfire)
-        chaos_cleared = max(0, base_chaos - post_chaos)
-        kill_flag = 1 if self._any_opponent_defeated(clone_world, owner_entity) else 0
+        cooldowns: Dict[int, int] = {}
+        for ability_entity in snapshot.ability_map:
+            clone_ability = clone_state.entity_map.get(ability_entity)
+            if clone_ability is None:
+                continue
+            try:
+                cooldown_comp: AbilityCooldown = clone_world.component_for_entity(
+                    clone_ability, AbilityCooldown
+                )
+                cooldowns[ability_entity] = cooldown_comp.remaining_turns
+            except KeyError:
+                cooldowns[ability_entity] = 0
+        return self._score_outcome(
+            snapshot,
+            candidate,
+            witchfire_cleared=max(0, base_witchfire - post_witchfire),
+            chaos_cleared=max(0, base_chaos - post_chaos),
+            opponent_defeated=self._any_opponent_defeated(clone_world, owner_entity),
+            extra_turn=candidate[0] == "swap" and clone_state.engine.last_action_generated_extra_turn,
+            bank_counts=self._clone_bank_counts(clone_world, owner_entity),
+            cooldowns=cooldowns,
+        )
+
+    def _score_projection(
+        self,
+        projection: AbilityProjection,
+        snapshot: OwnerSnapshot,
+        candidate: Tuple[str, ActionPayload],
+    ) -> float:
+        # Board-neutral abilities leave tiles and cooldown state untouched.
+        owner_entity = projection.owner_entity
+        opponents = {
+            ent for ent, _ in self.world.get_component(AbilityListOwner) if ent != owner_entity
+        }
+        return self._score_outcome(
+            snapshot,
+            candidate,
+            witchfire_cleared=0,
+            chaos_cleared=0,
+            opponent_defeated=bool(opponents & projection.defeated()),
+            extra_turn=False,
+            bank_counts=projection.owner_bank_counts(),
+            cooldowns={ent: snap.cooldown for ent, snap in snapshot.ability_map.items()},
+        )
+
+    def _score_outcome(
+        self,
+        snapshot: OwnerSnapshot,
+        candidate: Tuple[str, ActionPayload],
+        *,
+        witchfire_cleared: int,
+        chaos_cleared: int,
+        opponent_defeated: bool,
+        extra_turn: bool,
+        bank_counts: Mapping[str, int],
+        cooldowns: Dict[int, int],
+    ) -> float:
+        weights = self.weights
+        kill_flag = 1 if opponent_defeated else 0
         ability_usage_flag = 1 if candidate[0] == "ability" else 0
         ability_cost_total = 0
         free_action_bonus = 0
-        extra_turn_bonus = 0
+        extra_turn_bonus = weights.extra_turn_bonus if extra_turn else 0
         if candidate[0] == "ability":
             ability_action = cast(AbilityAction, candidate[1])
             ability_cost_total = self._ability_cost_total(snapshot, ability_action)
             ability_snapshot = snapshot.ability_map.get(ability_action.ability_entity)
             if ability_snapshot is not None and not ability_snapshot.ends_turn:
-                free_action_bonus = FREE_ACTION_BONUS
-        if candidate[0] == "swap" and clone_state.engine.last_action_generated_extra_turn:
-            extra_turn_bonus = EXTRA_TURN_BONUS
-        clone_bank_counts = self._clone_bank_counts(clone_world, owner_entity)
-        baseline_deficits = self._compute_mana_deficits(snapshot.bank_counts, snapshot.ability_map)
-        clone_deficits = self._compute_mana_deficits(clone_bank_counts, snapshot.ability_map, clone_state)
-        needed_mana_delta = max(0, sum(baseline_deficits.values()) - sum(clone_deficits.values()))
+                free_action_bonus = weights.free_action_bonus
+        # Scoring runs on count lists indexed by the snapshot's tile codes.
+        # Aligning the outcome may register a type, so it goes first.
+        codes = snapshot.bank_counts.codes
+        post_counts = self._aligned_counts(bank_counts, codes)
+        baseline_counts = snapshot.bank_counts.aligned(codes)
+        baseline_deficits = self._compute_mana_deficits(baseline_counts, snapshot.ability_map)
+        post_deficits = self._compute_mana_deficits(post_counts, snapshot.ability_map, cooldowns)
+        needed_mana_delta = max(0, sum(baseline_deficits) - sum(post_deficits))
         other_mana_gain, secrets_gain = self._compute_bank_gains(
-            snapshot.bank_counts,
-            clone_bank_counts,
+            baseline_counts,
+            post_counts,
             baseline_deficits,
+            secrets_code=codes.lookup("secrets"),
         )
-        new_affordable = self._count_new_affordable(clone_state, owner_entity, snapshot, clone_bank_counts)
+        new_affordable = self._count_new_affordable(snapshot, post_counts, cooldowns)
         knowledge_completion_bonus = 0
         meter_state = self._current_forbidden_knowledge()
         if meter_state is not None:
             current_value, max_value = meter_state
             remaining = max(0, max_value - current_value)
             if remaining > 0 and secrets_gain >= remaining:
-                knowledge_completion_bonus = KNOWLEDGE_COMPLETION_BONUS
+                knowledge_completion_bonus = weights.knowledge_completion_bonus
         score = (
-            kill_flag * KILL_BONUS
-            + witchfire_cleared * WITCHFIRE_BONUS
-            + chaos_cleared * CHAOS_TILE_BONUS
+            kill_flag * weights.kill_bonus
+            + witchfire_cleared * weights.witchfire_bonus
+            + chaos_cleared * weights.chaos_tile_bonus
             + extra_turn_bonus
-            + ability_usage_flag * ABILITY_USAGE_BONUS
+            + ability_usage_flag * weights.ability_usage_bonus
             + free_action_bonus
-            + ability_cost_total * ABILITY_COST_WEIGHT
-            + new_affordable * NEW_AFFORDABLE_WEIGHT
-            + needed_mana_delta * NEEDED_MANA_WEIGHT
-            + other_mana_gain * MANA_GAIN_WEIGHT
-            + secrets_gain * SECRETS_GAIN_WEIGHT
+            + ability_cost_total * weights.ability_cost_weight
+            + new_affordable * weights.new_affordable_weight
+            + needed_mana_delta * weights.needed_mana_weight
+            + other_mana_gain * weights.mana_gain_weight
+            + secrets_gain * weights.secrets_gain_weight
             + knowledge_completion_bonus
-            + self.random.random() * RANDOM_TIE_BREAKER
+            + self.random.random() * weights.random_tie_breaker
         )
         return score
 
+    def _score_neutral_types(self, owner_entity: int) -> frozenset[str]:
+        # Colours outside every ability cost only ever count as generic mana gain.
+        special = set(SCORE_SPECIAL_TYPES)
+        snapshot = self._capture_owner_snapshot(owner_entity)
+        for ability in snapshot.ability_map.values():
+            special.update(ability.cost)
+        return frozenset(set(active_tile_type_map(self.world).values()) - special)
+
     def _any_opponent_defeated(self, world: World, owner_entity: int) -> bool:
         # Consider only controller entities with abilities.
         opponents = {
@@ -134,10 +243,9 @@ class RuleBasedAISystem(BaseAISystem):
         return self._count_active_type(world, "witchfire")
 
     def _count_active_type(self, world: World, type_name: str) -> int:
-        active_map: Dict[int, bool] = {ent: active.active for ent, active in world.get_component(ActiveSwitch)}
         total = 0
-        for ent, tile_type in world.get_component(TileType):
-            if tile_type.type_name == type_name and active_map.get(ent, False):
+        for _, (tile_type, switch) in query_cache(world).join(TileType, ActiveSwitch):
+            if switch.active and tile_type.type_name == type_name:
                 total += 1
         return total
 
@@ -145,97 +253,85 @@ class RuleBasedAISystem(BaseAISystem):
         snap = snapshot.ability_map.get(ability_action.ability_entity)
         if snap is None:
             return 0
-        return sum(snap.cost.values())
+        return sum(snap.cost.amounts)
 
-    def _clone_bank_counts(self, world: World, owner_entity: int) -> Dict[str, int]:
+    def _clone_bank_counts(self, world: World, owner_entity: int) -> Mapping[str, int]:
         try:
             bank: TileBank = world.component_for_entity(owner_entity, TileBank)
         except KeyError:
             return {}
-        return dict(bank.counts)
+        return bank.counts
+
+    @staticmethod
+    def _aligned_counts(counts: Mapping[str, int], codes: TileCodes) -> List[int]:
+        if type(counts) is TileCounts:
+            return counts.aligned(codes)
+        return TileCounts(counts, codes=codes).aligned(codes)
 
     def _compute_mana_deficits(
         self,
-        counts: Dict[str, int],
+        counts: List[int],
         ability_map: Dict[int, AbilitySnapshot],
-        clone_state: CloneState | None = None,
-    ) -> Dict[str, int]:
-        deficits: Dict[str, int] = {}
+        cooldowns: Dict[int, int] | None = None,
+    ) -> List[int]:
+        deficits = [0] * len(counts)
         for ability_entity, snap in ability_map.items():
             cooldown = snap.cooldown
-            if clone_state is not None:
-                clone_ability = clone_state.entity_map.get(ability_entity)
-                if clone_ability is not None:
-                    try:
-                        cooldown_comp: AbilityCooldown = clone_state.world.component_for_entity(
-                            clone_ability, AbilityCooldown
-                        )
-                        cooldown = cooldown_comp.remaining_turns
-                    except KeyError:
-                        cooldown = 0
+            if cooldowns is not None:
+                cooldown = cooldowns.get(ability_entity, cooldown)
             if cooldown > 0:
                 continue
-            for tile_type, required in snap.cost.items():
-                missing = required - counts.get(tile_type, 0)
+            for code, required in snap.cost.nonzero():
+                missing = required - counts[code]
                 if missing > 0:
-                    deficits[tile_type] = deficits.get(tile_type, 0) + missing
+                    deficits[code] += missing
         return deficits
 
     def _compute_bank_gains(
         self,
-        baseline_counts: Dict[str, int],
-        clone_counts: Dict[str, int],
-        baseline_deficits: Dict[str, int],
+        baseline_counts: List[int],
+        clone_counts: List[int],
+        baseline_deficits: List[int],
+        *,
+        secrets_code: int | None,
     ) -> Tuple[int, int]:
         other_gain = 0
         secrets_gain = 0
-        for tile_type, amount in clone_counts.items():
-            previous = baseline_counts.get(tile_type, 0)
-            delta = amount - previous
-            if delta <= 0:
+        for code, (amount, previous, deficit) in enumerate(
+            zip(clone_counts, baseline_counts, baseline_deficits)
+        ):
+            if amount <= previous:
                 continue
-            if tile_type == "secrets":
-                secrets_gain += delta
+            if code == secrets_code:
+                secrets_gain += amount - previous
                 continue
-            if baseline_deficits.get(tile_type, 0) > 0:
+            if deficit > 0:
                 # Deficit reductions are already captured in needed_mana_delta.
                 continue
-            other_gain += delta
+            other_gain += amount - previous
         return other_gain, secrets_gain
 
     def _current_forbidden_knowledge(self) -> Tuple[int, int] | None:
-        entries = list(self.world.get_component(ForbiddenKnowledge))
-        if not entries:
+        meter = resources_of(self.world).get(ForbiddenKnowledge)
+        if meter is None:
             return None
-        meter = entries[0][1]
         return meter.value, meter.max_value
 
     def _count_new_affordable(
         self,
-        clone_state: CloneState,
-        clone_owner: int,
         snapshot: OwnerSnapshot,
-        clone_counts: Dict[str, int],
+        counts: List[int],
+        cooldowns: Dict[int, int],
     ) -> int:
-        if not clone_counts:
+        if not any(counts):
             return 0
         new_affordable = 0
         for ability_entity, snap in snapshot.ability_map.items():
-            if snap.cooldown > 0 or not snap.cost:
+            cost = snap.cost.nonzero()
+            if snap.cooldown > 0 or not cost or snap.affordable:
                 continue
-            was_affordable = snap.affordable
-            clone_ability = clone_state.entity_map.get(ability_entity)
-            if clone_ability is None:
+            if ability_entity not in cooldowns or cooldowns[ability_entity] > 0:
                 continue
-            try:
-                cooldown_comp: AbilityCooldown = clone_state.world.component_for_entity(
-                    clone_ability, AbilityCooldown
-                )
-                if cooldown_comp.remaining_turns > 0:
-                    continue
-            except KeyError:
-                pass
-            can_afford_now = all(clone_counts.get(t, 0) >= n for t, n in snap.cost.items())
-            if not was_affordable and can_afford_now:
+            if all(counts[code] >= n for code, n in cost):
                 new_affordable += 1
         return new_affordable
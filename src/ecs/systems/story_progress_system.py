@@ -20,13 +20,20 @@ from ecs.events.bus import (
     EVENT_ABILITY_UNLOCKED,
     EVENT_SKILL_GAINED,
     EVENT_FORBIDDEN_KNOWLEDGE_CHANGED,
+    EVENT_STORY_PROGRESS_SAVE,
     EventBus,
 )
 from ecs.systems.board_ops import get_tile_registry
+from ecs.resources import resources_of
 
 
 class StoryProgressSystem:
-    """Tracks and persists long-term story progress across matches."""
+    """Tracks and persists long-term story progress across matches.
+
+    Handlers update the tracker on the game thread and publish a snapshot on
+    ``EVENT_STORY_PROGRESS_SAVE``. With ``background_writes`` the file is
+    written by the bus's async worker, so saves never stall a frame.
+    """
 
     def __init__(
         self,
@@ -35,6 +42,7 @@ class StoryProgressSystem:
         *,
         save_path: Path | None = None,
         load_existing: bool = True,
+        background_writes: bool = False,
     ) -> None:
         self.world = world
         self.event_bus = event_bus
@@ -51,6 +59,10 @@ class StoryProgressSystem:
         self.event_bus.subscribe(EVENT_LOCATION_COMPLETED, self._on_location_completed)
         self.event_bus.subscribe(EVENT_ABILITY_UNLOCKED, self._on_ability_unlocked)
         self.event_bus.subscribe(EVENT_SKILL_GAINED, self._on_skill_gained)
+        if background_writes:
+            self.event_bus.subscribe_async(EVENT_STORY_PROGRESS_SAVE, self._write_progress)
+        else:
+            self.event_bus.subscribe(EVENT_STORY_PROGRESS_SAVE, self._write_progress)
 
         if load_existing:
             self.load_progress()
@@ -76,6 +88,8 @@ class StoryProgressSystem:
 
     def load_progress(self) -> None:
         tracker = self._tracker()
+        # A queued background save must land before the file is read back.
+        self.event_bus.flush_async()
         try:
             with self._save_path.open("r", encoding="utf-8") as handle:
                 payload = json.load(handle)
@@ -125,18 +139,30 @@ class StoryProgressSystem:
 
     def save_progress(self) -> None:
         tracker = self._tracker()
-        self._save_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._save_path.open("w", encoding="utf-8") as handle:
-            json.dump({
+        self._has_progress = tracker.enemies_defeated > 0
+        self.event_bus.emit(
+            EVENT_STORY_PROGRESS_SAVE,
+            path=self._save_path,
+            progress={
                 "enemies_defeated": tracker.enemies_defeated,
                 "locations_visited": list(tracker.locations_visited),
                 "enemies_encountered": list(tracker.enemies_encountered),
                 "dialogues_completed": list(tracker.dialogues_completed),
-                "abilities_unlocked": tracker.abilities_unlocked,
+                "abilities_unlocked": list(tracker.abilities_unlocked),
                 "skills_gained": list(tracker.skills_gained),
                 "locations_completed": tracker.locations_completed,
-            }, handle, indent=2)
-        self._has_progress = tracker.enemies_defeated > 0
+            },
+        )
+
+    def _write_progress(self, sender, path: Path, progress: dict) -> None:
+        if path != self._save_path:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a reader never sees a half-written file.
+        partial = path.with_name(path.name + ".tmp")
+        with partial.open("w", encoding="utf-8") as handle:
+            json.dump(progress, handle, indent=2)
+        partial.replace(path)
 
     # Event handlers -----------------------------------------------------
 
@@ -233,10 +259,11 @@ class StoryProgressSystem:
             health.current = health.max_hp
 
     def _reset_forbidden_knowledge_meter(self) -> None:
-        entries = list(self.world.get_component(ForbiddenKnowledge))
-        if not entries:
+        resources = resources_of(self.world)
+        meter = resources.get(ForbiddenKnowledge)
+        if meter is None:
             return
-        entity, meter = entries[0]
+        entity = resources.entity(ForbiddenKnowledge)
         previous_value = meter.value
         was_released = meter.chaos_released
         meter.value = 0
@@ -3,7 +3,6 @@ from typing import Dict
 from esper import World
 from ecs.events.bus import (
     EventBus,
-    EVENT_TILES_MATCHED,
     EVENT_BANK_MANA,
     EVENT_TILE_BANK_CHANGED,
     EVENT_TILE_BANK_SPEND_REQUEST,
@@ -11,10 +10,12 @@ from ecs.events.bus import (
     EVENT_TILE_BANK_INSUFFICIENT,
     EVENT_EFFECT_APPLY,
 )
+from ecs.events.payloads import TilesMatchedEvent
 from ecs.components.tile_bank import TileBank
 from ecs.components.ability_list_owner import AbilityListOwner
-from ecs.components.tile_type_registry import TileTypeRegistry
 from ecs.components.tile_types import TileTypes
+from ecs.resources import resources_of
+from ecs.utils.tile_banks import bank_index
 
 class TileBankSystem:
     """Tracks cleared tiles and manages spending for abilities.
@@ -30,25 +31,24 @@ class TileBankSystem:
     def __init__(self, world: World, event_bus: EventBus):
         self.world = world
         self.event_bus = event_bus
-        self.event_bus.subscribe(EVENT_TILES_MATCHED, self.on_tiles_matched)
+        self.event_bus.subscribe_typed(TilesMatchedEvent, self.on_tiles_matched)
         self.event_bus.subscribe(EVENT_TILE_BANK_SPEND_REQUEST, self.on_spend_request)
         self.event_bus.subscribe(EVENT_BANK_MANA, self.on_bank_mana)
 
     def _get_or_create_bank(self, owner_entity: int) -> int:
         # Find existing bank for owner or create one.
-        for ent, bank in self.world.get_component(TileBank):
-            if bank.owner_entity == owner_entity:
-                return ent
-        bank_ent = self.world.create_entity(TileBank(owner_entity=owner_entity))
-        return bank_ent
+        banks = bank_index(self.world)
+        entry = banks.find(owner_entity)
+        if entry is None:
+            entry = banks.create(owner_entity)
+        return entry[0]
 
     def _list_owners(self) -> list:
         return [ent for ent, comp in self.world.get_component(AbilityListOwner)]
 
-    def on_tiles_matched(self, sender, **kwargs):
-        positions = kwargs.get('positions', [])  # retained for possible future metrics
-        types = kwargs.get('types', [])    # list of (r,c,type_name)
-        owner_entity = kwargs.get('owner_entity')
+    def on_tiles_matched(self, sender, event: TilesMatchedEvent):
+        types = event.types    # list of (r,c,type_name)
+        owner_entity = event.owner_entity
         if owner_entity is None:
             owners = self._list_owners()
             if not owners:
@@ -69,7 +69,7 @@ class TileBankSystem:
                 owner_entity=owner_entity,
                 counts=bank.counts.copy(),
                 delta=readiness_gains,
-                source=kwargs.get('source', 'tiles_matched'),
+                source=event.source or 'tiles_matched',
             )
 
         witchfire_cleared = readiness_gains.get('witchfire', 0)
@@ -85,19 +85,9 @@ class TileBankSystem:
         ability_entity = kwargs.get('ability_entity')
         if owner_entity is None or not cost:
             return
-        # Find bank for owner
-        bank_ent = None
-        for ent, bank in self.world.get_component(TileBank):
-            if bank.owner_entity == owner_entity:
-                bank_ent = ent
-                bank_obj = bank
-                break
-        if bank_ent is None:
-            # No bank yet; create then fail
-            bank_ent = self._get_or_create_bank(owner_entity)
-            bank_obj: TileBank = self.world.component_for_entity(bank_ent, TileBank)
-        else:
-            bank_obj = bank_obj  # already set in loop
+        # No bank yet: create one, then the spend fails on it.
+        bank_ent = self._get_or_create_bank(owner_entity)
+        bank_obj: TileBank = self.world.component_for_entity(bank_ent, TileBank)
         missing = bank_obj.spend(cost)
         if missing:
             self.event_bus.emit(EVENT_TILE_BANK_INSUFFICIENT, entity=bank_ent, cost=cost, missing=missing, ability_entity=ability_entity)
@@ -154,9 +144,10 @@ class TileBankSystem:
         return
 
     def _registry(self) -> TileTypes:
-        for ent, _ in self.world.get_component(TileTypeRegistry):
-            return self.world.component_for_entity(ent, TileTypes)
-        raise RuntimeError('TileTypes definitions not found')
+        registry = resources_of(self.world).get(TileTypes)
+        if registry is None:
+            raise RuntimeError('TileTypes definitions not found')
+        return registry
 
     def _apply_readiness_from_tiles(self, owner_entity: int, gains: Dict[str, int]) -> None:
         # Regiment readiness removed; placeholder for future House/Circle progression.
@@ -19,6 +19,7 @@ from ecs.events.bus import (
     EVENT_TICK,
     EVENT_ABILITY_ACTIVATE_REQUEST,
 )
+from ecs.resources import resources_of
 
 
 class TooltipSystem:
@@ -37,17 +38,16 @@ class TooltipSystem:
         self._mouse_y: float = 0.0
         self._state_entity: Optional[int] = None
         self._state = self._ensure_state()
-        self.event_bus.subscribe(EVENT_MOUSE_MOVE, self.on_mouse_move)
+        # Hit-testing only needs the latest pointer position of each frame.
+        self.event_bus.subscribe_deferred(EVENT_MOUSE_MOVE, self.on_mouse_move)
         self.event_bus.subscribe(EVENT_TICK, self.on_tick)
         self.event_bus.subscribe(EVENT_ABILITY_ACTIVATE_REQUEST, self.on_input_action)
 
     def _ensure_state(self) -> TooltipState:
-        entries = list(self.world.get_component(TooltipState))
-        if entries:
-            self._state_entity, state = entries[0]
-            return state
-        self._state_entity = self.world.create_entity(TooltipState())
-        return self.world.component_for_entity(self._state_entity, TooltipState)
+        resources = resources_of(self.world)
+        state = resources.get_or_insert(TooltipState)
+        self._state_entity = resources.entity(TooltipState)
+        return state
 
     def on_mouse_move(self, sender, **payload):
         x = payload.get("x")
@@ -1,12 +1,9 @@
 from esper import World
 
 from ecs.components.turn_state import TurnState
+from ecs.resources import resources_of
 
 
 def get_or_create_turn_state(world: World) -> TurnState:
-    """Return the shared TurnState component, creating it if absent."""
-    existing = list(world.get_component(TurnState))
-    if existing:
-        return existing[0][1]
-    world.create_entity(TurnState())
-    return list(world.get_component(TurnState))[0][1]
+    """Return the shared TurnState resource, creating it if absent."""
+    return resources_of(world).get_or_insert(TurnState)
@@ -4,11 +4,11 @@ from ecs.events.bus import (
     EVENT_ABILITY_EFFECT_APPLIED,
     EVENT_CASCADE_COMPLETE,
     EVENT_CASCADE_STEP,
-    EVENT_MATCH_CLEARED,
     EVENT_TURN_ACTION_STARTED,
     EVENT_TURN_ADVANCED,
     EVENT_EXTRA_TURN_GRANTED,
 )
+from ecs.events.payloads import MatchClearedEvent
 from ecs.components.turn_order import TurnOrder
 from ecs.components.active_turn import ActiveTurn
 from ecs.components.ability_list_owner import AbilityListOwner
@@ -16,6 +16,7 @@ from ecs.components.turn_state import TurnState
 from ecs.components.human_agent import HumanAgent
 from ecs.components.ability import Ability
 from ecs.systems.turn_state_utils import get_or_create_turn_state
+from ecs.resources import resources_of
 
 class TurnSystem:
     """Rotates active owner only after cascades finish.
@@ -29,7 +30,7 @@ class TurnSystem:
         self.world = world
         self.event_bus = event_bus
         self.event_bus.subscribe(EVENT_TURN_ACTION_STARTED, self.on_turn_action_started)
-        self.event_bus.subscribe(EVENT_MATCH_CLEARED, self.on_match_cleared)
+        self.event_bus.subscribe_typed(MatchClearedEvent, self.on_match_cleared)
         self.event_bus.subscribe(EVENT_CASCADE_STEP, self.on_cascade_step)
         self.event_bus.subscribe(EVENT_CASCADE_COMPLETE, self.on_cascade_complete)
         self.event_bus.subscribe(EVENT_ABILITY_EFFECT_APPLIED, self.on_ability_effect_applied)
@@ -39,17 +40,17 @@ class TurnSystem:
 
     def _ensure_turn_order(self):
         # If no TurnOrder component, create one using current owners
-        existing = list(self.world.get_component(TurnOrder))
-        if existing:
+        resources = resources_of(self.world)
+        if TurnOrder in resources:
             return
         owners = [ent for ent, comp in self.world.get_component(AbilityListOwner)]
         if owners:
             human_entities = {ent for ent, _ in self.world.get_component(HumanAgent)}
             owners.sort(key=lambda entity: (entity not in human_entities, entity))
-        ent = self.world.create_entity(TurnOrder(owners=owners, index=0))
+        resources.insert(TurnOrder(owners=owners, index=0))
         # Initialize ActiveTurn if missing
-        if not list(self.world.get_component(ActiveTurn)) and owners:
-            self.world.create_entity(ActiveTurn(owner_entity=owners[0]))
+        if ActiveTurn not in resources and owners:
+            resources.insert(ActiveTurn(owner_entity=owners[0]))
 
     def _ensure_turn_state(self):
         get_or_create_turn_state(self.world)
@@ -57,7 +58,7 @@ class TurnSystem:
     def _turn_state(self) -> TurnState:
         return get_or_create_turn_state(self.world)
 
-    def on_match_cleared(self, sender, **payload):
+    def on_match_cleared(self, sender, event: MatchClearedEvent):
         # Set rotation pending (only first time in a cascade). Multiple match_cleared within cascade should not queue multiple advances.
         state = self._turn_state()
         if state.action_source == "ability" and not state.ability_ends_turn:
@@ -134,26 +135,25 @@ class TurnSystem:
         
     def _advance_turn(self):
         """Advance turn order and update ActiveTurn component."""
-        orders = list(self.world.get_component(TurnOrder))
-        if not orders:
+        resources = resources_of(self.world)
+        order = resources.get(TurnOrder)
+        if order is None:
             return
-        order_ent, order = orders[0]
         order.advance()
         new_owner = order.current()
         if new_owner is None:
             return
-        active_list = list(self.world.get_component(ActiveTurn))
+        active = resources.get(ActiveTurn)
         previous_owner = None
-        if not active_list:
-            self.world.create_entity(ActiveTurn(owner_entity=new_owner))
+        if active is None:
+            resources.insert(ActiveTurn(owner_entity=new_owner))
         else:
-            ent_active, comp_active = active_list[0]
-            previous_owner = comp_active.owner_entity
-            comp_active.owner_entity = new_owner
+            previous_owner = active.owner_entity
+            active.owner_entity = new_owner
         self.event_bus.emit(EVENT_TURN_ADVANCED, previous_owner=previous_owner, new_owner=new_owner)
 
     def _current_owner(self) -> int | None:
-        active_list = list(self.world.get_component(ActiveTurn))
-        if not active_list:
+        active = resources_of(self.world).get(ActiveTurn)
+        if active is None:
             return None
-        return active_list[0][1].owner_entity
+        return active.owner_entity
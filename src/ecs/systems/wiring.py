@@ -0,0 +1,192 @@
+"""System sets shared by the game window and its headless harnesses.
+
+``wire_game_systems`` builds everything the Arcade window runs, in the
+window's subscription order; without a window it leaves out the renderers and
+raw mouse input, which is what the replayer needs to re-drive a recorded
+session. ``wire_combat_systems`` is the smaller combat-only set used by
+self-play, the event benchmarks and harness replays.
+"""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from esper import World
+
+from ecs.components.turn_state import TurnState
+from ecs.constants import GRID_COLS, GRID_ROWS
+from ecs.events.bus import EventBus
+from ecs.menu.factory import spawn_main_menu
+from ecs.menu.input_system import MenuInputSystem
+from ecs.resources import resources_of
+from ecs.systems.ability_pool_system import AbilityPoolSystem
+from ecs.systems.ability_system import AbilitySystem
+from ecs.systems.ability_targeting_system import AbilityTargetingSystem
+from ecs.systems.animation import AnimationSystem
+from ecs.systems.board import BoardSystem
+from ecs.systems.choice_input_system import ChoiceInputSystem
+from ecs.systems.defeat_system import DefeatSystem
+from ecs.systems.dialogue_system import DialogueSystem
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+from ecs.systems.effects.bleeding_effect_system import BleedingEffectSystem
+from ecs.systems.effects.board_clear_effect_system import BoardClearEffectSystem
+from ecs.systems.effects.board_transform_effect_system import BoardTransformEffectSystem
+from ecs.systems.effects.damage_effect_system import DamageEffectSystem
+from ecs.systems.effects.deplete_effect_system import DepleteEffectSystem
+from ecs.systems.effects.heal_effect_system import HealEffectSystem
+from ecs.systems.effects.mana_drain_effect_system import ManaDrainEffectSystem
+from ecs.systems.effects.poison_effect_system import PoisonEffectSystem
+from ecs.systems.effects.tile_sacrifice_effect_system import TileSacrificeEffectSystem
+from ecs.systems.effects.vigour_effect_system import VigourEffectSystem
+from ecs.systems.forbidden_knowledge_system import ForbiddenKnowledgeSystem
+from ecs.systems.game_flow_system import GameFlowSystem
+from ecs.systems.health_system import HealthSystem
+from ecs.systems.location_choice_system import LocationChoiceSystem
+from ecs.systems.location_pool_system import LocationPoolSystem
+from ecs.systems.match import MatchSystem
+from ecs.systems.match_resolution import MatchResolutionSystem
+from ecs.systems.match_setup_system import MatchSetupSystem
+from ecs.systems.rule_based_ai_system import RuleBasedAISystem
+from ecs.systems.skills import ApplySkillEffectsSystem, SkillChoiceSystem, SkillPoolSystem
+from ecs.systems.story_progress_system import StoryProgressSystem
+from ecs.systems.tile_bank_system import TileBankSystem
+from ecs.systems.turn_system import TurnSystem
+
+
+def wire_combat_systems(world: World, bus: EventBus, rows: int, cols: int) -> Dict[str, object]:
+    """Board, effect, bank, health and turn systems for a headless combat."""
+
+    systems: Dict[str, object] = {
+        "board": BoardSystem(world, bus, rows=rows, cols=cols),
+        "match": MatchSystem(world, bus),
+        "animation": AnimationSystem(world, bus),
+        "match_resolution": MatchResolutionSystem(world, bus),
+        "ability_targeting": AbilityTargetingSystem(world, bus),
+        "ability": AbilitySystem(world, bus),
+        "effect_lifecycle": EffectLifecycleSystem(world, bus),
+        "board_clear": BoardClearEffectSystem(world, bus),
+        "board_transform": BoardTransformEffectSystem(world, bus),
+        "damage": DamageEffectSystem(world, bus),
+        "deplete": DepleteEffectSystem(world, bus),
+        "heal": HealEffectSystem(world, bus),
+        "mana_drain": ManaDrainEffectSystem(world, bus),
+        "tile_sacrifice": TileSacrificeEffectSystem(world, bus),
+        "poison": PoisonEffectSystem(world, bus),
+        "bleeding": BleedingEffectSystem(world, bus),
+        "vigour": VigourEffectSystem(world, bus),
+        "tile_bank": TileBankSystem(world, bus),
+        "health": HealthSystem(world, bus),
+        "turn": TurnSystem(world, bus),
+    }
+    resources_of(world).get_or_insert(TurnState)
+    return systems
+
+
+def wire_game_systems(
+    world: World,
+    bus: EventBus,
+    *,
+    window: Any = None,
+    menu_size: Tuple[int, int] = (800, 600),
+    story_save_path: Path | None = None,
+    load_story: bool = True,
+    background_writes: bool = False,
+    ai_rng: random.Random | None = None,
+) -> Dict[str, object]:
+    """Every system of the game window, keyed by its attribute name on the window.
+
+    Systems are created in the window's order, so handlers run in the same
+    order and entities get the same ids with or without a window. Passing the
+    window adds the renderers, tooltips and raw mouse input at their places;
+    none of them create entities. ``menu_size`` lays out the main menu when
+    there is no window to measure.
+    """
+
+    def size() -> Tuple[int, int]:
+        return (window.width, window.height) if window is not None else menu_size
+
+    systems: Dict[str, object] = {}
+    # Progression systems
+    story = StoryProgressSystem(
+        world,
+        bus,
+        save_path=story_save_path,
+        load_existing=load_story,
+        background_writes=background_writes,
+    )
+    systems["story_progress_system"] = story
+    systems["location_pool_system"] = LocationPoolSystem(world, bus)
+    systems["location_choice_system"] = LocationChoiceSystem(world, bus)
+
+    width, height = size()
+    spawn_main_menu(world, width, height, enable_continue=story.has_progress)
+    # Menu systems
+    systems["menu_input_system"] = MenuInputSystem(world, bus)
+    if window is not None:
+        from ecs.menu.render_system import MenuRenderSystem
+
+        systems["menu_render_system"] = MenuRenderSystem(world, window)
+
+    # Interface systems
+    systems["choice_input_system"] = ChoiceInputSystem(world, bus)
+    render_system = None
+    if window is not None:
+        from ecs.systems.render import RenderSystem
+        from ecs.systems.tooltip_system import TooltipSystem
+
+        render_system = RenderSystem(world, bus, window)
+        systems["render_system"] = render_system
+        systems["tooltip_system"] = TooltipSystem(world, bus, window, render_system)
+
+    # Narrative systems
+    systems["dialogue_system"] = DialogueSystem(world, bus)
+    if window is not None:
+        from ecs.rendering.dialogue_render_system import DialogueRenderSystem
+        from ecs.systems.input import InputSystem
+
+        systems["dialogue_render_system"] = DialogueRenderSystem(world, window, render_system)
+        # Input systems
+        systems["input_system"] = InputSystem(bus, window, world)
+
+    # Ability systems
+    systems["ability_pool_system"] = AbilityPoolSystem(world, bus)
+    systems["ability_system"] = AbilitySystem(world, bus)
+    systems["ability_targeting_system"] = AbilityTargetingSystem(world, bus)
+
+    # Skill systems
+    systems["skill_pool_system"] = SkillPoolSystem(world, bus)
+    systems["skill_choice_system"] = SkillChoiceSystem(world, bus)
+    systems["apply_skill_effects_system"] = ApplySkillEffectsSystem(world, bus)
+
+    # Flow systems
+    systems["match_setup_system"] = MatchSetupSystem(world, bus)
+    systems["game_flow_system"] = GameFlowSystem(world, bus)
+
+    # Board and animation systems
+    systems["animation_system"] = AnimationSystem(world, bus)
+    systems["board_system"] = BoardSystem(world, bus, rows=GRID_ROWS, cols=GRID_COLS)
+    systems["match_resolution_system"] = MatchResolutionSystem(world, bus)
+    systems["match_system"] = MatchSystem(world, bus)
+
+    # Resource and effect systems
+    systems["board_clear_effect_system"] = BoardClearEffectSystem(world, bus)
+    systems["board_transform_effect_system"] = BoardTransformEffectSystem(world, bus)
+    systems["damage_effect_system"] = DamageEffectSystem(world, bus)
+    systems["deplete_effect_system"] = DepleteEffectSystem(world, bus)
+    systems["effect_lifecycle_system"] = EffectLifecycleSystem(world, bus)
+    systems["heal_effect_system"] = HealEffectSystem(world, bus)
+    systems["mana_drain_effect_system"] = ManaDrainEffectSystem(world, bus)
+    systems["tile_sacrifice_effect_system"] = TileSacrificeEffectSystem(world, bus)
+    systems["poison_effect_system"] = PoisonEffectSystem(world, bus)
+    systems["bleeding_effect_system"] = BleedingEffectSystem(world, bus)
+    systems["vigour_effect_system"] = VigourEffectSystem(world, bus)
+    systems["tile_bank_system"] = TileBankSystem(world, bus)
+    systems["forbidden_knowledge_system"] = ForbiddenKnowledgeSystem(world, bus)
+
+    # Turn and AI systems
+    systems["defeat_system"] = DefeatSystem(world, bus, menu_size_provider=size)
+    systems["health_system"] = HealthSystem(world, bus)
+    systems["rule_based_ai_system"] = RuleBasedAISystem(world, bus, rng=ai_rng)
+    systems["turn_system"] = TurnSystem(world, bus)
+    return systems
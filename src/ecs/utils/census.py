@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+from esper import World
+
+
+@dataclass(slots=True)
+class WorldCensus:
+    """Entity counts for one world at one moment."""
+
+    live: int
+    dead_pending: int
+    by_component: Dict[str, int] = field(default_factory=dict)
+
+    def format(self, top: int = 8) -> str:
+        busiest = sorted(self.by_component.items(), key=lambda item: (-item[1], item[0]))[:top]
+        parts = ", ".join(f"{name}={count}" for name, count in busiest)
+        return f"{self.live} live, {self.dead_pending} pending deletion; {parts}"
+
+
+def take_census(world: World) -> WorldCensus:
+    """Count live and deletion-pending entities, and entities per component type."""
+
+    dead = world._dead_entities
+    entities = world._entities
+    pending = sum(1 for entity in dead if entity in entities)
+    return WorldCensus(
+        live=len(entities) - pending,
+        dead_pending=pending,
+        by_component={
+            component_type.__name__: len(owners) for component_type, owners in world._components.items()
+        },
+    )
+
+
+def reclaim_dead_entities(world: World) -> int:
+    """Finish every deferred ``delete_entity`` and return how many entities were dropped.
+
+    The game never calls ``World.process()``, so esper's own end-of-frame
+    cleanup never runs; the main loop and the headless self-play loop call
+    this once per frame instead. Entities that already disappeared (an
+    immediate delete, or ``remove_component`` taking the last component) are
+    skipped rather than tripping esper's flush.
+    """
+
+    dead = world._dead_entities
+    if not dead:
+        return 0
+    dead.intersection_update(world._entities)
+    reclaimed = len(dead)
+    world._clear_dead_entities()
+    return reclaimed
@@ -4,6 +4,7 @@ from esper import World
 
 from ecs.components.combatants import Combatants
 from ecs.components.game_state import GameState
+from ecs.resources import resources_of
 
 
 def find_primary_opponent(world: World, owner_entity: int | None) -> int | None:
@@ -48,9 +49,7 @@ def ensure_combatants(world: World, player_entity: int, opponent_entity: int) ->
 
 
 def _combatants(world: World) -> Combatants | None:
-    for _, comp in world.get_component(Combatants):
-        return comp
-    return None
+    return resources_of(world).get(Combatants)
 
 
 def _attach_combatants(world: World, player_entity: int, opponent_entity: int) -> None:
@@ -72,9 +71,7 @@ def _attach_combatants(world: World, player_entity: int, opponent_entity: int) -
 
 
 def _state_entity(world: World) -> int | None:
-    for entity, _ in world.get_component(GameState):
-        return entity
-    return None
+    return resources_of(world).entity(GameState)
 
 
 def _first_player(world: World) -> int | None:
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from esper import World
+
+from ecs.components.effect import Effect
+
+EffectKey = Tuple[int, str]
+
+
+class EffectIndex:
+    """Live effects by ``(owner, slug)`` and by slug, plus cached sums over them.
+
+    ``EffectLifecycleSystem`` records every effect it applies, refreshes,
+    accumulates or expires, and ``board_ops`` reports tile effects that move
+    to another tile. Modifier lookups in the damage path ask for a cached
+    total instead of walking the owner's ``EffectList``. A cached value is
+    dropped only when an effect under the same ``(owner, slug)`` (or, for
+    slug-wide counts, the same slug) changes.
+    """
+
+    __slots__ = ("world", "hits", "recomputes", "_by_key", "_by_slug", "_totals", "_slug_counts")
+
+    def __init__(self, world: World) -> None:
+        self.world = world
+        self.hits = 0
+        self.recomputes = 0
+        self._by_key: Dict[EffectKey, List[int]] = {}
+        self._by_slug: Dict[str, Dict[int, Effect]] = {}
+        self._totals: Dict[EffectKey, Dict[Tuple[str, Any, bool], int]] = {}
+        self._slug_counts: Dict[str, Dict[Tuple[str, Any], int]] = {}
+
+    # -- maintenance ------------------------------------------------------
+
+    def add(self, effect_entity: int, effect: Effect) -> None:
+        self._by_key.setdefault((effect.owner_entity, effect.slug), []).append(effect_entity)
+        self._by_slug.setdefault(effect.slug, {})[effect_entity] = effect
+        self._invalidate(effect.owner_entity, effect.slug)
+
+    def discard(self, effect_entity: int, effect: Effect) -> None:
+        self._unlink(effect_entity, effect.owner_entity, effect.slug)
+        bucket = self._by_slug.get(effect.slug)
+        if bucket is not None:
+            bucket.pop(effect_entity, None)
+            if not bucket:
+                del self._by_slug[effect.slug]
+        self._invalidate(effect.owner_entity, effect.slug)
+
+    def changed(self, effect: Effect) -> None:
+        """Metadata or count of an indexed effect was updated in place."""
+
+        self._invalidate(effect.owner_entity, effect.slug)
+
+    def move(self, effect_entity: int, effect: Effect, owner_entity: int) -> None:
+        """Re-home ``effect`` under ``owner_entity`` and update its component."""
+
+        previous = effect.owner_entity
+        effect.owner_entity = owner_entity
+        if previous == owner_entity or effect_entity not in self._by_slug.get(effect.slug, ()):
+            return
+        self._unlink(effect_entity, previous, effect.slug)
+        self._by_key.setdefault((owner_entity, effect.slug), []).append(effect_entity)
+        self._invalidate(previous, effect.slug)
+        self._invalidate(owner_entity, effect.slug)
+
+    # -- queries ----------------------------------------------------------
+
+    def effects(self, owner_entity: int, slug: str) -> Tuple[int, ...]:
+        """Effect entities of ``slug`` on ``owner_entity``, oldest first."""
+
+        return tuple(self._by_key.get((owner_entity, slug), ()))
+
+    def has(self, owner_entity: int, slug: str) -> bool:
+        return (owner_entity, slug) in self._by_key
+
+    def total(
+        self,
+        owner_entity: int | None,
+        slug: str,
+        key: str,
+        default: Any = 0,
+        *,
+        positive: bool = False,
+    ) -> int:
+        """Sum ``metadata[key]`` over the owner's ``slug`` effects.
+
+        Values that are missing use ``default``. Values that are not ints
+        count as 0, or as ``default`` when ``positive`` is set; with
+        ``positive`` set, values of 0 or below also count as ``default``.
+        """
+
+        if owner_entity is None:
+            return 0
+        bucket_key = (owner_entity, slug)
+        entities = self._by_key.get(bucket_key)
+        if not entities:
+            return 0
+        cached = self._totals.setdefault(bucket_key, {})
+        cache_key = (key, default, positive)
+        value = cached.get(cache_key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.recomputes += 1
+        effects = self._by_slug[slug]
+        value = 0
+        for effect_entity in entities:
+            raw = effects[effect_entity].metadata.get(key, None if positive else default)
+            value += _coerce_positive(raw, default) if positive else _coerce_int(raw)
+        cached[cache_key] = value
+        return value
+
+    def count_where(self, slug: str, key: str, value: Any) -> int:
+        """Number of live ``slug`` effects, on any owner, whose ``metadata[key] == value``."""
+
+        effects = self._by_slug.get(slug)
+        if not effects:
+            return 0
+        cached = self._slug_counts.setdefault(slug, {})
+        count = cached.get((key, value))
+        if count is not None:
+            self.hits += 1
+            return count
+        self.recomputes += 1
+        count = sum(1 for effect in effects.values() if effect.metadata.get(key) == value)
+        cached[(key, value)] = count
+        return count
+
+    # -- internals --------------------------------------------------------
+
+    def _unlink(self, effect_entity: int, owner_entity: int, slug: str) -> None:
+        bucket_key = (owner_entity, slug)
+        entities = self._by_key.get(bucket_key)
+        if entities is None or effect_entity not in entities:
+            return
+        entities.remove(effect_entity)
+        if not entities:
+            del self._by_key[bucket_key]
+
+    def _invalidate(self, owner_entity: int, slug: str) -> None:
+        self._totals.pop((owner_entity, slug), None)
+        self._slug_counts.pop(slug, None)
+
+
+def effect_index(world: World) -> EffectIndex:
+    """The world's effect index, attaching one on first use."""
+
+    index = world.__dict__.get("effect_index")
+    if index is None:
+        index = EffectIndex(world)
+        world.effect_index = index  # type: ignore[attr-defined]
+    return index
+
+
+def _coerce_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _coerce_positive(value: Any, default: int) -> int:
+    try:
+        amount = int(value)
+    except (TypeError, ValueError):
+        return default
+    return amount if amount > 0 else default
@@ -4,6 +4,7 @@ from esper import World
 
 from ecs.components.game_state import GameMode, GameState
 from ecs.events.bus import EVENT_GAME_MODE_CHANGED, EventBus
+from ecs.resources import resources_of
 
 
 def _sanitize_press_id(value: int | None) -> int | None:
@@ -26,7 +27,9 @@ def set_game_mode(
 
     guard_id = _sanitize_press_id(input_guard_press_id)
     previous_mode: GameMode | None = None
-    for _, state in world.get_component(GameState):
+    resources = resources_of(world)
+    state = resources.get(GameState)
+    if state is not None:
         previous_mode = state.mode
         changed = state.mode != mode
         if changed:
@@ -41,9 +44,7 @@ def set_game_mode(
             )
         return
     # No existing GameState component; create a new one.
-    state_entity = world.create_entity()
-    state = GameState(mode=mode, input_guard_press_id=guard_id)
-    world.add_component(state_entity, state)
+    resources.insert(GameState(mode=mode, input_guard_press_id=guard_id))
     event_bus.emit(
         EVENT_GAME_MODE_CHANGED,
         previous_mode=previous_mode,
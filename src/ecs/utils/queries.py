@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from esper import World
+
+QueryKey = Tuple[type, ...]
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Usage of one cached query."""
+
+    component_types: Tuple[str, ...]
+    kind: str
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def calls(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.calls if self.calls else 0.0
+
+
+class QueryCache:
+    """Memoised component joins for one world, invalidated per component type.
+
+    esper keeps its own ``get_component(s)`` cache but drops all of it on any
+    ``add_component``/``remove_component``, so a tile swap (which moves effect
+    components around) also discards every unrelated join. Here each component
+    type carries a version number that ``QueryWorld``'s mutators bump for the
+    types they touch, including deferred deletes once they are flushed. A
+    cached result is reused while every type in its key still has the version
+    it was built at.
+
+    A cache on a plain esper ``World`` is untracked: nothing reports its
+    mutations, so every query is recomputed.
+
+    Results are shared: callers must not mutate the returned lists or dicts.
+    Component instances are live, so field changes (a tile changing type in
+    place) are visible without any invalidation.
+    """
+
+    __slots__ = ("world", "tracked", "_versions", "_joins", "_maps", "_stats")
+
+    def __init__(self, world: World, *, tracked: bool = False) -> None:
+        self.world = world
+        self.tracked = tracked
+        self._versions: Dict[type, int] = {}
+        self._joins: Dict[QueryKey, Tuple[Tuple[int, ...], List[Tuple[int, List[Any]]]]] = {}
+        self._maps: Dict[type, Tuple[int, Dict[int, Any]]] = {}
+        self._stats: Dict[Tuple[str, QueryKey], QueryStats] = {}
+
+    def join(self, *component_types: type) -> List[Tuple[int, List[Any]]]:
+        """``(entity, [components])`` for entities holding every type, like ``get_components``.
+
+        Entities come in the order ``get_component`` yields holders of the first type.
+        """
+
+        versions = tuple(self._versions.get(component_type, 0) for component_type in component_types)
+        stats = self._stat("join", component_types)
+        cached = self._joins.get(component_types)
+        if cached is not None and cached[0] == versions:
+            stats.hits += 1
+            return cached[1]
+        stats.misses += 1
+        result = self._compute_join(component_types)
+        if self.tracked:
+            self._joins[component_types] = (versions, result)
+        return result
+
+    def mapping(self, component_type: type) -> Dict[int, Any]:
+        """Entity -> component for every holder of ``component_type``."""
+
+        version = self._versions.get(component_type, 0)
+        stats = self._stat("map", (component_type,))
+        cached = self._maps.get(component_type)
+        if cached is not None and cached[0] == version:
+            stats.hits += 1
+            return cached[1]
+        stats.misses += 1
+        entities = self.world._entities
+        holders = self.world._components.get(component_type, ())
+        result = {entity: entities[entity][component_type] for entity in holders}
+        if self.tracked:
+            self._maps[component_type] = (version, result)
+        return result
+
+    def version(self, component_type: type) -> int:
+        """Counter that changes whenever a ``component_type`` is added or removed."""
+
+        return self._versions.get(component_type, 0)
+
+    def report(self) -> List[QueryStats]:
+        """Per-query hit rates, busiest first."""
+
+        return sorted(self._stats.values(), key=lambda stats: (-stats.calls, stats.component_types))
+
+    def format_report(self) -> str:
+        return "\n".join(
+            f"{stats.kind} {'+'.join(stats.component_types)}: {stats.calls} calls, {stats.hit_rate:.0%} hits"
+            for stats in self.report()
+        )
+
+    # -- internals --------------------------------------------------------
+
+    def _compute_join(self, component_types: QueryKey) -> List[Tuple[int, List[Any]]]:
+        # Walk the first type's holders in store order, so a migrated "for each
+        # BoardPosition, look up the rest" loop keeps its iteration order.
+        components = self.world._components
+        entities = self.world._entities
+        first = components.get(component_types[0])
+        if not first:
+            return []
+        others = []
+        for component_type in component_types[1:]:
+            holders = components.get(component_type)
+            if not holders:
+                return []
+            others.append(holders)
+        return [
+            (entity, [entities[entity][component_type] for component_type in component_types])
+            for entity in first
+            if all(entity in holders for holders in others)
+        ]
+
+    def _stat(self, kind: str, key: QueryKey) -> QueryStats:
+        stats = self._stats.get((kind, key))
+        if stats is None:
+            stats = QueryStats(tuple(component_type.__name__ for component_type in key), kind)
+            self._stats[(kind, key)] = stats
+        return stats
+
+    def bump(self, component_type: type) -> None:
+        """Invalidate every cached query that involves ``component_type``."""
+
+        self._versions[component_type] = self._versions.get(component_type, 0) + 1
+
+    def bump_entity(self, entity: int) -> None:
+        for component_type in self.world._entities.get(entity, ()):
+            self.bump(component_type)
+
+
+class QueryWorld(World):
+    """esper ``World`` whose mutators keep its ``QueryCache`` current.
+
+    ``create_world`` and ``clone_world_state`` build these, so the cache is
+    attached before the first entity exists and sees every add and remove.
+    """
+
+    def __init__(self, timed: bool = False) -> None:
+        super().__init__(timed)
+        self.queries = QueryCache(self, tracked=True)
+
+    def create_entity(self, *components: Any) -> int:
+        entity = super().create_entity(*components)
+        for component in components:
+            self.queries.bump(type(component))
+        return entity
+
+    def add_component(self, entity: int, component_instance: Any, type_alias: type | None = None) -> None:
+        super().add_component(entity, component_instance, type_alias)
+        self.queries.bump(type_alias or type(component_instance))
+
+    def remove_component(self, entity: int, component_type: type) -> int:
+        result = super().remove_component(entity, component_type)
+        self.queries.bump(component_type)
+        return result
+
+    def delete_entity(self, entity: int, immediate: bool = False) -> None:
+        if immediate:
+            self.queries.bump_entity(entity)
+        super().delete_entity(entity, immediate)
+
+    def _clear_dead_entities(self) -> None:
+        for entity in self._dead_entities:
+            self.queries.bump_entity(entity)
+        super()._clear_dead_entities()
+
+    def clear_database(self) -> None:
+        for component_type in self._components:
+            self.queries.bump(component_type)
+        super().clear_database()
+
+
+def query_cache(world: World) -> QueryCache:
+    """The world's query cache; plain ``World``s get an untracked one on first use."""
+
+    cache = world.__dict__.get("queries")
+    if cache is None:
+        cache = QueryCache(world)
+        world.queries = cache  # type: ignore[attr-defined]
+    return cache
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from esper import World
+
+from ecs.components.tile_bank import TileBank
+from ecs.utils.queries import query_cache
+from ecs.utils.tile_codes import tile_counts
+
+BankEntry = Tuple[int, TileBank]
+
+
+class TileBankIndex:
+    """Owner entity -> ``(bank_entity, TileBank)`` lookup for one world.
+
+    ``TileBankSystem`` and ``DefeatSystem`` keep the index current when they
+    create, reassign or delete banks. Enemy factories and tests still create
+    banks with plain ``create_entity``, so every entry is checked on use: the
+    bank entity must still carry that exact component for the same owner.
+    A stale entry triggers one rebuild from the component store. So does a
+    missing one, once: the miss is remembered until a ``TileBank`` is added or
+    removed anywhere in the world (tracked by the query cache's type version)
+    or the index itself creates, reassigns or forgets that owner's bank. On a
+    plain ``World`` the query cache is untracked and misses always rebuild.
+    """
+
+    __slots__ = ("world", "hits", "rebuilds", "_by_owner", "_misses", "_queries")
+
+    def __init__(self, world: World) -> None:
+        self.world = world
+        self.hits = 0
+        self.rebuilds = 0
+        self._by_owner: Dict[int, BankEntry] = {}
+        # owner -> TileBank version at which it was last found to have no bank.
+        self._misses: Dict[int, int] = {}
+        self._queries = query_cache(world)
+
+    def find(self, owner_entity: int) -> BankEntry | None:
+        entry = self._by_owner.get(owner_entity)
+        if entry is not None:
+            if self._valid(owner_entity, entry):
+                self.hits += 1
+                return entry
+        else:
+            missed_at = self._misses.get(owner_entity)
+            if missed_at is not None and missed_at == self._queries.version(TileBank):
+                self.hits += 1
+                return None
+        self.rebuild()
+        entry = self._by_owner.get(owner_entity)
+        if entry is None and self._queries.tracked:
+            self._misses[owner_entity] = self._queries.version(TileBank)
+        return entry
+
+    def bank(self, owner_entity: int) -> TileBank | None:
+        entry = self.find(owner_entity)
+        return entry[1] if entry is not None else None
+
+    def create(self, owner_entity: int) -> BankEntry:
+        """Spawn a bank entity for ``owner_entity`` and index it."""
+
+        bank = TileBank(owner_entity=owner_entity, counts=tile_counts(self.world))
+        bank_entity = self.world.create_entity(bank)
+        self._by_owner[owner_entity] = (bank_entity, bank)
+        self._misses.pop(owner_entity, None)
+        return bank_entity, bank
+
+    def reassign(self, bank_entity: int, owner_entity: int) -> TileBank:
+        """Point the bank on ``bank_entity`` at a new owner."""
+
+        bank = self.world.component_for_entity(bank_entity, TileBank)
+        previous = self._by_owner.get(bank.owner_entity)
+        if previous is not None and previous[0] == bank_entity:
+            del self._by_owner[bank.owner_entity]
+        bank.owner_entity = owner_entity
+        self._by_owner[owner_entity] = (bank_entity, bank)
+        self._misses.pop(owner_entity, None)
+        return bank
+
+    def forget(self, owner_entity: int) -> None:
+        """Drop the entry for an owner whose bank is being deleted."""
+
+        self._by_owner.pop(owner_entity, None)
+        self._misses.pop(owner_entity, None)
+
+    def rebuild(self) -> None:
+        self.rebuilds += 1
+        by_owner: Dict[int, BankEntry] = {}
+        for bank_entity, bank in self.world.get_component(TileBank):
+            # First bank wins, matching the linear scans this replaces.
+            by_owner.setdefault(bank.owner_entity, (bank_entity, bank))
+        self._by_owner = by_owner
+        self._misses.clear()
+
+    def check(self) -> List[str]:
+        """Describe every way the index disagrees with the component store."""
+
+        problems: List[str] = []
+        owners_seen: Dict[int, int] = {}
+        for bank_entity, bank in self.world.get_component(TileBank):
+            owner = bank.owner_entity
+            if owner in owners_seen:
+                problems.append(
+                    f"owner {owner} has banks on entities {owners_seen[owner]} and {bank_entity}"
+                )
+                continue
+            owners_seen[owner] = bank_entity
+        for owner, entry in self._by_owner.items():
+            if not self._valid(owner, entry):
+                problems.append(f"owner {owner} indexed to stale bank entity {entry[0]}")
+            elif owners_seen.get(owner) != entry[0]:
+                problems.append(
+                    f"owner {owner} indexed to entity {entry[0]} but first bank is {owners_seen.get(owner)}"
+                )
+        return problems
+
+    def _valid(self, owner_entity: int, entry: BankEntry) -> bool:
+        components = self.world._entities.get(entry[0])
+        return (
+            components is not None
+            and components.get(TileBank) is entry[1]
+            and entry[1].owner_entity == owner_entity
+        )
+
+
+def bank_index(world: World) -> TileBankIndex:
+    """The world's owner -> bank index, attaching one on first use."""
+
+    index = world.__dict__.get("tile_banks")
+    if index is None:
+        index = TileBankIndex(world)
+        world.tile_banks = index  # type: ignore[attr-defined]
+    return index
+
+
+def find_bank(world: World, owner_entity: int) -> BankEntry | None:
+    return bank_index(world).find(owner_entity)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Mapping
+
+from esper import World
+
+from ecs.components.tile_counts import TileCodes, TileCounts
+from ecs.components.tile_types import TileTypes
+from ecs.resources import resources_of
+
+
+def tile_codes(world: World) -> TileCodes:
+    """The world's tile code table.
+
+    ``TileTypes`` owns it once the registry exists. Banks and abilities
+    created before that (``create_world`` spawns the combatants first) get the
+    table parked on the world, which the registry adopts when it is built with
+    ``codes=tile_codes(world)``.
+    """
+
+    registry = resources_of(world).get(TileTypes)
+    if registry is not None:
+        return registry.codes
+    codes = world.__dict__.get("tile_codes")
+    if codes is None:
+        codes = TileCodes()
+        world.tile_codes = codes  # type: ignore[attr-defined]
+    return codes
+
+
+def tile_counts(world: World, counts: Mapping[str, int] | None = None) -> TileCounts:
+    """Counts (a bank or an ability cost) on the world's code table."""
+
+    return TileCounts(counts, codes=tile_codes(world))
@@ -12,11 +12,14 @@ from ecs.components.character import Character
 from ecs.components.game_state import GameState, GameMode
 from ecs.components.forbidden_knowledge import ForbiddenKnowledge
 from ecs.components.health import Health
+from ecs.resources import Resources
+from ecs.utils.queries import QueryWorld
 from ecs.effects.factory import ensure_default_effects_registered
 from ecs.systems.effects.guarded_tile_effect_system import GuardedTileEffectSystem
 from ecs.systems.effects.tile_status_system import TileStatusSystem
 from ecs.factories.abilities import create_default_player_abilities
 from ecs.factories.enemies import create_enemy_undead_gardener
+from ecs.utils.tile_codes import tile_codes, tile_counts
 
 
 def create_world(
@@ -27,14 +30,16 @@ def create_world(
     randomize_enemy: bool = False,
     rng: random.Random | None = None,
 ) -> World:
-    world = World()
+    # Query-tracking world: the per-type query cache sees every mutation from here on.
+    world = QueryWorld()
     setattr(world, "random", rng or random.Random())
+    resources = Resources(world)
+    setattr(world, "resources", resources)
 
     # Register or update the global game state resource.
-    state_entity = world.create_entity()
-    world.add_component(state_entity, GameState(mode=initial_mode))
+    state_entity = resources.insert(GameState(mode=initial_mode))
     forbidden_knowledge = ForbiddenKnowledge()
-    world.add_component(state_entity, forbidden_knowledge)
+    resources.insert(forbidden_knowledge, state_entity)
     
     # Register core effect definitions if not already present.
     ensure_default_effects_registered()
@@ -46,7 +51,7 @@ def create_world(
     player1_ent = world.create_entity(
         HumanAgent(),
         AbilityListOwner(ability_entities=abilities_p1),
-        TileBank(owner_entity=0),
+        TileBank(owner_entity=0, counts=tile_counts(world)),
         Health(current=100, max_hp=100),
         Character(
             slug="fiora",
@@ -96,6 +101,8 @@ def create_world(
             spawnable=[
                 'nature', 'blood', 'shapeshift', 'spirit', 'hex', 'secrets', 'witchfire'
             ],
+            # Adopt the table the combatants' banks and abilities were built on.
+            codes=tile_codes(world),
         ),
     )
     tile_types = world.component_for_entity(registry_entity, TileTypes)
@@ -2,136 +2,52 @@
 
 Sets up ECS world, event bus, systems, and Arcade window.
 """
-from arcade import Window, run, set_background_color, color
+import random
+
+from arcade import Window, run, set_background_color, color, key
 from world import create_world
-from ecs.constants import GRID_ROWS, GRID_COLS
-from ecs.events.bus import EVENT_TICK, EventBus, EVENT_MOUSE_PRESS, EVENT_MOUSE_MOVE
+from ecs.events.bus import BACKEND_DIRECT, EventBus, EVENT_MOUSE_PRESS, EVENT_MOUSE_MOVE
+from ecs.events.flight_recorder import install_crash_dump
+from ecs.events.payloads import TickEvent
+from ecs.events.replay import EventRecorder, recording_from_env
 from ecs.components.game_state import GameState, GameMode
-from ecs.menu.factory import spawn_main_menu
-from ecs.menu.render_system import MenuRenderSystem
-from ecs.menu.input_system import MenuInputSystem
-from ecs.systems.choice_input_system import ChoiceInputSystem
-from ecs.systems.render import RenderSystem
-from ecs.systems.animation import AnimationSystem
-from ecs.systems.board import BoardSystem
-from ecs.systems.input import InputSystem
-from ecs.systems.match import MatchSystem
-from ecs.systems.match_resolution import MatchResolutionSystem
-from ecs.systems.tile_bank_system import TileBankSystem
-from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
-from ecs.systems.ability_system import AbilitySystem
-from ecs.systems.ability_targeting_system import AbilityTargetingSystem
-from ecs.systems.game_flow_system import GameFlowSystem
-from ecs.systems.turn_system import TurnSystem
-from ecs.systems.health_system import HealthSystem
-from ecs.systems.effects.damage_effect_system import DamageEffectSystem
-from ecs.systems.effects.deplete_effect_system import DepleteEffectSystem
-from ecs.systems.effects.heal_effect_system import HealEffectSystem
-from ecs.systems.effects.board_clear_effect_system import BoardClearEffectSystem
-from ecs.systems.effects.board_transform_effect_system import BoardTransformEffectSystem
-from ecs.systems.effects.mana_drain_effect_system import ManaDrainEffectSystem
-from ecs.systems.effects.poison_effect_system import PoisonEffectSystem
-from ecs.systems.effects.bleeding_effect_system import BleedingEffectSystem
-from ecs.systems.effects.tile_sacrifice_effect_system import TileSacrificeEffectSystem
-from ecs.systems.effects.vigour_effect_system import VigourEffectSystem
-from ecs.systems.tooltip_system import TooltipSystem
-from ecs.systems.rule_based_ai_system import RuleBasedAISystem
-from ecs.systems.defeat_system import DefeatSystem
-from ecs.systems.ability_pool_system import AbilityPoolSystem
-from ecs.systems.match_setup_system import MatchSetupSystem
-from ecs.systems.location_choice_system import LocationChoiceSystem
-from ecs.systems.location_pool_system import LocationPoolSystem
-from ecs.systems.dialogue_system import DialogueSystem
-from ecs.systems.story_progress_system import StoryProgressSystem
-from ecs.rendering.dialogue_render_system import DialogueRenderSystem
-from ecs.systems.forbidden_knowledge_system import ForbiddenKnowledgeSystem
-from ecs.systems.skills import SkillPoolSystem, SkillChoiceSystem, ApplySkillEffectsSystem
+from ecs.systems.wiring import wire_game_systems
+from ecs.resources import resources_of
+from ecs.utils.census import reclaim_dead_entities
 
 class BattlelinesWindow(Window):
     def __init__(self):
         super().__init__(800, 600, "Witchfire")
         self.set_update_rate(1/60)
-        self.event_bus = EventBus()
+        # Opt-in session recording: BATTLELINES_RECORD=<log> (see ecs.events.replay).
+        recording = recording_from_env(self.width, self.height)
+        header = recording[1] if recording is not None else None
+        # Blinker's delivery order follows handler addresses; a replayable session needs subscription order.
+        self.event_bus = EventBus(backend=BACKEND_DIRECT) if recording is not None else EventBus()
+        install_crash_dump(self.event_bus.flight_recorder)
         self.world = create_world(
             self.event_bus,
             initial_mode=GameMode.MENU,
             grant_default_player_abilities=False,
             randomize_enemy=True,
+            rng=random.Random(header.seed) if header is not None else None,
         )
-        # Progression systems
-        self.story_progress_system = StoryProgressSystem(self.world, self.event_bus)
-        self.location_pool_system = LocationPoolSystem(self.world, self.event_bus)
-        self.location_choice_system = LocationChoiceSystem(self.world, self.event_bus)
-
-        spawn_main_menu(
-            self.world,
-            self.width,
-            self.height,
-            enable_continue=self.story_progress_system.has_progress,
-        )
-        # Menu systems
-        self.menu_input_system = MenuInputSystem(self.world, self.event_bus)
-        self.menu_render_system = MenuRenderSystem(self.world, self)
-
-        # Interface systems
-        self.choice_input_system = ChoiceInputSystem(self.world, self.event_bus)
-        self.render_system = RenderSystem(self.world, self.event_bus, self)
-        self.tooltip_system = TooltipSystem(self.world, self.event_bus, self, self.render_system)
-
-        # Narrative systems
-        self.dialogue_system = DialogueSystem(self.world, self.event_bus)
-        self.dialogue_render_system = DialogueRenderSystem(self.world, self, self.render_system)
-
-        # Input systems
-        self.input_system = InputSystem(self.event_bus, self, self.world)
-
-        # Ability systems
-        self.ability_pool_system = AbilityPoolSystem(self.world, self.event_bus)
-        self.ability_system = AbilitySystem(self.world, self.event_bus)
-        self.ability_targeting_system = AbilityTargetingSystem(self.world, self.event_bus)
-
-        # Skill systems
-        self.skill_pool_system = SkillPoolSystem(self.world, self.event_bus)
-        self.skill_choice_system = SkillChoiceSystem(self.world, self.event_bus)
-        self.apply_skill_effects_system = ApplySkillEffectsSystem(self.world, self.event_bus)
-
-        # Flow systems
-        self.match_setup_system = MatchSetupSystem(self.world, self.event_bus)
-        self.game_flow_system = GameFlowSystem(self.world, self.event_bus)
-
-        # Board and animation systems
-        self.animation_system = AnimationSystem(self.world, self.event_bus)
-        self.board_system = BoardSystem(self.world, self.event_bus, rows=GRID_ROWS, cols=GRID_COLS)
-        self.match_resolution_system = MatchResolutionSystem(self.world, self.event_bus)
-        self.match_system = MatchSystem(self.world, self.event_bus)
-
-        # Resource and effect systems
-        self.board_clear_effect_system = BoardClearEffectSystem(self.world, self.event_bus)
-        self.board_transform_effect_system = BoardTransformEffectSystem(self.world, self.event_bus)
-        self.damage_effect_system = DamageEffectSystem(self.world, self.event_bus)
-        self.deplete_effect_system = DepleteEffectSystem(self.world, self.event_bus)
-        self.effect_lifecycle_system = EffectLifecycleSystem(self.world, self.event_bus)
-        self.heal_effect_system = HealEffectSystem(self.world, self.event_bus)
-        self.mana_drain_effect_system = ManaDrainEffectSystem(self.world, self.event_bus)
-        self.tile_sacrifice_effect_system = TileSacrificeEffectSystem(self.world, self.event_bus)
-        self.poison_effect_system = PoisonEffectSystem(self.world, self.event_bus)
-        self.bleeding_effect_system = BleedingEffectSystem(self.world, self.event_bus)
-        self.vigour_effect_system = VigourEffectSystem(self.world, self.event_bus)
-        self.tile_bank_system = TileBankSystem(self.world, self.event_bus)
-        self.forbidden_knowledge_system = ForbiddenKnowledgeSystem(self.world, self.event_bus)
-
-        # Turn and AI systems
-        self.defeat_system = DefeatSystem(
+        # A recorded session starts without saved progress and keeps its saves next to the log.
+        systems = wire_game_systems(
             self.world,
             self.event_bus,
-            menu_size_provider=lambda: (self.width, self.height),
+            window=self,
+            story_save_path=recording[0].with_suffix(".story.json") if recording is not None else None,
+            load_story=recording is None,
+            background_writes=True,
+            ai_rng=random.Random(header.ai_seed) if header is not None else None,
         )
-        self.health_system = HealthSystem(self.world, self.event_bus)
-        self.rule_based_ai_system = RuleBasedAISystem(self.world, self.event_bus)
-        self.turn_system = TurnSystem(self.world, self.event_bus)
-        
-        
-        
+        for name, system in systems.items():
+            setattr(self, name, system)
+        self.event_recorder = None
+        if recording is not None:
+            self.event_recorder = EventRecorder(recording[0], header).attach(self.event_bus)
+
         set_background_color(color.BLACK)
         # Toggle fullscreen and allow dynamic scaling; width/height update after fullscreen set.
         try:
@@ -140,6 +56,13 @@ class BattlelinesWindow(Window):
             # Headless test environments may fail; ignore.
             pass
 
+    def on_close(self):
+        # Let queued background saves reach the disk before the window goes away.
+        self.event_bus.close_async()
+        if self.event_recorder is not None:
+            self.event_recorder.close()
+        super().on_close()
+
     def on_resize(self, width: int, height: int):
         # Propagate resize to render system for recalculating layout
         if hasattr(self.render_system, 'notify_resize'):
@@ -159,9 +82,16 @@ class BattlelinesWindow(Window):
         self.render_system.process()
 
     def on_update(self, delta_time: float):
+        # Coalesced events (mouse motion etc.) are delivered once per frame, before the tick.
+        self.event_bus.flush_deferred()
         state = self._get_game_state()
-        if state and state.mode == GameMode.COMBAT:
-            self.event_bus.emit(EVENT_TICK, dt=delta_time)
+        ticked = bool(state and state.mode == GameMode.COMBAT)
+        if ticked:
+            self.event_bus.publish(TickEvent(delta_time))
+        # End of frame: drop entities deleted during it (animations, expired effects, cleared tiles).
+        reclaimed = reclaim_dead_entities(self.world)
+        if self.event_recorder is not None:
+            self.event_recorder.end_frame(ticked, reclaimed)
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
         self.event_bus.emit(EVENT_MOUSE_PRESS, x=x, y=y, button=button)
@@ -172,6 +102,10 @@ class BattlelinesWindow(Window):
             self.event_bus.emit(EVENT_MOUSE_MOVE, x=x, y=y, dx=dx, dy=dy)
 
     def on_key_press(self, symbol: int, modifiers: int):
+        if symbol == key.F9:
+            # On-demand dump of the recent event history for bug reports.
+            self.event_bus.flight_recorder.dump()
+            return
         state = self._get_game_state()
         if not state:
             return
@@ -181,9 +115,7 @@ class BattlelinesWindow(Window):
             self.dialogue_system.handle_key_press(symbol, modifiers)
 
     def _get_game_state(self) -> GameState | None:
-        for _, state in self.world.get_component(GameState):
-            return state
-        return None
+        return resources_of(self.world).get(GameState)
 
 def main():
     window = BattlelinesWindow()
@@ -180,15 +180,19 @@ def test_rule_based_ai_detects_mana_gain_from_match():
 
     clone_state.engine.swap_and_resolve(*swap, acting_owner=clone_owner)
 
+    codes = snapshot.bank_counts.codes
     clone_counts = ai_system._clone_bank_counts(clone_state.world, clone_owner)
-    baseline_counts = snapshot.bank_counts
     clone_bank = clone_state.world.component_for_entity(clone_owner, TileBank)
-    assert clone_bank.counts.get("nature", 0) > baseline_counts.get("nature", 0)
+    assert clone_bank.counts.get("nature", 0) > snapshot.bank_counts.get("nature", 0)
+    # The clone stays on the live world's code table.
+    assert clone_bank.counts.codes is codes
+    baseline_counts = snapshot.bank_counts.aligned(codes)
     baseline_deficits = ai_system._compute_mana_deficits(baseline_counts, snapshot.ability_map)
     other_gain, secrets_excess = ai_system._compute_bank_gains(
         baseline_counts,
-        clone_counts,
+        clone_counts.aligned(codes),
         baseline_deficits,
+        secrets_code=codes.lookup("secrets"),
     )
 
     assert other_gain >= 3
@@ -0,0 +1,233 @@
+import random
+
+from ecs.ai.ability_projection import is_board_neutral_ability, project_ability
+from ecs.components.ability import Ability
+from ecs.components.ability_list_owner import AbilityListOwner
+from ecs.components.health import Health
+from ecs.components.human_agent import HumanAgent
+from ecs.components.pending_ability_target import PendingAbilityTarget
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.components.tile import TileType
+from ecs.components.tile_bank import TileBank
+from ecs.events.bus import EventBus, EVENT_ABILITY_EXECUTE, EVENT_EFFECT_APPLY
+from ecs.factories.abilities import create_ability_by_name
+from ecs.systems.abilities.registry import create_resolver_registry
+from ecs.systems.ability_resolution_system import AbilityResolutionSystem
+from ecs.systems.base_ai_system import AbilityAction
+from ecs.systems.board import BoardSystem
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+from ecs.systems.effects.damage_effect_system import DamageEffectSystem
+from ecs.systems.effects.heal_effect_system import HealEffectSystem
+from ecs.systems.effects.mana_drain_effect_system import ManaDrainEffectSystem
+from ecs.systems.effects.thorns_effect_system import ThornsEffectSystem
+from ecs.systems.health_system import HealthSystem
+from ecs.systems.rule_based_ai_system import RuleBasedAISystem
+from ecs.systems.tile_bank_system import TileBankSystem
+from world import create_world
+
+
+def _setup_world():
+    bus = EventBus()
+    world = create_world(bus)
+    HealthSystem(world, bus)
+    EffectLifecycleSystem(world, bus)
+    DamageEffectSystem(world, bus)
+    HealEffectSystem(world, bus)
+    ManaDrainEffectSystem(world, bus)
+    ThornsEffectSystem(world, bus)
+    TileBankSystem(world, bus)
+    AbilityResolutionSystem(world, bus)
+    return bus, world
+
+
+def _human(world):
+    return next(ent for ent, _ in world.get_component(HumanAgent))
+
+
+def _enemy(world):
+    return next(ent for ent, _ in world.get_component(RuleBasedAgent))
+
+
+def _grant(world, owner: int, name: str) -> int:
+    ability_entity = create_ability_by_name(world, name)
+    world.component_for_entity(owner, AbilityListOwner).ability_entities.append(ability_entity)
+    return ability_entity
+
+
+def _pending(ability_entity: int, owner: int) -> PendingAbilityTarget:
+    return PendingAbilityTarget(ability_entity=ability_entity, owner_entity=owner, target_entity=owner)
+
+
+def _resolve_for_real(bus, world, ability_entity: int, owner: int) -> None:
+    ability = world.component_for_entity(ability_entity, Ability)
+    world.component_for_entity(owner, TileBank).spend(dict(ability.cost))
+    bus.emit(
+        EVENT_ABILITY_EXECUTE,
+        ability_entity=ability_entity,
+        owner_entity=owner,
+        pending=_pending(ability_entity, owner),
+    )
+
+
+def test_board_neutral_classification():
+    _, world = _setup_world()
+    resolvers = create_resolver_registry()
+    for name in ("blood_bolt", "life_drain", "shovel_punch", "bee_sting", "spirit_leech"):
+        assert is_board_neutral_ability(world, create_ability_by_name(world, name), resolvers), name
+    for name in ("crimson_pulse", "cease_witchfire", "guard"):
+        assert not is_board_neutral_ability(world, create_ability_by_name(world, name), resolvers), name
+
+
+def test_projection_matches_resolution_with_damage_modifiers():
+    bus, world = _setup_world()
+    human = _human(world)
+    enemy = _enemy(world)
+    blood_bolt = _grant(world, human, "blood_bolt")
+    world.component_for_entity(human, TileBank).counts["blood"] = 8
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=human, slug="damage_bonus", metadata={"bonus": 2})
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="frailty", metadata={"bonus": 1})
+
+    projection = project_ability(
+        world, blood_bolt, human, _pending(blood_bolt, human), create_resolver_registry()
+    )
+    assert projection is not None
+    _resolve_for_real(bus, world, blood_bolt, human)
+
+    assert projection.health[human] == world.component_for_entity(human, Health).current
+    assert projection.health[enemy] == world.component_for_entity(enemy, Health).current
+    assert projection.damage[enemy] == 5 + 2 + 1
+    assert projection.owner_bank_counts() == world.component_for_entity(human, TileBank).counts
+
+
+def test_projection_reflects_thorns_back_to_the_caster():
+    bus, world = _setup_world()
+    human = _human(world)
+    enemy = _enemy(world)
+    blood_bolt = _grant(world, human, "blood_bolt")
+    world.component_for_entity(human, TileBank).counts["blood"] = 8
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="thorns", turns=3, metadata={"amount": 2})
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=human, slug="frailty", metadata={"bonus": 1})
+    before = world.component_for_entity(human, Health).current
+
+    projection = project_ability(
+        world, blood_bolt, human, _pending(blood_bolt, human), create_resolver_registry()
+    )
+    assert projection is not None
+    _resolve_for_real(bus, world, blood_bolt, human)
+
+    # Blood bolt's own self-damage plus the reflected thorns, both raised by frailty.
+    assert world.component_for_entity(human, Health).current == before - (2 + 1) - (2 + 1)
+    assert projection.damage[human] == (2 + 1) + (2 + 1)
+    assert projection.health[human] == world.component_for_entity(human, Health).current
+    assert projection.health[enemy] == world.component_for_entity(enemy, Health).current
+
+
+def test_projection_matches_life_drain_and_bee_sting():
+    bus, world = _setup_world()
+    human = _human(world)
+    enemy = _enemy(world)
+    board = BoardSystem(world, bus, rows=2, cols=2)
+    for entity in (board._get_entity_at(r, c) for r in range(2) for c in range(2)):
+        world.component_for_entity(entity, TileType).type_name = "nature"
+    life_drain = _grant(world, human, "life_drain")
+    bee_sting = _grant(world, enemy, "bee_sting")
+    world.component_for_entity(human, TileBank).counts["blood"] = 7
+    world.component_for_entity(enemy, TileBank).counts.update(nature=5, spirit=3, shapeshift=3)
+    world.component_for_entity(human, Health).current = 50
+    world.component_for_entity(enemy, Health).current = 1
+    resolvers = create_resolver_registry()
+
+    drain_projection = project_ability(world, life_drain, human, _pending(life_drain, human), resolvers)
+    _resolve_for_real(bus, world, life_drain, human)
+    assert drain_projection is not None
+    assert drain_projection.healing[human] == 1
+    assert drain_projection.health[human] == world.component_for_entity(human, Health).current
+    assert drain_projection.defeated() == {enemy}
+
+    world.component_for_entity(enemy, Health).current = 30
+    sting_projection = project_ability(world, bee_sting, enemy, _pending(bee_sting, enemy), resolvers)
+    _resolve_for_real(bus, world, bee_sting, enemy)
+    assert sting_projection is not None
+    assert sting_projection.damage[human] == 4
+    assert sting_projection.health[human] == world.component_for_entity(human, Health).current
+
+
+def test_projection_matches_mana_drain_gains():
+    bus, world = _setup_world()
+    human = _human(world)
+    enemy = _enemy(world)
+    spirit_leech = _grant(world, human, "spirit_leech")
+    world.component_for_entity(human, TileBank).counts.update(spirit=5)
+    world.component_for_entity(enemy, TileBank).counts.update(hex=3, nature=1)
+
+    projection = project_ability(
+        world, spirit_leech, human, _pending(spirit_leech, human), create_resolver_registry()
+    )
+    _resolve_for_real(bus, world, spirit_leech, human)
+
+    assert projection is not None
+    assert projection.bank_counts[enemy] == world.component_for_entity(enemy, TileBank).counts
+    assert projection.owner_bank_counts() == world.component_for_entity(human, TileBank).counts
+    assert projection.mana_removed[enemy] == 2
+
+
+def test_analytic_score_matches_clone_simulation():
+    bus, world = _setup_world()
+    enemy = _enemy(world)
+    shovel_punch = _grant(world, enemy, "shovel_punch")
+    world.component_for_entity(enemy, TileBank).counts.update(nature=6, shapeshift=4)
+    candidate = ("ability", AbilityAction(ability_entity=shovel_punch, target_type="self"))
+
+    ai_system = RuleBasedAISystem(world, bus, rng=random.Random(3))
+    analytic_score = ai_system._score_action(enemy, candidate)
+    ai_system.analytic_ability_scoring = False
+    ai_system.random = random.Random(3)
+    clone_score = ai_system._score_action(enemy, candidate)
+
+    assert analytic_score == clone_score
+
+
+def test_unscored_projection_falls_back_to_clone_scoring():
+    bus, world = _setup_world()
+    enemy = _enemy(world)
+    shovel_punch = _grant(world, enemy, "shovel_punch")
+    world.component_for_entity(enemy, TileBank).counts.update(nature=6, shapeshift=4)
+    candidate = ("ability", AbilityAction(ability_entity=shovel_punch, target_type="self"))
+
+    ai_system = RuleBasedAISystem(world, bus, rng=random.Random(3))
+    ai_system.analytic_ability_scoring = False
+    clone_score = ai_system._score_action(enemy, candidate)
+    ai_system.analytic_ability_scoring = True
+    ai_system._score_projection = lambda projection, snapshot, candidate: None
+    ai_system.random = random.Random(3)
+
+    assert ai_system._score_action(enemy, candidate) == clone_score
+
+
+def test_clone_scoring_sees_the_same_lethal_outcome_as_the_projection():
+    bus, world = _setup_world()
+    human = _human(world)
+    enemy = _enemy(world)
+    blood_bolt = _grant(world, enemy, "blood_bolt")
+    world.component_for_entity(enemy, TileBank).counts["blood"] = 8
+    # Only frailty's extra point makes the bolt lethal, so the clone needs the live effects too.
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=human, slug="frailty", metadata={"bonus": 1})
+    candidate = ("ability", AbilityAction(ability_entity=blood_bolt, target_type="self"))
+    ai_system = RuleBasedAISystem(world, bus, rng=random.Random(3))
+
+    def scores(current_health):
+        world.component_for_entity(human, Health).current = current_health
+        result = []
+        for analytic in (True, False):
+            ai_system.analytic_ability_scoring = analytic
+            ai_system.random = random.Random(3)
+            result.append(ai_system._score_action(enemy, candidate))
+        return result
+
+    lethal_analytic, lethal_clone = scores(6)
+    survived_analytic, survived_clone = scores(7)
+
+    assert lethal_analytic == lethal_clone
+    assert survived_analytic == survived_clone
+    assert lethal_clone - survived_clone == ai_system.weights.kill_bonus
+    assert world.component_for_entity(human, Health).current == 7
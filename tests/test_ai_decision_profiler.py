@@ -0,0 +1,80 @@
+import json
+import random
+
+from ecs.ai.decision_profiler import DecisionProfiler, RollingHistogram
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.events.bus import EventBus, EVENT_TICK
+from ecs.systems.board import BoardSystem
+from ecs.systems.rule_based_ai_system import RuleBasedAISystem
+from world import create_world
+
+
+def test_rolling_histogram_percentiles_over_window():
+    hist = RollingHistogram(window=4)
+    for value in (10.0, 1.0, 2.0, 3.0, 4.0):
+        hist.add(value)
+    stats = hist.summary()
+    assert stats["count"] == 5
+    # 10.0 fell out of the window but still counts as the max ever seen.
+    assert stats["p50"] == 3.0
+    assert stats["p95"] == 4.0
+    assert stats["max"] == 10.0
+
+
+def test_profiler_records_phases_and_candidates(tmp_path):
+    bus = EventBus()
+    # Seeded so the first decision is always a two-click swap.
+    world = create_world(bus, rng=random.Random(5))
+    BoardSystem(world, bus, rows=5, cols=5)
+    ai = RuleBasedAISystem(world, bus, rng=random.Random(5))
+    log_path = tmp_path / "decisions.jsonl"
+    ai.profiler = DecisionProfiler(log_path)
+    owner = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    ai.pending_owner = owner
+    ai.has_dispatched_action = False
+    ai.delay_remaining = 0.0
+
+    bus.emit(EVENT_TICK, dt=0.016)
+    # The swap's second click waits out the selection delay; the record stays open.
+    assert ai.profiler.decisions == 0
+    first_dispatch = ai.profiler.current.phases["dispatch"]
+    bus.emit(EVENT_TICK, dt=0.5)
+
+    assert ai.profiler.decisions == 1
+    assert ai.profiler.current is None
+    summary = ai.profiler.summary()
+    assert {"find_swaps", "clone", "simulate", "score", "dispatch"} <= set(summary["phases"])
+    record = json.loads(log_path.read_text().splitlines()[0])
+    assert record["owner"] == owner
+    assert record["candidates"]["swap"] > 0
+    assert record["phases"]["dispatch"] > first_dispatch
+    assert record["total"] >= sum(record["phases"].values()) * 0.99
+    assert "AI decisions: 1" in ai.profiler.format_report()
+
+
+def test_failed_decision_does_not_leak_into_the_next():
+    bus = EventBus()
+    # Seeded so the first decision is always a two-click swap.
+    world = create_world(bus, rng=random.Random(5))
+    BoardSystem(world, bus, rows=5, cols=5)
+    ai = RuleBasedAISystem(world, bus, rng=random.Random(5))
+    ai.profiler = DecisionProfiler()
+    owner = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    ai.pending_owner = owner
+    ai.delay_remaining = 0.0
+
+    def fail(owner_entity):
+        ai.profiler.count_candidates("swap", 99)
+        raise RuntimeError("boom")
+
+    ai._choose_action = fail
+    try:
+        bus.emit(EVENT_TICK, dt=0.016)
+    except RuntimeError:
+        pass
+    assert ai.profiler.current is None
+    assert ai.profiler.decisions == 1
+
+    del ai._choose_action
+    bus.emit(EVENT_TICK, dt=0.016)
+    assert ai.profiler.current.candidates.get("swap") != 99
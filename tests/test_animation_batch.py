@@ -0,0 +1,86 @@
+from ecs.components.animation_fade import FadeAnimation
+from ecs.components.animation_fall import FallAnimation
+from ecs.events.bus import EventBus, EVENT_ANIMATION_COMPLETE, EVENT_ANIMATION_START
+from ecs.events.payloads import TickEvent
+from ecs.systems.animation import AnimationSystem
+from ecs.systems.animation_batch import AnimationBatch
+from world import create_world
+
+
+def _setup():
+    bus = EventBus()
+    world = create_world(bus)
+    animations = AnimationSystem(world, bus)
+    completed = []
+    bus.subscribe(EVENT_ANIMATION_COMPLETE, lambda sender, **payload: completed.append(payload))
+    return bus, world, animations, completed
+
+
+def test_batch_matches_per_component_arithmetic():
+    fade = AnimationBatch("fade", descending=True)
+    views = [FadeAnimation(pos=(0, c)) for c in range(2)]
+    fade.add_segment([1], views[:1], 0.2)
+    fade.add_segment([2], views[1:], 0.3)
+    alphas = [1.0, 1.0]
+    durations = [0.2, 0.3]
+    done = False
+    while not done:
+        done = fade.advance(0.02)
+        for i, d in enumerate(durations):
+            if alphas[i] > 0.0:
+                alphas[i] = max(0.0, alphas[i] - 0.02 / d)
+        assert [view.alpha for view in views] == alphas
+    assert alphas == [0.0, 0.0]
+
+    fall = AnimationBatch("fall")
+    view = FallAnimation(src=(2, 0), dst=(1, 0))
+    fall.add_segment([3], [view], 0.25)
+    assert not fall.advance(0.05)
+    assert view.linear == 0.05 / 0.25
+    assert view.eased == 2 * view.linear * view.linear
+    while not fall.advance(0.05):
+        pass
+    assert (view.linear, view.eased) == (1.0, 1.0)
+
+
+def test_groups_started_mid_flight_complete_together():
+    bus, world, animations, completed = _setup()
+    bus.emit(EVENT_ANIMATION_START, kind="fade", items=[(0, 0), (0, 1)])
+    for _ in range(5):
+        bus.publish(TickEvent(0.02))
+    bus.emit(EVENT_ANIMATION_START, kind="fade", items=[(1, 0)])
+    for _ in range(6):
+        bus.publish(TickEvent(0.02))
+    # The first two are done, but the group waits for the late tile.
+    assert completed == []
+    alphas = sorted(fade.alpha for _, fade in world.get_component(FadeAnimation))
+    assert alphas[:2] == [0.0, 0.0] and alphas[2] > 0.0
+    for _ in range(10):
+        bus.publish(TickEvent(0.02))
+
+    assert [(event["kind"], sorted(event["items"])) for event in completed] == [("fade", [(0, 0), (0, 1), (1, 0)])]
+    assert not world.get_component(FadeAnimation)
+    assert len(animations.batches[FadeAnimation]) == 0
+
+
+def test_fall_completion_reports_moves():
+    bus, world, animations, completed = _setup()
+    moves = [{"from": (3, c), "to": (2, c)} for c in range(3)]
+    bus.emit(EVENT_ANIMATION_START, kind="fall", items=moves)
+    for _ in range(20):
+        bus.publish(TickEvent(0.02))
+
+    assert [event["kind"] for event in completed] == ["fall"]
+    assert sorted(completed[0]["items"], key=lambda move: move["from"]) == moves
+    assert not world.get_component(FallAnimation)
+
+
+def test_ticks_update_the_same_buffers_in_place():
+    fall = AnimationBatch("fall")
+    fall.add_segment([1, 2], [FallAnimation(src=(2, c), dst=(1, c)) for c in range(2)], 0.25)
+    buffers = (fall.values, fall.durations, fall.eased)
+    while not fall.advance(0.05):
+        assert all(new is old for new, old in zip((fall.values, fall.durations, fall.eased), buffers))
+    fall.clear()
+    assert all(new is old for new, old in zip((fall.values, fall.durations, fall.eased), buffers))
+    assert len(fall.values) == 0
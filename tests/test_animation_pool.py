@@ -0,0 +1,58 @@
+from ecs.components.animation_fade import FadeAnimation
+from ecs.components.animation_fall import FallAnimation
+from ecs.components.duration import Duration
+from ecs.events.bus import EventBus, EVENT_ANIMATION_COMPLETE, EVENT_ANIMATION_START
+from ecs.events.payloads import TickEvent
+from ecs.systems.animation import AnimationSystem
+from world import create_world
+
+
+def _run(bus, world, kind, items, ticks=30):
+    bus.emit(EVENT_ANIMATION_START, kind=kind, items=items)
+    for _ in range(ticks):
+        bus.publish(TickEvent(0.02))
+    assert not world.get_component(FadeAnimation)
+    assert not world.get_component(FallAnimation)
+
+
+def test_cascade_steps_reuse_pooled_slots():
+    bus = EventBus()
+    world = create_world(bus)
+    animations = AnimationSystem(world, bus)
+    completed = []
+    bus.subscribe(EVENT_ANIMATION_COMPLETE, lambda sender, **payload: completed.append(payload["kind"]))
+
+    _run(bus, world, "fade", [(0, c) for c in range(6)])
+    entities = len(world._entities)
+    next_id = world._next_entity_id
+    assert animations.factory.pooled(FadeAnimation) == 6
+
+    for _ in range(3):
+        _run(bus, world, "fade", [(1, c) for c in range(4)])
+    assert world._next_entity_id == next_id
+    assert len(world._entities) == entities
+    assert animations.factory.slots_created == 6
+    assert animations.factory.pooled(FadeAnimation) == 6
+
+    moves = [{"from": (2, c), "to": (1, c)} for c in range(3)]
+    _run(bus, world, "fall", moves)
+    _run(bus, world, "fall", moves)
+    assert animations.factory.slots_created == 9
+    assert animations.factory.pooled(FallAnimation) == 3
+    assert completed == ["fade"] * 4 + ["fall"] * 2
+
+
+def test_pooled_slot_is_reset_and_survives_outside_deletion():
+    bus = EventBus()
+    world = create_world(bus)
+    animations = AnimationSystem(world, bus)
+    _run(bus, world, "fade", [(0, 0), (0, 1)])
+
+    idle = [ent for ent, _ in world.get_component(Duration)]
+    world.delete_entity(idle[0], immediate=True)
+    bus.emit(EVENT_ANIMATION_START, kind="fade", items=[(3, 3), (4, 4)])
+
+    fades = sorted(fade.pos for _, fade in world.get_component(FadeAnimation))
+    assert fades == [(3, 3), (4, 4)]
+    assert all(fade.alpha == 1.0 for _, fade in world.get_component(FadeAnimation))
+    assert animations.factory.slots_created == 3
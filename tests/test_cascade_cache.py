@@ -0,0 +1,148 @@
+import random
+
+from ecs.ai.simulation import clone_world_state
+from ecs.components.active_switch import ActiveSwitch
+from ecs.components.board_position import BoardPosition
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.components.tile import TileType
+from ecs.components.tile_bank import TileBank
+from ecs.events.bus import EventBus
+from ecs.systems.board import BoardSystem
+from ecs.systems.board_ops import CascadeCache, board_key, find_valid_swaps, resolve_swap_cascade
+from ecs.systems.rule_based_ai_system import RuleBasedAISystem, RuleBasedWeights
+from world import create_world
+
+
+def _board_state(world):
+    state = {}
+    for entity, pos in world.get_component(BoardPosition):
+        state[(pos.row, pos.col)] = (
+            world.component_for_entity(entity, TileType).type_name,
+            world.component_for_entity(entity, ActiveSwitch).active,
+        )
+    return state
+
+
+def _bank(world, owner):
+    return dict(world.component_for_entity(owner, TileBank).counts)
+
+
+def _randomise(world, board, rng, types):
+    for row in range(6):
+        for col in range(6):
+            entity = board._get_entity_at(row, col)
+            world.component_for_entity(entity, TileType).type_name = rng.choice(types)
+
+
+def test_cached_replay_matches_world_resolution():
+    bus = EventBus()
+    world = create_world(bus)
+    board = BoardSystem(world, bus, rows=6, cols=6)
+    owner = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    rng = random.Random(11)
+    cache = CascadeCache()
+    compared = 0
+    for _ in range(8):
+        _randomise(world, board, rng, ["hex", "nature", "blood", "spirit"])
+        for swap in find_valid_swaps(world):
+            slow = clone_world_state(world)
+            slow.engine.cascade_cache = None
+            fast = clone_world_state(world)
+            fast.engine.cascade_cache = cache
+            slow_owner = slow.entity_map[owner]
+            fast_owner = fast.entity_map[owner]
+            slow.engine.swap_and_resolve(*swap, acting_owner=slow_owner)
+            fast.engine.swap_and_resolve(*swap, acting_owner=fast_owner)
+            assert _board_state(fast.world) == _board_state(slow.world)
+            assert _bank(fast.world, fast_owner) == _bank(slow.world, slow_owner)
+            assert (
+                fast.engine.last_action_generated_extra_turn
+                == slow.engine.last_action_generated_extra_turn
+            )
+            compared += 1
+    assert compared > 0
+    assert cache.stats.misses == compared
+
+
+def test_cache_hits_and_lru_eviction():
+    bus = EventBus()
+    world = create_world(bus)
+    BoardSystem(world, bus, rows=5, cols=5)
+    key, _ = board_key(world)
+    cache = CascadeCache(maxsize=2)
+    cache.resolve(key, (0, 0), (0, 1))
+    cache.resolve(key, (0, 0), (1, 0))
+    cache.resolve(key, (0, 0), (0, 1))
+    assert cache.stats.hits == 1
+    cache.resolve(key, (1, 1), (1, 2))
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+    # (0, 0)->(1, 0) was least recently used and is gone.
+    cache.resolve(key, (0, 0), (1, 0))
+    assert cache.stats.misses == 4
+    assert 0.0 < cache.stats.hit_rate < 1.0
+
+
+def _assert_same_outcome(left, right):
+    assert left.swapped == right.swapped
+    assert left.final_cells == right.final_cells
+    assert [sorted(step.typed) for step in left.steps] == [sorted(step.typed) for step in right.steps]
+    assert [sorted(map(tuple, step.groups)) for step in left.steps] == [
+        sorted(map(tuple, step.groups)) for step in right.steps
+    ]
+
+
+def test_canonical_cache_restores_mirrored_and_recoloured_outcomes():
+    bus = EventBus()
+    world = create_world(bus)
+    board = BoardSystem(world, bus, rows=6, cols=6)
+    rng = random.Random(5)
+    cache = CascadeCache(canonicalize=True)
+    for _ in range(6):
+        _randomise(world, board, rng, ["hex", "nature", "blood"])
+        key, _ = board_key(world)
+        for swap in find_valid_swaps(world):
+            _assert_same_outcome(cache.resolve(key, *swap), resolve_swap_cascade(key, *swap))
+            # The mirrored board with renamed colours lands on the same entry.
+            rows, cols, cells = key
+            mirrored = []
+            for start in range(0, len(cells), cols):
+                mirrored.extend(reversed(cells[start:start + cols]))
+            rename = {"hex": "nature", "nature": "blood", "blood": "hex"}
+            recoloured = tuple((rename[t], active) for t, active in mirrored)
+            m_src, m_dst = ((r, cols - 1 - c) for r, c in swap)
+            hits = cache.stats.hits
+            _assert_same_outcome(
+                cache.resolve((rows, cols, recoloured), m_src, m_dst),
+                resolve_swap_cascade((rows, cols, recoloured), m_src, m_dst),
+            )
+            assert cache.stats.hits == hits + 1
+
+
+def test_symmetric_dedup_keeps_best_score():
+    bus = EventBus()
+    world = create_world(bus)
+    board = BoardSystem(world, bus, rows=6, cols=6)
+    rng = random.Random(2)
+    for row in range(6):
+        left = [rng.choice(["hex", "nature", "blood", "spirit"]) for _ in range(3)]
+        for col, type_name in enumerate(left + left[::-1]):
+            world.component_for_entity(board._get_entity_at(row, col), TileType).type_name = type_name
+    owner = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    ai = RuleBasedAISystem(world, bus, weights=RuleBasedWeights(random_tie_breaker=0.0))
+    scored = []
+    original = ai._score_action
+
+    def counting(owner_entity, candidate):
+        scored.append(candidate)
+        return original(owner_entity, candidate)
+
+    ai._score_action = counting
+    plain_choice = ai._choose_action(owner)
+    plain_count = len(scored)
+    scored.clear()
+    ai.symmetric_swap_dedup = True
+    dedup_choice = ai._choose_action(owner)
+
+    assert len(scored) < plain_count
+    assert original(owner, dedup_choice) == original(owner, plain_choice)
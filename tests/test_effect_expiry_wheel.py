@@ -0,0 +1,81 @@
+from ecs.components.effect_duration import EffectDuration
+from ecs.components.human_agent import HumanAgent
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.effects.benchmark import measure_turn_advance
+from ecs.events.bus import (
+    EventBus,
+    EVENT_EFFECT_APPLY,
+    EVENT_EFFECT_EXPIRED,
+    EVENT_TURN_ADVANCED,
+)
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+from ecs.utils.effect_index import effect_index
+from world import create_world
+
+
+def _setup():
+    bus = EventBus()
+    world = create_world(bus)
+    EffectLifecycleSystem(world, bus)
+    player = next(ent for ent, _ in world.get_component(HumanAgent))
+    enemy = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    expired = []
+    bus.subscribe(EVENT_EFFECT_EXPIRED, lambda sender, **payload: expired.append(payload["effect_entity"]))
+    return bus, world, player, enemy, expired
+
+
+def _end_turn(bus, owner, other):
+    bus.emit(EVENT_TURN_ADVANCED, previous_owner=owner, new_owner=other)
+
+
+def test_wheel_matches_full_scan_with_many_live_effects():
+    report = measure_turn_advance(effects=520, turns=60, seed=3)
+
+    assert report.live_effects >= 500
+    assert report.wheel_expiries
+    assert report.same_expiries
+
+
+def test_effects_due_on_the_same_turn_expire_in_apply_order():
+    bus, world, player, enemy, expired = _setup()
+    applied = []
+    for turns in (2, 1, 2, 2):
+        bus.emit(
+            EVENT_EFFECT_APPLY,
+            owner_entity=player,
+            slug="damage_bonus",
+            turns=turns,
+            metadata={"bonus": 1},
+            allow_multiple=True,
+        )
+        applied.append(effect_index(world).effects(player, "damage_bonus")[-1])
+
+    _end_turn(bus, enemy, player)
+    assert expired == []
+    _end_turn(bus, player, enemy)
+    assert expired == [applied[1]]
+    assert world.component_for_entity(applied[0], EffectDuration).remaining_turns == 1
+    _end_turn(bus, player, enemy)
+    assert expired == [applied[1], applied[0], applied[2], applied[3]]
+
+
+def test_refresh_reschedules_the_expiry():
+    bus, world, player, enemy, expired = _setup()
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="frailty", turns=1, metadata={})
+    (effect_entity,) = effect_index(world).effects(enemy, "frailty")
+
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="frailty", turns=3, metadata={}, refresh=True)
+    _end_turn(bus, enemy, player)
+    _end_turn(bus, enemy, player)
+    assert expired == []
+    assert world.component_for_entity(effect_entity, EffectDuration).remaining_turns == 1
+    _end_turn(bus, enemy, player)
+    assert expired == [effect_entity]
+
+    # Refreshing without turns makes the effect permanent.
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="frailty", turns=1, metadata={})
+    (effect_entity,) = effect_index(world).effects(enemy, "frailty")
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="frailty", metadata={}, refresh=True)
+    for _ in range(3):
+        _end_turn(bus, enemy, player)
+    assert effect_index(world).has(enemy, "frailty")
@@ -0,0 +1,90 @@
+from ecs.components.human_agent import HumanAgent
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.events.bus import (
+    EventBus,
+    EVENT_EFFECT_APPLY,
+    EVENT_EFFECT_REMOVE,
+    EVENT_HEALTH_DAMAGE,
+)
+from ecs.systems.board import BoardSystem
+from ecs.systems.board_ops import get_entity_at, swap_tile_types
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+from ecs.systems.effects.damage_effect_system import DamageEffectSystem
+from ecs.utils.effect_index import effect_index
+from world import create_world
+
+
+def _setup():
+    bus = EventBus()
+    world = create_world(bus)
+    EffectLifecycleSystem(world, bus)
+    DamageEffectSystem(world, bus)
+    player = next(ent for ent, _ in world.get_component(HumanAgent))
+    enemy = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    return bus, world, player, enemy
+
+
+def test_modifier_totals_are_cached_until_the_slug_changes():
+    bus, world, player, enemy = _setup()
+    index = effect_index(world)
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=player, slug="damage_bonus", metadata={"bonus": 2})
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=player, slug="damage_bonus", metadata={"bonus": 3})
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="frailty", metadata={})
+
+    assert index.total(player, "damage_bonus", "bonus") == 5
+    assert index.total(enemy, "frailty", "bonus", 1) == 1
+    recomputes = index.recomputes
+    for _ in range(10):
+        assert index.total(player, "damage_bonus", "bonus") == 5
+    assert index.recomputes == recomputes
+
+    # An unrelated slug on the same owner keeps the cached total.
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=player, slug="thorns", metadata={"amount": 1})
+    assert index.total(player, "damage_bonus", "bonus") == 5
+    assert index.recomputes == recomputes
+
+    first = index.effects(player, "damage_bonus")[0]
+    bus.emit(EVENT_EFFECT_REMOVE, effect_entity=first)
+    assert index.total(player, "damage_bonus", "bonus") == 3
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=player, slug="damage_bonus", metadata={"bonus": 7}, refresh=True)
+    assert index.total(player, "damage_bonus", "bonus") == 7
+
+
+def test_damage_includes_outgoing_and_incoming_modifiers():
+    bus, world, player, enemy = _setup()
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=player, slug="damage_bonus", metadata={"bonus": 2})
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="frailty", metadata={"bonus": 1})
+    hits = []
+    bus.subscribe(EVENT_HEALTH_DAMAGE, lambda sender, **payload: hits.append(payload["amount"]))
+
+    bus.emit(
+        EVENT_EFFECT_APPLY,
+        owner_entity=enemy,
+        slug="damage",
+        turns=0,
+        metadata={"amount": 4, "source_owner": player},
+    )
+
+    assert hits == [7]
+    assert not effect_index(world).has(enemy, "damage")
+
+
+def test_tile_effects_follow_swapped_tiles():
+    bus, world, player, enemy = _setup()
+    BoardSystem(world, bus, rows=3, cols=3)
+    index = effect_index(world)
+    tile_a = get_entity_at(world, 0, 0)
+    tile_b = get_entity_at(world, 0, 1)
+    bus.emit(
+        EVENT_EFFECT_APPLY,
+        owner_entity=tile_a,
+        slug="tile_guarded",
+        metadata={"source_owner": enemy},
+    )
+    assert index.count_where("tile_guarded", "source_owner", enemy) == 1
+
+    assert swap_tile_types(world, (0, 0), (0, 1))
+
+    assert not index.has(tile_a, "tile_guarded")
+    assert len(index.effects(tile_b, "tile_guarded")) == 1
+    assert index.count_where("tile_guarded", "source_owner", enemy) == 1
@@ -0,0 +1,65 @@
+from ecs.components.effect import Effect
+from ecs.components.human_agent import HumanAgent
+from ecs.effects.benchmark import measure_apply_throughput
+from ecs.effects.factory import ensure_default_effects_registered
+from ecs.effects.registry import EffectDefinition, EffectRegistry
+from ecs.events.bus import EventBus, EVENT_EFFECT_APPLY
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+from ecs.utils.effect_index import effect_index
+from world import create_world
+
+
+def test_templates_split_control_keys_from_metadata():
+    registry = EffectRegistry()
+    registry.register(
+        EffectDefinition(
+            slug="venom",
+            display_name="Venom",
+            tags=("cumulative",),
+            default_metadata={"damage_per_tick": 1, "stack_key": "venom", "allow_multiple": False, "turns": 2},
+        )
+    )
+    template = registry.template("venom")
+
+    assert dict(template.metadata) == {"damage_per_tick": 1, "turns": 2}
+    assert template.stack_key == "venom"
+    assert template.allow_multiple is False
+    assert template.cumulative and template.always_cumulative
+
+    same, metadata = template.instantiate({"damage_per_tick": 3})
+    assert same is template
+    assert metadata == {"damage_per_tick": 3, "turns": 2}
+    assert dict(template.metadata) == {"damage_per_tick": 1, "turns": 2}
+
+    custom, metadata = template.instantiate({"stack_key": "other", "count": "2"})
+    assert custom.stack_key == "other" and custom.count == 2
+    assert metadata == {"damage_per_tick": 1, "turns": 2}
+
+    bare = registry.template("unknown")
+    assert not registry.has("unknown")
+    assert bare.allow_multiple and not bare.cumulative and dict(bare.metadata) == {}
+
+
+def test_applied_effects_keep_only_descriptive_metadata():
+    ensure_default_effects_registered()
+    bus = EventBus()
+    world = create_world(bus)
+    EffectLifecycleSystem(world, bus)
+    player = next(ent for ent, _ in world.get_component(HumanAgent))
+
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=player, slug="poison", count=2, metadata={"source_owner": 7})
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=player, slug="poison", count=1, cumulative=False)
+
+    (effect_entity,) = effect_index(world).effects(player, "poison")
+    effect = world.component_for_entity(effect_entity, Effect)
+    assert effect.count == 3
+    assert effect.stack_key == "poison"
+    assert effect.metadata == {"damage_per_tick": 1, "reason": "poison", "source_owner": 7}
+
+
+def test_apply_throughput_benchmark_runs():
+    report = measure_apply_throughput(applies=400, seed=3)
+
+    assert report.applies == 400
+    assert report.expiries > 0
+    assert report.us_per_apply > 0
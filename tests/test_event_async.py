@@ -0,0 +1,96 @@
+import json
+import threading
+from pathlib import Path
+
+from esper import World
+
+from ecs.events.async_worker import AsyncWorker
+from ecs.events.bus import EVENT_ENEMY_DEFEATED, EVENT_MENU_CONTINUE_SELECTED, EventBus
+from ecs.systems.story_progress_system import StoryProgressSystem
+
+
+def test_async_handlers_run_off_thread_in_emit_order():
+    for backend in ("blinker", "direct"):
+        bus = EventBus(backend=backend)
+        seen = []
+        threads = set()
+
+        def record(sender, n):
+            seen.append(n)
+            threads.add(threading.get_ident())
+
+        bus.subscribe_async("write", record)
+        for n in range(200):
+            bus.emit("write", n=n)
+        assert bus.flush_async(timeout=5)
+        assert seen == list(range(200)), backend
+        assert threading.get_ident() not in threads
+        assert bus.close_async(timeout=5)
+        assert not bus.async_worker.running
+
+
+def test_full_queue_blocks_the_emitter_until_the_worker_catches_up():
+    bus = EventBus(backend="direct")
+    bus.async_worker = AsyncWorker(capacity=2)
+    gate = threading.Event()
+    seen = []
+
+    def slow(sender, n):
+        gate.wait(5)
+        seen.append(n)
+
+    bus.subscribe_async("write", slow)
+    emitter = threading.Thread(target=lambda: [bus.emit("write", n=n) for n in range(6)])
+    emitter.start()
+    emitter.join(0.2)
+    # One call is running and two are queued, so the emitter is stuck on the fourth.
+    assert emitter.is_alive()
+    assert not bus.flush_async(timeout=0.05)
+    gate.set()
+    emitter.join(5)
+    assert bus.flush_async(timeout=5)
+    assert seen == list(range(6))
+    assert bus.async_worker.waits >= 1
+    bus.close_async(timeout=5)
+
+
+def test_failing_async_handler_does_not_stop_the_worker(capsys):
+    bus = EventBus(backend="direct")
+    seen = []
+
+    def flaky(sender, n):
+        if n == 1:
+            raise RuntimeError("disk full")
+        seen.append(n)
+
+    bus.subscribe_async("write", flaky)
+    for n in range(3):
+        bus.emit("write", n=n)
+    assert bus.flush_async(timeout=5)
+    bus.close_async(timeout=5)
+
+    assert seen == [0, 2]
+    assert [str(exc) for _, exc in bus.async_worker.errors] == ["disk full"]
+    assert "disk full" in capsys.readouterr().err
+
+
+def test_story_progress_background_writes_land_in_order(tmp_path):
+    world = World()
+    bus = EventBus()
+    save_path = Path(tmp_path) / "progress.json"
+    StoryProgressSystem(world, bus, save_path=save_path, load_existing=False, background_writes=True)
+
+    for _ in range(5):
+        bus.emit(EVENT_ENEMY_DEFEATED, entity=None)
+    assert bus.flush_async(timeout=5)
+
+    payload = json.loads(save_path.read_text(encoding="utf-8"))
+    assert payload["enemies_defeated"] == 5
+    assert not save_path.with_name("progress.json.tmp").exists()
+
+    # Continue reads the file back; pending writes are flushed first.
+    bus.emit(EVENT_ENEMY_DEFEATED, entity=None)
+    bus.emit(EVENT_MENU_CONTINUE_SELECTED)
+    payload = json.loads(save_path.read_text(encoding="utf-8"))
+    assert payload["enemies_defeated"] == 6
+    bus.close_async(timeout=5)
@@ -1,3 +1,6 @@
+import pytest
+
+from ecs.events.benchmark import compare_backends
 from ecs.events.bus import EventBus
 
 
@@ -13,3 +16,87 @@ def test_event_bus_emit_subscribe():
 
     assert received["value"] == 42
     assert received["msg"] == "hello"
+
+
+def test_direct_backend_calls_handlers_in_subscription_order():
+    bus = EventBus(backend="direct")
+    calls = []
+
+    def first(sender, **kwargs):
+        calls.append(("first", sender, kwargs))
+
+    def second(sender, **kwargs):
+        calls.append(("second", sender, kwargs))
+
+    bus.subscribe("test", first)
+    bus.subscribe("test", second)
+    bus.subscribe("test", first)
+    bus.emit("test", value=1)
+    bus.emit("other", value=2)
+
+    assert calls == [("first", bus, {"value": 1}), ("second", bus, {"value": 1})]
+
+
+def test_direct_backend_subscribe_during_emit_applies_to_next_emit():
+    bus = EventBus(backend="direct")
+    calls = []
+
+    def late(sender, **kwargs):
+        calls.append("late")
+
+    def subscriber(sender, **kwargs):
+        calls.append("early")
+        bus.subscribe("test", late)
+
+    bus.subscribe("test", subscriber)
+    bus.emit("test")
+    assert calls == ["early"]
+    bus.emit("test")
+    assert calls == ["early", "early", "late"]
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        EventBus(backend="nope")
+
+
+def test_backend_benchmark_reports_each_backend():
+    rates = compare_backends(handlers=2, emits=200, repeats=1)
+    assert set(rates) == {"blinker", "direct"}
+    assert all(rate > 0 for rate in rates.values())
+
+
+@pytest.mark.parametrize("backend", ["blinker", "direct"])
+def test_deferred_subscription_coalesces_until_flush(backend):
+    bus = EventBus(backend=backend)
+    sync, latest, per_owner = [], [], []
+    bus.subscribe("bank", lambda sender, **kw: sync.append(kw["n"]))
+    bus.subscribe_deferred("bank", lambda sender, **kw: latest.append(kw["n"]))
+    bus.subscribe_deferred("bank", lambda sender, **kw: per_owner.append((kw["owner"], kw["n"])), coalesce_key="owner")
+
+    for n, owner in enumerate([1, 2, 1, 1, 2]):
+        bus.emit("bank", owner=owner, n=n)
+
+    assert sync == [0, 1, 2, 3, 4]
+    assert latest == [] and per_owner == []
+    assert bus.flush_deferred() == 3
+    assert latest == [4]
+    assert per_owner == [(1, 3), (2, 4)]
+    assert bus.flush_deferred() == 0
+
+
+def test_events_queued_during_flush_wait_for_next_flush():
+    bus = EventBus(backend="direct")
+    calls = []
+
+    def on_move(sender, **kw):
+        calls.append(kw["x"])
+        if kw["x"] < 2:
+            bus.emit("move", x=kw["x"] + 1)
+
+    bus.subscribe_deferred("move", on_move)
+    bus.emit("move", x=0)
+    bus.flush_deferred()
+    assert calls == [0]
+    bus.flush_deferred()
+    assert calls == [0, 1]
@@ -0,0 +1,40 @@
+import pytest
+
+from ecs.events.benchmark import measure_cascade_payloads
+from ecs.events.bus import EVENT_BUS_BACKENDS, EVENT_MATCH_FOUND, EVENT_TICK, EventBus
+from ecs.events.payloads import MatchFoundEvent, TickEvent
+
+
+@pytest.mark.parametrize("backend", EVENT_BUS_BACKENDS)
+def test_publish_and_emit_reach_typed_and_kwargs_handlers(backend):
+    bus = EventBus(backend=backend)
+    typed, legacy = [], []
+    bus.subscribe_typed(MatchFoundEvent, lambda sender, event: typed.append(event))
+    bus.subscribe(EVENT_MATCH_FOUND, lambda sender, **payload: legacy.append(payload))
+
+    event = MatchFoundEvent([(0, 0), (0, 1), (0, 2)], 3)
+    bus.publish(event)
+    bus.emit(EVENT_MATCH_FOUND, positions=[(1, 1)], size=1, reason="swap", extra=True)
+
+    assert typed[0] is event
+    assert typed[1] == MatchFoundEvent([(1, 1)], 1, "swap")
+    # None-valued fields are left out of the kwargs view, as before.
+    assert legacy[0] == {"positions": [(0, 0), (0, 1), (0, 2)], "size": 3}
+    assert legacy[1]["extra"] is True
+
+
+def test_publish_keeps_subscription_order_across_handler_kinds():
+    bus = EventBus(backend="direct")
+    calls = []
+    bus.subscribe(EVENT_TICK, lambda sender, **payload: calls.append(("kwargs", payload["dt"])))
+    bus.subscribe_typed(TickEvent, lambda sender, event: calls.append(("typed", event.dt)))
+    bus.subscribe(EVENT_TICK, lambda sender, **payload: calls.append(("kwargs", payload["dt"])))
+    bus.publish(TickEvent(0.5))
+    assert calls == [("kwargs", 0.5), ("typed", 0.5), ("kwargs", 0.5)]
+
+
+def test_typed_payloads_reduce_allocations_per_cascade():
+    report = measure_cascade_payloads(cascades=3)
+    assert report.cascades == 3
+    assert report.typed_payloads < report.kwargs_payloads
+    assert report.reduction > 0.2
@@ -0,0 +1,77 @@
+import pytest
+
+from ecs.events.bus import EVENT_BUS_BACKENDS, EventBus
+from ecs.events.profiling import EventProfiler
+
+
+class _Chain:
+    def __init__(self, bus):
+        self.bus = bus
+        self.leaf_calls = 0
+
+    def on_outer(self, sender, **payload):
+        self.bus.emit("inner", value=payload["value"])
+
+    def on_inner(self, sender, **payload):
+        self.leaf_calls += 1
+
+
+@pytest.mark.parametrize("backend", EVENT_BUS_BACKENDS)
+def test_profiler_records_nested_emits_and_handlers(backend, tmp_path):
+    bus = EventBus(backend=backend)
+    chain = _Chain(bus)
+    bus.subscribe("outer", chain.on_outer)
+    bus.subscribe("inner", chain.on_inner)
+    profiler = bus.enable_profiling()
+
+    bus.emit("outer", value=1)
+    bus.emit("outer", value=2)
+
+    assert chain.leaf_calls == 2
+    assert profiler.events["outer"].emits == 2
+    assert profiler.events["inner"].max_depth == 1
+    assert profiler.events["outer"].max_depth == 0
+    assert profiler.events["inner"].handlers["_Chain.on_inner"].calls == 2
+    assert "outer;_Chain.on_outer;inner;_Chain.on_inner" in profiler.collapsed
+    assert profiler.depth == 0
+
+    path = profiler.write_collapsed(tmp_path / "bus.folded")
+    for line in path.read_text().splitlines():
+        stack, micros = line.rsplit(" ", 1)
+        assert stack.startswith("outer;") and int(micros) > 0
+    assert "_Chain.on_inner" in profiler.format_report()
+
+
+@pytest.mark.parametrize("backend", EVENT_BUS_BACKENDS)
+def test_disable_profiling_restores_plain_emit(backend):
+    bus = EventBus(backend=backend)
+    plain_emit = bus.emit
+    calls = []
+    bus.subscribe("evt", lambda sender, **payload: calls.append(payload))
+    profiler = bus.enable_profiling(EventProfiler())
+    bus.emit("evt", n=1)
+    assert bus.disable_profiling() is profiler
+    assert bus.emit == plain_emit
+    bus.emit("evt", n=2)
+
+    assert calls == [{"n": 1}, {"n": 2}]
+    assert profiler.events["evt"].emits == 1
+
+
+def test_keyed_handlers_appear_under_router():
+    bus = EventBus(backend="direct")
+    seen = []
+
+    def on_poison(sender, **payload):
+        seen.append(payload["slug"])
+
+    bus.subscribe_keyed("effect", "slug", "poison", on_poison)
+    profiler = bus.enable_profiling()
+    bus.emit("effect", slug="poison")
+    bus.emit("effect", slug="other")
+
+    assert seen == ["poison"]
+    assert profiler.events["effect"].emits == 2
+    label = on_poison.__qualname__
+    assert profiler.events["effect"].handlers[label].calls == 1
+    assert f"effect;keyed[slug];{label}" in profiler.collapsed
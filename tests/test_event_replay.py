@@ -0,0 +1,203 @@
+from ecs.components.active_switch import ActiveSwitch
+from ecs.components.choice_window import ChoiceOption, ChoiceWindow
+from ecs.components.game_state import GameMode, GameState
+from ecs.components.active_turn import ActiveTurn
+from ecs.components.board_position import BoardPosition
+from ecs.components.health import Health
+from ecs.components.human_agent import HumanAgent
+from ecs.components.tile import TileType
+from ecs.components.tile_bank import TileBank
+import pytest
+
+from ecs.events.bus import EVENT_BANK_MANA, EVENT_HEALTH_DAMAGE, EVENT_MOUSE_PRESS, EVENT_TICK, EVENT_TILE_CLICK, EventBus
+from ecs.events.payloads import TickEvent
+from ecs.events.replay import (
+    OP_EVENT,
+    OP_RECLAIM,
+    OP_TICK_RUN,
+    OP_TILE_CLICK,
+    EventRecorder,
+    iter_events,
+    SessionHeader,
+    create_game_session,
+    create_session,
+    read_log,
+    recording_from_env,
+    replay,
+)
+from ecs.menu.components import MenuButton
+from ecs.resources import resources_of
+from ecs.systems.board_ops import find_valid_swaps
+from ecs.utils.census import reclaim_dead_entities
+
+
+def _snapshot(world):
+    board = {}
+    for entity, pos in world.get_component(BoardPosition):
+        if world.has_component(entity, TileType):
+            board[(pos.row, pos.col)] = (
+                world.component_for_entity(entity, TileType).type_name,
+                world.component_for_entity(entity, ActiveSwitch).active,
+            )
+    health = sorted((ent, hp.current) for ent, hp in world.get_component(Health))
+    banks = sorted((bank.owner_entity, sorted(bank.counts.items())) for _, bank in world.get_component(TileBank))
+    return board, health, banks
+
+
+def _human_turn(world):
+    human = next(ent for ent, _ in world.get_component(HumanAgent))
+    return any(turn.owner_entity == human for _, turn in world.get_component(ActiveTurn))
+
+
+def test_recorded_session_replays_to_identical_state(tmp_path):
+    header = SessionHeader(seed=4, ai_seed=11)
+    world, bus, _ = create_session(header)
+    path = tmp_path / "session.blog"
+    human_clicks = 0
+    with EventRecorder(path, header).attach(bus):
+        tick = TickEvent(0.25)
+        for _ in range(400):
+            if _human_turn(world) and human_clicks < 8:
+                swaps = find_valid_swaps(world)
+                if swaps:
+                    src, dst = swaps[0]
+                    bus.emit(EVENT_TILE_CLICK, row=src[0], col=src[1])
+                    bus.emit(EVENT_TILE_CLICK, row=dst[0], col=dst[1])
+                    human_clicks += 2
+            bus.publish(tick)
+    expected = _snapshot(world)
+
+    _, records = read_log(path)
+    # AI clicks happen inside ticks and are re-derived, not recorded.
+    assert sum(1 for op, _ in records if op == OP_TILE_CLICK) == human_clicks > 0
+    assert any(op == OP_TICK_RUN for op, _ in records)
+    assert path.stat().st_size < 400 * 9
+
+    result = replay(path)
+    assert result.ticks == 400
+    assert result.inputs == human_clicks
+    assert _snapshot(result.world) == expected
+
+
+def test_recorder_survives_profiling_and_run_to_completion_toggles(tmp_path):
+    bus = EventBus()
+    clicks = []
+    bus.subscribe(EVENT_TILE_CLICK, lambda sender, **payload: clicks.append(payload["row"]))
+    # A derived click raised from inside a tick is not an input.
+    bus.subscribe(EVENT_TICK, lambda sender, **payload: bus.emit(EVENT_TILE_CLICK, row=9, col=9))
+    path = tmp_path / "hook.blog"
+    with EventRecorder(path, SessionHeader(seed=1)).attach(bus):
+        bus.emit(EVENT_TILE_CLICK, row=0, col=0)
+        bus.enable_profiling()
+        bus.emit(EVENT_TILE_CLICK, row=1, col=0)
+        bus.enable_run_to_completion()
+        bus.publish(TickEvent(0.5))
+        bus.emit(EVENT_TILE_CLICK, row=2, col=0)
+        bus.disable_run_to_completion()
+        bus.disable_profiling()
+        bus.emit(EVENT_TILE_CLICK, row=3, col=0)
+    bus.emit(EVENT_TILE_CLICK, row=4, col=0)
+
+    assert clicks == [0, 1, 9, 2, 3, 4]
+    assert bus.input_recorder is None
+    _, records = read_log(path)
+    assert [fields[0] for op, fields in records if op == OP_TILE_CLICK] == [0, 1, 2, 3]
+
+
+def _game_snapshot(world):
+    board, health, banks = _snapshot(world)
+    mode = resources_of(world).get(GameState).mode
+    return mode, len(world._entities), board, health, banks
+
+
+def _end_frame(world, bus, recorder, dt=0.25):
+    """One window frame: tick in combat, then reclaim, as ``BattlelinesWindow.on_update`` does."""
+    ticked = resources_of(world).get(GameState).mode == GameMode.COMBAT
+    if ticked:
+        bus.publish(TickEvent(dt))
+    recorder.end_frame(ticked, reclaim_dead_entities(world))
+    return ticked
+
+
+def test_game_session_replays_from_the_menu(tmp_path):
+    header = SessionHeader.for_game(seed=7, width=800, height=600)
+    world, bus, systems = create_game_session(header, save_dir=tmp_path)
+    path = tmp_path / "game.blog"
+    ticks = 0
+    with EventRecorder(path, header).attach(bus) as recorder:
+        new_game = next(button for _, button in world.get_component(MenuButton) if button.enabled)
+        bus.emit(EVENT_MOUSE_PRESS, x=new_game.x, y=new_game.y, button=1)
+        for _ in range(20):
+            mode = resources_of(world).get(GameState).mode
+            if mode == GameMode.COMBAT:
+                break
+            if mode == GameMode.DIALOGUE:
+                systems["dialogue_system"].handle_key_press(13, 0)
+            else:
+                window_entity, window = next(iter(world.get_component(ChoiceWindow)))
+                option = window.option_entities[-1]
+                bus.emit(
+                    "choice_selected",
+                    window_entity=window_entity,
+                    choice_entity=option,
+                    payload_entity=world.component_for_entity(option, ChoiceOption).payload_entity,
+                )
+            ticks += _end_frame(world, bus, recorder)
+        assert resources_of(world).get(GameState).mode == GameMode.COMBAT
+        human_clicks = 0
+        for frame in range(300):
+            if _human_turn(world) and human_clicks < 6:
+                swaps = find_valid_swaps(world)
+                if swaps:
+                    src, dst = swaps[0]
+                    bus.emit(EVENT_TILE_CLICK, row=src[0], col=src[1])
+                    if frame == 0:
+                        bus.emit(EVENT_MOUSE_PRESS, x=0.0, y=0.0, button=4)
+                        bus.emit(EVENT_TILE_CLICK, row=src[0], col=src[1])
+                    bus.emit(EVENT_TILE_CLICK, row=dst[0], col=dst[1])
+                    human_clicks += 2
+            ticks += _end_frame(world, bus, recorder)
+    expected = _game_snapshot(world)
+
+    replayed_header, records = read_log(path)
+    assert replayed_header == header
+    events = [fields[0] for op, fields in records if op == OP_EVENT]
+    # The left press became a menu event; the right press is kept as-is.
+    assert events[0] == "menu_new_game_selected"
+    assert EVENT_MOUSE_PRESS in events and "dialogue_advance" in events
+    assert any(op == OP_RECLAIM for op, _ in records)
+
+    result = replay(path)
+    assert result.ticks == ticks
+    assert _game_snapshot(result.world) == expected
+
+
+def test_recording_is_opt_in_through_the_environment(tmp_path):
+    assert recording_from_env(800, 600, environ={}) is None
+    log = tmp_path / "session.blog"
+    path, header = recording_from_env(800, 600, environ={"BATTLELINES_RECORD": str(log), "BATTLELINES_SEED": "12"})
+    assert path == log
+    assert (header.seed, header.game_session, header.width, header.height) == (12, True, 800, 600)
+
+
+def test_event_records_keep_their_schema_and_reject_anything_else(tmp_path):
+    path = tmp_path / "events.blog"
+    bus = EventBus()
+    with EventRecorder(path, SessionHeader(seed=1)).attach(bus):
+        bus.emit(EVENT_MOUSE_PRESS, x=3.5, y=4, button=4, press_id=9)
+        bus.emit(EVENT_HEALTH_DAMAGE, target_entity=2, amount=10, reason="debug", source_owner=None)
+        for bad in (
+            {"amount": 1},
+            {"owner_entity": 1, "type_name": ("hex",), "amount": 1},
+            {"owner_entity": 1, "type_name": "hex", "amount": True},
+        ):
+            with pytest.raises(ValueError, match="Cannot record 'bank_mana'"):
+                bus.emit(EVENT_BANK_MANA, **bad)
+        with pytest.raises(ValueError, match="'tiles' is not in its schema"):
+            bus.emit(EVENT_HEALTH_DAMAGE, target_entity=2, amount=1, tiles={(0, 0)})
+
+    _, records = read_log(path)
+    assert list(iter_events(records)) == [
+        (EVENT_MOUSE_PRESS, {"x": 3.5, "y": 4, "button": 4, "press_id": 9}),
+        (EVENT_HEALTH_DAMAGE, {"target_entity": 2, "amount": 10, "reason": "debug", "source_owner": None}),
+    ]
@@ -0,0 +1,134 @@
+import sys
+
+import pytest
+
+from ecs.ai.self_play import MatchConfig, play_match
+from ecs.events.bus import EventBus
+from ecs.events.payloads import TickEvent
+
+
+def _wire_chain(bus, calls):
+    def on_a(sender, **payload):
+        calls.append("a")
+        bus.emit("b")
+        bus.emit("c")
+
+    def on_b(sender, **payload):
+        calls.append("b")
+        bus.emit("d")
+
+    bus.subscribe("a", on_a)
+    bus.subscribe("b", on_b)
+    bus.subscribe("c", lambda sender, **payload: calls.append("c"))
+    bus.subscribe("d", lambda sender, **payload: calls.append("d"))
+
+
+def test_run_to_completion_delivers_nested_events_fifo():
+    for backend in ("blinker", "direct"):
+        nested, queued = [], []
+        bus = EventBus(backend=backend)
+        _wire_chain(bus, queued)
+        bus.enable_run_to_completion(trace=True)
+
+        nested_bus = EventBus(backend=backend)
+        _wire_chain(nested_bus, nested)
+        nested_bus.emit("a")
+        bus.emit("a")
+
+        assert nested == ["a", "b", "d", "c"], backend
+        assert queued == ["a", "b", "c", "d"], backend
+        assert bus.schedule_trace == [(0, "a", None), (1, "b", 0), (2, "c", 0), (3, "d", 1)]
+        assert "d  <- 1 b" in bus.format_schedule_trace()
+        assert bus.disable_run_to_completion() is not None
+        assert bus.schedule_trace is None
+
+
+def test_run_to_completion_queues_typed_events_too():
+    bus = EventBus(backend="direct")
+    calls = []
+
+    def on_tick(sender, event):
+        calls.append(("tick", event.dt))
+        if event.dt < 0.5:
+            bus.emit("after")
+        calls.append("tick done")
+
+    def on_after(sender, **payload):
+        calls.append("after")
+        bus.publish(TickEvent(0.5))
+
+    bus.subscribe_typed(TickEvent, on_tick)
+    bus.subscribe("after", on_after)
+    bus.enable_run_to_completion()
+
+    bus.publish(TickEvent(0.25))
+
+    assert calls == [("tick", 0.25), "tick done", "after", ("tick", 0.5), "tick done"]
+
+
+def test_long_chains_do_not_grow_the_stack():
+    length = sys.getrecursionlimit() * 2
+    for queued in (False, True):
+        bus = EventBus(backend="direct")
+        seen = []
+
+        def step(sender, n, bus=bus, seen=seen):
+            seen.append(n)
+            if n < length:
+                bus.emit("step", n=n + 1)
+
+        bus.subscribe("step", step)
+        if not queued:
+            with pytest.raises(RecursionError):
+                bus.emit("step", n=1)
+            continue
+        bus.enable_run_to_completion()
+        bus.emit("step", n=1)
+        assert len(seen) == length
+
+
+def test_emit_now_drains_its_own_cascade_before_returning():
+    bus = EventBus(backend="direct")
+    calls = []
+
+    def on_tick(sender, **payload):
+        bus.emit("later")
+        bus.emit_now("click")
+        calls.append("click returned")
+
+    bus.subscribe("tick", on_tick)
+    bus.subscribe("click", lambda sender, **payload: bus.emit("click_result"))
+    bus.subscribe("click_result", lambda sender, **payload: calls.append("click_result"))
+    bus.subscribe("later", lambda sender, **payload: calls.append("later"))
+    bus.enable_run_to_completion(trace=True)
+
+    bus.emit("tick")
+
+    assert calls == ["click_result", "click returned", "later"]
+    assert [name for _, name, _ in bus.schedule_trace] == ["tick", "click", "click_result", "later"]
+
+
+def test_handler_error_drops_queued_events_and_leaves_bus_usable():
+    bus = EventBus(backend="direct")
+    calls = []
+
+    def explode(sender, **payload):
+        bus.emit("orphan")
+        raise ValueError("boom")
+
+    bus.subscribe("explode", explode)
+    bus.subscribe("orphan", lambda sender, **payload: calls.append("orphan"))
+    bus.enable_run_to_completion()
+
+    with pytest.raises(ValueError):
+        bus.emit("explode")
+    bus.emit("orphan")
+
+    assert calls == ["orphan"]
+
+
+def test_headless_match_keeps_turning_under_run_to_completion():
+    # Seed 23 hits a board stalemate on its second turn; the reset must still fire.
+    result = play_match(MatchConfig(seed=23, max_turns=8, max_ticks=2000, run_to_completion=True))
+
+    assert result.turns == 8
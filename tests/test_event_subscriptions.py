@@ -0,0 +1,171 @@
+import gc
+
+from ecs.ai.simulation import clone_world_state
+from ecs.components.effect_list import EffectList
+from ecs.components.human_agent import HumanAgent
+from ecs.events.bus import (
+    EVENT_BATTLE_RESOLVED,
+    EVENT_EFFECT_APPLY,
+    EVENT_EFFECT_REMOVE,
+    EVENT_TICK,
+    EVENT_TURN_ADVANCED,
+    EventBus,
+)
+from ecs.events.payloads import TickEvent
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+from world import create_world
+
+
+def test_subscription_handle_unsubscribes_on_both_backends():
+    for backend in ("blinker", "direct"):
+        bus = EventBus(backend=backend)
+        calls = []
+        plain = bus.subscribe("ping", lambda sender, **p: calls.append("plain"))
+        keyed = bus.subscribe_keyed("ping", "slug", "a", lambda sender, **p: calls.append("keyed"))
+        typed = bus.subscribe_typed(TickEvent, lambda sender, event: calls.append("typed"))
+        bus.emit("ping", slug="a")
+        bus.publish(TickEvent())
+        assert sorted(calls) == ["keyed", "plain", "typed"], backend
+
+        calls.clear()
+        assert plain.unsubscribe() and keyed.unsubscribe() and typed.unsubscribe()
+        assert not plain.unsubscribe()
+        bus.emit("ping", slug="a")
+        bus.publish(TickEvent())
+        assert calls == [], backend
+        assert bus.census() == {}, backend
+        assert not bus._keyed
+
+
+def test_unsubscribe_by_function_matches_wrapped_handlers():
+    bus = EventBus(backend="direct")
+    calls = []
+
+    def on_tick(sender, event):
+        calls.append(event.dt)
+
+    bus.subscribe_typed(TickEvent, on_tick)
+    assert bus.unsubscribe(EVENT_TICK, on_tick)
+    assert not bus.unsubscribe(EVENT_TICK, on_tick)
+    bus.publish(TickEvent())
+    assert calls == []
+
+
+def test_unsubscribing_deferred_handler_drops_queued_payloads():
+    bus = EventBus(backend="direct")
+    calls = []
+    handle = bus.subscribe_deferred("move", lambda sender, **p: calls.append(p))
+    bus.emit("move", x=1)
+    handle.unsubscribe()
+    assert bus.flush_deferred() == 0
+    assert calls == []
+
+
+def test_group_close_drops_everything_and_census_reports_it():
+    bus = EventBus(backend="direct")
+    other = bus.subscribe("ping", lambda sender, **p: None)
+    with bus.group() as group:
+        group.subscribe("ping", lambda sender, **p: None)
+        group.subscribe_keyed("effect", "slug", "a", lambda sender, **p: None)
+        group.subscribe_keyed("effect", "slug", "b", lambda sender, **p: None)
+        group.subscribe_deferred("move", lambda sender, **p: None)
+        group.subscribe_async("save", lambda sender, **p: None)
+        assert bus.census() == {"ping": 2, "effect": 2, "move": 1, "save": 1}
+        assert "slug='a'" in bus.format_census()
+    assert len(group) == 0
+    assert bus.census() == {"ping": 1}
+    other.unsubscribe()
+    assert bus.format_census() == "(no handlers attached)"
+    bus.close_async()
+
+
+def test_expire_on_event_handler_is_released_with_last_effect():
+    bus = EventBus(backend="direct")
+    world = create_world(bus)
+    lifecycle = EffectLifecycleSystem(world, bus)
+    owner = next(ent for ent, _ in world.get_component(HumanAgent))
+    baseline = bus.census()
+
+    bus.emit(
+        EVENT_EFFECT_APPLY,
+        owner_entity=owner,
+        slug="battle_focus",
+        expire_on_events=(EVENT_BATTLE_RESOLVED,),
+    )
+    assert bus.census()[EVENT_BATTLE_RESOLVED] == baseline.get(EVENT_BATTLE_RESOLVED, 0) + 1
+
+    bus.emit(EVENT_BATTLE_RESOLVED)
+    assert bus.census() == baseline
+
+    lifecycle.close()
+    expected = dict(baseline)
+    for name in (EVENT_EFFECT_APPLY, EVENT_EFFECT_REMOVE, EVENT_TURN_ADVANCED):
+        expected[name] -= 1
+        if not expected[name]:
+            del expected[name]
+    assert bus.census() == expected
+
+
+def test_scored_clone_releases_its_lifecycle_handlers():
+    bus = EventBus(backend="direct")
+    world = create_world(bus)
+    owner = next(ent for ent, _ in world.get_component(HumanAgent))
+    clone = clone_world_state(world)
+    clone.event_bus.emit(
+        EVENT_EFFECT_APPLY,
+        owner_entity=clone.entity_map.get(owner, owner),
+        slug="battle_focus",
+        expire_on_events=(EVENT_BATTLE_RESOLVED,),
+    )
+    assert clone.event_bus.census()[EVENT_BATTLE_RESOLVED] == 1
+
+    clone.close()
+    census = clone.event_bus.census()
+    for name in (EVENT_BATTLE_RESOLVED, EVENT_EFFECT_APPLY, EVENT_EFFECT_REMOVE, EVENT_TURN_ADVANCED):
+        assert name not in census
+
+
+def _combat(bus, world, owner):
+    for _ in range(3):
+        bus.emit(
+            EVENT_EFFECT_APPLY,
+            owner_entity=owner,
+            slug="battle_focus",
+            expire_on_events=(EVENT_BATTLE_RESOLVED,),
+            expire_match_owner=True,
+            expire_payload_owner_key="attacker_owner",
+        )
+        bus.emit(EVENT_EFFECT_APPLY, owner_entity=owner, slug="battle_focus", turns=1)
+        # The AI evaluates moves on a scratch clone with its own bus and systems.
+        clone_world_state(world)
+        bus.emit(EVENT_BATTLE_RESOLVED, attacker_owner=owner, defender_owner=-1)
+        for _ in range(2):
+            bus.emit(EVENT_TURN_ADVANCED, previous_owner=owner, new_owner=owner)
+            # End of frame: esper drops the entities deleted this turn.
+            world._clear_dead_entities()
+
+
+def test_handlers_and_memory_stay_flat_over_500_combats():
+    bus = EventBus(backend="direct")
+    world = create_world(bus)
+    EffectLifecycleSystem(world, bus)
+    owner = next(ent for ent, _ in world.get_component(HumanAgent))
+    # Warm up until the flight recorder ring and esper's tables are full size.
+    for _ in range(20):
+        _combat(bus, world, owner)
+    world._clear_dead_entities()
+    gc.collect()
+    baseline = bus.census()
+    objects_before = len(gc.get_objects())
+
+    for combat in range(500):
+        _combat(bus, world, owner)
+        if combat % 100 == 0:
+            assert bus.census() == baseline
+    world._clear_dead_entities()
+    gc.collect()
+
+    assert bus.census() == baseline
+    assert world.component_for_entity(owner, EffectList).effect_entities == []
+    # A leaked handler, closure or clone per combat would add thousands of objects.
+    assert len(gc.get_objects()) - objects_before < 100
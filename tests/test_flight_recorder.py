@@ -0,0 +1,108 @@
+import sys
+
+import pytest
+
+from ecs.events.benchmark import measure_flight_recorder_overhead, measure_single_handler_overhead
+from ecs.events.bus import EVENT_BUS_BACKENDS, EventBus
+from ecs.events.flight_recorder import FlightRecorder, install_crash_dump
+from ecs.events.payloads import TickEvent
+
+
+@pytest.mark.parametrize("backend", EVENT_BUS_BACKENDS)
+def test_ring_keeps_last_events_with_depth(backend):
+    bus = EventBus(backend=backend, flight_recorder_size=4)
+    bus.subscribe("outer", lambda sender, **payload: bus.emit("inner", positions=[(0, 0), (0, 1), (0, 2), (0, 3)]))
+    for n in range(3):
+        bus.emit("noise", n=n)
+    bus.emit("outer", value=1)
+    bus.publish(TickEvent(0.5))
+
+    entries = bus.flight_recorder.entries()
+    assert [(name, depth) for _, _, depth, name, _ in entries] == [
+        ("noise", 0),
+        ("outer", 0),
+        ("inner", 1),
+        ("tick", 0),
+    ]
+    assert entries[2][4] == "positions=[(0, 0), (0, 1), (0, 2), ... 4 total]"
+    assert entries[3][4] == "dt=0.5"
+    assert bus.flight_recorder.depth == 0
+
+
+@pytest.mark.parametrize("backend", EVENT_BUS_BACKENDS)
+def test_profiled_publish_is_noted_once(backend):
+    bus = EventBus(backend=backend, flight_recorder_size=8)
+    bus.subscribe("tick", lambda sender, **payload: bus.emit("inner"))
+    bus.enable_profiling()
+    bus.publish(TickEvent(0.5))
+    bus.emit("outer")
+
+    assert [(name, depth) for _, _, depth, name, _ in bus.flight_recorder.entries()] == [
+        ("tick", 0),
+        ("inner", 1),
+        ("outer", 0),
+    ]
+
+
+def test_reused_event_is_noted_as_it_was_published():
+    bus = EventBus(backend="direct", flight_recorder_size=8)
+    tick = TickEvent(0.5)
+    bus.publish(tick)
+    tick.dt = 0.25
+    bus.publish(tick)
+
+    assert [summary for *_, summary in bus.flight_recorder.entries()] == ["dt=0.5", "dt=0.25"]
+
+
+def test_reading_entries_has_no_side_effects():
+    recorder = FlightRecorder(4)
+    for n in range(6):
+        recorder.note("step", {"n": n})
+    first = recorder.entries()
+    assert recorder.entries() == first and recorder.seq == 6
+    assert [sequence for sequence, *_ in first] == [2, 3, 4, 5]
+
+
+def test_depth_restored_after_handler_exception():
+    bus = EventBus(backend="direct")
+
+    def boom(sender, **payload):
+        raise RuntimeError("boom")
+
+    bus.subscribe("explode", boom)
+    with pytest.raises(RuntimeError):
+        bus.emit("explode")
+    assert bus.flight_recorder.depth == 0
+
+
+def test_disabled_flight_recorder_uses_plain_emit():
+    bus = EventBus(backend="direct", flight_recorder_size=0)
+    assert bus.flight_recorder is None
+    assert bus.emit == bus._emit_direct
+
+
+def test_crash_hook_dumps_recent_events(tmp_path, monkeypatch):
+    recorder = FlightRecorder(8)
+    recorder.note("cascade_step", {"depth": 2})
+    seen = []
+    monkeypatch.setattr(sys, "excepthook", lambda *exc: seen.append(exc[0]))
+    hook = install_crash_dump(recorder, tmp_path / "crash.log")
+
+    hook(ValueError, ValueError("bad tile"), None)
+
+    text = (tmp_path / "crash.log").read_text()
+    assert "# unhandled ValueError: bad tile" in text
+    assert "cascade_step  depth=2" in text
+    assert seen == [ValueError]
+
+
+def test_flight_recorder_benchmark_reports_both_paths():
+    overhead = measure_flight_recorder_overhead(handlers=2, emits=200, cascades=1, repeats=1)
+    assert overhead.emit_ns_bare > 0 and overhead.emit_ns_recorded > 0
+    assert overhead.cascade_ms_bare > 0 and overhead.cascade_ms_recorded > 0
+
+
+def test_single_handler_benchmark_reports_cascade_events():
+    overhead = measure_single_handler_overhead(emits=200, cascades=1, repeats=1)
+    assert overhead.emit_ns_bare > 0 and overhead.emit_ns_recorded > 0
+    assert overhead.cheapest_event and 0 < overhead.cheapest_handler_ns <= overhead.handler_ns
@@ -0,0 +1,68 @@
+from ecs.components.health import Health
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.events.bus import EVENT_EFFECT_APPLIED, EVENT_EFFECT_APPLY, EventBus
+from ecs.systems.effect_lifecycle_system import EffectLifecycleSystem
+from ecs.systems.effects.board_clear_effect_system import BoardClearEffectSystem
+from ecs.systems.effects.board_transform_effect_system import BoardTransformEffectSystem
+from ecs.systems.effects.damage_effect_system import DamageEffectSystem
+from ecs.systems.effects.deplete_effect_system import DepleteEffectSystem
+from ecs.systems.effects.heal_effect_system import HealEffectSystem
+from ecs.systems.effects.mana_drain_effect_system import ManaDrainEffectSystem
+from ecs.systems.effects.tile_sacrifice_effect_system import TileSacrificeEffectSystem
+from ecs.systems.health_system import HealthSystem
+from world import create_world
+
+
+def test_keyed_subscription_routes_on_payload_value():
+    for backend in ("blinker", "direct"):
+        bus = EventBus(backend=backend)
+        calls = []
+        bus.subscribe_keyed("effect", "slug", "poison", lambda sender, **p: calls.append(("poison", p["n"])))
+        bus.subscribe_keyed("effect", "slug", "heal", lambda sender, **p: calls.append(("heal", p["n"])))
+        bus.emit("effect", slug="poison", n=1)
+        bus.emit("effect", slug="other", n=2)
+        bus.emit("effect", n=3)
+        bus.emit("effect", slug="heal", n=4)
+        assert calls == [("poison", 1), ("heal", 4)], backend
+
+
+def _count_invocations(bus, name, counter):
+    def wrap(fn):
+        def counted(sender, **payload):
+            counter[0] += 1
+            return fn(sender, **payload)
+        return counted
+
+    bus._handlers[name] = tuple(wrap(fn) for fn in bus._handlers[name])
+    for (event_name, _), table in bus._keyed.items():
+        if event_name == name:
+            for value, handlers in list(table.items()):
+                table[value] = tuple(wrap(fn) for fn in handlers)
+
+
+def test_effect_apply_only_reaches_matching_effect_system():
+    bus = EventBus(backend="direct")
+    world = create_world(bus)
+    EffectLifecycleSystem(world, bus)
+    HealthSystem(world, bus)
+    for system in (
+        DamageEffectSystem,
+        DepleteEffectSystem,
+        HealEffectSystem,
+        ManaDrainEffectSystem,
+        BoardClearEffectSystem,
+        BoardTransformEffectSystem,
+        TileSacrificeEffectSystem,
+    ):
+        system(world, bus)
+    counter = [0]
+    _count_invocations(bus, EVENT_EFFECT_APPLIED, counter)
+    enemy = next(ent for ent, _ in world.get_component(RuleBasedAgent))
+    before = world.component_for_entity(enemy, Health).current
+
+    bus.emit(EVENT_EFFECT_APPLY, owner_entity=enemy, slug="damage", metadata={"amount": 3})
+
+    assert world.component_for_entity(enemy, Health).current == before - 3
+    # The slug router, the damage system and the slug-agnostic TileStatusSystem that
+    # create_world wires; with unkeyed subscriptions all eight subscribers ran.
+    assert counter[0] == 3
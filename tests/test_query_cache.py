@@ -0,0 +1,85 @@
+from esper import World
+
+from ecs.ai.simulation import clone_world_state
+from ecs.components.active_switch import ActiveSwitch
+from ecs.components.board_position import BoardPosition
+from ecs.components.effect import Effect
+from ecs.components.tile import TileType
+from ecs.events.bus import EventBus
+from ecs.systems.board import BoardSystem
+from ecs.utils.census import reclaim_dead_entities
+from ecs.utils.queries import QueryWorld, query_cache
+from world import create_world
+
+
+def _tiles(world, count):
+    return [
+        world.create_entity(BoardPosition(row=0, col=col), ActiveSwitch(active=True), TileType(type_name="hex"))
+        for col in range(count)
+    ]
+
+
+def test_joins_are_reused_until_one_of_their_types_changes():
+    world = QueryWorld()
+    tiles = _tiles(world, 4)
+    queries = query_cache(world)
+
+    first = queries.join(BoardPosition, TileType)
+    assert [entity for entity, _ in first] == [entity for entity, _ in world.get_component(BoardPosition)]
+    assert queries.join(BoardPosition, TileType) is first
+
+    # Unrelated component churn (effects coming and going) keeps the join.
+    effect = world.create_entity(Effect(slug="poison", owner_entity=tiles[0]))
+    world.delete_entity(effect, immediate=True)
+    assert queries.join(BoardPosition, TileType) is first
+
+    world.remove_component(tiles[1], TileType)
+    second = queries.join(BoardPosition, TileType)
+    assert second is not first
+    assert tiles[1] not in {entity for entity, _ in second}
+
+    # In-place edits are visible through the shared component instances.
+    world.component_for_entity(tiles[0], TileType).type_name = "chaos"
+    assert queries.mapping(TileType)[tiles[0]].type_name == "chaos"
+
+    (stats,) = [entry for entry in queries.report() if entry.kind == "join"]
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert stats.hit_rate == 0.5
+
+
+def test_deferred_deletes_invalidate_when_flushed():
+    world = QueryWorld()
+    tiles = _tiles(world, 3)
+    queries = query_cache(world)
+    switches = queries.mapping(ActiveSwitch)
+    assert set(switches) == set(tiles)
+
+    world.delete_entity(tiles[2])
+    assert queries.mapping(ActiveSwitch) is switches  # still in the world until the flush
+    reclaim_dead_entities(world)
+
+    assert set(queries.mapping(ActiveSwitch)) == set(tiles[:2])
+    assert "map ActiveSwitch: 3 calls, 33% hits" in queries.format_report()
+
+
+def test_game_and_clone_worlds_are_tracked_from_creation():
+    bus = EventBus()
+    world = create_world(bus)
+    BoardSystem(world, bus, 4, 4)
+    assert query_cache(world).tracked
+    clone = clone_world_state(world)
+    assert query_cache(clone.world).tracked
+    # The board built during cloning is already visible through the clone's cache.
+    assert len(query_cache(clone.world).mapping(TileType)) == 16
+
+
+def test_plain_worlds_get_an_untracked_cache_that_always_recomputes():
+    world = World()
+    tiles = _tiles(world, 2)
+    queries = query_cache(world)
+    assert not queries.tracked
+
+    first = queries.join(BoardPosition, TileType)
+    world.remove_component(tiles[0], TileType)
+    assert [entity for entity, _ in queries.join(BoardPosition, TileType)] == [tiles[1]]
+    assert first is not queries.join(BoardPosition, TileType)
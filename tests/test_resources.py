@@ -0,0 +1,85 @@
+import pytest
+from esper import World
+
+from ecs.ai.simulation import clone_world_state
+from ecs.components.board import Board
+from ecs.components.game_state import GameMode, GameState
+from ecs.components.turn_state import TurnState
+from ecs.events.bus import EventBus
+from ecs.resources import Resources, resources_of
+from ecs.utils.game_state import set_game_mode
+from world import create_world
+
+
+def test_lookups_hit_the_cache_after_the_first_scan():
+    world = World()
+    resources = resources_of(world)
+    assert resources_of(world) is resources
+    assert resources.get(TurnState) is None
+    with pytest.raises(KeyError):
+        resources[TurnState]
+
+    state = TurnState()
+    holder = world.create_entity(state)
+    assert resources[TurnState] is state
+    scans = resources.scans
+    for _ in range(100):
+        assert resources[TurnState] is state
+    assert resources.scans == scans
+    assert resources.entity(TurnState) == holder
+    assert TurnState in resources
+
+
+def test_replacement_behind_the_registry_is_noticed():
+    world = World()
+    resources = resources_of(world)
+    first = TurnState()
+    holder = world.create_entity(first)
+    assert resources[TurnState] is first
+
+    second = TurnState()
+    world.add_component(holder, second)
+    assert resources[TurnState] is second
+
+    world.delete_entity(holder, immediate=True)
+    assert resources.get(TurnState) is None
+    assert TurnState not in resources
+
+
+def test_insert_replaces_in_place_and_hooks_fire():
+    world = World()
+    resources = resources_of(world)
+    events = []
+    resources.on_insert(GameState, lambda w, ent, inst: events.append(("insert", ent, inst.mode)))
+    resources.on_remove(GameState, lambda w, ent, inst: events.append(("remove", ent, inst.mode)))
+
+    holder = resources.insert(GameState(mode=GameMode.MENU))
+    same = resources.insert(GameState(mode=GameMode.COMBAT))
+    assert same == holder
+    assert resources[GameState].mode == GameMode.COMBAT
+    removed = resources.remove(GameState)
+    assert removed.mode == GameMode.COMBAT
+    assert resources.get(GameState) is None
+    assert events == [
+        ("insert", holder, GameMode.MENU),
+        ("remove", holder, GameMode.MENU),
+        ("insert", holder, GameMode.COMBAT),
+        ("remove", holder, GameMode.COMBAT),
+    ]
+    assert resources.get_or_insert(TurnState) is resources[TurnState]
+
+
+def test_world_and_clones_share_state_through_their_registries():
+    bus = EventBus()
+    world = create_world(bus)
+    assert isinstance(world.resources, Resources)
+    set_game_mode(world, bus, GameMode.MENU)
+    assert world.resources[GameState].mode == GameMode.MENU
+
+    world.create_entity(Board(rows=8, cols=8))
+    clone = clone_world_state(world).world
+    board = clone.resources[Board]
+    assert board is not world.resources[Board]
+    assert (board.rows, board.cols) == (8, 8)
+    assert clone.resources.scans == 0
+
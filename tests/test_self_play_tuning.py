@@ -0,0 +1,60 @@
+import json
+import random
+
+from ecs.ai.self_play import MatchConfig, play_match
+from ecs.ai.tuning import perturb_weights, successive_halving
+from ecs.systems.rule_based_ai_system import DEFAULT_WEIGHTS, RuleBasedAISystem, RuleBasedWeights
+from ecs.events.bus import EventBus
+from world import create_world
+
+
+def test_rule_based_ai_uses_weight_profile():
+    bus = EventBus()
+    world = create_world(bus)
+    weights = RuleBasedWeights(extra_turn_bonus=7.0)
+    assert RuleBasedAISystem(world, bus).weights is DEFAULT_WEIGHTS
+    assert RuleBasedAISystem(world, bus, weights=weights).weights.extra_turn_bonus == 7.0
+    assert RuleBasedWeights.from_dict({**weights.to_dict(), "unknown": 1}) == weights
+
+
+def test_perturb_weights_keeps_tie_breaker():
+    perturbed = perturb_weights(DEFAULT_WEIGHTS, random.Random(1))
+    assert perturbed.random_tie_breaker == DEFAULT_WEIGHTS.random_tie_breaker
+    assert perturbed.extra_turn_bonus != DEFAULT_WEIGHTS.extra_turn_bonus
+    assert perturbed.extra_turn_bonus > 0
+
+
+def test_headless_match_advances_turns():
+    result = play_match(MatchConfig(seed=3, max_turns=3))
+    assert result.turns == 3 or result.winner is not None
+    assert result.ticks < 20_000
+    assert play_match(MatchConfig(seed=3, max_turns=3)) == result
+
+
+def test_headless_match_leaves_global_rng_alone():
+    random.seed(11)
+    state = random.getstate()
+    result = play_match(MatchConfig(seed=5, max_turns=2))
+    assert random.getstate() == state
+    random.random()  # a caller's draws in between must not change the replay
+    assert play_match(MatchConfig(seed=5, max_turns=2)) == result
+
+
+def test_successive_halving_keeps_best_and_persists(tmp_path):
+    candidates = [RuleBasedWeights(extra_turn_bonus=float(value)) for value in (1, 4, 2, 3)]
+
+    def evaluate(candidate, baseline, seed, max_turns):
+        # Higher extra-turn bonus wins more often in this fake league.
+        return {"seed": seed, "points": candidate["extra_turn_bonus"] / 4.0, "matches": 2}
+
+    results = tmp_path / "results.jsonl"
+    report = successive_halving(candidates, seeds_per_candidate=1, evaluate=evaluate, results_path=results)
+
+    assert report.best.weights.extra_turn_bonus == 4.0
+    assert [len(round_) for round_ in report.rounds] == [4, 2, 1]
+    # 4 candidates x 1 seed, then 2 x 2, then 1 x 4.
+    lines = results.read_text().splitlines()
+    assert len(lines) == 12
+    assert report.matches == 24
+    assert json.loads(lines[0])["round"] == 0
+    assert report.matches_per_second > 0
@@ -1,6 +1,6 @@
 from math import ceil
 
-from ecs.events.bus import EventBus, EVENT_TILE_SWAP_REQUEST, EVENT_TILE_SWAP_DO, EVENT_TILE_SWAP_FINALIZE, EVENT_TICK
+from ecs.events.bus import EventBus, EVENT_TILE_SWAP_REQUEST, EVENT_TILE_SWAP_DO, EVENT_TILE_SWAP_FINALIZE, EVENT_TICK, EVENT_TILE_SWAP_VALID
 from ecs.systems.board import BoardSystem
 from ecs.systems.render import RenderSystem
 from ecs.systems.match import MatchSystem
@@ -65,3 +65,18 @@ def test_swap_animation_tick_progress():
     assert do_events.get('fired'), "DO event was not emitted"
     assert finalized.get('src') == (0,0)
     assert finalized.get('dst') == (0,1)
+
+
+def test_swap_request_during_finalize_wait_starts_new_swap():
+    bus = EventBus()
+    world = create_world(bus)
+    AnimationSystem(world, bus)
+    do_events = []
+    bus.subscribe(EVENT_TILE_SWAP_DO, lambda sender, **k: do_events.append((k['src'], k['dst'])))
+    for _ in range(2):
+        # Validity arrives before the request, as when MatchSystem answers first; the
+        # second request repeats the same pair while the first swap is still finalizing.
+        bus.emit(EVENT_TILE_SWAP_VALID, src=(0, 0), dst=(0, 1))
+        bus.emit(EVENT_TILE_SWAP_REQUEST, src=(0, 0), dst=(0, 1))
+        bus.emit(EVENT_TICK, dt=1.0)
+    assert do_events == [((0, 0), (0, 1)), ((0, 0), (0, 1))]
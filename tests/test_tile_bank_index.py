@@ -0,0 +1,116 @@
+from ecs.ai.simulation import clone_world_state
+from ecs.components.rule_based_agent import RuleBasedAgent
+from ecs.components.tile_bank import TileBank
+from ecs.events.bus import (
+    EventBus,
+    EVENT_BANK_MANA,
+    EVENT_ENTITY_DEFEATED,
+    EVENT_TILE_BANK_SPEND_REQUEST,
+    EVENT_TILE_BANK_SPENT,
+)
+from ecs.systems.defeat_system import DefeatSystem
+from ecs.systems.tile_bank_system import TileBankSystem
+from ecs.utils.tile_banks import bank_index, find_bank
+from world import create_world
+
+
+def _enemy(world):
+    return next(ent for ent, _ in world.get_component(RuleBasedAgent))
+
+
+def test_lookups_are_served_from_the_index():
+    bus = EventBus()
+    world = create_world(bus)
+    TileBankSystem(world, bus)
+    banks = bank_index(world)
+    enemy = _enemy(world)
+
+    spent = []
+    bus.subscribe(EVENT_TILE_BANK_SPENT, lambda sender, **payload: spent.append(payload))
+    bus.emit(EVENT_BANK_MANA, owner_entity=enemy, gains={"hex": 3})
+    rebuilds = banks.rebuilds
+    for _ in range(3):
+        bus.emit(EVENT_TILE_BANK_SPEND_REQUEST, entity=enemy, cost={"hex": 1})
+
+    assert len(spent) == 3
+    assert banks.rebuilds == rebuilds
+    assert world.component_for_entity(enemy, TileBank).counts["hex"] == 0
+    assert banks.check() == []
+
+
+def test_bank_created_on_demand_is_indexed():
+    bus = EventBus()
+    world = create_world(bus)
+    TileBankSystem(world, bus)
+    owner = world.create_entity()
+
+    bus.emit(EVENT_BANK_MANA, owner_entity=owner, gains={"blood": 2})
+    bank_entity, bank = find_bank(world, owner)
+
+    assert bank_entity != owner
+    assert bank.counts == {"blood": 2}
+    assert bank_index(world).check() == []
+
+
+def test_enemy_replacement_moves_the_index_to_the_new_enemy():
+    bus = EventBus()
+    world = create_world(bus)
+    DefeatSystem(world, bus)
+    banks = bank_index(world)
+    defeated = _enemy(world)
+    assert find_bank(world, defeated) is not None
+
+    bus.emit(EVENT_ENTITY_DEFEATED, entity=defeated)
+    replacement = _enemy(world)
+
+    assert replacement != defeated
+    assert find_bank(world, defeated) is None
+    assert find_bank(world, replacement)[0] == replacement
+    assert banks.check() == []
+
+
+def test_check_reports_stale_and_duplicate_banks():
+    bus = EventBus()
+    world = create_world(bus)
+    banks = bank_index(world)
+    enemy = _enemy(world)
+    assert find_bank(world, enemy) is not None
+
+    world.remove_component(enemy, TileBank)
+    assert banks.check() == [f"owner {enemy} indexed to stale bank entity {enemy}"]
+    assert find_bank(world, enemy) is None
+
+    world.create_entity(TileBank(owner_entity=enemy))
+    world.create_entity(TileBank(owner_entity=enemy))
+    assert any("has banks on entities" in problem for problem in banks.check())
+
+
+def test_clones_start_with_a_populated_index():
+    bus = EventBus()
+    world = create_world(bus)
+    enemy = _enemy(world)
+    clone = clone_world_state(world)
+
+    clone_banks = bank_index(clone.world)
+    assert clone_banks.find(clone.entity_map[enemy])[0] == clone.entity_map[enemy]
+    assert clone_banks.rebuilds == 0
+    assert clone_banks.check() == []
+
+
+def test_misses_are_remembered_until_a_bank_appears():
+    bus = EventBus()
+    world = create_world(bus)
+    banks = bank_index(world)
+    owner = world.create_entity()
+
+    assert find_bank(world, owner) is None
+    rebuilds = banks.rebuilds
+    for _ in range(5):
+        assert find_bank(world, owner) is None
+    assert banks.rebuilds == rebuilds
+
+    # A bank created behind the index's back still invalidates the miss.
+    bank_entity = world.create_entity(TileBank(owner_entity=owner))
+    assert find_bank(world, owner)[0] == bank_entity
+    assert banks.rebuilds == rebuilds + 1
+    assert banks.check() == []
@@ -0,0 +1,61 @@
+from ecs.ai.simulation import clone_world_state
+from ecs.components.ability import Ability
+from ecs.components.ability_list_owner import AbilityListOwner
+from ecs.components.tile_bank import TileBank
+from ecs.components.tile_counts import TileCodes, TileCounts
+from ecs.components.tile_types import TileTypes
+from ecs.events.bus import EventBus
+from ecs.resources import resources_of
+from ecs.utils.tile_codes import tile_codes
+from world import create_world
+
+
+def test_counts_read_like_a_counter_over_code_slots():
+    codes = TileCodes(["blood", "hex", "nature"])
+    counts = TileCounts({"hex": 2, "blood": 0}, codes=codes)
+    assert counts.amounts == [0, 2, 0]
+    assert counts == {"hex": 2}
+    assert counts["nature"] == 0 and counts.get("nature", 7) == 7
+    assert "blood" not in counts and len(counts) == 1
+
+    counts["witchfire"] = 3  # unseen names get the next code
+    assert codes.lookup("witchfire") == 3
+    assert list(counts) == ["hex", "witchfire"]
+    assert counts.pop("hex", 0) == 2 and counts.copy() == {"witchfire": 3}
+    counts.clear()
+    assert not counts
+
+
+def test_same_table_spends_slot_by_slot_and_other_tables_by_name():
+    codes = TileCodes(["blood", "hex", "nature"])
+    bank = TileBank(owner_entity=1, counts=TileCounts({"blood": 4, "hex": 1}, codes=codes))
+    cost = TileCounts({"blood": 3}, codes=codes)
+    assert cost.nonzero() == ((0, 3),)
+    assert bank.spend(cost) == {}
+    assert bank.spend(cost) == {"blood": 2}
+    assert bank.counts == {"blood": 1, "hex": 1}
+
+    foreign = TileCounts({"hex": 1, "spirit": 1})
+    assert not bank.can_spend(foreign)
+    bank.add("spirit", 2)
+    assert bank.spend(foreign) == {} and bank.counts == {"blood": 1, "spirit": 1}
+
+
+def test_world_banks_costs_and_registry_share_one_table():
+    world = create_world(EventBus())
+    codes = tile_codes(world)
+    registry = resources_of(world).get(TileTypes)
+    assert registry.codes is codes
+    assert set(registry.types) <= set(codes.names)
+    for _, bank in world.get_component(TileBank):
+        assert bank.counts.codes is codes
+    for _, owner in world.get_component(AbilityListOwner):
+        for ability_entity in owner.ability_entities:
+            assert world.component_for_entity(ability_entity, Ability).cost.codes is codes
+
+    clone = clone_world_state(world)
+    try:
+        for _, bank in clone.world.get_component(TileBank):
+            assert bank.counts.codes is codes
+    finally:
+        clone.close()
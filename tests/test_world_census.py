@@ -0,0 +1,39 @@
+from esper import World
+
+from ecs.ai.self_play import MatchConfig, play_match
+from ecs.components.effect import Effect
+from ecs.components.effect_duration import EffectDuration
+from ecs.utils.census import reclaim_dead_entities, take_census
+
+
+def test_reclaim_finishes_deferred_deletes():
+    world = World()
+    kept = world.create_entity(Effect(slug="kept", owner_entity=0))
+    doomed = [world.create_entity(Effect(slug="gone", owner_entity=0), EffectDuration(1)) for _ in range(3)]
+    for entity in doomed:
+        world.delete_entity(entity)
+    # Removing the last component already drops the entity; the flush must not trip over it.
+    world.remove_component(doomed[0], Effect)
+    world.remove_component(doomed[0], EffectDuration)
+
+    census = take_census(world)
+    assert (census.live, census.dead_pending) == (1, 2)
+    assert census.by_component == {"Effect": 3, "EffectDuration": 2}
+
+    assert reclaim_dead_entities(world) == 2
+    assert reclaim_dead_entities(world) == 0
+    census = take_census(world)
+    assert (census.live, census.dead_pending) == (1, 0)
+    assert census.by_component == {"Effect": 1}
+    assert world.entity_exists(kept)
+    assert "1 live, 0 pending deletion; Effect=1" == census.format()
+
+
+def test_entity_count_stays_bounded_over_a_long_match():
+    short = play_match(MatchConfig(seed=5, max_turns=10))
+    long = play_match(MatchConfig(seed=5, max_turns=120))
+
+    assert long.turns > 3 * short.turns
+    # An 8x8 board is 64 tiles; the rest is combatants, abilities and live effects.
+    assert long.peak_entities < 150
+    assert long.peak_entities - short.peak_entities < 30